@@ -45,6 +45,11 @@ def build_readme():
         "command_files_cli_options",
         _get_command_params_table("files"),
     )
+    readme = _set_new_variable_content(
+        readme,
+        "command_all_cli_options",
+        _get_command_params_table("all"),
+    )
 
     _save_readme(readme + "\n")
 
@@ -171,6 +176,10 @@ def _get_command_options_col(command: click.Command, param: click.Parameter) ->
             return f"Negative integer ({rng})"
         return f"Integer in range {rng}"
 
+    if isinstance(param_type, click.types.FloatRange):
+        rng = param_type._describe_range()  # noqa: SLF001
+        return f"Number in range {rng}"
+
     if isinstance(param_type, click.types.IntParamType):
         if getattr(param, "count", False) is True:
             return ""
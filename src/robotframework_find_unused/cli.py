@@ -5,28 +5,25 @@ CLI entry point
 # ruff: noqa: FBT001,D301
 
 import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
 
 from robotframework_find_unused.__version__ import __version__
-from robotframework_find_unused.commands import (
-    ArgumentsOptions,
-    FileOptions,
-    KeywordOptions,
-    ReturnOptions,
-    VariableOptions,
-    command_arguments,
-    command_files,
-    command_keywords,
-    command_returns,
-    command_variables,
-)
-from robotframework_find_unused.common.const import FilterOption
-from robotframework_find_unused.reporter.cli.argument_reporter import ArgumentCliReporter
-from robotframework_find_unused.reporter.cli.file_reporter import FileCliReporter
-from robotframework_find_unused.reporter.cli.keyword_reporter import KeywordCliReporter
-from robotframework_find_unused.reporter.cli.return_reporter import ReturnCliReporter
-from robotframework_find_unused.reporter.cli.variable_reporter import VariableCliReporter
+from robotframework_find_unused.common.const import (
+    DEFAULT_LIBRARY_TIMEOUT,
+    DiscoveryOption,
+    FilterOption,
+)
+from robotframework_find_unused.common.profiling import apply_profile, get_profiler
+
+if TYPE_CHECKING:
+    from robotframework_find_unused.reporter.base.partial.profiling import PartialReporter_Profile
+
+# Commands and reporters are imported in the command that uses them. Importing them imports Robot
+# Framework, which is slow. This keeps `--help` and `--version` fast.
 
 click_choice_filter_option = click.Choice(
     ["include", "exclude", "only"],
@@ -34,6 +31,177 @@ click_choice_filter_option = click.Choice(
 )
 
 
+def format_option(command: Callable) -> Callable:
+    """Add output format option to a command"""
+    return click.option(
+        "--format",
+        "output_format",
+        type=click.Choice(["text", "ndjson"], case_sensitive=False),
+        default="text",
+        show_default=True,
+        help=(
+            "Output format. `ndjson` streams one JSON object per line for every progress event "
+            "and every result"
+        ),
+    )(command)
+
+
+def discovery_option(command: Callable) -> Callable:
+    """Add file discovery option to a command"""
+    return click.option(
+        "--discovery",
+        type=click.Choice(["auto", "robocop", "native"], case_sensitive=False),
+        default="auto",
+        show_default=True,
+        help=(
+            "How to find files. `auto` uses Robocop when a Robocop config file applies, and the "
+            "faster `native` otherwise"
+        ),
+    )(command)
+
+
+def cache_options(command: Callable) -> Callable:
+    """Add persistent parse cache options to a command"""
+    command = click.option(
+        "--no-cache",
+        default=False,
+        is_flag=True,
+        help="Don't use the persistent parse cache, even when a cache directory is provided",
+    )(command)
+    return click.option(
+        "--cache-dir",
+        type=click.types.STRING,
+        default=None,
+        metavar="<path>",
+        envvar="ROBOTUNUSED_CACHE_DIR",
+        help=(
+            "Persist parsed files and library keywords in this directory "
+            "(e.g. `.robotunused_cache`). Unchanged files and libraries are not parsed again on "
+            "the next run"
+        ),
+    )(command)
+
+
+def watch_option(command: Callable) -> Callable:
+    """Add watch mode option to a command"""
+    return click.option(
+        "--watch",
+        default=False,
+        is_flag=True,
+        help=(
+            "Keep running. Analyze changed files again when they are saved and output the "
+            "difference in unused items"
+        ),
+    )(command)
+
+
+def jobs_option(command: Callable) -> Callable:
+    """Add parallel parsing option to a command"""
+    return click.option(
+        "-j",
+        "--jobs",
+        type=click.IntRange(min=0, max_open=True),
+        default=1,
+        help=(
+            "Parse files and document libraries in parallel with this many processes. Use 0 to "
+            "use all CPU cores"
+        ),
+    )(command)
+
+
+def max_parsed_files_option(command: Callable) -> Callable:
+    """Add option to limit the parsed files kept in memory to a command"""
+    return click.option(
+        "--max-parsed-files",
+        type=click.IntRange(min=0, max_open=True),
+        default=0,
+        metavar="<count>",
+        help=(
+            "Keep at most this many parsed files in memory. Files are parsed again when a later "
+            "step needs them. Use 0 to keep all files"
+        ),
+    )(command)
+
+
+def low_memory_option(command: Callable) -> Callable:
+    """Add low memory mode option to a command"""
+    return click.option(
+        "--low-memory",
+        default=False,
+        is_flag=True,
+        help=(
+            "Don't keep parsed files in memory. Keep compact facts about every file instead. Later "
+            "steps use the facts instead of parsing files again"
+        ),
+    )(command)
+
+
+def library_options(command: Callable) -> Callable:
+    """Add options for the processes that document libraries to a command"""
+    command = click.option(
+        "--library-memory-limit",
+        type=click.IntRange(min=1, max_open=True),
+        default=None,
+        metavar="<MB>",
+        help=(
+            "Stop documenting a library when its process uses more than this many MB of memory. "
+            "Not supported on Windows"
+        ),
+    )(command)
+    return click.option(
+        "--library-timeout",
+        type=click.FloatRange(min=0, min_open=True),
+        default=DEFAULT_LIBRARY_TIMEOUT,
+        show_default=True,
+        metavar="<seconds>",
+        help=(
+            "Stop documenting a library after this many seconds. Libraries are imported in "
+            "separate processes"
+        ),
+    )(command)
+
+
+def profile_options(command: Callable) -> Callable:
+    """Add profiling options to a command"""
+    command = click.option(
+        "--profile-output",
+        type=click.types.STRING,
+        default=None,
+        metavar="<path>",
+        help="Write the profile to this JSON file. Implies --profile",
+    )(command)
+    return click.option(
+        "--profile",
+        default=False,
+        is_flag=True,
+        help=(
+            "Measure time, memory, and processed items of every step and output a summary. "
+            "Slows down the analysis"
+        ),
+    )(command)
+
+
+def run_command(
+    command: Callable[[Any, Any], None],
+    options: Any,  # noqa: ANN401
+    reporter: "PartialReporter_Profile",
+    *,
+    profile: bool,
+    profile_output: str | None,
+) -> None:
+    """Run a command. Output the profile afterwards when profiling."""
+    apply_profile(enabled=profile or profile_output is not None)
+    try:
+        command(options, reporter)
+    finally:
+        # Also after the reporter exits
+        profiler = get_profiler()
+        if profiler is not None:
+            if profile_output is not None:
+                profiler.write_json(Path(profile_output))
+            reporter.on_profile_end(profiler.steps, profile_output)
+
+
 @click.group(
     context_settings={
         "help_option_names": ["-h", "--help"],
@@ -101,6 +269,45 @@ def cli():
     count=True,
     help="Show more log output. When provided twice: Show even more log output",
 )
+@click.option(
+    "--incremental",
+    default=False,
+    is_flag=True,
+    help=(
+        "Keep a keyword index in the cache directory. Only analyze files that changed since the "
+        "previous run. Requires --cache-dir"
+    ),
+)
+@click.option(
+    "--since",
+    type=click.types.STRING,
+    default=None,
+    metavar="<git-ref>",
+    help=(
+        "With --incremental: Only analyze files changed since this Git ref, according to "
+        "`git diff --name-only`. Skips comparing the contents of all files"
+    ),
+)
+@click.option(
+    "--changed",
+    type=click.types.STRING,
+    default=[],
+    multiple=True,
+    metavar="<path>",
+    help=(
+        "With --incremental: Only analyze this changed file. Can be used multiple times. Skips "
+        "comparing the contents of all files"
+    ),
+)
+@format_option
+@discovery_option
+@watch_option
+@cache_options
+@jobs_option
+@max_parsed_files_option
+@low_memory_option
+@library_options
+@profile_options
 @click.argument("file_path", default=".")
 def keywords(  # noqa: PLR0913
     show_count: bool,
@@ -110,6 +317,21 @@ def keywords(  # noqa: PLR0913
     library: FilterOption,
     unused_library: FilterOption,
     verbose: int,
+    incremental: bool,
+    since: str | None,
+    changed: list[str],
+    output_format: str,
+    discovery: DiscoveryOption,
+    watch: bool,
+    jobs: int,
+    max_parsed_files: int,
+    low_memory: bool,
+    library_timeout: float,
+    library_memory_limit: int | None,
+    cache_dir: str | None,
+    no_cache: bool,
+    profile: bool,
+    profile_output: str | None,
     file_path: str,
 ):
     """
@@ -159,6 +381,10 @@ def keywords(  # noqa: PLR0913
     Robot Framework localization is not supported. Any language other than English will produce
     unexpected results.
     """
+    from robotframework_find_unused.commands import KeywordOptions, command_keywords
+    from robotframework_find_unused.reporter.cli.keyword_reporter import KeywordCliReporter
+    from robotframework_find_unused.reporter.ndjson.keyword_reporter import KeywordNdjsonReporter
+
     options = KeywordOptions(
         source_path=file_path,
         deprecated_keywords=deprecated,
@@ -168,12 +394,38 @@ def keywords(  # noqa: PLR0913
         keyword_filter_glob=filter,
         show_all_count=show_count,
         verbose=verbose,
+        jobs=jobs,
+        library_timeout=library_timeout,
+        library_memory_limit=library_memory_limit,
+        cache_dir=None if no_cache else cache_dir,
+        discovery=discovery,
+        max_parsed_files=max_parsed_files,
+        low_memory=low_memory,
+        incremental=incremental,
+        changed_since=since,
+        changed_files=tuple(changed),
+        watch=watch,
     )
+    if (since is not None or len(changed) > 0) and not incremental:
+        msg = "--since and --changed require --incremental"
+        raise click.UsageError(msg)
+    if incremental and options.cache_dir is None:
+        msg = "--incremental requires --cache-dir"
+        raise click.UsageError(msg)
+
     # Empty argv to prevent libraries from trying to interpret robotunused arguments
     sys.argv = [sys.argv[0]]
 
-    reporter = KeywordCliReporter(options)
-    command_keywords(options, reporter)
+    reporter = (
+        KeywordNdjsonReporter(options) if output_format == "ndjson" else KeywordCliReporter(options)
+    )
+    run_command(
+        command_keywords,
+        options,
+        reporter,
+        profile=profile,
+        profile_output=profile_output,
+    )
 
 
 @cli.command(name="variables")
@@ -220,12 +472,33 @@ def keywords(  # noqa: PLR0913
     count=True,
     help="Show more log output. When provided twice: Show even more log output",
 )
+@format_option
+@discovery_option
+@watch_option
+@cache_options
+@jobs_option
+@max_parsed_files_option
+@low_memory_option
+@library_options
+@profile_options
 @click.argument("file_path", default=".")
-def variables(
+def variables(  # noqa: PLR0913
     show_count: bool,
     filter: str | None,  # noqa: A002
     verbose: int,
+    output_format: str,
+    discovery: DiscoveryOption,
+    watch: bool,
+    jobs: int,
+    max_parsed_files: int,
+    low_memory: bool,
+    library_timeout: float,
+    library_memory_limit: int | None,
+    cache_dir: str | None,
+    no_cache: bool,
     pythonpath: list[str],
+    profile: bool,
+    profile_output: str | None,
     file_path: str,
 ):
     """
@@ -300,18 +573,40 @@ def variables(
     Robot Framework localization is not supported. Any language other than English will produce
     unexpected results.
     """
+    from robotframework_find_unused.commands import VariableOptions, command_variables
+    from robotframework_find_unused.reporter.cli.variable_reporter import VariableCliReporter
+    from robotframework_find_unused.reporter.ndjson.variable_reporter import VariableNdjsonReporter
+
     options = VariableOptions(
         source_path=file_path,
         show_all_count=show_count,
         filter_glob=filter,
         pythonpath=pythonpath,
         verbose=verbose,
+        jobs=jobs,
+        library_timeout=library_timeout,
+        library_memory_limit=library_memory_limit,
+        cache_dir=None if no_cache else cache_dir,
+        discovery=discovery,
+        max_parsed_files=max_parsed_files,
+        low_memory=low_memory,
+        watch=watch,
     )
     # Empty argv to prevent libraries from trying to interpret robotunused arguments
     sys.argv = [sys.argv[0]]
 
-    reporter = VariableCliReporter(options)
-    command_variables(options, reporter)
+    reporter = (
+        VariableNdjsonReporter(options)
+        if output_format == "ndjson"
+        else VariableCliReporter(options)
+    )
+    run_command(
+        command_variables,
+        options,
+        reporter,
+        profile=profile,
+        profile_output=profile_output,
+    )
 
 
 @cli.command(name="arguments")
@@ -369,6 +664,14 @@ def variables(
     count=True,
     help="Show more log output. When provided twice: Show even more log output",
 )
+@format_option
+@discovery_option
+@cache_options
+@jobs_option
+@max_parsed_files_option
+@low_memory_option
+@library_options
+@profile_options
 @click.argument("file_path", default=".")
 def arguments(  # noqa: PLR0913
     show_count: bool,
@@ -378,6 +681,17 @@ def arguments(  # noqa: PLR0913
     library: FilterOption,
     unused: FilterOption,
     verbose: int,
+    output_format: str,
+    discovery: DiscoveryOption,
+    jobs: int,
+    max_parsed_files: int,
+    low_memory: bool,
+    library_timeout: float,
+    library_memory_limit: int | None,
+    cache_dir: str | None,
+    no_cache: bool,
+    profile: bool,
+    profile_output: str | None,
     file_path: str,
 ):
     """
@@ -422,6 +736,10 @@ def arguments(  # noqa: PLR0913
     Robot Framework localization is not supported. Any language other than English will produce
     unexpected results.
     """
+    from robotframework_find_unused.commands import ArgumentsOptions, command_arguments
+    from robotframework_find_unused.reporter.cli.argument_reporter import ArgumentCliReporter
+    from robotframework_find_unused.reporter.ndjson.argument_reporter import ArgumentNdjsonReporter
+
     options = ArgumentsOptions(
         source_path=file_path,
         deprecated_keywords=deprecated,
@@ -431,12 +749,29 @@ def arguments(  # noqa: PLR0913
         keyword_filter_glob=filter,
         show_all_count=show_count,
         verbose=verbose,
+        jobs=jobs,
+        library_timeout=library_timeout,
+        library_memory_limit=library_memory_limit,
+        cache_dir=None if no_cache else cache_dir,
+        discovery=discovery,
+        max_parsed_files=max_parsed_files,
+        low_memory=low_memory,
     )
     # Empty argv to prevent libraries from trying to interpret robotunused arguments
     sys.argv = [sys.argv[0]]
 
-    reporter = ArgumentCliReporter(options)
-    command_arguments(options, reporter)
+    reporter = (
+        ArgumentNdjsonReporter(options)
+        if output_format == "ndjson"
+        else ArgumentCliReporter(options)
+    )
+    run_command(
+        command_arguments,
+        options,
+        reporter,
+        profile=profile,
+        profile_output=profile_output,
+    )
 
 
 @cli.command(name="returns")
@@ -494,6 +829,14 @@ def arguments(  # noqa: PLR0913
     count=True,
     help="Show more log output. When provided twice: Show even more log output",
 )
+@format_option
+@discovery_option
+@cache_options
+@jobs_option
+@max_parsed_files_option
+@low_memory_option
+@library_options
+@profile_options
 @click.argument("file_path", default=".")
 def returns(  # noqa: PLR0913
     show_count: bool,
@@ -503,6 +846,17 @@ def returns(  # noqa: PLR0913
     library: FilterOption,
     unused: FilterOption,
     verbose: int,
+    output_format: str,
+    discovery: DiscoveryOption,
+    jobs: int,
+    max_parsed_files: int,
+    low_memory: bool,
+    library_timeout: float,
+    library_memory_limit: int | None,
+    cache_dir: str | None,
+    no_cache: bool,
+    profile: bool,
+    profile_output: str | None,
     file_path: str,
 ):
     """
@@ -530,6 +884,10 @@ def returns(  # noqa: PLR0913
     Robot Framework localization is not supported. Any language other than English will produce
     unexpected results.
     """
+    from robotframework_find_unused.commands import ReturnOptions, command_returns
+    from robotframework_find_unused.reporter.cli.return_reporter import ReturnCliReporter
+    from robotframework_find_unused.reporter.ndjson.return_reporter import ReturnNdjsonReporter
+
     options = ReturnOptions(
         source_path=file_path,
         deprecated_keywords=deprecated,
@@ -539,12 +897,27 @@ def returns(  # noqa: PLR0913
         keyword_filter_glob=filter,
         show_all_count=show_count,
         verbose=verbose,
+        jobs=jobs,
+        library_timeout=library_timeout,
+        library_memory_limit=library_memory_limit,
+        cache_dir=None if no_cache else cache_dir,
+        discovery=discovery,
+        max_parsed_files=max_parsed_files,
+        low_memory=low_memory,
     )
     # Empty argv to prevent libraries from trying to interpret robotunused arguments
     sys.argv = [sys.argv[0]]
 
-    reporter = ReturnCliReporter(options)
-    command_returns(options, reporter)
+    reporter = (
+        ReturnNdjsonReporter(options) if output_format == "ndjson" else ReturnCliReporter(options)
+    )
+    run_command(
+        command_returns,
+        options,
+        reporter,
+        profile=profile,
+        profile_output=profile_output,
+    )
 
 
 @cli.command(name="files")
@@ -639,6 +1012,15 @@ def returns(  # noqa: PLR0913
     count=True,
     help="Show more log output. When provided twice: Show even more log output",
 )
+@format_option
+@discovery_option
+@watch_option
+@cache_options
+@jobs_option
+@max_parsed_files_option
+@low_memory_option
+@library_options
+@profile_options
 @click.argument("file_path", default=".")
 def files(  # noqa: PLR0913
     show_count: bool,
@@ -652,6 +1034,18 @@ def files(  # noqa: PLR0913
     unused: FilterOption,
     pythonpath: list[str],
     verbose: int,
+    output_format: str,
+    discovery: DiscoveryOption,
+    watch: bool,
+    jobs: int,
+    max_parsed_files: int,
+    low_memory: bool,
+    library_timeout: float,
+    library_memory_limit: int | None,
+    cache_dir: str | None,
+    no_cache: bool,
+    profile: bool,
+    profile_output: str | None,
     file_path: str,
 ):
     """
@@ -722,6 +1116,10 @@ def files(  # noqa: PLR0913
     Robot Framework localization is not supported. Any language other than English will produce
     unexpected results.
     """
+    from robotframework_find_unused.commands import FileOptions, command_files
+    from robotframework_find_unused.reporter.cli.file_reporter import FileCliReporter
+    from robotframework_find_unused.reporter.ndjson.file_reporter import FileNdjsonReporter
+
     options = FileOptions(
         path_filter_glob=filter,
         show_all_count=show_count,
@@ -733,14 +1131,218 @@ def files(  # noqa: PLR0913
         tree_max_depth=tree_max_depth,
         tree_max_height=tree_max_height,
         verbose=verbose,
+        jobs=jobs,
+        library_timeout=library_timeout,
+        library_memory_limit=library_memory_limit,
+        cache_dir=None if no_cache else cache_dir,
+        discovery=discovery,
+        max_parsed_files=max_parsed_files,
+        low_memory=low_memory,
+        source_path=file_path,
+        pythonpath=pythonpath,
+        watch=watch,
+    )
+    if show_tree and output_format == "ndjson":
+        msg = "--show-tree is not supported with --format ndjson"
+        raise click.UsageError(msg)
+
+    # Empty argv to prevent libraries from trying to interpret robotunused arguments
+    sys.argv = [sys.argv[0]]
+
+    reporter = (
+        FileNdjsonReporter(options) if output_format == "ndjson" else FileCliReporter(options)
+    )
+    run_command(
+        command_files,
+        options,
+        reporter,
+        profile=profile,
+        profile_output=profile_output,
+    )
+
+
+@cli.command(name="all")
+@click.option(
+    "-c",
+    "--show-count",
+    default=False,
+    is_flag=True,
+    help="Output usage count for everything instead of only unused things",
+)
+@click.option(
+    "--pythonpath",
+    type=click.types.STRING,
+    default=[],
+    multiple=True,
+    show_default=False,
+    metavar="<path>",
+    envvar="PYTHONPATH",
+    help="""
+        Same as --pythonpath in Robotframework:
+        Additional locations (directories, ZIPs) where to
+        search libraries and other extensions when they are
+        imported. Multiple paths can be given by separating
+        them with a colon (`:`) or by using this option
+        several times. Given path can also be a glob pattern
+        matching multiple paths.
+    """,
+)
+@click.option(
+    "-v",
+    "--verbose",
+    default=0,
+    count=True,
+    help="Show more log output. When provided twice: Show even more log output",
+)
+@format_option
+@discovery_option
+@cache_options
+@jobs_option
+@max_parsed_files_option
+@low_memory_option
+@library_options
+@profile_options
+@click.argument("file_path", default=".")
+def all_commands(  # noqa: PLR0913
+    show_count: bool,
+    pythonpath: list[str],
+    verbose: int,
+    output_format: str,
+    discovery: DiscoveryOption,
+    jobs: int,
+    max_parsed_files: int,
+    low_memory: bool,
+    library_timeout: float,
+    library_memory_limit: int | None,
+    cache_dir: str | None,
+    no_cache: bool,
+    profile: bool,
+    profile_output: str | None,
+    file_path: str,
+):
+    """
+    Find all unused things
+
+    Run the commands keywords, arguments, returns, variables, and files at once. Files are
+    discovered and parsed only once, which is a lot faster than running the commands one by one.
+
+    Every command uses its default options. The exit code is the sum of the exit codes of all
+    commands. When any command fails, the exit code is 255.
+
+    ----------
+
+    Limitations
+
+    The limitations of every individual command apply. Use `--help` on individual commands for
+    details.
+    """
+    from robotframework_find_unused.commands import (
+        AllOptions,
+        ArgumentsOptions,
+        FileOptions,
+        KeywordOptions,
+        ReturnOptions,
+        VariableOptions,
+        command_all,
+    )
+    from robotframework_find_unused.reporter.cli.all_reporter import AllCliReporter
+    from robotframework_find_unused.reporter.ndjson.all_reporter import AllNdjsonReporter
+
+    cache_dir = None if no_cache else cache_dir
+    options = AllOptions(
+        keywords=KeywordOptions(
+            show_all_count=show_count,
+            deprecated_keywords="include",
+            private_keywords="include",
+            library_keywords="exclude",
+            unused_library_keywords="exclude",
+            keyword_filter_glob=None,
+            verbose=verbose,
+            source_path=file_path,
+            jobs=jobs,
+            library_timeout=library_timeout,
+            library_memory_limit=library_memory_limit,
+            cache_dir=cache_dir,
+        ),
+        arguments=ArgumentsOptions(
+            deprecated_keywords="include",
+            private_keywords="include",
+            library_keywords="exclude",
+            unused_keywords="exclude",
+            keyword_filter_glob=None,
+            show_all_count=show_count,
+            verbose=verbose,
+            source_path=file_path,
+            jobs=jobs,
+            library_timeout=library_timeout,
+            library_memory_limit=library_memory_limit,
+            cache_dir=cache_dir,
+        ),
+        returns=ReturnOptions(
+            show_all_count=show_count,
+            deprecated_keywords="include",
+            private_keywords="include",
+            library_keywords="exclude",
+            unused_keywords="exclude",
+            keyword_filter_glob=None,
+            verbose=verbose,
+            source_path=file_path,
+            jobs=jobs,
+            library_timeout=library_timeout,
+            library_memory_limit=library_memory_limit,
+            cache_dir=cache_dir,
+        ),
+        variables=VariableOptions(
+            show_all_count=show_count,
+            filter_glob=None,
+            verbose=verbose,
+            pythonpath=pythonpath,
+            source_path=file_path,
+            jobs=jobs,
+            library_timeout=library_timeout,
+            library_memory_limit=library_memory_limit,
+            cache_dir=cache_dir,
+        ),
+        files=FileOptions(
+            show_all_count=show_count,
+            library_files="include",
+            variable_files="include",
+            resource_files="include",
+            unused_files="include",
+            path_filter_glob=None,
+            show_tree=False,
+            tree_max_depth=0,
+            tree_max_height=0,
+            verbose=verbose,
+            source_path=file_path,
+            pythonpath=pythonpath,
+            jobs=jobs,
+            library_timeout=library_timeout,
+            library_memory_limit=library_memory_limit,
+            cache_dir=cache_dir,
+        ),
+        verbose=verbose,
         source_path=file_path,
         pythonpath=pythonpath,
+        jobs=jobs,
+        library_timeout=library_timeout,
+        library_memory_limit=library_memory_limit,
+        cache_dir=cache_dir,
+        discovery=discovery,
+        max_parsed_files=max_parsed_files,
+        low_memory=low_memory,
     )
     # Empty argv to prevent libraries from trying to interpret robotunused arguments
     sys.argv = [sys.argv[0]]
 
-    reporter = FileCliReporter(options)
-    command_files(options, reporter)
+    reporter = AllNdjsonReporter(options) if output_format == "ndjson" else AllCliReporter(options)
+    run_command(
+        command_all,
+        options,
+        reporter,
+        profile=profile,
+        profile_output=profile_output,
+    )
 
 
 def run_cli():
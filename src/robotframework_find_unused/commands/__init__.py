@@ -1,27 +1,62 @@
 """
 CLI frontend
+
+Commands are imported on first use. Importing them imports Robot Framework, which is slow.
 """
 
-from .arguments.arguments import command_arguments
-from .arguments.options import ArgumentsOptions
-from .files.files import command_files
-from .files.options import FileOptions
-from .keywords.keywords import command_keywords
-from .keywords.options import KeywordOptions
-from .returns.options import ReturnOptions
-from .returns.returns import command_returns
-from .variables.options import VariableOptions
-from .variables.variables import command_variables
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .all.all import command_all
+    from .all.options import AllOptions
+    from .arguments.arguments import command_arguments
+    from .arguments.options import ArgumentsOptions
+    from .files.files import command_files
+    from .files.options import FileOptions
+    from .keywords.keywords import command_keywords
+    from .keywords.options import KeywordOptions
+    from .returns.options import ReturnOptions
+    from .returns.returns import command_returns
+    from .variables.options import VariableOptions
+    from .variables.variables import command_variables
+
+_LAZY_IMPORTS = {
+    "AllOptions": ".all.options",
+    "ArgumentsOptions": ".arguments.options",
+    "FileOptions": ".files.options",
+    "KeywordOptions": ".keywords.options",
+    "ReturnOptions": ".returns.options",
+    "VariableOptions": ".variables.options",
+    "command_all": ".all.all",
+    "command_arguments": ".arguments.arguments",
+    "command_files": ".files.files",
+    "command_keywords": ".keywords.keywords",
+    "command_returns": ".returns.returns",
+    "command_variables": ".variables.variables",
+}
 
 __all__ = [
+    "AllOptions",
     "ArgumentsOptions",
     "FileOptions",
     "KeywordOptions",
     "ReturnOptions",
     "VariableOptions",
+    "command_all",
     "command_arguments",
     "command_files",
     "command_keywords",
     "command_returns",
     "command_variables",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name not in _LAZY_IMPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
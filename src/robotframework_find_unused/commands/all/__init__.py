@@ -0,0 +1,3 @@
+"""
+Run all commands
+"""
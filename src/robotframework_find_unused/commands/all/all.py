@@ -0,0 +1,167 @@
+"""
+Implementation of the 'all' command
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from robotframework_find_unused.commands.step.discover_files import step_discover_file_paths
+from robotframework_find_unused.commands.step.file_import_filter import step_filter_file_imports
+from robotframework_find_unused.commands.step.keyword_count_uses import (
+    append_unused_library_keywords,
+    step_count_keyword_uses,
+)
+from robotframework_find_unused.commands.step.keyword_definitions import (
+    step_get_custom_keyword_definitions,
+)
+from robotframework_find_unused.commands.step.keyword_filter import step_filter_keywords
+from robotframework_find_unused.commands.step.lib_keyword_definitions import (
+    step_get_downloaded_lib_keywords,
+)
+from robotframework_find_unused.commands.step.parse_file_use import step_parse_file_use
+from robotframework_find_unused.commands.step.parse_files import step_parse_files
+from robotframework_find_unused.commands.step.variables_count_uses import step_count_variable_uses
+from robotframework_find_unused.commands.step.variables_definitions import (
+    step_get_variable_definitions,
+)
+from robotframework_find_unused.common.file_discovery import apply_file_discovery
+from robotframework_find_unused.common.pythonpath import apply_pythonpath
+from robotframework_find_unused.parse.libdoc_cache import apply_libdoc_cache
+from robotframework_find_unused.parse.libdoc_worker import apply_libdoc_workers
+from robotframework_find_unused.parse.parse_cache import apply_parse_cache
+from robotframework_find_unused.parse.parse_robot_file import (
+    apply_max_parsed_files,
+    apply_parse_jobs,
+    apply_skip_sections,
+)
+from robotframework_find_unused.visitors.robot.file_facts import apply_low_memory
+
+if TYPE_CHECKING:
+    from robotframework_find_unused.common.const import KeywordData, LibraryData
+    from robotframework_find_unused.reporter.base.all_reporter import AllReporter
+
+    from .options import AllOptions
+
+
+def command_all(options: "AllOptions", reporter: "AllReporter") -> None:
+    """
+    Entry point for the CLI command 'all'
+
+    Runs the keywords, arguments, returns, variables, and files commands. Files are discovered and
+    parsed once. Keyword definitions and keyword uses are gathered once and shared between the
+    keywords, arguments, and returns reports.
+    """
+    reporter.on_command_start()
+
+    apply_pythonpath(options.pythonpath)
+    apply_parse_cache(options.cache_dir)
+    apply_libdoc_cache(options.cache_dir)
+    apply_parse_jobs(options.jobs)
+    apply_skip_sections(enabled=False)
+    apply_file_discovery(options.discovery)
+    apply_max_parsed_files(options.max_parsed_files)
+    apply_low_memory(enabled=options.low_memory)
+    apply_libdoc_workers(options.jobs, options.library_timeout, options.library_memory_limit)
+
+    file_paths = step_discover_file_paths(options.source_path, reporter=reporter)
+    if file_paths is None:
+        return
+
+    counted_keywords = None
+    downloaded_library_keywords: list[LibraryData] = []
+    with reporter.on_analysis("keywords"):
+        (counted_keywords, downloaded_library_keywords) = _count_keywords(
+            file_paths,
+            options,
+            reporter,
+        )
+        if counted_keywords is not None:
+            reporter.keywords.on_command_end(
+                step_filter_keywords(list(counted_keywords), reporter=reporter.keywords),
+            )
+
+    if counted_keywords is not None:
+        with reporter.on_analysis("arguments"):
+            keywords = list(counted_keywords)
+            if (
+                options.arguments.library_keywords != "exclude"
+                and options.arguments.unused_keywords != "exclude"
+            ):
+                keywords = append_unused_library_keywords(keywords, downloaded_library_keywords)
+
+            reporter.arguments.on_command_end(
+                step_filter_keywords(keywords, reporter=reporter.arguments),
+            )
+
+        with reporter.on_analysis("returns"):
+            keywords = list(counted_keywords)
+            if (
+                options.returns.library_keywords != "exclude"
+                and options.returns.unused_keywords != "exclude"
+            ):
+                keywords = append_unused_library_keywords(keywords, downloaded_library_keywords)
+
+            reporter.returns.on_command_end(
+                step_filter_keywords(keywords, reporter=reporter.returns),
+            )
+
+    with reporter.on_analysis("variables"):
+        variables = step_get_variable_definitions(
+            file_paths,
+            Path(options.source_path),
+            reporter=reporter.variables,
+        )
+        if len(variables) > 0:
+            counted_variables = step_count_variable_uses(
+                file_paths,
+                variables,
+                reporter=reporter.variables,
+            )
+            reporter.variables.on_command_end(counted_variables)
+
+    with reporter.on_analysis("files"):
+        files = step_parse_file_use(
+            file_paths,
+            Path(options.source_path),
+            reporter=reporter.files,
+        )
+        files = step_filter_file_imports(files, reporter=reporter.files)
+        reporter.files.on_command_end(files)
+
+    reporter.on_command_end()
+
+
+def _count_keywords(
+    file_paths: list[Path],
+    options: "AllOptions",
+    reporter: "AllReporter",
+) -> "tuple[list[KeywordData] | None, list[LibraryData]]":
+    """
+    Gather keyword definitions and count keyword uses once for all keyword reports.
+
+    Returns None instead of counted keywords when there is nothing to count.
+    """
+    files = step_parse_files(file_paths, reporter=reporter.keywords)
+
+    # Python keyword returns are only used by the returns report, but don't change anything else
+    keywords = step_get_custom_keyword_definitions(
+        files,
+        reporter=reporter.keywords,
+        enrich_py_keywords=True,
+    )
+    if len(keywords) == 0 and options.keywords.library_keywords == "exclude":
+        return (None, [])
+
+    downloaded_library_keywords = step_get_downloaded_lib_keywords(
+        file_paths,
+        reporter=reporter.keywords,
+        enrich_py_keywords=options.returns.library_keywords != "exclude",
+    )
+
+    counted_keywords = step_count_keyword_uses(
+        file_paths,
+        keywords,
+        downloaded_library_keywords,
+        reporter=reporter.keywords,
+    )
+    return (counted_keywords, downloaded_library_keywords)
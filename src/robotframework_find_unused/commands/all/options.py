@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+
+from robotframework_find_unused.commands.arguments.options import ArgumentsOptions
+from robotframework_find_unused.commands.files.options import FileOptions
+from robotframework_find_unused.commands.keywords.options import KeywordOptions
+from robotframework_find_unused.commands.returns.options import ReturnOptions
+from robotframework_find_unused.commands.variables.options import VariableOptions
+from robotframework_find_unused.common.const import DEFAULT_LIBRARY_TIMEOUT, DiscoveryOption
+
+
+@dataclass
+class AllOptions:
+    """
+    Command line options for the 'all' command
+    """
+
+    keywords: KeywordOptions
+    arguments: ArgumentsOptions
+    returns: ReturnOptions
+    variables: VariableOptions
+    files: FileOptions
+    verbose: int
+    source_path: str
+    pythonpath: list[str]
+    jobs: int
+    cache_dir: str | None
+    library_timeout: float = DEFAULT_LIBRARY_TIMEOUT
+    """Seconds before documenting a single library is stopped"""
+    library_memory_limit: int | None = None
+    """Memory limit in MB of every process that documents libraries"""
+    discovery: DiscoveryOption = "auto"
+    """How files are discovered"""
+    max_parsed_files: int = 0
+    """Max number of parsed files kept in memory. 0 keeps all files"""
+    low_memory: bool = False
+    """Keep compact facts about files in memory instead of parsed files"""
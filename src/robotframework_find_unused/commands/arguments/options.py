@@ -1,6 +1,10 @@
 from dataclasses import dataclass
 
-from robotframework_find_unused.common.const import FilterOption
+from robotframework_find_unused.common.const import (
+    DEFAULT_LIBRARY_TIMEOUT,
+    DiscoveryOption,
+    FilterOption,
+)
 
 
 @dataclass
@@ -17,3 +21,15 @@ class ArgumentsOptions:
     show_all_count: bool
     verbose: int
     source_path: str
+    jobs: int
+    cache_dir: str | None
+    library_timeout: float = DEFAULT_LIBRARY_TIMEOUT
+    """Seconds before documenting a single library is stopped"""
+    library_memory_limit: int | None = None
+    """Memory limit in MB of every process that documents libraries"""
+    discovery: DiscoveryOption = "auto"
+    """How files are discovered"""
+    max_parsed_files: int = 0
+    """Max number of parsed files kept in memory. 0 keeps all files"""
+    low_memory: bool = False
+    """Keep compact facts about files in memory instead of parsed files"""
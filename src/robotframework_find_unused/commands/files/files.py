@@ -8,10 +8,22 @@ from typing import TYPE_CHECKING
 from robotframework_find_unused.commands.step.discover_files import step_discover_file_paths
 from robotframework_find_unused.commands.step.file_import_filter import step_filter_file_imports
 from robotframework_find_unused.commands.step.parse_file_use import step_parse_file_use
+from robotframework_find_unused.commands.step.watch import step_watch_files
+from robotframework_find_unused.common.file_discovery import apply_file_discovery
 from robotframework_find_unused.common.pythonpath import apply_pythonpath
+from robotframework_find_unused.parse.libdoc_cache import apply_libdoc_cache
+from robotframework_find_unused.parse.libdoc_worker import apply_libdoc_workers
+from robotframework_find_unused.parse.parse_cache import apply_parse_cache
+from robotframework_find_unused.parse.parse_robot_file import (
+    apply_max_parsed_files,
+    apply_parse_jobs,
+    apply_skip_sections,
+)
+from robotframework_find_unused.reporter.base.file_reporter import FileReporter
+from robotframework_find_unused.visitors.robot.file_facts import apply_low_memory
 
 if TYPE_CHECKING:
-    from robotframework_find_unused.reporter.base.file_reporter import FileReporter
+    from robotframework_find_unused.common.const import FileUseData
 
     from .options import FileOptions
 
@@ -23,6 +35,14 @@ def command_files(options: "FileOptions", reporter: "FileReporter") -> None:
     reporter.on_command_start()
 
     apply_pythonpath(options.pythonpath)
+    apply_parse_cache(options.cache_dir)
+    apply_libdoc_cache(options.cache_dir)
+    apply_parse_jobs(options.jobs)
+    apply_skip_sections(enabled=True)
+    apply_file_discovery(options.discovery)
+    apply_max_parsed_files(options.max_parsed_files)
+    apply_low_memory(enabled=options.low_memory)
+    apply_libdoc_workers(options.jobs, options.library_timeout, options.library_memory_limit)
 
     file_paths = step_discover_file_paths(options.source_path, reporter=reporter)
     if file_paths is None:
@@ -37,3 +57,36 @@ def command_files(options: "FileOptions", reporter: "FileReporter") -> None:
     files = step_filter_file_imports(files, reporter=reporter)
 
     reporter.on_command_end(files)
+
+    if options.watch:
+        _watch_files(file_paths, files, options, reporter)
+
+
+def _watch_files(
+    file_paths: list[Path],
+    files: "list[FileUseData]",
+    options: "FileOptions",
+    reporter: "FileReporter",
+) -> None:
+    """
+    Keep watching for changes.
+
+    File imports are followed again for all files, but only changed files are parsed again.
+    """
+    # Updates are only reported as a difference. Don't output the steps.
+    silent_reporter = FileReporter(options)
+
+    def on_change(file_paths: list[Path], changed_paths: list[Path]) -> None:  # noqa: ARG001
+        nonlocal files
+
+        updated_files = step_parse_file_use(
+            file_paths,
+            Path(options.source_path),
+            reporter=silent_reporter,
+        )
+        updated_files = step_filter_file_imports(updated_files, reporter=silent_reporter)
+
+        reporter.on_watch_update(files, updated_files)
+        files = updated_files
+
+    step_watch_files(options.source_path, file_paths, on_change, reporter=reporter)
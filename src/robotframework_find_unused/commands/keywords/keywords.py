@@ -10,13 +10,36 @@ from robotframework_find_unused.commands.step.keyword_definitions import (
     step_get_custom_keyword_definitions,
 )
 from robotframework_find_unused.commands.step.keyword_filter import step_filter_keywords
+from robotframework_find_unused.commands.step.keyword_index import (
+    get_changed_index_files,
+    save_keyword_index,
+    step_count_keyword_uses_incremental,
+    step_load_keyword_index,
+    step_update_keyword_index,
+)
 from robotframework_find_unused.commands.step.lib_keyword_definitions import (
     step_get_downloaded_lib_keywords,
 )
-from robotframework_find_unused.commands.step.parse_files import step_parse_files_with_libdoc
+from robotframework_find_unused.commands.step.parse_files import step_parse_files
+from robotframework_find_unused.commands.step.watch import step_watch_files
+from robotframework_find_unused.common.file_discovery import apply_file_discovery
+from robotframework_find_unused.common.normalize import normalize_file_path
+from robotframework_find_unused.index.keyword_index import KeywordIndex
+from robotframework_find_unused.parse.libdoc_cache import apply_libdoc_cache
+from robotframework_find_unused.parse.libdoc_worker import apply_libdoc_workers
+from robotframework_find_unused.parse.parse_cache import apply_parse_cache
+from robotframework_find_unused.parse.parse_robot_file import (
+    apply_max_parsed_files,
+    apply_parse_jobs,
+    apply_skip_sections,
+)
+from robotframework_find_unused.reporter.base.keyword_reporter import KeywordReporter
+from robotframework_find_unused.visitors.robot.file_facts import apply_low_memory
 
 if TYPE_CHECKING:
-    from robotframework_find_unused.reporter.base.keyword_reporter import KeywordReporter
+    from pathlib import Path
+
+    from robotframework_find_unused.common.const import KeywordData
 
     from .options import KeywordOptions
 
@@ -27,28 +50,122 @@ def command_keywords(options: "KeywordOptions", reporter: "KeywordReporter") ->
     """
     reporter.on_command_start()
 
+    apply_parse_cache(options.cache_dir)
+    apply_libdoc_cache(options.cache_dir)
+    apply_parse_jobs(options.jobs)
+    apply_skip_sections(enabled=False)
+    apply_file_discovery(options.discovery)
+    apply_max_parsed_files(options.max_parsed_files)
+    apply_low_memory(enabled=options.low_memory)
+    apply_libdoc_workers(options.jobs, options.library_timeout, options.library_memory_limit)
+
     file_paths = step_discover_file_paths(options.source_path, reporter=reporter)
     if file_paths is None:
         return
 
-    files = step_parse_files_with_libdoc(file_paths, reporter=reporter)
+    if options.watch:
+        _watch_keywords(file_paths, options, reporter)
+        return
+
+    if options.incremental:
+        counted_keywords = step_count_keyword_uses_incremental(
+            file_paths,
+            options,
+            reporter=reporter,
+        )
+    else:
+        counted_keywords = _count_keyword_uses(file_paths, options, reporter)
+    if counted_keywords is None:
+        return
+
+    counted_keywords = step_filter_keywords(counted_keywords, reporter=reporter)
+
+    reporter.on_command_end(counted_keywords)
+
+
+def _count_keyword_uses(
+    file_paths: "list[Path]",
+    options: "KeywordOptions",
+    reporter: "KeywordReporter",
+) -> "list[KeywordData] | None":
+    """
+    Gather keyword definitions and count keyword uses in all files.
+
+    Returns None when there is nothing to count.
+    """
+    files = step_parse_files(file_paths, reporter=reporter)
 
     keywords = step_get_custom_keyword_definitions(files, reporter=reporter)
     if len(keywords) == 0 and options.library_keywords == "exclude":
-        return
+        return None
 
     downloaded_library_keywords = step_get_downloaded_lib_keywords(
         file_paths,
         reporter=reporter,
     )
 
-    counted_keywords = step_count_keyword_uses(
+    return step_count_keyword_uses(
         file_paths,
         keywords,
         downloaded_library_keywords,
         reporter=reporter,
     )
 
-    counted_keywords = step_filter_keywords(counted_keywords, reporter=reporter)
 
+def _watch_keywords(
+    file_paths: "list[Path]",
+    options: "KeywordOptions",
+    reporter: "KeywordReporter",
+) -> None:
+    """
+    Count keyword uses, then keep the keyword index in memory and update it when files change.
+
+    The index is persisted after every update when running incremental.
+    """
+    if options.incremental:
+        (index, changed_files) = step_load_keyword_index(file_paths, options, reporter=reporter)
+    else:
+        index = KeywordIndex(definitions_fingerprint=None, files={})
+        changed_files = get_changed_index_files(file_paths, index)
+
+    counted_keywords = step_update_keyword_index(
+        file_paths,
+        changed_files,
+        index,
+        options,
+        reporter=reporter,
+    )
+    if counted_keywords is None:
+        return
+    if options.incremental:
+        save_keyword_index(index, options)
+
+    counted_keywords = step_filter_keywords(counted_keywords, reporter=reporter)
     reporter.on_command_end(counted_keywords)
+
+    # Updates are only reported as a difference. Don't output the steps.
+    silent_reporter = KeywordReporter(options)
+
+    def on_change(file_paths: "list[Path]", changed_paths: "list[Path]") -> None:
+        nonlocal counted_keywords
+
+        changed_files = get_changed_index_files(
+            file_paths,
+            index,
+            {normalize_file_path(p) for p in changed_paths},
+        )
+        updated_keywords = step_update_keyword_index(
+            file_paths,
+            changed_files,
+            index,
+            options,
+            reporter=silent_reporter,
+        )
+        updated_keywords = step_filter_keywords(updated_keywords or [], reporter=silent_reporter)
+        if options.incremental:
+            save_keyword_index(index, options)
+
+        reporter.on_watch_update(counted_keywords, updated_keywords)
+        counted_keywords = updated_keywords
+
+    step_watch_files(options.source_path, file_paths, on_change, reporter=reporter)
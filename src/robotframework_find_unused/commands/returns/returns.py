@@ -5,7 +5,10 @@ Implementation of the 'returns' command
 from typing import TYPE_CHECKING
 
 from robotframework_find_unused.commands.step.discover_files import step_discover_file_paths
-from robotframework_find_unused.commands.step.keyword_count_uses import step_count_keyword_uses
+from robotframework_find_unused.commands.step.keyword_count_uses import (
+    append_unused_library_keywords,
+    step_count_keyword_uses,
+)
 from robotframework_find_unused.commands.step.keyword_definitions import (
     step_get_custom_keyword_definitions,
 )
@@ -13,7 +16,17 @@ from robotframework_find_unused.commands.step.keyword_filter import step_filter_
 from robotframework_find_unused.commands.step.lib_keyword_definitions import (
     step_get_downloaded_lib_keywords,
 )
-from robotframework_find_unused.commands.step.parse_files import step_parse_files_with_libdoc
+from robotframework_find_unused.commands.step.parse_files import step_parse_files
+from robotframework_find_unused.common.file_discovery import apply_file_discovery
+from robotframework_find_unused.parse.libdoc_cache import apply_libdoc_cache
+from robotframework_find_unused.parse.libdoc_worker import apply_libdoc_workers
+from robotframework_find_unused.parse.parse_cache import apply_parse_cache
+from robotframework_find_unused.parse.parse_robot_file import (
+    apply_max_parsed_files,
+    apply_parse_jobs,
+    apply_skip_sections,
+)
+from robotframework_find_unused.visitors.robot.file_facts import apply_low_memory
 
 if TYPE_CHECKING:
     from robotframework_find_unused.reporter.base.return_reporter import ReturnReporter
@@ -27,11 +40,20 @@ def command_returns(options: "ReturnOptions", reporter: "ReturnReporter") -> Non
     """
     reporter.on_command_start()
 
+    apply_parse_cache(options.cache_dir)
+    apply_libdoc_cache(options.cache_dir)
+    apply_parse_jobs(options.jobs)
+    apply_skip_sections(enabled=False)
+    apply_file_discovery(options.discovery)
+    apply_max_parsed_files(options.max_parsed_files)
+    apply_low_memory(enabled=options.low_memory)
+    apply_libdoc_workers(options.jobs, options.library_timeout, options.library_memory_limit)
+
     file_paths = step_discover_file_paths(options.source_path, reporter=reporter)
     if file_paths is None:
         return
 
-    files = step_parse_files_with_libdoc(file_paths, reporter=reporter)
+    files = step_parse_files(file_paths, reporter=reporter)
 
     keywords = step_get_custom_keyword_definitions(
         files,
@@ -55,11 +77,10 @@ def command_returns(options: "ReturnOptions", reporter: "ReturnReporter") -> Non
     )
 
     if options.library_keywords != "exclude" and options.unused_keywords != "exclude":
-        for lib in downloaded_library_keywords:
-            for kw in lib.keywords:
-                if kw in counted_keywords:
-                    continue
-                counted_keywords.append(kw)
+        counted_keywords = append_unused_library_keywords(
+            counted_keywords,
+            downloaded_library_keywords,
+        )
 
     counted_keywords = step_filter_keywords(counted_keywords, reporter=reporter)
 
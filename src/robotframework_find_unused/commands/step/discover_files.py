@@ -1,7 +1,12 @@
+import os
 from pathlib import Path
 
-import robocop
-
+from robotframework_find_unused.common.file_discovery import (
+    RobocopConfigFoundError,
+    discover_file_paths_native,
+    get_file_discovery,
+)
+from robotframework_find_unused.common.profiling import profile_step
 from robotframework_find_unused.reporter.base.partial.discover_files import (
     PartialReporter_DiscoverFiles,
 )
@@ -16,21 +21,16 @@ def step_discover_file_paths(
 ) -> list[Path] | None:
     """
     Get file paths recursively with Robocop excludes.
+
+    Without Robocop config file, files are found without Robocop. This is a lot faster.
     """
     reporter.on_discover_files_start(input_path)
 
-    if robocop.__version__.startswith("6.") or robocop.__version__.startswith("7."):
-        file_paths = _discover_file_paths_robocop_6_7(input_path)
-    else:
-        file_paths = _discover_file_paths_robocop(input_path)
-
-    sorted_file_paths = sorted(file_paths, key=lambda f: f)
-    sorted_file_paths = sorted(
-        sorted_file_paths,
-        key=lambda p: len(p.parts)
-        # __init__ files should always be before the files they apply to
-        + (-0.5 if p.stem == "__init__" else 0),
-    )
+    with profile_step("discover_files") as profile_items:
+        file_paths = _discover_file_paths(input_path)
+
+        sorted_file_paths = sorted(file_paths, key=_get_sort_key)
+        profile_items["files"] = len(sorted_file_paths)
 
     if len(sorted_file_paths) == 0:
         reporter.on_discover_files_fail(
@@ -43,6 +43,35 @@ def step_discover_file_paths(
     return sorted_file_paths
 
 
+def _get_sort_key(path: Path) -> tuple[float, list[str]]:
+    """
+    Sort by depth, then by path. Same as sorting by `len(path.parts)`, then by `path`.
+    """
+    # Faster than comparing paths
+    parts = os.path.normcase(path).split(os.sep)  # noqa: PTH206
+    # __init__ files should always be before the files they apply to
+    depth = len(parts) - (0.5 if path.stem == "__init__" else 0)
+    return (depth, parts)
+
+
+def _discover_file_paths(input_path: str) -> list[Path]:
+    discovery = get_file_discovery()
+    if discovery != "robocop":
+        try:
+            return discover_file_paths_native(
+                input_path,
+                allow_robocop_config=(discovery == "native"),
+            )
+        except RobocopConfigFoundError:
+            pass
+
+    import robocop
+
+    if robocop.__version__.startswith("6.") or robocop.__version__.startswith("7."):
+        return _discover_file_paths_robocop_6_7(input_path)
+    return _discover_file_paths_robocop(input_path)
+
+
 def _discover_file_paths_robocop_6_7(input_path: str) -> list[Path]:
     """
     Get file paths recursively with Robocop.
@@ -2,7 +2,7 @@
 Implementation of the 'files' command
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal, Optional
 
 from robotframework_find_unused.common.const import FileUseData
@@ -31,20 +31,23 @@ class FileImportTreeNode:
     depth: int
     branches: list["FileImportTreeNode"] | Literal["CIRCULAR", "MAX_DEPTH", "DEDUPED"]
     parent: Optional["FileImportTreeNode"]
+    _content_hash: int | None = field(default=None, repr=False, compare=False)
 
     def content_hash(self) -> int:
         """
         Hash the content, but not itself.
 
-        Use to find multiple nodes with same content.
+        Use to find multiple nodes with same content. Memoized: Don't change branches afterwards.
         """
-        if isinstance(self.branches, str):
-            return hash(self.data)
+        if self._content_hash is not None:
+            return self._content_hash
 
-        hashable = []
-        for branch in self.branches:
-            hashable.append(str(branch.content_hash()))
-        return hash("|".join(hashable))
+        if isinstance(self.branches, str):
+            self._content_hash = hash(self.data)
+        else:
+            hashable = [str(branch.content_hash()) for branch in self.branches]
+            self._content_hash = hash("|".join(hashable))
+        return self._content_hash
 
     def relative_path_to_parent(self) -> str:
         """
@@ -64,13 +67,29 @@ class FileImportTreeNode:
         return hash(hash(self.data) + self.content_hash())
 
 
+@dataclass
+class FileImportGraph:
+    """File imports compiled to integer-indexed adjacency lists"""
+
+    files: list[FileUseData]
+    index: dict[str, int]
+    """Index of every file, by file ID"""
+    imports: list[list[int]]
+    """Indexes of the files imported by every file"""
+    components: list[int]
+    """Strongly connected component of every file. Only files in the same component can import
+    each other in a circle."""
+    hashes: list[int]
+    """Hash of every file. Content hash of pruned nodes."""
+
+
 class FileImportTreeBuilder:
     """Build and output file import trees."""
 
     max_height: int
     max_depth: int
 
-    _tree_cache: dict[int, FileImportTreeNode]
+    _tree_cache: dict[tuple[int, ...], FileImportTreeNode]
 
     def __init__(self, max_depth: int = 5, max_height: int = 0) -> None:
         self.max_depth = max_depth
@@ -85,11 +104,11 @@ class FileImportTreeBuilder:
         """
         Build file import trees for each root file. Group root files with identical imports.
         """
-        file_imports_map = self.get_imports_of_files(files)
+        graph = self.get_import_graph(files)
 
         grouped_trees: dict[int, list[FileImportTreeNode]] = {}
         for root_file in root_files:
-            tree = self.build_single_file_tree(root_file, file_imports_map)
+            tree = self.build_single_file_tree(root_file, graph)
 
             tree_hash = tree.content_hash()
             if tree_hash not in grouped_trees:
@@ -100,73 +119,95 @@ class FileImportTreeBuilder:
 
     def build_single_file_tree(
         self,
-        cur_file: FileUseData,
-        file_imports: dict[str, list[FileUseData]],
-        *,
-        depth: int = 0,
-        visited_files_in_branch: list[str] | None = None,
-        runtime_file_scope: set[str] | None = None,
+        root_file: FileUseData,
+        graph: FileImportGraph,
     ) -> FileImportTreeNode:
         """
         Build file import tree for a single file.
+
+        Every file is expanded at most once per tree. Later imports of the same file are pruned.
         """
-        if visited_files_in_branch is None:
-            visited_files_in_branch = []
-        if runtime_file_scope is None:
-            runtime_file_scope = set()
+        root_index = graph.index[root_file.id]
+        root_imports = tuple(graph.imports[root_index])
+        if root_imports in self._tree_cache:
+            # We already built a tree with the same imports. Reuse the branches
+            node = FileImportTreeNode(
+                data=root_file,
+                depth=0,
+                branches=self._tree_cache[root_imports].branches,
+                parent=None,
+            )
+        else:
+            node = self._build_node(root_index, graph, 0, set(), set())
+            self._tree_cache[root_imports] = node
+        return node
 
+    def _build_node(
+        self,
+        file_index: int,
+        graph: FileImportGraph,
+        depth: int,
+        files_in_branch: set[int],
+        runtime_file_scope: set[int],
+    ) -> FileImportTreeNode:
+        """
+        Build the node of a file that is not pruned, including its branches.
+        """
         node = FileImportTreeNode(
-            data=cur_file,
+            data=graph.files[file_index],
             depth=depth,
             branches=[],
             parent=None,
         )
-
-        prune_reason = self._get_node_prune_reason(
-            node,
-            depth,
-            visited_files_in_branch,
-            runtime_file_scope,
-        )
-        if prune_reason is not None:
-            node.branches = prune_reason
-            return node
-
-        visited_files_in_branch = visited_files_in_branch.copy()
-        visited_files_in_branch.append(node.data.id)
-
-        runtime_file_scope.add(node.data.id)
-
-        cur_file_imports = file_imports.get(node.data.id, [])
-
-        cur_file_import_hash = hash("|".join([str(hash(i)) for i in cur_file_imports]))
-        if depth == 0 and cur_file_import_hash in self._tree_cache:
-            # We already built a tree with the same imports. Reuse the branches
-            node.branches = self._tree_cache[cur_file_import_hash].branches
-            return node
-
-        node.branches = []
-        for file_import in cur_file_imports:
-            branch_node = self.build_single_file_tree(
-                file_import,
-                file_imports,
-                depth=depth + 1,
-                visited_files_in_branch=visited_files_in_branch,
-                runtime_file_scope=runtime_file_scope,
+        files_in_branch.add(file_index)
+        runtime_file_scope.add(file_index)
+
+        branches: list[FileImportTreeNode] = []
+        branch_hashes: list[str] = []
+        for import_index in graph.imports[file_index]:
+            prune_reason = self._get_node_prune_reason(
+                import_index,
+                file_index,
+                graph,
+                depth + 1,
+                files_in_branch,
+                runtime_file_scope,
             )
+            if prune_reason is None:
+                branch_node = self._build_node(
+                    import_index,
+                    graph,
+                    depth + 1,
+                    files_in_branch,
+                    runtime_file_scope,
+                )
+            else:
+                # Pruned nodes are leaves. Don't recurse for them
+                branch_node = FileImportTreeNode(
+                    data=graph.files[import_index],
+                    depth=depth + 1,
+                    branches=prune_reason,
+                    parent=None,
+                    _content_hash=graph.hashes[import_index],
+                )
             branch_node.parent = node
-            node.branches.append(branch_node)
+            branches.append(branch_node)
+            branch_hashes.append(str(branch_node.content_hash()))
+        node.branches = branches
+        # Same as content_hash(), but bottom-up, so every node is hashed once
+        node._content_hash = hash("|".join(branch_hashes))  # noqa: SLF001
 
-        if depth == 0:
-            self._tree_cache[cur_file_import_hash] = node
+        files_in_branch.discard(file_index)
         return node
 
-    def _get_node_prune_reason(
+    def _get_node_prune_reason(  # noqa: PLR0913
         self,
-        node: FileImportTreeNode,
+        file_index: int,
+        parent_index: int,
+        graph: FileImportGraph,
         depth: int,
-        visited_files_in_branch: list[str],
-        runtime_file_scope: set[str],
+        files_in_branch: set[int],
+        runtime_file_scope: set[int],
     ) -> Literal["CIRCULAR", "MAX_DEPTH", "DEDUPED"] | None:
         """
         Why should the node be pruned or None.
@@ -174,27 +215,34 @@ class FileImportTreeBuilder:
         if self.max_depth > 0 and depth > self.max_depth:
             return "MAX_DEPTH"
 
-        if node.data.id in visited_files_in_branch:
+        if (
+            graph.components[parent_index] == graph.components[file_index]
+            and file_index in files_in_branch
+        ):
             return "CIRCULAR"
 
-        if node.data.id in runtime_file_scope:
+        if file_index in runtime_file_scope:
             return "DEDUPED"
 
         return None
 
-    def get_imports_of_files(self, files: list[FileUseData]) -> dict[str, list[FileUseData]]:
+    def get_import_graph(self, files: list[FileUseData]) -> FileImportGraph:
         """
-        Swap nodes and branches from imported_files -> file to file -> imported_files.
+        Compile file uses to an import graph. Swaps imported_file -> file to file -> imported_files.
         """
-        file_imports_map: dict[str, list[FileUseData]] = {}
-        for file in files:
-            file_imports_map[file.id] = []
-
-        for file in files:
+        index = {file.id: i for (i, file) in enumerate(files)}
+        imports: list[list[int]] = [[] for _ in files]
+        for i, file in enumerate(files):
             for using_file in file.used_by:
-                file_imports_map[using_file.file.id].append(file)
-
-        return file_imports_map
+                imports[index[using_file.file.id]].append(i)
+
+        return FileImportGraph(
+            files=files,
+            index=index,
+            imports=imports,
+            components=_get_strongly_connected_components(imports),
+            hashes=[hash(file) for file in files],
+        )
 
     def flatten_tree(self, tree: FileImportTreeNode) -> list[FileImportTreeNode]:
         """
@@ -236,3 +284,70 @@ class FileImportTreeBuilder:
             circular_count=circular_count,
             deduped_count=deduped_count,
         )
+
+
+def _get_strongly_connected_components(imports: list[list[int]]) -> list[int]:
+    """
+    Get the strongly connected component of every node with Tarjan's algorithm.
+    """
+    tarjan = _Tarjan(imports)
+    for start in range(len(imports)):
+        if tarjan.order[start] == -1:
+            tarjan.strong_connect(start)
+    return tarjan.components
+
+
+class _Tarjan:
+    """State of Tarjan's strongly connected components algorithm"""
+
+    def __init__(self, imports: list[list[int]]) -> None:
+        node_count = len(imports)
+        self.imports = imports
+        self.components = [-1] * node_count
+        self.order = [-1] * node_count
+        self.low_link = [0] * node_count
+        self.on_stack = [False] * node_count
+        self.stack: list[int] = []
+        self.next_order = 0
+        self.component_count = 0
+
+    def strong_connect(self, start: int) -> None:
+        """
+        Find the components of all nodes reachable from start.
+
+        Iterative, so deep import chains don't hit the recursion limit.
+        """
+        work = [(start, 0)]
+        while work:
+            (node, edge_index) = work.pop()
+            if edge_index == 0:
+                self.order[node] = self.low_link[node] = self.next_order
+                self.next_order += 1
+                self.stack.append(node)
+                self.on_stack[node] = True
+
+            if edge_index < len(self.imports[node]):
+                work.append((node, edge_index + 1))
+                target = self.imports[node][edge_index]
+                if self.order[target] == -1:
+                    work.append((target, 0))
+                elif self.on_stack[target]:
+                    self.low_link[node] = min(self.low_link[node], self.order[target])
+                continue
+
+            if self.low_link[node] == self.order[node]:
+                self._pop_component(node)
+            if work:
+                parent = work[-1][0]
+                self.low_link[parent] = min(self.low_link[parent], self.low_link[node])
+
+    def _pop_component(self, root: int) -> None:
+        """
+        Assign the members of the component to it. They are on top of the stack.
+        """
+        member = -1
+        while member != root:
+            member = self.stack.pop()
+            self.on_stack[member] = False
+            self.components[member] = self.component_count
+        self.component_count += 1
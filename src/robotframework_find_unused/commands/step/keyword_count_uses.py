@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING
 
 from robotframework_find_unused.commands.keywords.options import KeywordOptions
+from robotframework_find_unused.common.profiling import profile_step
+from robotframework_find_unused.convert.convert_keyword import get_library_keywords
 from robotframework_find_unused.visitors.robot import visit_robot_files
 from robotframework_find_unused.visitors.robot.keyword_visitor import RobotVisitorKeywords
 
@@ -25,21 +27,39 @@ def step_count_keyword_uses(
     """
     reporter.on_count_keyword_uses_start(file_paths, keywords, downloaded_libraries)
 
-    visitor = RobotVisitorKeywords(keywords, downloaded_libraries)
-    visit_robot_files(file_paths, visitor)
-    counted_keywords = list(visitor.keywords.values())
+    with profile_step("count_keyword_uses") as profile_items:
+        visitor = RobotVisitorKeywords(keywords, downloaded_libraries)
+        visit_robot_files(file_paths, visitor)
+        counted_keywords = list(visitor.keywords.values())
 
-    counted_keywords = _append_unused_keywords(counted_keywords, downloaded_libraries, reporter)
+        counted_keywords = append_requested_unused_library_keywords(
+            counted_keywords,
+            downloaded_libraries,
+            reporter,
+        )
+
+        profile_items["files"] = len(file_paths)
+        profile_items["keywords"] = len(counted_keywords)
+        profile_items["keyword_calls"] = sum(kw.use_count for kw in counted_keywords)
+        profile_items["resolution_cache_hits"] = visitor.kw_matcher.resolution_cache_hits
+        profile_items["resolution_cache_misses"] = visitor.kw_matcher.resolution_cache_misses
 
     reporter.on_count_keyword_uses_end(file_paths, keywords, downloaded_libraries, counted_keywords)
+    reporter.on_keyword_resolution_cache_stats(
+        visitor.kw_matcher.resolution_cache_hits,
+        visitor.kw_matcher.resolution_cache_misses,
+    )
     return counted_keywords
 
 
-def _append_unused_keywords(
+def append_requested_unused_library_keywords(
     counted_keywords: "list[KeywordData]",
     downloaded_libraries: "list[LibraryData]",
     reporter: "PartialReporter_CountKeywords",
 ) -> "list[KeywordData]":
+    """
+    Add the unused keywords of downloaded libraries when the options ask for them.
+    """
     if reporter.options.library_keywords == "exclude":
         return counted_keywords
 
@@ -49,10 +69,25 @@ def _append_unused_keywords(
     ):
         return counted_keywords
 
+    return append_unused_library_keywords(counted_keywords, downloaded_libraries)
+
+
+def append_unused_library_keywords(
+    counted_keywords: "list[KeywordData]",
+    downloaded_libraries: "list[LibraryData]",
+) -> "list[KeywordData]":
+    """
+    Add the keywords of downloaded libraries that are not yet counted. Those keywords are unused.
+
+    Library keywords are the same objects everywhere, so counted keywords are recognized by
+    identity. This avoids comparing every field of every counted keyword.
+    """
+    counted_ids = {id(kw) for kw in counted_keywords}
     for lib in downloaded_libraries:
-        for kw in lib.keywords:
-            if kw in counted_keywords:
+        for kw in get_library_keywords(lib):
+            if id(kw) in counted_ids:
                 continue
+            counted_ids.add(id(kw))
             counted_keywords.append(kw)
 
     return counted_keywords
@@ -3,6 +3,7 @@ from typing import cast
 from robot.libdocpkg.model import KeywordDoc, LibraryDoc
 
 from robotframework_find_unused.common.const import KeywordData
+from robotframework_find_unused.common.profiling import profile_step
 from robotframework_find_unused.convert.convert_keyword import libdoc_keyword_to_keyword_data
 from robotframework_find_unused.reporter.base.partial.keyword_definitions import (
     PartialReporter_CustomKeywordDefinitions,
@@ -23,10 +24,13 @@ def step_get_custom_keyword_definitions(
     """
     reporter.on_get_custom_keyword_definitions_start(files)
 
-    keywords = _get_custom_keyword_definitions(
-        files,
-        enrich_py_keywords=enrich_py_keywords,
-    )
+    with profile_step("get_custom_keyword_definitions") as profile_items:
+        keywords = _get_custom_keyword_definitions(
+            files,
+            enrich_py_keywords=enrich_py_keywords,
+        )
+        profile_items["files"] = len(files)
+        profile_items["keywords"] = len(keywords)
 
     reporter.on_get_custom_keyword_definitions_end(files, keywords)
     return keywords
@@ -0,0 +1,355 @@
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from robotframework_find_unused.commands.step.keyword_count_uses import (
+    append_requested_unused_library_keywords,
+)
+from robotframework_find_unused.commands.step.keyword_definitions import (
+    step_get_custom_keyword_definitions,
+)
+from robotframework_find_unused.commands.step.parse_files import step_parse_files
+from robotframework_find_unused.common.normalize import normalize_file_path
+from robotframework_find_unused.common.profiling import profile_step
+from robotframework_find_unused.index.changed_files import GitError, get_git_changed_files
+from robotframework_find_unused.index.keyword_index import (
+    KeywordIndex,
+    KeywordIndexFile,
+    KeywordIndexStore,
+    count_indexed_keyword_uses,
+    get_definitions_fingerprint,
+)
+from robotframework_find_unused.parse.parse_cache import hash_file_content
+from robotframework_find_unused.parse.parse_robot_file import parse_robot_file
+from robotframework_find_unused.visitors.robot import iter_robot_file_visits
+from robotframework_find_unused.visitors.robot.keyword_visitor.keyword_file_visitor import (
+    RobotVisitorKeywordsPerFile,
+)
+from robotframework_find_unused.visitors.robot.library_import import RobotVisitorLibraryImports
+
+if TYPE_CHECKING:
+    from robot.libdocpkg.model import LibraryDoc
+
+    from robotframework_find_unused.commands.keywords.options import KeywordOptions
+    from robotframework_find_unused.common.const import KeywordData, LibraryData
+    from robotframework_find_unused.reporter.base.keyword_reporter import KeywordReporter
+
+
+def step_count_keyword_uses_incremental(
+    file_paths: list[Path],
+    options: "KeywordOptions",
+    *,
+    reporter: "KeywordReporter",
+) -> "list[KeywordData] | None":
+    """
+    Count keyword uses with the persisted keyword index and keep the user up-to-date on progress.
+
+    Only .robot and .resource files that changed since the index was stored are parsed and counted
+    again. Returns None when there is nothing to count.
+    """
+    (index, changed_files) = step_load_keyword_index(file_paths, options, reporter=reporter)
+
+    counted_keywords = step_update_keyword_index(
+        file_paths,
+        changed_files,
+        index,
+        options,
+        reporter=reporter,
+    )
+    if counted_keywords is None:
+        return None
+
+    save_keyword_index(index, options)
+    return counted_keywords
+
+
+def step_load_keyword_index(
+    file_paths: list[Path],
+    options: "KeywordOptions",
+    *,
+    reporter: "KeywordReporter",
+) -> tuple[KeywordIndex, dict[str, Path]]:
+    """
+    Load the persisted keyword index and find out which files changed since it was stored.
+
+    Returns the index, and the changed .robot and .resource files keyed by normalized path.
+    """
+    reporter.on_keyword_index_load_start()
+    index = _get_store(options).load(options.source_path)
+    index_found = index is not None
+    if index is None:
+        index = KeywordIndex(definitions_fingerprint=None, files={})
+
+    listed_files = _get_listed_changed_files(options, reporter)
+    changed_files = get_changed_index_files(file_paths, index, listed_files)
+
+    robot_file_keys = {normalize_file_path(p) for p in _get_robot_file_paths(file_paths)}
+    deleted_files = [key for key in index.files if key not in robot_file_keys]
+    reporter.on_keyword_index_load_end(
+        index_found=index_found,
+        changed_files=list(changed_files.values()),
+        deleted_files=deleted_files,
+    )
+    return (index, changed_files)
+
+
+def save_keyword_index(index: KeywordIndex, options: "KeywordOptions") -> None:
+    """Persist the keyword index"""
+    _get_store(options).save(options.source_path, index)
+
+
+def step_update_keyword_index(
+    file_paths: list[Path],
+    changed_files: dict[str, Path],
+    index: KeywordIndex,
+    options: "KeywordOptions",
+    *,
+    reporter: "KeywordReporter",
+) -> "list[KeywordData] | None":
+    """
+    Update the keyword index for the changed files and keep the user up-to-date on progress.
+
+    Returns all keywords with their total uses. Returns None when there is nothing to count.
+    """
+    robot_file_paths = {normalize_file_path(p): p for p in _get_robot_file_paths(file_paths)}
+
+    files = _get_keyword_definitions(file_paths, changed_files, index, reporter)
+    keywords = step_get_custom_keyword_definitions(files, reporter=reporter)
+    if len(keywords) == 0 and options.library_keywords == "exclude":
+        return None
+
+    downloaded_libraries = _get_downloaded_lib_keywords(
+        file_paths,
+        robot_file_paths,
+        changed_files,
+        index,
+        reporter,
+    )
+
+    fingerprint = get_definitions_fingerprint(keywords, downloaded_libraries)
+    if index.definitions_fingerprint is not None and fingerprint != index.definitions_fingerprint:
+        reporter.on_keyword_index_definitions_changed()
+        for index_file in index.files.values():
+            index_file.keyword_uses = None
+    index.definitions_fingerprint = fingerprint
+
+    return _count_keyword_uses(
+        robot_file_paths,
+        keywords,
+        downloaded_libraries,
+        index,
+        reporter,
+    )
+
+
+def get_changed_index_files(
+    file_paths: list[Path],
+    index: KeywordIndex,
+    listed_files: set[str] | None = None,
+) -> dict[str, Path]:
+    """
+    Get the .robot and .resource files that must be analyzed again, keyed by normalized path.
+
+    Files that are not in the index are always changed. When a list of changed files (normalized
+    paths) is provided, it's trusted. Without a list, compares file contents.
+    """
+    changed_files: dict[str, Path] = {}
+    for file_path in _get_robot_file_paths(file_paths):
+        key = normalize_file_path(file_path)
+        index_file = index.files.get(key)
+        if index_file is None:
+            changed_files[key] = file_path
+        elif listed_files is not None:
+            if key in listed_files:
+                changed_files[key] = file_path
+        elif index_file.content_hash != hash_file_content(file_path):
+            changed_files[key] = file_path
+
+    return changed_files
+
+
+def _get_store(options: "KeywordOptions") -> KeywordIndexStore:
+    if options.cache_dir is None:
+        msg = "The keyword index requires a cache directory"
+        raise ValueError(msg)
+
+    return KeywordIndexStore(Path(options.cache_dir).absolute())
+
+
+def _get_robot_file_paths(file_paths: list[Path]) -> list[Path]:
+    return [p for p in file_paths if p.suffix in (".resource", ".robot")]
+
+
+def _get_listed_changed_files(
+    options: "KeywordOptions",
+    reporter: "KeywordReporter",
+) -> set[str] | None:
+    """
+    Get the user provided list of changed files as normalized paths.
+
+    Returns None when the user did not provide a list.
+    """
+    if options.changed_since is None and len(options.changed_files) == 0:
+        return None
+
+    listed_files = {normalize_file_path(p) for p in options.changed_files}
+    if options.changed_since is not None:
+        try:
+            changed = get_git_changed_files(options.changed_since, options.source_path)
+        except GitError as e:
+            reporter.on_keyword_index_changed_files_error(str(e))
+            return None
+        listed_files.update(normalize_file_path(p) for p in changed)
+
+    return listed_files
+
+
+def _get_keyword_definitions(
+    file_paths: list[Path],
+    changed_files: dict[str, Path],
+    index: KeywordIndex,
+    reporter: "KeywordReporter",
+) -> "list[LibraryDoc]":
+    """
+    Get the keyword definitions of all files.
+
+    Changed .robot and .resource files, and all Python files are parsed. The keyword definitions of
+    unchanged .robot and .resource files are taken from the index. Files that can't be parsed are
+    not indexed.
+    """
+    parse_file_paths = [
+        p
+        for p in file_paths
+        if normalize_file_path(p) in changed_files or p.suffix not in (".resource", ".robot")
+    ]
+    parsed_files = {
+        normalize_file_path(str(f.source)): f
+        for f in step_parse_files(parse_file_paths, reporter=reporter)
+    }
+
+    files: list[LibraryDoc] = []
+    indexed_files: dict[str, KeywordIndexFile] = {}
+    for file_path in file_paths:
+        key = normalize_file_path(file_path)
+        if key in changed_files and key in parsed_files:
+            indexed_files[key] = KeywordIndexFile(
+                content_hash=hash_file_content(file_path),
+                definitions=parsed_files[key],
+                library_imports=[],
+                keyword_uses=None,
+            )
+        elif key in index.files:
+            indexed_files[key] = index.files[key]
+
+        if key in indexed_files:
+            files.append(indexed_files[key].definitions)
+        elif key in parsed_files:
+            files.append(parsed_files[key])
+
+    # Drops deleted files and keeps the index in the order of the discovered files
+    index.files = indexed_files
+    return files
+
+
+def _get_downloaded_lib_keywords(
+    file_paths: list[Path],
+    robot_file_paths: dict[str, Path],
+    changed_files: dict[str, Path],
+    index: KeywordIndex,
+    reporter: "KeywordReporter",
+) -> "list[LibraryData]":
+    """
+    Gather keyword definitions from imported downloaded libraries.
+
+    Library imports of unchanged files are taken from the index.
+    """
+    reporter.on_get_downloaded_keyword_definitions_start(file_paths)
+
+    visitor = RobotVisitorLibraryImports(reporter)
+    for key, file_path in robot_file_paths.items():
+        index_file = index.files[key]
+        if key in changed_files:
+            visitor.visit(parse_robot_file(file_path))
+            index_file.library_imports = visitor.library_imports.get(file_path, [])
+            continue
+
+        for lib_name in index_file.library_imports:
+            visitor.register_downloaded_library(lib_name)
+    visitor.load_downloaded_libraries()
+
+    downloaded_libraries = list(visitor.downloaded_libraries.values())
+
+    reporter.on_get_downloaded_keyword_definitions_end(file_paths, downloaded_libraries)
+    return downloaded_libraries
+
+
+def _count_keyword_uses(
+    robot_file_paths: dict[str, Path],
+    keywords: "list[KeywordData]",
+    downloaded_libraries: "list[LibraryData]",
+    index: KeywordIndex,
+    reporter: "KeywordReporter",
+) -> "list[KeywordData]":
+    """
+    Count keyword uses in files without indexed keyword uses. Then add up the uses of all files.
+    """
+    count_file_paths = [
+        file_path
+        for key, file_path in robot_file_paths.items()
+        if index.files[key].keyword_uses is None
+    ]
+    reporter.on_count_keyword_uses_start(count_file_paths, keywords, downloaded_libraries)
+
+    with profile_step("count_keyword_uses") as profile_items:
+        visitor = RobotVisitorKeywordsPerFile(keywords, downloaded_libraries)
+        remaining = len(count_file_paths)
+        # Parse in parallel when configured. Visits files in the order of the visits below
+        with closing(iter_robot_file_visits(count_file_paths, visitor)) as visits:
+            for key, file_path in robot_file_paths.items():
+                if remaining == 0:
+                    break
+
+                index_file = index.files[key]
+                if index_file.keyword_uses is None:
+                    next(visits)
+                    index_file.keyword_uses = visitor.file_uses[file_path]
+                    remaining -= 1
+                    continue
+
+                # Calls to unknown keywords in earlier files are known keywords in later files.
+                # Register them to resolve keyword calls exactly like a full run does.
+                for use in index_file.keyword_uses.keywords.values():
+                    visitor.kw_matcher.get_keyword_definition(use.name)
+
+        counted_keywords = count_indexed_keyword_uses(
+            keywords,
+            downloaded_libraries,
+            (
+                index_file.keyword_uses
+                for index_file in index.files.values()
+                if index_file.keyword_uses is not None
+            ),
+        )
+        counted_keywords = append_requested_unused_library_keywords(
+            counted_keywords,
+            downloaded_libraries,
+            reporter,
+        )
+
+        profile_items["files"] = len(count_file_paths)
+        profile_items["keywords"] = len(counted_keywords)
+        profile_items["keyword_calls"] = sum(kw.use_count for kw in counted_keywords)
+        profile_items["resolution_cache_hits"] = visitor.kw_matcher.resolution_cache_hits
+        profile_items["resolution_cache_misses"] = visitor.kw_matcher.resolution_cache_misses
+
+    reporter.on_count_keyword_uses_end(
+        count_file_paths,
+        keywords,
+        downloaded_libraries,
+        counted_keywords,
+    )
+    reporter.on_keyword_resolution_cache_stats(
+        visitor.kw_matcher.resolution_cache_hits,
+        visitor.kw_matcher.resolution_cache_misses,
+    )
+    return counted_keywords
@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING
 
+from robotframework_find_unused.common.profiling import profile_step
+from robotframework_find_unused.parse.libdoc_cache import get_libdoc_cache
 from robotframework_find_unused.visitors.robot import visit_robot_files
 from robotframework_find_unused.visitors.robot.library_import import RobotVisitorLibraryImports
 
@@ -24,11 +26,23 @@ def step_get_downloaded_lib_keywords(
     """
     reporter.on_get_downloaded_keyword_definitions_start(file_paths)
 
-    robot_file_paths = [p for p in file_paths if p.suffix in (".resource", ".robot")]
+    cache = get_libdoc_cache()
+    (cache_hits, cache_misses) = (cache.hits, cache.misses) if cache else (0, 0)
 
-    visitor = RobotVisitorLibraryImports(reporter, enrich_py_keywords=enrich_py_keywords)
-    visit_robot_files(robot_file_paths, visitor)
-    downloaded_libraries = list(visitor.downloaded_libraries.values())
+    with profile_step("get_downloaded_lib_keywords") as profile_items:
+        robot_file_paths = [p for p in file_paths if p.suffix in (".resource", ".robot")]
+
+        visitor = RobotVisitorLibraryImports(reporter, enrich_py_keywords=enrich_py_keywords)
+        visit_robot_files(robot_file_paths, visitor)
+        visitor.load_downloaded_libraries()
+        downloaded_libraries = list(visitor.downloaded_libraries.values())
+
+        profile_items["files"] = len(robot_file_paths)
+        profile_items["libraries"] = len(downloaded_libraries)
+        profile_items["keywords"] = sum(len(lib.keyword_docs) for lib in downloaded_libraries)
+        if cache is not None:
+            profile_items["libdoc_cache_hits"] = cache.hits - cache_hits
+            profile_items["libdoc_cache_misses"] = cache.misses - cache_misses
 
     reporter.on_get_downloaded_keyword_definitions_end(file_paths, downloaded_libraries)
     return downloaded_libraries
@@ -2,6 +2,7 @@ from pathlib import Path
 
 from robotframework_find_unused.common.const import FileUseData, FileUsedByData, ResolvedFileImport
 from robotframework_find_unused.common.normalize import normalize_file_path
+from robotframework_find_unused.common.profiling import profile_step
 from robotframework_find_unused.reporter.base.file_reporter import FileReporter
 from robotframework_find_unused.visitors.robot import visit_robot_files
 from robotframework_find_unused.visitors.robot.file_import import RobotVisitorFileImports
@@ -13,7 +14,11 @@ def step_parse_file_use(file_paths: list[Path], source_path: Path, *, reporter:
     """
     reporter.on_count_file_uses_start(file_paths, source_path)
 
-    files = _count_file_uses(file_paths, source_path, reporter)
+    with profile_step("parse_file_use") as profile_items:
+        files = _count_file_uses(file_paths, source_path, reporter)
+
+        profile_items["files"] = len(file_paths)
+        profile_items["file_uses"] = sum(len(file.used_by) for file in files)
 
     reporter.on_count_file_uses_end(file_paths, source_path, files)
     return files
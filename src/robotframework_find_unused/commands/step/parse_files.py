@@ -2,23 +2,71 @@ from pathlib import Path
 
 from robot.libdocpkg.model import LibraryDoc
 
+from robotframework_find_unused.common.profiling import profile_step
 from robotframework_find_unused.parse.libdoc import parse_files_with_libdoc
+from robotframework_find_unused.parse.parse_cache import get_parse_cache
 from robotframework_find_unused.reporter.base.partial.parse_files import (
     PartialReporter_ParseFiles,
 )
+from robotframework_find_unused.visitors.robot import visit_robot_files
+from robotframework_find_unused.visitors.robot.keyword_definition import (
+    RobotVisitorKeywordDefinitions,
+)
 
 
-def step_parse_files_with_libdoc(
+def step_parse_files(
     file_paths: list[Path],
     *,
     reporter: PartialReporter_ParseFiles,
 ) -> list[LibraryDoc]:
     """
-    Parse files with libdoc and keep the user up-to-date on progress
+    Parse files and keep the user up-to-date on progress
+
+    Robot files are parsed with the Robot parser. The parsed models are reused when counting keyword
+    uses. Python files are parsed with LibDoc. Files that can't be parsed are reported as errors and
+    left out.
     """
     reporter.on_parse_files_start(file_paths)
 
-    (parsed_files, errors) = parse_files_with_libdoc(file_paths)
+    parse_cache = get_parse_cache()
+    (cache_hits, cache_misses) = (parse_cache.hits, parse_cache.misses) if parse_cache else (0, 0)
+
+    with profile_step("parse_files") as profile_items:
+        robot_file_paths = [p for p in file_paths if p.suffix in (".resource", ".robot")]
+        visitor = RobotVisitorKeywordDefinitions()
+        visit_robot_files(robot_file_paths, visitor)
+        robot_errors = {
+            p: visitor.errors[p.absolute()]
+            for p in robot_file_paths
+            if p.absolute() in visitor.errors
+        }
+        valid_robot_file_paths = [p for p in robot_file_paths if p not in robot_errors]
+        robot_files = dict(zip(valid_robot_file_paths, visitor.files, strict=True))
+
+        # Document all other files at once, so they are documented in parallel
+        parse_files_with_libdoc(
+            [p for p in file_paths if p not in robot_files and p not in robot_errors],
+        )
+
+        parsed_files: list[LibraryDoc] = []
+        errors: list[str] = []
+        for file_path in file_paths:
+            if file_path in robot_files:
+                parsed_files.append(robot_files[file_path])
+                continue
+            if file_path in robot_errors:
+                errors.append(robot_errors[file_path])
+                continue
+
+            (libdoc_files, libdoc_errors) = parse_files_with_libdoc([file_path])
+            parsed_files.extend(libdoc_files)
+            errors.extend(libdoc_errors)
+
+        profile_items["files"] = len(file_paths)
+        profile_items["errors"] = len(errors)
+        if parse_cache is not None:
+            profile_items["parse_cache_hits"] = parse_cache.hits - cache_hits
+            profile_items["parse_cache_misses"] = parse_cache.misses - cache_misses
 
     reporter.on_parse_files_end(file_paths, parsed_files, errors)
     return parsed_files
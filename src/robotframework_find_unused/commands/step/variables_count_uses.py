@@ -1,9 +1,18 @@
 from pathlib import Path
 
 from robotframework_find_unused.common.const import VariableData
+from robotframework_find_unused.common.profiling import profile_step
+from robotframework_find_unused.index.variable_index import (
+    VariableIndex,
+    count_indexed_variable_uses,
+    get_variable_definitions_fingerprint,
+)
 from robotframework_find_unused.reporter.base.variable_reporter import VariableReporter
 from robotframework_find_unused.visitors.robot import visit_robot_files
 from robotframework_find_unused.visitors.robot.variable_count import RobotVisitorVariableUses
+from robotframework_find_unused.visitors.robot.variable_file_count import (
+    RobotVisitorVariableUsesPerFile,
+)
 
 
 def step_count_variable_uses(
@@ -17,10 +26,64 @@ def step_count_variable_uses(
     """
     reporter.on_count_variable_uses_start(file_paths, variable_defs)
 
-    visitor = RobotVisitorVariableUses(variable_defs)
-    visit_robot_files(file_paths, visitor)
+    with profile_step("count_variable_uses") as profile_items:
+        visitor = RobotVisitorVariableUses(variable_defs)
+        visit_robot_files(file_paths, visitor)
 
-    variables = list(visitor.variables.values())
+        variables = list(visitor.variables.values())
+
+        profile_items["files"] = len(file_paths)
+        profile_items["variables"] = len(variables)
+        profile_items["variable_uses"] = sum(var.use_count for var in variables)
+
+    reporter.on_count_variable_uses_end(file_paths, variable_defs, variables)
+    return variables
+
+
+def step_update_variable_index(
+    file_paths: list[Path],
+    changed_files: list[Path],
+    variable_defs: dict[str, VariableData],
+    index: VariableIndex,
+    *,
+    reporter: VariableReporter,
+):
+    """
+    Count variable uses in changed files only and show progress
+
+    Variable uses of unchanged files are taken from the index. All files are counted when the
+    variable definitions changed.
+    """
+    reporter.on_count_variable_uses_start(file_paths, variable_defs)
+
+    with profile_step("count_variable_uses") as profile_items:
+        fingerprint = get_variable_definitions_fingerprint(variable_defs)
+        if fingerprint != index.definitions_fingerprint:
+            index.file_uses = {}
+        index.definitions_fingerprint = fingerprint
+
+        changed_file_set = set(changed_files)
+        count_file_paths = [
+            p for p in file_paths if p in changed_file_set or p not in index.file_uses
+        ]
+
+        visitor = RobotVisitorVariableUsesPerFile(variable_defs)
+        visit_robot_files(count_file_paths, visitor)
+
+        file_uses: dict[Path, dict[str, int]] = {}
+        for file_path in file_paths:
+            if file_path in visitor.file_uses:
+                file_uses[file_path] = visitor.file_uses[file_path]
+            elif file_path in index.file_uses:
+                file_uses[file_path] = index.file_uses[file_path]
+                count_indexed_variable_uses(variable_defs, [file_uses[file_path]])
+        index.file_uses = file_uses
+
+        variables = list(visitor.variables.values())
+
+        profile_items["files"] = len(count_file_paths)
+        profile_items["variables"] = len(variables)
+        profile_items["variable_uses"] = sum(var.use_count for var in variables)
 
     reporter.on_count_variable_uses_end(file_paths, variable_defs, variables)
     return variables
@@ -2,6 +2,7 @@ from pathlib import Path
 
 from robotframework_find_unused.common.const import VariableData
 from robotframework_find_unused.common.normalize import normalize_variable_name
+from robotframework_find_unused.common.profiling import profile_step
 from robotframework_find_unused.reporter.base.variable_reporter import VariableReporter
 from robotframework_find_unused.resolve.resolve_variables import resolve_variable_name
 from robotframework_find_unused.visitors.robot import visit_robot_files
@@ -21,10 +22,14 @@ def step_get_variable_definitions(
     """
     reporter.on_get_variable_definitions_start(file_paths, source_path)
 
-    visitor = RobotVisitorVariableDefinitions(source_path, set(file_paths), reporter)
-    visit_robot_files(file_paths, visitor)
+    with profile_step("get_variable_definitions") as profile_items:
+        visitor = RobotVisitorVariableDefinitions(source_path, set(file_paths), reporter)
+        visit_robot_files(file_paths, visitor)
 
-    variables = _resolve_vars_in_var_name(visitor.variables)
+        variables = _resolve_vars_in_var_name(visitor.variables)
+
+        profile_items["files"] = len(file_paths)
+        profile_items["variables"] = len(variables)
 
     reporter.on_get_variable_definitions_end(file_paths, source_path, variables)
     return variables
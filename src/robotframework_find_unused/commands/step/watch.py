@@ -0,0 +1,98 @@
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from robotframework_find_unused.commands.step.discover_files import step_discover_file_paths
+from robotframework_find_unused.common.file_watcher import FileWatcher
+from robotframework_find_unused.common.path import path_exists
+from robotframework_find_unused.common.pythonpath import forget_python_module
+from robotframework_find_unused.parse.libdoc import forget_libdoc_file
+from robotframework_find_unused.parse.parse_robot_file import forget_robot_file
+from robotframework_find_unused.reporter.base.partial.discover_files import (
+    PartialReporter_DiscoverFiles,
+)
+from robotframework_find_unused.reporter.base.partial.watch import PartialReporter_Watch
+from robotframework_find_unused.visitors.robot.file_facts_visitor import forget_file_facts
+
+# Files are polled less often while nothing changes, because every poll checks all files
+POLL_INTERVAL_SECONDS = 0.5
+SETTLE_INTERVAL_SECONDS = 0.05
+
+
+def step_watch_files(
+    source_path: str,
+    file_paths: list[Path],
+    on_change: Callable[[list[Path], list[Path]], None],
+    *,
+    reporter: PartialReporter_Watch,
+) -> None:
+    """
+    Watch files for changes until the user stops and keep the user up-to-date on changes.
+
+    Calls `on_change` with all discovered files and the changed files. Changed files are parsed
+    again, unchanged files are not.
+    """
+    watcher = FileWatcher(Path(source_path))
+    watcher.watch(file_paths)
+
+    reporter.on_watch_start(file_paths)
+    try:
+        while True:
+            (changed_files, directories_changed) = _wait_for_changes(watcher)
+
+            if directories_changed:
+                # Files may have been added or removed. Discover files silently.
+                path_exists.cache_clear()
+                discovered = step_discover_file_paths(
+                    source_path,
+                    reporter=PartialReporter_DiscoverFiles(reporter.options),
+                )
+                discovered = discovered or []
+                changed_files.update(set(discovered).symmetric_difference(file_paths))
+
+                file_paths = discovered
+                watcher.watch(file_paths)
+
+            if len(changed_files) == 0:
+                continue
+
+            sorted_changed_files = sorted(changed_files)
+            for path in sorted_changed_files:
+                _forget_file(path)
+
+            reporter.on_watch_change(sorted_changed_files)
+            on_change(file_paths, sorted_changed_files)
+    except KeyboardInterrupt:
+        reporter.on_watch_end()
+
+
+def _wait_for_changes(watcher: FileWatcher) -> tuple[set[Path], bool]:
+    """
+    Block until files changed.
+
+    Waits until files stop changing to handle editors that save files in multiple steps. Returns
+    within `POLL_INTERVAL_SECONDS + SETTLE_INTERVAL_SECONDS` after the last change.
+    """
+    changed_files: set[Path] = set()
+    directories_changed = False
+    while True:
+        settling = len(changed_files) > 0 or directories_changed
+        time.sleep(SETTLE_INTERVAL_SECONDS if settling else POLL_INTERVAL_SECONDS)
+
+        (files, directories) = watcher.poll()
+        if len(files) == 0 and not directories:
+            if len(changed_files) > 0 or directories_changed:
+                return (changed_files, directories_changed)
+            continue
+
+        changed_files.update(files)
+        directories_changed = directories_changed or directories
+
+
+def _forget_file(file_path: Path) -> None:
+    """Forget everything parsed from the file"""
+    forget_robot_file(file_path)
+    forget_file_facts(file_path)
+    forget_libdoc_file(file_path)
+    if file_path.suffix == ".py":
+        forget_python_module(file_path)
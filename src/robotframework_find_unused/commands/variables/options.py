@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from robotframework_find_unused.common.const import DEFAULT_LIBRARY_TIMEOUT, DiscoveryOption
+
 
 @dataclass
 class VariableOptions:
@@ -12,3 +14,17 @@ class VariableOptions:
     verbose: int
     pythonpath: list[str]
     source_path: str
+    jobs: int
+    cache_dir: str | None
+    watch: bool = False
+    """Keep running and analyze changed files again"""
+    library_timeout: float = DEFAULT_LIBRARY_TIMEOUT
+    """Seconds before documenting a single library is stopped"""
+    library_memory_limit: int | None = None
+    """Memory limit in MB of every process that documents libraries"""
+    discovery: DiscoveryOption = "auto"
+    """How files are discovered"""
+    max_parsed_files: int = 0
+    """Max number of parsed files kept in memory. 0 keeps all files"""
+    low_memory: bool = False
+    """Keep compact facts about files in memory instead of parsed files"""
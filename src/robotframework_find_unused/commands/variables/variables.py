@@ -6,15 +6,29 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from robotframework_find_unused.commands.step.discover_files import step_discover_file_paths
-from robotframework_find_unused.commands.step.variables_count_uses import step_count_variable_uses
+from robotframework_find_unused.commands.step.variables_count_uses import (
+    step_count_variable_uses,
+    step_update_variable_index,
+)
 from robotframework_find_unused.commands.step.variables_definitions import (
     step_get_variable_definitions,
 )
+from robotframework_find_unused.commands.step.watch import step_watch_files
+from robotframework_find_unused.common.file_discovery import apply_file_discovery
 from robotframework_find_unused.common.pythonpath import apply_pythonpath
+from robotframework_find_unused.index.variable_index import VariableIndex
+from robotframework_find_unused.parse.libdoc_cache import apply_libdoc_cache
+from robotframework_find_unused.parse.libdoc_worker import apply_libdoc_workers
+from robotframework_find_unused.parse.parse_cache import apply_parse_cache
+from robotframework_find_unused.parse.parse_robot_file import (
+    apply_max_parsed_files,
+    apply_parse_jobs,
+    apply_skip_sections,
+)
+from robotframework_find_unused.reporter.base.variable_reporter import VariableReporter
+from robotframework_find_unused.visitors.robot.file_facts import apply_low_memory
 
 if TYPE_CHECKING:
-    from robotframework_find_unused.reporter.base.variable_reporter import VariableReporter
-
     from .options import VariableOptions
 
 
@@ -25,11 +39,23 @@ def command_variables(options: "VariableOptions", reporter: "VariableReporter")
     reporter.on_command_start()
 
     apply_pythonpath(options.pythonpath)
+    apply_parse_cache(options.cache_dir)
+    apply_libdoc_cache(options.cache_dir)
+    apply_parse_jobs(options.jobs)
+    apply_skip_sections(enabled=False)
+    apply_file_discovery(options.discovery)
+    apply_max_parsed_files(options.max_parsed_files)
+    apply_low_memory(enabled=options.low_memory)
+    apply_libdoc_workers(options.jobs, options.library_timeout, options.library_memory_limit)
 
     file_paths = step_discover_file_paths(options.source_path, reporter=reporter)
     if file_paths is None:
         return
 
+    if options.watch:
+        _watch_variables(file_paths, options, reporter)
+        return
+
     variables = step_get_variable_definitions(
         file_paths,
         Path(options.source_path),
@@ -45,3 +71,57 @@ def command_variables(options: "VariableOptions", reporter: "VariableReporter")
     )
 
     reporter.on_command_end(variables)
+
+
+def _watch_variables(
+    file_paths: list[Path],
+    options: "VariableOptions",
+    reporter: "VariableReporter",
+) -> None:
+    """
+    Count variable uses, then keep watching for changes.
+
+    The variable uses of every file are kept in memory. Only changed files are counted again.
+    """
+    index = VariableIndex(definitions_fingerprint=None, file_uses={})
+
+    variable_defs = step_get_variable_definitions(
+        file_paths,
+        Path(options.source_path),
+        reporter=reporter,
+    )
+    if len(variable_defs) == 0:
+        return
+
+    variables = step_update_variable_index(
+        file_paths,
+        [],
+        variable_defs,
+        index,
+        reporter=reporter,
+    )
+    reporter.on_command_end(variables)
+
+    # Updates are only reported as a difference. Don't output the steps.
+    silent_reporter = VariableReporter(options)
+
+    def on_change(file_paths: list[Path], changed_paths: list[Path]) -> None:
+        nonlocal variables
+
+        variable_defs = step_get_variable_definitions(
+            file_paths,
+            Path(options.source_path),
+            reporter=silent_reporter,
+        )
+        updated_variables = step_update_variable_index(
+            file_paths,
+            changed_paths,
+            variable_defs,
+            index,
+            reporter=silent_reporter,
+        )
+
+        reporter.on_watch_update(variables, updated_variables)
+        variables = updated_variables
+
+    step_watch_files(options.source_path, file_paths, on_change, reporter=reporter)
@@ -1,27 +1,33 @@
 import re
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal, TypeAlias
+from typing import TYPE_CHECKING, Literal, TypeAlias
 
-import robot.errors
-from robot.libdocpkg.model import ArgumentSpec
+if TYPE_CHECKING:
+    # Importing Robot Framework is slow. Not needed at runtime.
+    import robot.errors
+    from robot.libdocpkg.model import ArgumentSpec
 
 VERBOSE_NO = 0
 VERBOSE_SINGLE = 1
 VERBOSE_DOUBLE = 2
 
+DEFAULT_LIBRARY_TIMEOUT = 60.0
+"""Seconds before documenting a single library is stopped"""
+
 FilterOption: TypeAlias = Literal["include", "exclude", "only"]
+DiscoveryOption: TypeAlias = Literal["auto", "robocop", "native"]
 
 
-@dataclass
+@dataclass(slots=True)
 class KeywordData:
     """Data structure for Keywords"""
 
     name: str
     normalized_name: str
-    name_parts: list[str]
-    name_match_pattern: re.Pattern | None
+    name_parts: tuple[str, ...]
+    """Keyword name cut into parts. Embedded arguments are `__VARIABLE__`."""
     type: Literal[
         "CUSTOM_SUITE",
         "CUSTOM_LIBRARY",
@@ -39,14 +45,38 @@ class KeywordData:
     return_use_count: int
     """If the keyword returns, how often is the return used during keyword call?"""
 
-    arguments: ArgumentSpec | None
+    arguments: "ArgumentSpec | None"
     library: str
 
+    _name_match_pattern: re.Pattern | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    @property
+    def name_match_pattern(self) -> re.Pattern | None:
+        """
+        Regex pattern that matches calls to the keyword. None without embedded arguments.
+
+        Compiled on first use. Most keywords are never matched with a pattern.
+        """
+        if len(self.name_parts) <= 1:
+            return None
+
+        if self._name_match_pattern is None:
+            pattern = "".join(
+                ".+?" if part == "__VARIABLE__" else re.escape(part) for part in self.name_parts
+            )
+            self._name_match_pattern = re.compile(f"^{pattern}$")
+        return self._name_match_pattern
+
 
 VariableDefinedInType: TypeAlias = Literal["variables_section", "variable_file", "runtime"]
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableValue:
     """Data structure for Variable resolution"""
 
@@ -54,7 +84,7 @@ class VariableValue:
     value: Iterable[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableData(VariableValue):
     """Data structure for Variables"""
 
@@ -66,18 +96,36 @@ class VariableData(VariableValue):
     defined_in: str
 
 
-@dataclass
+@dataclass(slots=True)
+class LibraryKeywordDoc:
+    """
+    Compact data structure for a keyword of a downloaded library.
+
+    Converted to `KeywordData` when the keyword is used. Most library keywords never are.
+    """
+
+    name: str
+    library: str
+    deprecated: bool
+    private: bool
+    returns: None | bool
+    arguments: "ArgumentSpec"
+
+
+@dataclass(slots=True)
 class LibraryData:
     """Data structure for Library keywords"""
 
     name: str
     name_normalized: str
-    keywords: list[KeywordData]
-    keyword_names_normalized: set[str]
-    import_error: Literal[False] | robot.errors.DataError
+    keyword_docs: dict[str, LibraryKeywordDoc]
+    """All keywords of the library, keyed by normalized name"""
+    import_error: "Literal[False] | robot.errors.DataError"
+    keywords: dict[str, KeywordData] = field(default_factory=dict)
+    """Keywords converted to `KeywordData` so far, keyed by normalized name"""
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedFileImport:
     """Data structure for resolved file imports"""
 
@@ -91,7 +139,7 @@ class ResolvedFileImport:
     path: Path
 
 
-@dataclass
+@dataclass(slots=True)
 class FileUseData:
     """Data structure for file imports"""
 
@@ -114,7 +162,7 @@ FileUseType: TypeAlias = Literal[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class FileUsedByData:
     """Data structure for which file is using a file."""
 
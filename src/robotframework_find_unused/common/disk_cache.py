@@ -0,0 +1,177 @@
+import contextlib
+import hashlib
+import io
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# 512 MiB
+DEFAULT_MAX_CACHE_SIZE = 512 * 1024 * 1024
+
+# After eviction, the cache is at most this fraction of the maximum size. Prevents evicting on
+# every single write once the cache is full.
+EVICTION_LOW_WATERMARK = 0.8
+
+CACHE_ENTRY_SUFFIX = ".pickle"
+
+
+@dataclass
+class DiskCacheEntry:
+    """Data structure for a single file in the disk cache"""
+
+    path: Path
+    size: int
+    mtime_ns: int
+
+
+class DiskCache:
+    """
+    Persistent key-value store in a directory on disk.
+
+    Every user of the cache gets its own namespace: A subdirectory of the cache directory. Values
+    are pickled. Entries are evicted least recently used first when the total size of the
+    stored entries grows beyond `max_size` bytes.
+    """
+
+    cache_directory: Path
+    directory: Path
+    max_size: int
+
+    _size: int | None
+
+    def __init__(
+        self,
+        cache_directory: Path,
+        namespace: str,
+        max_size: int = DEFAULT_MAX_CACHE_SIZE,
+    ) -> None:
+        self.cache_directory = cache_directory
+        self.directory = cache_directory.joinpath(namespace)
+        self.max_size = max_size
+        self._size = None
+
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        """
+        Get a value from the cache. Returns None when the key is not cached.
+        """
+        entry_path = self._get_entry_path(key)
+        try:
+            with entry_path.open("rb") as f:
+                value = pickle.load(f)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: BLE001
+            # Corrupt or incompatible entry. Treat as not cached.
+            self._remove_entry(entry_path)
+            return None
+
+        # Bump recency for least recently used eviction
+        with contextlib.suppress(OSError):
+            os.utime(entry_path)
+
+        return value
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """
+        Store a value in the cache.
+        """
+        buffer = io.BytesIO()
+        self._get_pickler(buffer).dump(value)
+        data = buffer.getvalue()
+
+        self._ensure_directory()
+        entry_path = self._get_entry_path(key)
+        old_entry_size = self._get_entry_size(entry_path)
+
+        # Write to a temporary file first. Concurrent readers never see a half written entry.
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(entry_path)
+
+        self._size = self.get_size() - old_entry_size + len(data)
+        if self._size > self.max_size:
+            self.evict()
+
+    def evict(self, target_size: int | None = None) -> None:
+        """
+        Remove least recently used entries until the cache is at most `target_size` bytes.
+        """
+        if target_size is None:
+            target_size = int(self.max_size * EVICTION_LOW_WATERMARK)
+
+        entries = sorted(self._scan_entries(), key=lambda entry: entry.mtime_ns)
+
+        size = sum(entry.size for entry in entries)
+        for entry in entries:
+            if size <= target_size:
+                break
+            size -= entry.size
+            self._remove_entry(entry.path)
+
+        self._size = size
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+        self.evict(target_size=0)
+
+    def get_size(self) -> int:
+        """
+        Get the total size of all cache entries in bytes.
+        """
+        if self._size is None:
+            self._size = sum(entry.size for entry in self._scan_entries())
+        return self._size
+
+    def _get_pickler(self, file: io.BytesIO) -> pickle.Pickler:
+        return pickle.Pickler(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _get_entry_path(self, key: str) -> Path:
+        key_hash = hashlib.sha256(key.encode("utf8")).hexdigest()
+        return self.directory.joinpath(key_hash + CACHE_ENTRY_SUFFIX)
+
+    def _get_entry_size(self, entry_path: Path) -> int:
+        try:
+            return entry_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _scan_entries(self) -> list["DiskCacheEntry"]:
+        entries: list[DiskCacheEntry] = []
+        try:
+            with os.scandir(self.directory) as it:
+                for dir_entry in it:
+                    if not dir_entry.name.endswith(CACHE_ENTRY_SUFFIX):
+                        continue
+                    try:
+                        stat = dir_entry.stat()
+                    except FileNotFoundError:
+                        # Removed by a concurrent process
+                        continue
+                    entries.append(
+                        DiskCacheEntry(
+                            path=Path(dir_entry.path),
+                            size=stat.st_size,
+                            mtime_ns=stat.st_mtime_ns,
+                        ),
+                    )
+        except FileNotFoundError:
+            return []
+        return entries
+
+    def _remove_entry(self, entry_path: Path) -> None:
+        entry_path.unlink(missing_ok=True)
+
+    def _ensure_directory(self) -> None:
+        if self.directory.is_dir():
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Keep cache files out of version control
+        gitignore_path = self.cache_directory.joinpath(".gitignore")
+        if not gitignore_path.exists():
+            gitignore_path.write_text("# Automatically created by robotunused\n*\n")
@@ -0,0 +1,190 @@
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pathspec
+
+from robotframework_find_unused.common.const import DiscoveryOption
+
+FILE_SUFFIXES = {".robot", ".resource", ".py"}
+
+# Same as the default excludes of Robocop
+DEFAULT_EXCLUDED_NAMES = {
+    ".direnv",
+    ".eggs",
+    ".git",
+    ".svn",
+    ".hg",
+    ".nox",
+    ".tox",
+    ".venv",
+    "venv",
+    "dist",
+}
+
+# Files Robocop reads its configuration from
+ROBOCOP_CONFIG_NAMES = ("robocop.toml", "robot.toml", "pyproject.toml")
+
+# Path of the walked directory relative to the directory of the gitignore, and the gitignore
+GitIgnore = tuple[str, pathspec.GitIgnoreSpec]
+
+_discovery: DiscoveryOption = "auto"
+
+
+def apply_file_discovery(discovery: DiscoveryOption) -> None:
+    """
+    Set how files are discovered.
+
+    - `robocop`: Use Robocop, which applies the file filters of Robocop config files
+    - `native`: Walk the file system. Ignores Robocop config files
+    - `auto`: Walk the file system, unless a Robocop config file applies to the files
+    """
+    global _discovery  # noqa: PLW0603
+    _discovery = discovery
+
+
+def get_file_discovery() -> DiscoveryOption:
+    """
+    Get how files are discovered.
+    """
+    return _discovery
+
+
+class RobocopConfigFoundError(Exception):
+    """A Robocop config file applies to the discovered files"""
+
+
+def discover_file_paths_native(input_path: str, *, allow_robocop_config: bool) -> list[Path]:
+    """
+    Get file paths recursively with `os.scandir`. Mimics Robocop without config file.
+
+    Skips default excludes and files ignored by `.gitignore` files. Raises
+    `RobocopConfigFoundError` when a Robocop config file is found and that is not allowed.
+    """
+    source = Path(input_path)
+    resolved_source = source.resolve()
+    if not allow_robocop_config and _has_parent_robocop_config(resolved_source):
+        raise RobocopConfigFoundError
+
+    if not resolved_source.is_dir():
+        # Paths passed directly are not filtered
+        return [resolved_source] if resolved_source.is_file() else []
+
+    gitignores = _get_parent_gitignores(resolved_source)
+    file_paths = _walk(
+        resolved_source,
+        gitignores,
+        allow_robocop_config=allow_robocop_config,
+        visited={resolved_source},
+    )
+    # Symlinks can lead to the same file more than once
+    return [Path(file_path) for file_path in dict.fromkeys(file_paths)]
+
+
+def _walk(
+    directory: Path,
+    gitignores: list[GitIgnore],
+    *,
+    allow_robocop_config: bool,
+    visited: set[Path],
+) -> Iterator[str]:
+    with os.scandir(directory) as it:
+        entries = list(it)
+
+    names = {entry.name for entry in entries}
+    if not allow_robocop_config and _has_robocop_config(directory, names):
+        raise RobocopConfigFoundError
+    if ".gitignore" in names:
+        gitignores = [*gitignores, ("", _read_gitignore(directory / ".gitignore"))]
+
+    for entry in entries:
+        if entry.name in DEFAULT_EXCLUDED_NAMES:
+            continue
+
+        if entry.is_dir():
+            if _is_ignored(f"{entry.name}/", gitignores):
+                continue
+            subdirectory = _get_subdirectory(entry, visited)
+            if subdirectory is not None:
+                yield from _walk(
+                    subdirectory,
+                    [(f"{prefix}{entry.name}/", gitignore) for (prefix, gitignore) in gitignores],
+                    allow_robocop_config=allow_robocop_config,
+                    visited=visited,
+                )
+        elif entry.is_file() and os.path.splitext(entry.name)[1] in FILE_SUFFIXES:  # noqa: PTH122
+            if _is_ignored(entry.name, gitignores):
+                continue
+            yield os.path.realpath(entry.path) if entry.is_symlink() else entry.path
+
+
+def _get_subdirectory(entry: os.DirEntry, visited: set[Path]) -> Path | None:
+    """
+    Get the path of a directory to walk. Returns None when the directory was walked before.
+    """
+    path = Path(entry.path)
+    if entry.is_symlink():
+        path = path.resolve()
+        if path in visited:
+            # Prevents endless symlink loops
+            return None
+        visited.add(path)
+    return path
+
+
+def _is_ignored(name: str, gitignores: list[GitIgnore]) -> bool:
+    """
+    Return true if any gitignore ignores the entry. Directory names end with a slash.
+    """
+    return any(gitignore.match_file(f"{prefix}{name}") for (prefix, gitignore) in gitignores)
+
+
+def _get_parent_gitignores(directory: Path) -> list[GitIgnore]:
+    """
+    Get the gitignores of a directory and its parents, up to the root of the Git repository.
+    """
+    gitignores: list[GitIgnore] = []
+    for parent in [directory, *directory.parents]:
+        gitignore_path = parent / ".gitignore"
+        if gitignore_path.is_file():
+            prefix = directory.relative_to(parent).as_posix()
+            gitignores.append(
+                ("" if prefix == "." else f"{prefix}/", _read_gitignore(gitignore_path)),
+            )
+        if (parent / ".git").is_dir():
+            break
+    return gitignores
+
+
+def _read_gitignore(path: Path) -> pathspec.GitIgnoreSpec:
+    with path.open(encoding="utf-8") as f:
+        return pathspec.GitIgnoreSpec.from_lines(f.readlines())
+
+
+def _has_parent_robocop_config(path: Path) -> bool:
+    """
+    Return true if Robocop finds a config file in the path or its parents.
+
+    Like Robocop, stops searching at the root of the Git repository.
+    """
+    for parent in [path, *path.parents] if path.is_dir() else path.parents:
+        if _has_robocop_config(parent, set(ROBOCOP_CONFIG_NAMES)):
+            return True
+        if (parent / ".git").is_dir():
+            break
+    return False
+
+
+def _has_robocop_config(directory: Path, names: set[str]) -> bool:
+    for config_name in ROBOCOP_CONFIG_NAMES:
+        if config_name not in names:
+            continue
+        config_path = directory / config_name
+        if not config_path.is_file():
+            continue
+        if config_name == "robocop.toml":
+            return True
+        # Other files are only used when they have a Robocop section
+        if "[tool.robocop" in config_path.read_text(encoding="utf-8", errors="replace"):
+            return True
+    return False
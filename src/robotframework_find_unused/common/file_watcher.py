@@ -0,0 +1,69 @@
+from pathlib import Path
+
+# (modification time in nanoseconds, size in bytes). None when the path does not exist.
+PathStat = tuple[int, int] | None
+
+
+class FileWatcher:
+    """
+    Poll files for changes.
+
+    Also polls the directories that contain the files. A directory changes when a file is added to,
+    or removed from, that directory. This allows finding new files without walking the entire
+    source tree.
+    """
+
+    files: dict[Path, PathStat]
+    directories: dict[Path, PathStat]
+
+    def __init__(self, source_path: Path) -> None:
+        self.source_path = source_path.absolute()
+        self.files = {}
+        self.directories = {}
+
+    def watch(self, file_paths: list[Path]) -> None:
+        """
+        Start watching the given files. Replaces previously watched files.
+        """
+        self.files = {path: _stat(path) for path in file_paths}
+
+        directories: set[Path] = set()
+        if self.source_path.is_dir():
+            directories.add(self.source_path)
+        for path in file_paths:
+            for directory in path.absolute().parents:
+                if directory in directories or not directory.is_relative_to(self.source_path):
+                    break
+                directories.add(directory)
+
+        self.directories = {path: _stat(path) for path in sorted(directories)}
+
+    def poll(self) -> tuple[list[Path], bool]:
+        """
+        Get the watched files that changed since the previous poll.
+
+        Returns the changed files, and whether files may have been added or removed.
+        """
+        changed_files: list[Path] = []
+        for path, prev_stat in self.files.items():
+            cur_stat = _stat(path)
+            if cur_stat != prev_stat:
+                self.files[path] = cur_stat
+                changed_files.append(path)
+
+        directories_changed = False
+        for path, prev_stat in self.directories.items():
+            cur_stat = _stat(path)
+            if cur_stat != prev_stat:
+                self.directories[path] = cur_stat
+                directories_changed = True
+
+        return (changed_files, directories_changed)
+
+
+def _stat(path: Path) -> PathStat:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,117 @@
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+
+@dataclass
+class StepProfile:
+    """Data structure for the measurements of a single step"""
+
+    name: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_memory_mb: float
+    """Peak memory allocated by Python during the step"""
+    peak_rss_mb: float | None
+    """Peak resident set size of the process up to the end of the step. None when unknown."""
+    items: dict[str, int]
+    """Number of processed items, like files or keywords"""
+
+
+class Profiler:
+    """
+    Measure time, memory, and processed items of every step.
+
+    Memory is measured with `tracemalloc`, which slows down Python code while profiling.
+    """
+
+    steps: list[StepProfile]
+
+    def __init__(self) -> None:
+        self.steps = []
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def step(self, name: str) -> Generator[dict[str, int]]:
+        """
+        Measure a step. Add processed item counts to the yielded dict.
+        """
+        items: dict[str, int] = {}
+        tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        yield items
+
+        self.steps.append(
+            StepProfile(
+                name=name,
+                wall_seconds=time.perf_counter() - wall_start,
+                cpu_seconds=time.process_time() - cpu_start,
+                peak_memory_mb=tracemalloc.get_traced_memory()[1] / 1024 / 1024,
+                peak_rss_mb=_get_peak_rss_mb(),
+                items=items,
+            ),
+        )
+
+    def write_json(self, file_path: Path) -> None:
+        """Write all measurements to a JSON file"""
+        content = {"steps": [asdict(step) for step in self.steps]}
+        file_path.write_text(json.dumps(content, indent=2) + "\n", encoding="utf8")
+
+
+_profiler: Profiler | None = None
+
+
+def apply_profile(*, enabled: bool) -> None:
+    """Start or stop measuring steps"""
+    global _profiler  # noqa: PLW0603
+
+    if not enabled:
+        if _profiler is not None:
+            tracemalloc.stop()
+        _profiler = None
+        return
+
+    _profiler = Profiler()
+
+
+def get_profiler() -> Profiler | None:
+    """Get the profiler. None when not profiling."""
+    return _profiler
+
+
+@contextmanager
+def profile_step(name: str) -> Generator[dict[str, int]]:
+    """
+    Measure a step when profiling. Add processed item counts to the yielded dict.
+    """
+    if _profiler is None:
+        yield {}
+        return
+
+    with _profiler.step(name) as items:
+        yield items
+
+
+def _get_peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # Bytes on macOS, kilobytes elsewhere
+        return peak / 1024 / 1024
+    return peak / 1024
@@ -1,4 +1,5 @@
 import sys
+from pathlib import Path
 
 from robot.conf import RobotSettings
 
@@ -9,3 +10,12 @@ def apply_pythonpath(pythonpath: list[str]):
 
     if settings.pythonpath:
         sys.path = settings.pythonpath + sys.path
+
+
+def forget_python_module(file_path: Path) -> None:
+    """Remove modules imported from the file. The next import reads the file again."""
+    resolved_path = file_path.resolve()
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if module_file is not None and Path(module_file).resolve() == resolved_path:
+            del sys.modules[name]
@@ -1,9 +1,9 @@
-import re
+import sys
 from typing import Any, Literal, cast
 
 from robot.libdocpkg.model import KeywordDoc
 
-from robotframework_find_unused.common.const import KeywordData
+from robotframework_find_unused.common.const import KeywordData, LibraryData, LibraryKeywordDoc
 from robotframework_find_unused.common.normalize import normalize_keyword_name
 from robotframework_find_unused.parse.parse_variable import get_variables_in_string
 
@@ -20,14 +20,13 @@ def libdoc_keyword_to_keyword_data(
     for arg in libdoc.args.argument_names:
         argument_use_count[arg] = 0
 
-    normalized_name = normalize_keyword_name(libdoc.name)
-    name_parts = get_keyword_name_parts(normalized_name)
+    # Interned: Normalized names are used as keys in many dicts and sets
+    normalized_name = sys.intern(normalize_keyword_name(libdoc.name))
 
     return KeywordData(
         name=libdoc.name,
         normalized_name=normalized_name,
-        name_parts=name_parts,
-        name_match_pattern=get_keyword_name_match_pattern(name_parts),
+        name_parts=get_keyword_name_parts(normalized_name),
         library=cast(Any, libdoc.parent).name,
         deprecated=(libdoc.deprecated is True),
         private=("robot:private" in libdoc.tags),
@@ -40,11 +39,70 @@ def libdoc_keyword_to_keyword_data(
     )
 
 
-def get_keyword_name_parts(name: str) -> list[str]:
+def libdoc_keyword_to_library_keyword_doc(
+    libdoc: KeywordDoc,
+    keyword_returns: bool | None = None,
+) -> LibraryKeywordDoc:
+    """
+    Convert a Libdoc keyword of a downloaded library to a compact data structure
+    """
+    return LibraryKeywordDoc(
+        name=libdoc.name,
+        library=cast(Any, libdoc.parent).name,
+        deprecated=(libdoc.deprecated is True),
+        private=("robot:private" in libdoc.tags),
+        returns=keyword_returns,
+        arguments=libdoc.args,
+    )
+
+
+def get_library_keyword(library: LibraryData, normalized_name: str) -> KeywordData | None:
+    """
+    Get a keyword of a downloaded library. Returns None when the library has no such keyword.
+
+    The keyword is converted to `KeywordData` on first use. Later calls return the same object.
+    """
+    keyword = library.keywords.get(normalized_name)
+    if keyword is not None:
+        return keyword
+
+    doc = library.keyword_docs.get(normalized_name)
+    if doc is None:
+        return None
+
+    keyword = KeywordData(
+        name=doc.name,
+        normalized_name=sys.intern(normalized_name),
+        name_parts=get_keyword_name_parts(normalized_name),
+        library=doc.library,
+        deprecated=doc.deprecated,
+        private=doc.private,
+        argument_use_count=dict.fromkeys(doc.arguments.argument_names, 0),
+        arguments=doc.arguments,
+        use_count=0,
+        returns=doc.returns,
+        return_use_count=0,
+        type="LIBRARY",
+    )
+    library.keywords[normalized_name] = keyword
+    return keyword
+
+
+def get_library_keywords(library: LibraryData) -> list[KeywordData]:
+    """
+    Get all keywords of a downloaded library. Converts every keyword that was not used yet.
+    """
+    return [
+        cast(KeywordData, get_library_keyword(library, normalized_name))
+        for normalized_name in library.keyword_docs
+    ]
+
+
+def get_keyword_name_parts(name: str) -> tuple[str, ...]:
     """Cut keyword name into parts based on embedded variables."""
     name_vars = get_variables_in_string(name)
     if len(name_vars) == 0:
-        return [name]
+        return (name,)
 
     name_parts = []
     for var in name_vars:
@@ -55,16 +113,4 @@ def get_keyword_name_parts(name: str) -> list[str]:
     if name:
         name_parts.append(name)
 
-    return name_parts
-
-
-def get_keyword_name_match_pattern(name_parts: list[str]) -> re.Pattern:
-    """Build regex pattern that allows for matching calls to keywords with embedded args"""
-    pattern = "^"
-    for part in name_parts:
-        if part == "__VARIABLE__":
-            pattern += ".+?"
-        else:
-            pattern += re.escape(part)
-    pattern += "$"
-    return re.compile(pattern)
+    return tuple(name_parts)
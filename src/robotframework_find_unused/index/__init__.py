@@ -0,0 +1,3 @@
+"""
+Analysis results per file, to analyze only changed files again
+"""
@@ -0,0 +1,41 @@
+import subprocess
+from pathlib import Path
+
+
+class GitError(Exception):
+    """Git command failed"""
+
+
+def get_git_changed_files(git_ref: str, source_path: str) -> list[Path]:
+    """
+    Get the files that changed since the given Git ref. Includes uncommitted changes.
+
+    Uses `git diff --name-only`. Paths are absolute.
+    """
+    cwd = Path(source_path)
+    if not cwd.is_dir():
+        cwd = cwd.parent
+
+    repo_root = _run_git(["rev-parse", "--show-toplevel"], cwd).strip()
+    changed = _run_git(["diff", "--name-only", "--no-renames", git_ref, "--"], cwd)
+
+    return [Path(repo_root).joinpath(line) for line in changed.splitlines() if line]
+
+
+def _run_git(args: list[str], cwd: Path) -> str:
+    try:
+        process = subprocess.run(  # noqa: S603
+            ["git", *args],  # noqa: S607
+            cwd=cwd,
+            check=True,
+            capture_output=True,
+            encoding="utf8",
+        )
+    except FileNotFoundError as e:
+        msg = "Git is not installed"
+        raise GitError(msg) from e
+    except subprocess.CalledProcessError as e:
+        msg = e.stderr.strip().splitlines()[0] if e.stderr.strip() else str(e)
+        raise GitError(msg) from e
+
+    return process.stdout
@@ -0,0 +1,162 @@
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from robot.version import VERSION as ROBOT_VERSION
+
+from robotframework_find_unused.__version__ import __version__
+from robotframework_find_unused.common.disk_cache import DiskCache
+from robotframework_find_unused.common.normalize import normalize_file_path
+from robotframework_find_unused.visitors.robot.keyword_visitor.keyword_definition_manager import (
+    KeywordDefinitionManager,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from robot.libdocpkg.model import ArgumentSpec, LibraryDoc
+
+    from robotframework_find_unused.common.const import KeywordData, LibraryData
+    from robotframework_find_unused.visitors.robot.keyword_visitor.keyword_file_visitor import (
+        KeywordFileUses,
+    )
+
+
+@dataclass
+class KeywordIndexFile:
+    """Data structure for the indexed keyword data of a single .robot or .resource file"""
+
+    content_hash: str
+    definitions: "LibraryDoc"
+    library_imports: list[str]
+    """Names of the imported downloaded libraries"""
+
+    keyword_uses: "KeywordFileUses | None"
+    """None when keyword uses are not yet counted"""
+
+
+@dataclass
+class KeywordIndex:
+    """
+    Data structure for the keyword index of a project.
+
+    Keyword uses are stored per file. Keyword uses of a file only stay valid as long as the keyword
+    definitions they were resolved against are unchanged.
+    """
+
+    definitions_fingerprint: str | None
+    files: dict[str, KeywordIndexFile]
+    """Indexed files, keyed by normalized file path"""
+
+
+class KeywordIndexStore:
+    """
+    Persistent storage for keyword indexes.
+
+    Indexes are keyed on source path, Robot Framework version, and robotunused version.
+    """
+
+    def __init__(self, cache_directory: Path) -> None:
+        self.store = DiskCache(cache_directory, "keyword_index")
+
+    def load(self, source_path: str) -> KeywordIndex | None:
+        """Get the stored index. Returns None when there is no index for the source path"""
+        index = self.store.get(self._get_key(source_path))
+        if not isinstance(index, KeywordIndex):
+            return None
+        return index
+
+    def save(self, source_path: str, index: KeywordIndex) -> None:
+        """Store the index"""
+        self.store.set(self._get_key(source_path), index)
+
+    def _get_key(self, source_path: str) -> str:
+        return "|".join(
+            [
+                normalize_file_path(source_path),
+                ROBOT_VERSION,
+                __version__,
+            ],
+        )
+
+
+def get_definitions_fingerprint(
+    custom_keywords: "list[KeywordData]",
+    downloaded_libraries: "list[LibraryData]",
+) -> str:
+    """
+    Hash everything that influences how keyword calls are resolved to keyword definitions.
+    """
+    fingerprint = hashlib.blake2b(digest_size=16)
+    for kw in custom_keywords:
+        fingerprint.update(_keyword_fingerprint(kw))
+
+    for lib in downloaded_libraries:
+        fingerprint.update(f"{lib.name_normalized}|{lib.import_error is not False}\n".encode())
+        for name, doc in lib.keyword_docs.items():
+            fingerprint.update(
+                f"{name}|LIBRARY|{doc.library}|{_arguments_fingerprint(doc.arguments)}\n".encode(),
+            )
+
+    return fingerprint.hexdigest()
+
+
+def _keyword_fingerprint(keyword: "KeywordData") -> bytes:
+    return (
+        f"{keyword.normalized_name}|{keyword.type}|{keyword.library}|"
+        f"{_arguments_fingerprint(keyword.arguments)}\n"
+    ).encode()
+
+
+def _arguments_fingerprint(arguments: "ArgumentSpec | None") -> str:
+    """
+    Argument structure and defaults.
+
+    Leaves out type hints: Those don't influence keyword uses and are not kept in the Libdoc cache.
+    """
+    if arguments is None:
+        return "None"
+
+    defaults = {name: str(value) for name, value in arguments.defaults.items()}
+    return repr(
+        (
+            arguments.positional_only,
+            arguments.positional_or_named,
+            arguments.var_positional,
+            arguments.named_only,
+            arguments.var_named,
+            defaults,
+        ),
+    )
+
+
+def count_indexed_keyword_uses(
+    custom_keywords: "list[KeywordData]",
+    downloaded_libraries: "list[LibraryData]",
+    file_uses: "Iterable[KeywordFileUses]",
+) -> "list[KeywordData]":
+    """
+    Add up the keyword uses of all files.
+
+    Produces the same keywords, in the same order, as counting all files with
+    `RobotVisitorKeywords`.
+    """
+    kw_matcher = KeywordDefinitionManager(custom_keywords, downloaded_libraries)
+    for uses in file_uses:
+        for use in uses.keywords.values():
+            keyword = kw_matcher.get_keyword_definition(use.name)
+            keyword.use_count += use.use_count
+            keyword.return_use_count += use.return_use_count
+
+            if use.argument_use_count is None or keyword.argument_use_count is None:
+                continue
+            for arg, count in use.argument_use_count.items():
+                if arg in keyword.argument_use_count:
+                    keyword.argument_use_count[arg] += count
+
+        for name, returns in uses.returns.items():
+            if name in kw_matcher.keywords:
+                kw_matcher.keywords[name].returns = returns
+
+    return list(kw_matcher.keywords.values())
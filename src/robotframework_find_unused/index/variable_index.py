@@ -0,0 +1,43 @@
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from robotframework_find_unused.common.const import VariableData
+
+
+@dataclass
+class VariableIndex:
+    """
+    Data structure for the variable index of a project.
+
+    Variable uses are stored per file. Variable uses of a file only stay valid as long as the
+    variable definitions they were counted against are unchanged.
+    """
+
+    definitions_fingerprint: str | None
+    file_uses: dict[Path, dict[str, int]]
+    """Number of uses of each variable, keyed by normalized name. Per file."""
+
+
+def get_variable_definitions_fingerprint(variables: dict[str, VariableData]) -> str:
+    """
+    Hash everything that influences how variable uses are counted.
+    """
+    fingerprint = hashlib.blake2b(digest_size=16)
+    for var in variables.values():
+        fingerprint.update(f"{var.normalized_name}|{var.resolved_name}|{var.value!r}\n".encode())
+    return fingerprint.hexdigest()
+
+
+def count_indexed_variable_uses(
+    variables: dict[str, VariableData],
+    file_uses: Iterable[dict[str, int]],
+) -> None:
+    """
+    Add the variable uses of the given files to the variable definitions.
+    """
+    for uses in file_uses:
+        for name, count in uses.items():
+            if name in variables:
+                variables[name].use_count += count
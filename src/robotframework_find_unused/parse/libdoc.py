@@ -1,26 +1,42 @@
 from pathlib import Path
 
-import robot.errors
-from robot.libdoc import LibraryDocumentation
 from robot.libdocpkg.model import LibraryDoc
 
+from robotframework_find_unused.parse.libdoc_worker import document_libraries
+
+# Parsed documentation, or the parse error message
+_parsed_files: dict[Path, LibraryDoc | str] = {}
+
 
 def parse_files_with_libdoc(file_paths: list[Path]) -> tuple[list[LibraryDoc], list[str]]:
     """
     Gather files in the given scope with LibDoc
 
-    Libdoc supports .robot, .resource, .py, and downloaded libs
+    Libdoc supports .robot, .resource, .py, and downloaded libs. Python files are imported in
+    worker processes.
+
+    Results are kept in memory.
     """
+    unparsed_paths = list(dict.fromkeys(p for p in file_paths if p not in _parsed_files))
+    for file, libdoc in zip(unparsed_paths, document_libraries(unparsed_paths), strict=True):
+        _parsed_files[file] = (
+            libdoc if isinstance(libdoc, LibraryDoc) else libdoc.message.split("\n", maxsplit=1)[0]
+        )
+
     files: list[LibraryDoc] = []
     errors: list[str] = []
     for file in file_paths:
-        try:
-            libdoc = LibraryDocumentation(file)
+        libdoc = _parsed_files[file]
+        if isinstance(libdoc, str):
+            errors.append(libdoc)
+        else:
             files.append(libdoc)
-        except robot.errors.DataError as e:
-            errors.append(e.message.split("\n", maxsplit=1)[0])
-            continue
-        if not isinstance(libdoc, LibraryDoc):
-            continue
 
     return (files, errors)
+
+
+def forget_libdoc_file(file_path: Path) -> None:
+    """
+    Drop the in-memory documentation of a file. The next parse reads the file again.
+    """
+    _parsed_files.pop(file_path, None)
@@ -0,0 +1,205 @@
+import functools
+import io
+import json
+import pickle
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from robot.libraries import STDLIBS
+from robot.running.arguments import ArgumentSpec
+from robot.version import VERSION as ROBOT_VERSION
+
+from robotframework_find_unused.__version__ import __version__
+from robotframework_find_unused.common.const import LibraryData
+from robotframework_find_unused.common.disk_cache import DEFAULT_MAX_CACHE_SIZE, DiskCache
+
+# Keywords of these standard libraries are not known without connecting to something
+UNCACHEABLE_STDLIBS = {"Remote"}
+
+
+class LibDocCache:
+    """
+    Persistent cache for the keywords of downloaded libraries.
+
+    Entries are keyed on library name, installed distribution version, Robot Framework version,
+    and robotunused version. Only libraries that can be tied to a version are cached: Robot
+    standard libraries, and libraries installed from a non-editable distribution.
+    """
+
+    hits: int
+    misses: int
+
+    def __init__(self, cache_directory: Path, max_size: int = DEFAULT_MAX_CACHE_SIZE) -> None:
+        self.store = _LibraryDiskCache(cache_directory, "libdoc", max_size)
+        self.hits = 0
+        self.misses = 0
+
+    def get_library(self, lib_name: str, *, enrich_py_keywords: bool) -> LibraryData | None:
+        """
+        Get the library from cache. Returns None when the library is not cached.
+        """
+        key = self._get_key(lib_name, enrich_py_keywords=enrich_py_keywords)
+        if key is None:
+            return None
+
+        library: LibraryData | None = self.store.get(key)
+        if isinstance(library, LibraryData):
+            self.hits += 1
+            return library
+
+        self.misses += 1
+        return None
+
+    def set_library(self, lib_name: str, library: LibraryData, *, enrich_py_keywords: bool) -> None:
+        """
+        Store the library in cache. Libraries that failed to import are never cached.
+        """
+        if library.import_error is not False:
+            return
+
+        key = self._get_key(lib_name, enrich_py_keywords=enrich_py_keywords)
+        if key is None:
+            return
+
+        self.store.set(key, library)
+
+    def _get_key(self, lib_name: str, *, enrich_py_keywords: bool) -> str | None:
+        library_version = get_library_version(lib_name)
+        if library_version is None:
+            return None
+
+        return "|".join(
+            [
+                lib_name,
+                library_version,
+                "enriched" if enrich_py_keywords else "plain",
+                ROBOT_VERSION,
+                __version__,
+            ],
+        )
+
+
+def get_library_version(lib_name: str) -> str | None:
+    """
+    Get the version of the code that provides a library. Does not import the library.
+
+    Returns None when the library can't be tied to a version. For example, for libraries on the
+    Python path that are not installed, or for libraries installed in editable mode.
+    """
+    if lib_name in UNCACHEABLE_STDLIBS:
+        return None
+    if lib_name in STDLIBS:
+        return f"robotframework=={ROBOT_VERSION}"
+    if "/" in lib_name or "\\" in lib_name:
+        # Path to a library. Not installed.
+        return None
+
+    module_name = lib_name.split(".", maxsplit=1)[0]
+    return _get_module_distribution_version(module_name)
+
+
+@functools.cache
+def _get_module_distribution_version(module_name: str) -> str | None:
+    dist_names = _get_packages_distributions().get(module_name)
+    if not dist_names:
+        return None
+
+    versions: list[str] = []
+    for dist_name in sorted(set(dist_names)):
+        try:
+            dist = metadata.distribution(dist_name)
+        except metadata.PackageNotFoundError:
+            return None
+        if _is_editable_install(dist):
+            # Code can change without a version change
+            return None
+        versions.append(f"{dist_name}=={dist.version}")
+
+    return ",".join(versions)
+
+
+@functools.cache
+def _get_packages_distributions() -> dict[str, list[str]]:
+    return dict(metadata.packages_distributions())
+
+
+def _is_editable_install(dist: metadata.Distribution) -> bool:
+    direct_url = dist.read_text("direct_url.json")
+    if direct_url is None:
+        return False
+
+    try:
+        return json.loads(direct_url).get("dir_info", {}).get("editable", False) is True
+    except (ValueError, AttributeError):
+        return True
+
+
+class LibraryPickler(pickle.Pickler):
+    """
+    Pickler for library keyword data.
+
+    Libdoc argument specs refer to the library code: Their name is a function, and their types and
+    defaults can be any object from the library. Keep only what robotunused uses, so loading a
+    cached library never imports the library.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:  # noqa: ANN401
+        """Reduce argument specs to plain data"""
+        if isinstance(obj, ArgumentSpec):
+            return (
+                _restore_argument_spec,
+                (
+                    {
+                        "name": obj.name,
+                        "type": obj.type,
+                        "positional_only": obj.positional_only,
+                        "positional_or_named": obj.positional_or_named,
+                        "var_positional": obj.var_positional,
+                        "named_only": obj.named_only,
+                        "var_named": obj.var_named,
+                        "defaults": {
+                            name: _to_plain_value(value) for name, value in obj.defaults.items()
+                        },
+                        "embedded": obj.embedded,
+                    },
+                ),
+            )
+        return NotImplemented
+
+
+def _restore_argument_spec(kwargs: dict[str, Any]) -> ArgumentSpec:
+    return ArgumentSpec(**kwargs)
+
+
+def _to_plain_value(value: object) -> object:
+    """Keep values that can be restored without importing the library. Others become strings."""
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    return str(value)
+
+
+class _LibraryDiskCache(DiskCache):
+    """Disk cache that can store library keyword data."""
+
+    def _get_pickler(self, file: io.BytesIO) -> pickle.Pickler:
+        return LibraryPickler(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+_libdoc_cache: LibDocCache | None = None
+
+
+def apply_libdoc_cache(cache_dir: str | None) -> None:
+    """Enable the persistent Libdoc cache. Disables the cache when `cache_dir` is None"""
+    global _libdoc_cache  # noqa: PLW0603
+
+    if cache_dir is None:
+        _libdoc_cache = None
+        return
+
+    _libdoc_cache = LibDocCache(Path(cache_dir).absolute())
+
+
+def get_libdoc_cache() -> LibDocCache | None:
+    """Get the active persistent Libdoc cache. Returns None when the cache is disabled."""
+    return _libdoc_cache
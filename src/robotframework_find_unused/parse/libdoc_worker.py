@@ -0,0 +1,253 @@
+import multiprocessing
+import os
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Any, cast
+
+import robot.errors
+from robot.libdoc import LibraryDocumentation
+from robot.libdocpkg.jsonbuilder import JsonDocBuilder
+from robot.libdocpkg.model import LibraryDoc
+from robot.libraries import STDLIBS
+
+from robotframework_find_unused.common.const import DEFAULT_LIBRARY_TIMEOUT
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+# These standard libraries connect to something when imported
+ISOLATED_STDLIBS = {"Remote"}
+
+# Documenting these files does not import Python code
+IN_PROCESS_SUFFIXES = {".robot", ".resource", ".libspec", ".xml", ".json"}
+
+LibdocResult = LibraryDoc | robot.errors.DataError
+
+
+@dataclass
+class LibdocWorkerSettings:
+    """Settings for the worker processes that document libraries"""
+
+    jobs: int = 1
+    timeout: float = DEFAULT_LIBRARY_TIMEOUT
+    """Seconds before documenting a single library is stopped"""
+    memory_limit_mb: int | None = None
+    """Address space limit of every worker process. Only on platforms that support it."""
+
+
+_settings = LibdocWorkerSettings()
+
+
+def apply_libdoc_workers(
+    jobs: int,
+    timeout: float = DEFAULT_LIBRARY_TIMEOUT,
+    memory_limit_mb: int | None = None,
+) -> None:
+    """
+    Set how libraries are documented. Use 0 jobs to use all CPU cores.
+    """
+    global _settings  # noqa: PLW0603
+    _settings = LibdocWorkerSettings(
+        jobs=jobs if jobs > 0 else (os.cpu_count() or 1),
+        timeout=timeout,
+        memory_limit_mb=memory_limit_mb,
+    )
+
+
+def document_libraries(names: Sequence[str | Path]) -> list[LibdocResult]:
+    """
+    Document libraries with Libdoc. Returns results in the order of `names`.
+
+    Python libraries are imported in worker processes, so a slow or broken library does not stall
+    or bloat this process. Robot standard libraries and Robot files are documented in this process.
+    """
+    results: dict[int, LibdocResult] = {}
+    isolated: dict[int, str | Path] = {}
+    for i, name in enumerate(names):
+        if _needs_isolation(name):
+            isolated[i] = name
+        else:
+            results[i] = _document_in_process(name)
+
+    if isolated:
+        isolated_results = _LibdocWorkerPool(_settings).run(list(isolated.values()))
+        results.update(zip(isolated.keys(), isolated_results, strict=True))
+
+    return [results[i] for i in range(len(names))]
+
+
+def _needs_isolation(name: str | Path) -> bool:
+    if isinstance(name, Path):
+        return name.suffix.lower() not in IN_PROCESS_SUFFIXES
+    return name not in STDLIBS or name in ISOLATED_STDLIBS
+
+
+def _document_in_process(name: str | Path) -> LibdocResult:
+    try:
+        return LibraryDocumentation(name)
+    except robot.errors.DataError as e:
+        return e
+
+
+@dataclass
+class _Worker:
+    process: BaseProcess
+    connection: Connection
+    task: int | None = None
+    """Index of the library the worker is documenting"""
+    started_at: float = 0.0
+
+
+class _LibdocWorkerPool:
+    """
+    Document libraries in worker processes.
+
+    A worker that exceeds the timeout or exits unexpectedly is replaced by a new worker.
+    """
+
+    def __init__(self, settings: LibdocWorkerSettings) -> None:
+        self.settings = settings
+        self.context = multiprocessing.get_context()
+
+    def run(self, names: list[str | Path]) -> list[LibdocResult]:
+        """Document all libraries. Returns results in the order of `names`."""
+        results: dict[int, LibdocResult] = {}
+        pending = list(reversed(range(len(names))))
+        workers: list[_Worker] = []
+        try:
+            for _ in range(min(self.settings.jobs, len(names))):
+                workers.append(self._start_worker())
+
+            while len(results) < len(names):
+                for worker in workers:
+                    if worker.task is None and pending:
+                        worker.task = pending.pop()
+                        worker.started_at = time.monotonic()
+                        worker.connection.send(names[worker.task])
+
+                busy = [w for w in workers if w.task is not None]
+                ready = wait([w.connection for w in busy], timeout=self._get_wait_timeout(busy))
+
+                for worker in busy:
+                    task = cast(int, worker.task)
+                    result = self._collect_result(worker, names[task], ready=ready)
+                    if result is None:
+                        continue
+
+                    results[task] = result
+                    worker.task = None
+                    if worker.connection.closed:
+                        # Worker was stopped. Replace it when there is more work to do.
+                        workers.remove(worker)
+                        if pending:
+                            workers.append(self._start_worker())
+        finally:
+            for worker in workers:
+                self._stop_worker(worker, force=worker.task is not None)
+
+        return [results[i] for i in range(len(names))]
+
+    def _collect_result(
+        self,
+        worker: _Worker,
+        name: str | Path,
+        *,
+        ready: list[Any],
+    ) -> LibdocResult | None:
+        """Get the result of a busy worker. Returns None when the worker is not done yet."""
+        if worker.connection in ready:
+            return self._receive(worker, name)
+
+        if time.monotonic() - worker.started_at >= self.settings.timeout:
+            self._stop_worker(worker, force=True)
+            return robot.errors.DataError(
+                f"Documenting library '{name}' timed out after {self.settings.timeout:g} seconds",
+            )
+
+        return None
+
+    def _get_wait_timeout(self, busy: list[_Worker]) -> float:
+        now = time.monotonic()
+        deadline = min(w.started_at for w in busy) + self.settings.timeout
+        return max(0.0, deadline - now)
+
+    def _receive(self, worker: _Worker, name: str | Path) -> LibdocResult:
+        try:
+            (spec, error) = worker.connection.recv()
+        except (EOFError, OSError):
+            self._stop_worker(worker, force=True)
+            return robot.errors.DataError(
+                f"Documenting library '{name}' failed: Worker process exited unexpectedly "
+                f"with exit code {worker.process.exitcode}",
+            )
+
+        if error is not None:
+            return robot.errors.DataError(error)
+        return _build_libdoc(spec)
+
+    def _start_worker(self) -> _Worker:
+        (connection, worker_connection) = self.context.Pipe()
+        process = self.context.Process(
+            target=_worker_main,
+            args=(worker_connection, sys.path, self.settings.memory_limit_mb),
+            daemon=True,
+        )
+        process.start()
+        worker_connection.close()
+        return _Worker(process=process, connection=connection)
+
+    def _stop_worker(self, worker: _Worker, *, force: bool) -> None:
+        if force:
+            worker.process.kill()
+        elif worker.process.is_alive():
+            worker.connection.send(None)
+        worker.process.join()
+        worker.connection.close()
+
+
+def _build_libdoc(spec: dict[str, Any]) -> LibraryDoc:
+    """Build documentation from a Libdoc JSON spec"""
+    libdoc = JsonDocBuilder().build_from_dict(spec)
+    for keyword in [*libdoc.inits, *libdoc.keywords]:
+        # Libdoc leaves these as lists, which breaks argument spec methods
+        args = keyword.args
+        args.positional_only = tuple(args.positional_only)
+        args.positional_or_named = tuple(args.positional_or_named)
+        args.named_only = tuple(args.named_only)
+    return libdoc
+
+
+def _worker_main(
+    connection: Connection,
+    python_path: list[str],
+    memory_limit_mb: int | None,
+) -> None:
+    """Document libraries sent over the connection until receiving None"""
+    sys.path = python_path
+    # Prevent libraries from trying to interpret robotunused arguments
+    sys.argv = sys.argv[:1]
+
+    if memory_limit_mb is not None and resource is not None:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    while True:
+        name = connection.recv()
+        if name is None:
+            return
+
+        try:
+            libdoc = LibraryDocumentation(name)
+            connection.send((libdoc.to_dictionary(include_private=True), None))
+        except robot.errors.DataError as e:
+            connection.send((None, e.message))
+        except Exception as e:  # noqa: BLE001
+            connection.send((None, f"Documenting library '{name}' failed: {e!r}"))
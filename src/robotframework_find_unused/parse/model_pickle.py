@@ -0,0 +1,39 @@
+import ast
+import io
+import pickle
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from robot.parsing.model.blocks import File
+
+
+class RobotModelPickler(pickle.Pickler):
+    """
+    Pickler for Robot models.
+
+    Robot model nodes are `ast.AST` instances. Those are pickled by calling their constructor
+    without arguments, which most Robot nodes don't support. Restore them without calling the
+    constructor instead.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:  # noqa: ANN401
+        """Reduce Robot model nodes without their constructor"""
+        if isinstance(obj, ast.AST):
+            return (_restore_node, (type(obj),), obj.__dict__)
+        return NotImplemented
+
+
+def _restore_node(cls: type[ast.AST]) -> ast.AST:
+    return cls.__new__(cls)
+
+
+def dumps_model(model: "File") -> bytes:
+    """Pickle a Robot model"""
+    buffer = io.BytesIO()
+    RobotModelPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(model)
+    return buffer.getvalue()
+
+
+def loads_model(data: bytes) -> "File":
+    """Unpickle a Robot model"""
+    return cast("File", pickle.loads(data))  # noqa: S301
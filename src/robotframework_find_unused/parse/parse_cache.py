@@ -0,0 +1,128 @@
+import hashlib
+import io
+import pickle
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from robot.version import VERSION as ROBOT_VERSION
+
+from robotframework_find_unused.__version__ import __version__
+from robotframework_find_unused.common.disk_cache import DEFAULT_MAX_CACHE_SIZE, DiskCache
+from robotframework_find_unused.common.normalize import normalize_file_path
+from robotframework_find_unused.parse.model_pickle import RobotModelPickler
+
+if TYPE_CHECKING:
+    from robot.parsing.model.blocks import File
+
+
+@dataclass
+class ParseCacheEntry:
+    """Data structure for a single cached Robot model"""
+
+    mtime_ns: int
+    size: int
+    content_hash: str
+    model: "File"
+
+
+class ParseCache:
+    """
+    Persistent cache for parsed Robot models.
+
+    Entries are keyed on file path, parsed sections, Robot Framework version, and robotunused
+    version. An entry is only used when the file did not change since it was cached. A file is
+    unchanged when mtime and size are unchanged, or when the content hash is unchanged.
+    """
+
+    hits: int
+    misses: int
+
+    def __init__(self, cache_directory: Path, max_size: int = DEFAULT_MAX_CACHE_SIZE) -> None:
+        self.store = _RobotModelDiskCache(cache_directory, "parse", max_size)
+        self.hits = 0
+        self.misses = 0
+
+    def get_model(
+        self,
+        file_path: Path,
+        parse_sections: tuple[str, ...] | str,
+        parse: Callable[[], "File"],
+    ) -> "File":
+        """
+        Get the model from cache. Falls back to `parse()` and caches the result.
+        """
+        key = self._get_key(file_path, parse_sections)
+        stat = file_path.stat()
+
+        entry: ParseCacheEntry | None = self.store.get(key)
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            self.hits += 1
+            return entry.model
+
+        content_hash = hash_file_content(file_path)
+        if entry is not None and entry.content_hash == content_hash:
+            # File was touched, but content is unchanged
+            self.hits += 1
+            entry.mtime_ns = stat.st_mtime_ns
+            entry.size = stat.st_size
+            self.store.set(key, entry)
+            return entry.model
+
+        self.misses += 1
+        model = parse()
+        self.store.set(
+            key,
+            ParseCacheEntry(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                content_hash=content_hash,
+                model=model,
+            ),
+        )
+        return model
+
+    def _get_key(self, file_path: Path, parse_sections: tuple[str, ...] | str) -> str:
+        if not isinstance(parse_sections, str):
+            parse_sections = ",".join(parse_sections)
+
+        return "|".join(
+            [
+                normalize_file_path(file_path),
+                parse_sections,
+                ROBOT_VERSION,
+                __version__,
+            ],
+        )
+
+
+class _RobotModelDiskCache(DiskCache):
+    """Disk cache that can store Robot models."""
+
+    def _get_pickler(self, file: io.BytesIO) -> pickle.Pickler:
+        return RobotModelPickler(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def hash_file_content(file_path: Path) -> str:
+    """Get a hash of the file content. Suitable for change detection"""
+    return hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+
+
+_parse_cache: ParseCache | None = None
+
+
+def apply_parse_cache(cache_dir: str | None) -> None:
+    """Enable the persistent parse cache. Disables the cache when `cache_dir` is None"""
+    global _parse_cache  # noqa: PLW0603
+
+    if cache_dir is None:
+        _parse_cache = None
+        return
+
+    _parse_cache = ParseCache(Path(cache_dir).absolute())
+
+
+def get_parse_cache() -> ParseCache | None:
+    """Get the active persistent parse cache. Returns None when the cache is disabled."""
+    return _parse_cache
@@ -1,70 +1,395 @@
-from functools import cache
+import io
+import itertools
+import os
+import pickle
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Literal, TypeAlias
+from typing import Any, Literal, TypeAlias, TypeVar, cast
 
 import robot.api.parsing
+from robot.api.parsing import Token
 
-# Limitation: No localisation
-RobotFileSectionName: TypeAlias = Literal[
-    "comments",
-    "settings",
-    "variables",
-    "keywords",
-    "test cases",
-    "tasks",
-]
+from robotframework_find_unused.parse.model_pickle import dumps_model, loads_model
+from robotframework_find_unused.parse.parse_cache import apply_parse_cache, get_parse_cache
+from robotframework_find_unused.parse.section_index import RobotFileSectionName, read_sections
+
+ParseSections: TypeAlias = tuple[RobotFileSectionName, ...] | Literal["all"]
+T = TypeVar("T")
+
+_SECTION_HEADERS: dict[str, RobotFileSectionName] = {
+    Token.COMMENT_HEADER: "comments",
+    Token.SETTING_HEADER: "settings",
+    Token.VARIABLE_HEADER: "variables",
+    Token.KEYWORD_HEADER: "keywords",
+    Token.TESTCASE_HEADER: "test cases",
+    Token.TASK_HEADER: "tasks",
+}
+
+# Files parsed per worker task, and worker tasks queued per job. Bounds the pickled models or
+# summaries that wait to be visited.
+MAX_PARSE_CHUNK_SIZE = 16
+PARSE_CHUNKS_PER_JOB = 2
+
+# Parsed models with the sections they include, by file path
+_parsed_models: dict[Path, tuple[ParseSections, robot.api.parsing.File]] = {}
+_parse_jobs = 1
+_max_parsed_files = 0
+_skip_sections = False
+
+
+def apply_parse_jobs(jobs: int) -> None:
+    """
+    Set the number of processes used to parse files. Use 0 to use all CPU cores.
+    """
+    global _parse_jobs  # noqa: PLW0603
+    _parse_jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+
+
+def get_parse_jobs() -> int:
+    """Get the number of processes used to parse files"""
+    return _parse_jobs
+
+
+def apply_max_parsed_files(max_parsed_files: int) -> None:
+    """
+    Set how many parsed files are kept in memory. Use 0 to keep all files.
+
+    The least recently used files are dropped first. A dropped file is parsed again when it's used
+    later. Models that are still used elsewhere stay alive until their last user is done with them.
+    """
+    global _max_parsed_files  # noqa: PLW0603
+    _max_parsed_files = max_parsed_files
+    _drop_least_recently_used()
+
+
+def apply_skip_sections(*, enabled: bool) -> None:
+    """
+    Enable or disable skipping unrequested sections when parsing files.
+
+    Only enable when no later step needs other sections of the same files. Otherwise, files are
+    parsed once more for the other sections. When disabled, entire files are parsed and requests
+    for specific sections are served from the same model.
+    """
+    global _skip_sections  # noqa: PLW0603
+    _skip_sections = enabled
 
 
-@cache
 def parse_robot_file(
     file_path: Path,
-    parse_sections: tuple[RobotFileSectionName, ...] | Literal["all"] = "all",
-):
+    parse_sections: ParseSections = "all",
+    *,
+    keep_model: bool = True,
+) -> robot.api.parsing.File:
     """
     Parse a file using the Robot parser.
 
-    Can skip entire sections but keeps the section headers.
+    Can skip entire sections but keeps the section headers. Skipped sections are not tokenized when
+    enabled with `apply_skip_sections`. Later requests for the same or fewer sections are served
+    from the same model. Requests for more sections parse the entire file once.
+
+    Models are kept in memory, unless `keep_model` is disabled. Uses the persistent parse cache when
+    enabled.
     """
-    if parse_sections == "all" or file_path.suffix.lower() not in [".robot", ".resource"]:
-        return robot.api.parsing.get_model(file_path, data_only=True)
+    (parsed_sections, model) = _get_parsed_model(file_path, parse_sections)
+    if model is None:
+        model = _get_model(file_path, parsed_sections)
+    if keep_model:
+        _keep_model(file_path, parsed_sections, model)
+    return _get_sections_view(model, parse_sections)
+
+
+def forget_robot_file(file_path: Path) -> None:
+    """
+    Drop the in-memory model of a file. The next parse reads the file again.
+    """
+    _parsed_models.pop(file_path, None)
+
+
+def parse_robot_files(
+    file_paths: Iterable[Path],
+    parse_sections: ParseSections = "all",
+    *,
+    keep_models: bool = True,
+) -> Generator[robot.api.parsing.File]:
+    """
+    Parse multiple files using the Robot parser. Yields models in the order of `file_paths`.
+
+    Models are kept in memory, unless `keep_models` is disabled.
+
+    Parses files in worker processes when multiple jobs are configured with `apply_parse_jobs`.
+    """
+    file_paths = list(file_paths)
+    unparsed_paths = list(
+        dict.fromkeys(p for p in file_paths if _get_parsed_model(p, parse_sections)[1] is None),
+    )
+
+    jobs = min(_parse_jobs, len(unparsed_paths))
+    if jobs <= 1:
+        for file_path in file_paths:
+            yield parse_robot_file(file_path, parse_sections, keep_model=keep_models)
+        return
+
+    with _get_parse_executor(jobs) as executor:
+        parsed = _parse_in_workers(
+            executor,
+            [(p, _get_parsed_model(p, parse_sections)[0]) for p in unparsed_paths],
+            jobs,
+        )
+        pending_paths = set(unparsed_paths)
+
+        for file_path in file_paths:
+            (parsed_sections, model) = _get_parsed_model(file_path, parse_sections)
+            if file_path in pending_paths:
+                pending_paths.discard(file_path)
+                pickled_model, cache_hit = next(parsed)
+                model = loads_model(pickled_model)
+                _count_cache_hit(cache_hit)
+            elif model is None:
+                # Parsed before, but dropped to stay within the limit of parsed files
+                model = _get_model(file_path, parsed_sections)
+
+            if keep_models:
+                _keep_model(file_path, parsed_sections, model)
+            yield _get_sections_view(model, parse_sections)
+
+
+def summarize_robot_files(
+    file_paths: Iterable[Path],
+    summarize: Callable[[robot.api.parsing.File], T],
+) -> Generator[T]:
+    """
+    Parse multiple files and summarize every model. Yields summaries in the order of `file_paths`.
+
+    Models are not kept in memory. Models that are already in memory are summarized without parsing
+    them again. Files that occur more than once are summarized once.
+
+    Parses and summarizes files in worker processes when multiple jobs are configured with
+    `apply_parse_jobs`. Only the pickled summaries are sent back, so `summarize` must be a
+    module-level function that returns something small and picklable.
+    """
+    file_paths = list(file_paths)
+    unparsed_paths = list(
+        dict.fromkeys(p for p in file_paths if _get_parsed_model(p, "all")[1] is None),
+    )
+    summarized: dict[Path, T] = {}
+
+    jobs = min(_parse_jobs, len(unparsed_paths))
+    if jobs <= 1:
+        for file_path in file_paths:
+            if file_path not in summarized:
+                summarized[file_path] = summarize(parse_robot_file(file_path, keep_model=False))
+            yield summarized[file_path]
+        return
+
+    with _get_parse_executor(jobs) as executor:
+        summaries = _parse_in_workers(
+            executor,
+            [(p, "all") for p in unparsed_paths],
+            jobs,
+            summarize,
+        )
+        pending_paths = set(unparsed_paths)
+
+        for file_path in file_paths:
+            if file_path in summarized:
+                yield summarized[file_path]
+                continue
+
+            if file_path in pending_paths:
+                pickled_summary, cache_hit = next(summaries)
+                _count_cache_hit(cache_hit)
+                summary = cast("T", pickle.loads(pickled_summary))  # noqa: S301
+            else:
+                summary = summarize(parse_robot_file(file_path, keep_model=False))
+            summarized[file_path] = summary
+            yield summary
 
-    file_content = _get_partial_file_content(file_path, parse_sections)
-    model = robot.api.parsing.get_model(file_content, data_only=True)
-    model.source = file_path
-    return model
 
+def _get_parse_executor(jobs: int) -> ProcessPoolExecutor:
+    """
+    Get a process pool for parsing files. Workers share the persistent parse cache when enabled.
+    """
+    parse_cache = get_parse_cache()
+    cache_dir = str(parse_cache.store.cache_directory) if parse_cache else None
+    return ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=apply_parse_cache,
+        initargs=(cache_dir,),
+    )
+
+
+def _count_cache_hit(cache_hit: bool | None) -> None:
+    """
+    Count a persistent parse cache hit or miss of a worker process in the main process.
+    """
+    parse_cache = get_parse_cache()
+    if parse_cache is None or cache_hit is None:
+        return
+    if cache_hit:
+        parse_cache.hits += 1
+    else:
+        parse_cache.misses += 1
+
+
+def _parse_in_workers(
+    executor: ProcessPoolExecutor,
+    parse_args: list[tuple[Path, ParseSections]],
+    jobs: int,
+    summarize: Callable[[robot.api.parsing.File], Any] | None = None,
+) -> Generator[tuple[bytes, bool | None]]:
+    """
+    Parse files in worker processes. Yields pickled models in the order of `parse_args`.
+
+    Yields pickled summaries instead when `summarize` is given.
+
+    Only a few chunks of files are queued at once. Files are parsed as the results are consumed,
+    so pickled results don't pile up in memory when visiting is slower than parsing.
+    """
+    chunk_size = max(1, min(len(parse_args) // (jobs * 4), MAX_PARSE_CHUNK_SIZE))
+    chunks = (parse_args[i : i + chunk_size] for i in range(0, len(parse_args), chunk_size))
+
+    queue: deque[Future[list[tuple[bytes, bool | None]]]] = deque()
+    for chunk in itertools.islice(chunks, jobs * PARSE_CHUNKS_PER_JOB):
+        queue.append(executor.submit(_get_pickled_models, chunk, summarize))
 
-def _get_partial_file_content(
+    while queue:
+        results = queue.popleft().result()
+        chunk = next(chunks, None)
+        if chunk is not None:
+            queue.append(executor.submit(_get_pickled_models, chunk, summarize))
+        yield from results
+
+
+def _get_parsed_model(
     file_path: Path,
-    parse_sections: tuple[RobotFileSectionName, ...] | Literal["all"],
-) -> str:
+    parse_sections: ParseSections,
+) -> tuple[ParseSections, robot.api.parsing.File | None]:
+    """
+    Get the parsed model of a file when it includes the sections.
+
+    Otherwise, returns None and the sections to parse.
     """
-    Get partial raw file content.
+    if file_path not in _parsed_models:
+        return (parse_sections if _skip_sections else "all", None)
+
+    (parsed_sections, model) = _parsed_models[file_path]
+    if parsed_sections == "all" or (
+        parse_sections != "all" and set(parse_sections).issubset(parsed_sections)
+    ):
+        return (parsed_sections, model)
+    # Parse the entire file, so the file is not parsed again for other sections
+    return ("all", None)
+
 
-    Output is a .robot or .resource file with only specific *** sections ***. Section headers are
-    always included.
+def _keep_model(
+    file_path: Path,
+    parsed_sections: ParseSections,
+    model: robot.api.parsing.File,
+) -> None:
+    """
+    Keep the model in memory as the most recently used model.
     """
-    with file_path.open(encoding="utf8") as f:
-        raw_file_content = f.readlines()
+    # Dicts keep insertion order. Insert again to move the model to the end
+    _parsed_models.pop(file_path, None)
+    _parsed_models[file_path] = (parsed_sections, model)
+    _drop_least_recently_used()
+
 
-    file_content = ""
-    cur_section = None
-    for line in raw_file_content:
-        if line.startswith("***"):
-            cur_section = line.strip("* \n").lower()
+def _drop_least_recently_used() -> None:
+    if _max_parsed_files <= 0:
+        return
 
-            # Limitation: No localisation
-            if not cur_section.endswith("s"):
-                # Is an old singular section header. Make plural
-                cur_section += "s"
+    while len(_parsed_models) > _max_parsed_files:
+        del _parsed_models[next(iter(_parsed_models))]
 
-            # Always keep section headings
-            file_content += line
-            continue
 
-        if cur_section and cur_section not in parse_sections:
-            continue
+def _get_sections_view(
+    model: robot.api.parsing.File,
+    parse_sections: ParseSections,
+) -> robot.api.parsing.File:
+    """
+    Get a shallow copy of the model with only specific sections.
+
+    Other sections are emptied, but their headers are kept.
+    """
+    if parse_sections == "all":
+        return model
 
-        file_content += line
+    sections = []
+    for section in model.sections:
+        # The implicit comment section at the start of a file has no header. Always keep it
+        if section.header is None or _SECTION_HEADERS.get(section.header.type) in parse_sections:
+            sections.append(section)
+        else:
+            sections.append(type(section)(header=section.header))
 
-    return file_content
+    return robot.api.parsing.File(
+        sections=sections,
+        source=model.source,
+        languages=model.languages,
+    )
+
+
+def _get_pickled_models(
+    parse_args: list[tuple[Path, ParseSections]],
+    summarize: Callable[[robot.api.parsing.File], Any] | None = None,
+) -> list[tuple[bytes, bool | None]]:
+    """
+    Parse a chunk of files in a worker process.
+    """
+    return [
+        _get_pickled_model(file_path, parse_sections, summarize)
+        for (file_path, parse_sections) in parse_args
+    ]
+
+
+def _get_pickled_model(
+    file_path: Path,
+    parse_sections: ParseSections,
+    summarize: Callable[[robot.api.parsing.File], Any] | None = None,
+) -> tuple[bytes, bool | None]:
+    """
+    Parse a file in a worker process.
+
+    Returns the pickled model, or its pickled summary when `summarize` is given. Also returns
+    whether the model came from the persistent parse cache (None when the cache is disabled).
+    """
+    parse_cache = get_parse_cache()
+    hits = parse_cache.hits if parse_cache else 0
+
+    model = _get_model(file_path, parse_sections)
+
+    cache_hit = parse_cache.hits > hits if parse_cache else None
+    if summarize is None:
+        return (dumps_model(model), cache_hit)
+    return (pickle.dumps(summarize(model), protocol=pickle.HIGHEST_PROTOCOL), cache_hit)
+
+
+def _get_model(
+    file_path: Path,
+    parse_sections: ParseSections,
+) -> robot.api.parsing.File:
+    parse_cache = get_parse_cache()
+    if parse_cache is None:
+        return _parse_robot_file(file_path, parse_sections)
+
+    return parse_cache.get_model(
+        file_path,
+        parse_sections,
+        lambda: _parse_robot_file(file_path, parse_sections),
+    )
+
+
+def _parse_robot_file(
+    file_path: Path,
+    parse_sections: ParseSections,
+) -> robot.api.parsing.File:
+    if parse_sections == "all" or file_path.suffix.lower() not in [".robot", ".resource"]:
+        return robot.api.parsing.get_model(file_path, data_only=True)
+
+    file_content = read_sections(file_path, parse_sections)
+    model = robot.api.parsing.get_model(io.StringIO(file_content), data_only=True)
+    model.source = file_path
+    return model
@@ -1,6 +1,15 @@
+import re
+
 # Shortest possible var: `${x}`
 MIN_VAR_CHAR_COUNT = 4
 
+VARIABLE_START_CHARS = "$&@%"
+
+_BRACE_PATTERN = re.compile(r"[{}]")
+# Variable start, or `$name` in Python expressions.
+# Details: https://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#special-variable-syntax
+_REFERENCE_PATTERN = re.compile(r"[$@&%]{|\$(\w+)")
+
 
 def get_variables_in_string(input_string: str) -> list[str]:
     """
@@ -8,41 +17,85 @@ def get_variables_in_string(input_string: str) -> list[str]:
     """
     variables: list[str] = []
 
-    string = input_string
-    while len(string) > 0:
-        string = _find_variable_start(string)
-        (string, variable) = _find_variable_end(string)
+    position = 0
+    while True:
+        start = _find_variable_start(input_string, position)
+        if start is None:
+            break
 
-        if variable:
-            variables.append(variable)
+        position = _find_variable_end(input_string, start)
+        variables.append(input_string[start:position])
 
     return variables
 
 
-def _find_variable_start(string: str) -> str:
-    while len(string) >= MIN_VAR_CHAR_COUNT and string[0:2] not in ["${", "&{", "@{", "%{"]:
-        string = string[1:]
+def get_variable_references(input_string: str, *, python_expression: bool = False) -> list[str]:
+    """
+    Return the Robot variables in a string, in a single pass.
+
+    Also returns the variables used in inline Python evaluations (`${{ }}`). In Python expressions,
+    also returns variables used with the special `$name` syntax as `${name}`.
+    """
+    references: list[str] = []
+    last_start = len(input_string) - MIN_VAR_CHAR_COUNT
+
+    position = 0
+    while True:
+        match = _REFERENCE_PATTERN.search(input_string, position)
+        if match is None:
+            break
+
+        name = match.group(1)
+        if name is not None:
+            if python_expression:
+                references.append("${" + name + "}")
+            position = match.end()
+            continue
+
+        start = match.start()
+        if start > last_start:
+            # Too short to be a variable
+            position = start + 1
+            continue
 
-    if len(string) < MIN_VAR_CHAR_COUNT:
-        return ""
+        position = _find_variable_end(input_string, start)
+        variable = input_string[start:position]
+        references.append(variable)
 
-    return string
+        # Details: https://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#inline-python-evaluation
+        if len(variable) > len("${{}}") and variable.startswith("${{") and variable.endswith("}}"):
+            references += get_variable_references(variable[3:-2], python_expression=True)
 
+    return references
 
-def _find_variable_end(string: str) -> tuple[str, str | None]:
-    variable = ""
+
+def _find_variable_start(string: str, position: int) -> int | None:
+    """Find the index of the next variable start at or after the given position"""
+    last_start = len(string) - MIN_VAR_CHAR_COUNT
+
+    brace = string.find("{", position + 1)
+    while brace != -1 and brace - 1 <= last_start:
+        if string[brace - 1] in VARIABLE_START_CHARS:
+            return brace - 1
+        brace = string.find("{", brace + 1)
+
+    return None
+
+
+def _find_variable_end(string: str, start: int) -> int:
+    """
+    Find the index just after the end of the variable.
+
+    Variables without a closing brace end at the end of the string.
+    """
     depth = 0
-    while len(string) > 0:
-        char = string[0]
-        if char == "{":
+    for match in _BRACE_PATTERN.finditer(string, start):
+        if match.group() == "{":
             depth += 1
-        if char == "}":
-            depth -= 1
+            continue
 
-        variable += char
-        string = string[1:]
-
-        if char == "}" and depth == 0:
-            break
+        depth -= 1
+        if depth == 0:
+            return match.end()
 
-    return (string, variable or None)
+    return len(string)
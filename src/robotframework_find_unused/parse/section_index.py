@@ -0,0 +1,164 @@
+"""
+Find sections of Robot files without tokenizing the files
+"""
+
+import contextlib
+import functools
+import mmap
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal, TypeAlias
+
+from robot.conf import Languages
+from robot.errors import DataError
+
+RobotFileSectionName: TypeAlias = Literal[
+    "comments",
+    "settings",
+    "variables",
+    "keywords",
+    "test cases",
+    "tasks",
+]
+
+# Files of at least this many bytes are memory-mapped instead of read
+MMAP_MIN_FILE_SIZE = 1024 * 1024
+
+_SECTION_NAMES: dict[str, RobotFileSectionName] = {
+    "Comments": "comments",
+    "Settings": "settings",
+    "Variables": "variables",
+    "Keywords": "keywords",
+    "Test Cases": "test cases",
+    "Tasks": "tasks",
+}
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+_LANGUAGE_PATTERN = re.compile(rb"^language:[^\S\r\n]*([^\r\n]*)", re.MULTILINE | re.IGNORECASE)
+_CELL_SEPARATOR_PATTERN = re.compile(r"\s{2,}|\t")
+
+
+@dataclass(slots=True)
+class SectionSlice:
+    """Byte offsets of a single section in a Robot file"""
+
+    name: RobotFileSectionName | None
+    """None for the implicit comment section at the start of a file, and unknown sections"""
+    start: int
+    """Start of the header line"""
+    body_start: int
+    """Start of the line after the header"""
+    end: int
+
+
+def read_sections(file_path: Path, sections: Iterable[RobotFileSectionName]) -> str:
+    """
+    Read the content of specific sections of a Robot file.
+
+    Other known sections are emptied, but their header lines are kept. Their lines are replaced
+    with empty lines, so line numbers don't change. Emptied sections are never decoded.
+    """
+    with file_path.open("rb") as f:
+        if file_path.stat().st_size < MMAP_MIN_FILE_SIZE:
+            return _read_sections(f.read(), set(sections))
+
+        try:
+            content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Can't map files that were emptied in the meantime
+            return _read_sections(f.read(), set(sections))
+        with content:
+            return _read_sections(content, set(sections))
+
+
+def _read_sections(content: bytes | mmap.mmap, sections: set[RobotFileSectionName]) -> str:
+    chunks: list[bytes] = []
+    for section in get_section_index(content):
+        if section.name is None or section.name in sections:
+            chunks.append(content[section.start : section.end])
+            continue
+
+        chunks.append(content[section.start : section.body_start])
+        chunks.append(b"\n" * content[section.body_start : section.end].count(b"\n"))
+
+    return b"".join(chunks).decode("utf-8")
+
+
+def get_section_index(content: bytes | mmap.mmap) -> list[SectionSlice]:
+    """
+    Get the byte offsets of every section in the content of a Robot file.
+
+    Recognizes section headers in English, and in languages configured in the file with
+    `language: <lang>`.
+    """
+    content_start = len(_UTF8_BOM) if content[: len(_UTF8_BOM)] == _UTF8_BOM else 0
+    header_starts = _find_header_starts(content, content_start)
+
+    implicit_end = header_starts[0] if header_starts else len(content)
+    languages = _get_languages(content, content_start, implicit_end)
+
+    sections = [SectionSlice(None, content_start, content_start, implicit_end)]
+    for i, start in enumerate(header_starts):
+        end = header_starts[i + 1] if i + 1 < len(header_starts) else len(content)
+        body_start = content.find(b"\n", start, end) + 1 or end
+        header_line = content[start:body_start].decode("utf-8")
+        sections.append(
+            SectionSlice(_get_section_name(header_line, languages), start, body_start, end),
+        )
+    return sections
+
+
+def _find_header_starts(content: bytes | mmap.mmap, start: int) -> list[int]:
+    """
+    Find the start of every line that starts with `*`.
+
+    Searches with `find`, which is a lot faster than a multiline regex.
+    """
+    header_starts = [start] if content[start : start + 1] == b"*" else []
+    position = content.find(b"\n*", start)
+    while position != -1:
+        header_starts.append(position + 1)
+        position = content.find(b"\n*", position + 2)
+    return header_starts
+
+
+def _get_languages(content: bytes | mmap.mmap, start: int, end: int) -> tuple[str, ...]:
+    """
+    Get the languages configured in the implicit comment section.
+    """
+    return tuple(
+        match.group(1).decode("utf-8").strip()
+        for match in _LANGUAGE_PATTERN.finditer(content, start, end)
+    )
+
+
+def _get_section_name(
+    header_line: str,
+    languages: tuple[str, ...],
+) -> RobotFileSectionName | None:
+    """
+    Get the name of a section like Robot does. Returns None for unknown section headers.
+    """
+    marker = _CELL_SEPARATOR_PATTERN.split(header_line.strip(), maxsplit=1)[0]
+    normalized = " ".join(marker.split()).strip("* ").title()
+
+    english_name = _get_header_translations(languages).get(normalized)
+    if english_name is None and f"{normalized}s" in _SECTION_NAMES:
+        # Deprecated singular header
+        english_name = f"{normalized}s"
+    return _SECTION_NAMES.get(english_name) if english_name else None
+
+
+@functools.cache
+def _get_header_translations(languages: tuple[str, ...]) -> dict[str, str]:
+    """
+    Get English section headers by translated section header.
+    """
+    translations = Languages()
+    for language in languages:
+        # Robot reports invalid languages and continues without them
+        with contextlib.suppress(DataError):
+            translations.add_language(language)
+    return translations.headers
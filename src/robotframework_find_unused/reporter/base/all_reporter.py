@@ -0,0 +1,50 @@
+import contextlib
+from typing import TYPE_CHECKING, Literal, TypeAlias
+
+from .argument_reporter import ArgumentReporter
+from .file_reporter import FileReporter
+from .keyword_reporter import KeywordReporter
+from .partial.discover_files import PartialReporter_DiscoverFiles
+from .partial.profiling import PartialReporter_Profile
+from .return_reporter import ReturnReporter
+from .variable_reporter import VariableReporter
+
+if TYPE_CHECKING:
+    from robotframework_find_unused.commands.all.options import AllOptions
+
+AnalysisName: TypeAlias = Literal["keywords", "arguments", "returns", "variables", "files"]
+
+
+class AllReporter(PartialReporter_DiscoverFiles, PartialReporter_Profile):
+    """
+    Base reporter class for all command.
+
+    Delegates to a reporter for each analysis.
+    """
+
+    keywords: KeywordReporter
+    arguments: ArgumentReporter
+    returns: ReturnReporter
+    variables: VariableReporter
+    files: FileReporter
+
+    def __init__(self, options: "AllOptions") -> None:
+        self.options = options
+        self.keywords = KeywordReporter(options.keywords)
+        self.arguments = ArgumentReporter(options.arguments)
+        self.returns = ReturnReporter(options.returns)
+        self.variables = VariableReporter(options.variables)
+        self.files = FileReporter(options.files)
+
+    def on_command_start(self):
+        """Before the command does anything"""
+
+    def on_command_end(self):
+        """When the command has done all the things"""
+
+    def on_analysis(
+        self,
+        analysis: AnalysisName,  # noqa: ARG002
+    ) -> contextlib.AbstractContextManager:
+        """Wrap a single analysis. Ends after `on_command_end` of the analysis reporter"""
+        return contextlib.nullcontext()
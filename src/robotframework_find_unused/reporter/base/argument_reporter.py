@@ -9,6 +9,7 @@ from .partial.keyword_definitions import (
     PartialReporter_DownloadedKeywordDefinitions,
 )
 from .partial.parse_files import PartialReporter_ParseFiles
+from .partial.profiling import PartialReporter_Profile
 
 if TYPE_CHECKING:
     from robotframework_find_unused.commands.arguments.options import ArgumentsOptions
@@ -20,6 +21,7 @@ class ArgumentReporter(
     PartialReporter_CustomKeywordDefinitions,
     PartialReporter_DownloadedKeywordDefinitions,
     PartialReporter_CountKeywords,
+    PartialReporter_Profile,
 ):
     """
     Base reporter class for keyword command.
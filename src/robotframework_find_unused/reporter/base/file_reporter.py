@@ -2,13 +2,15 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .partial.discover_files import PartialReporter_DiscoverFiles
+from .partial.profiling import PartialReporter_Profile
+from .partial.watch import PartialReporter_Watch
 
 if TYPE_CHECKING:
     from robotframework_find_unused.commands.files.options import FileOptions
     from robotframework_find_unused.common.const import FileUseData
 
 
-class FileReporter(PartialReporter_DiscoverFiles):
+class FileReporter(PartialReporter_DiscoverFiles, PartialReporter_Watch, PartialReporter_Profile):
     """
     Base reporter class for files command.
     """
@@ -22,6 +24,13 @@ class FileReporter(PartialReporter_DiscoverFiles):
     def on_command_end(self, files: list["FileUseData"]):
         """When the command has done all the things"""
 
+    def on_watch_update(
+        self,
+        previous_files: list["FileUseData"],
+        files: list["FileUseData"],
+    ):
+        """When the results are updated after files changed in watch mode"""
+
     def on_count_file_uses_start(self, file_paths: list[Path], source_path: Path):
         """Before finding out which files are used"""
 
@@ -8,7 +8,10 @@ from .partial.keyword_definitions import (
     PartialReporter_CustomKeywordDefinitions,
     PartialReporter_DownloadedKeywordDefinitions,
 )
+from .partial.keyword_index import PartialReporter_KeywordIndex
 from .partial.parse_files import PartialReporter_ParseFiles
+from .partial.profiling import PartialReporter_Profile
+from .partial.watch import PartialReporter_Watch
 
 if TYPE_CHECKING:
     from robotframework_find_unused.commands.keywords.options import KeywordOptions
@@ -20,6 +23,9 @@ class KeywordReporter(
     PartialReporter_CustomKeywordDefinitions,
     PartialReporter_DownloadedKeywordDefinitions,
     PartialReporter_CountKeywords,
+    PartialReporter_KeywordIndex,
+    PartialReporter_Watch,
+    PartialReporter_Profile,
 ):
     """
     Base reporter class for keyword command.
@@ -33,3 +39,10 @@ class KeywordReporter(
 
     def on_command_end(self, counted_keywords: list[KeywordData]):
         """When the command has done all the things"""
+
+    def on_watch_update(
+        self,
+        previous_keywords: list[KeywordData],
+        counted_keywords: list[KeywordData],
+    ):
+        """When the results are updated after files changed in watch mode"""
@@ -32,6 +32,9 @@ class PartialReporter_CountKeywords:  # noqa: N801
     ):
         """After keyword uses are counted"""
 
+    def on_keyword_resolution_cache_stats(self, cache_hits: int, cache_misses: int):
+        """After keyword uses are counted. With the use of the keyword call resolution cache."""
+
     def on_filter_keywords(
         self,
         keywords: "list[KeywordData]",
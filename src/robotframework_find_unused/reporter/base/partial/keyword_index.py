@@ -0,0 +1,32 @@
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from robotframework_find_unused.commands.keywords.options import KeywordOptions
+
+
+class PartialReporter_KeywordIndex:  # noqa: N801
+    """
+    Partial base reporter for the incremental keyword index.
+    """
+
+    def __init__(self, options: "KeywordOptions") -> None:
+        self.options = options
+
+    def on_keyword_index_load_start(self):
+        """Before the keyword index is loaded"""
+
+    def on_keyword_index_load_end(
+        self,
+        *,
+        index_found: bool,
+        changed_files: list[Path],
+        deleted_files: list[str],
+    ):
+        """After the keyword index is loaded and changed files are known"""
+
+    def on_keyword_index_changed_files_error(self, error: str):
+        """When getting changed files from Git fails"""
+
+    def on_keyword_index_definitions_changed(self):
+        """When keyword definitions changed. Keyword uses must be counted in all files."""
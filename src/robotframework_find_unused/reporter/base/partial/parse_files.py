@@ -17,7 +17,7 @@ class PartialReporter_ParseFiles:  # noqa: N801
         self.options = options
 
     def on_parse_files_start(self, file_paths: list[Path]):
-        """Before Libdoc file parsing starts"""
+        """Before file parsing starts"""
 
     def on_parse_files_end(
         self,
@@ -25,4 +25,4 @@ class PartialReporter_ParseFiles:  # noqa: N801
         files: list[LibraryDoc],
         parse_errors: list[str],
     ):
-        """After all files have been parsed by Libdoc"""
+        """After all files have been parsed"""
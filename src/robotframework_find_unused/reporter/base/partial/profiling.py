@@ -0,0 +1,31 @@
+from typing import TYPE_CHECKING, TypeAlias
+
+if TYPE_CHECKING:
+    from robotframework_find_unused.commands.all.options import AllOptions
+    from robotframework_find_unused.commands.arguments.options import ArgumentsOptions
+    from robotframework_find_unused.commands.files.options import FileOptions
+    from robotframework_find_unused.commands.keywords.options import KeywordOptions
+    from robotframework_find_unused.commands.returns.options import ReturnOptions
+    from robotframework_find_unused.commands.variables.options import VariableOptions
+    from robotframework_find_unused.common.profiling import StepProfile
+
+    CommandOptions: TypeAlias = (
+        KeywordOptions
+        | ArgumentsOptions
+        | ReturnOptions
+        | VariableOptions
+        | FileOptions
+        | AllOptions
+    )
+
+
+class PartialReporter_Profile:  # noqa: N801
+    """
+    Partial base reporter for profiling.
+    """
+
+    def __init__(self, options: "CommandOptions") -> None:
+        self.options = options
+
+    def on_profile_end(self, steps: "list[StepProfile]", output_path: str | None):
+        """After the command, when profiling"""
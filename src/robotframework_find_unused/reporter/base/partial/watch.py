@@ -0,0 +1,25 @@
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from robotframework_find_unused.commands.files.options import FileOptions
+    from robotframework_find_unused.commands.keywords.options import KeywordOptions
+    from robotframework_find_unused.commands.variables.options import VariableOptions
+
+
+class PartialReporter_Watch:  # noqa: N801
+    """
+    Partial base reporter for watch mode.
+    """
+
+    def __init__(self, options: "KeywordOptions | VariableOptions | FileOptions") -> None:
+        self.options = options
+
+    def on_watch_start(self, file_paths: list[Path]):
+        """Before watching files for changes"""
+
+    def on_watch_change(self, changed_files: list[Path]):
+        """When files changed, before the results are updated"""
+
+    def on_watch_end(self):
+        """When the user stops watching"""
@@ -4,12 +4,18 @@ from typing import TYPE_CHECKING
 from robotframework_find_unused.common.const import VariableData
 
 from .partial.discover_files import PartialReporter_DiscoverFiles
+from .partial.profiling import PartialReporter_Profile
+from .partial.watch import PartialReporter_Watch
 
 if TYPE_CHECKING:
     from robotframework_find_unused.commands.variables.options import VariableOptions
 
 
-class VariableReporter(PartialReporter_DiscoverFiles):
+class VariableReporter(
+    PartialReporter_DiscoverFiles,
+    PartialReporter_Watch,
+    PartialReporter_Profile,
+):
     """
     Base reporter class for variable command.
     """
@@ -23,6 +29,13 @@ class VariableReporter(PartialReporter_DiscoverFiles):
     def on_command_end(self, counted_variables: list[VariableData]):
         """When the command has done all the things"""
 
+    def on_watch_update(
+        self,
+        previous_variables: list[VariableData],
+        counted_variables: list[VariableData],
+    ):
+        """When the results are updated after files changed in watch mode"""
+
     def on_get_variable_definitions_start(
         self,
         file_paths: list[Path],
@@ -0,0 +1,67 @@
+import sys
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import click
+
+from robotframework_find_unused.reporter.base.all_reporter import AllReporter, AnalysisName
+
+from .argument_reporter import ArgumentCliReporter
+from .file_reporter import FileCliReporter
+from .keyword_reporter import KeywordCliReporter
+from .partial.discover_files import PartialCliReporterDiscoverFiles
+from .partial.profiling import PartialCliReporterProfile
+from .return_reporter import ReturnCliReporter
+from .variable_reporter import VariableCliReporter
+
+if TYPE_CHECKING:
+    from robotframework_find_unused.commands.all.options import AllOptions
+
+ANALYSIS_TITLES: dict[AnalysisName, str] = {
+    "keywords": "Keywords",
+    "arguments": "Keyword arguments",
+    "returns": "Keyword returns",
+    "variables": "Variables",
+    "files": "Files",
+}
+
+
+class AllCliReporter(AllReporter, PartialCliReporterDiscoverFiles, PartialCliReporterProfile):
+    """
+    CLI reporter for all command.
+    """
+
+    def __init__(self, options: "AllOptions") -> None:
+        self.options = options
+        self.keywords = KeywordCliReporter(options.keywords)
+        self.arguments = ArgumentCliReporter(options.arguments)
+        self.returns = ReturnCliReporter(options.returns)
+        self.variables = VariableCliReporter(options.variables)
+        self.files = FileCliReporter(options.files)
+        self.exit_codes: dict[AnalysisName, int] = {}
+
+    @contextmanager
+    def on_analysis(self, analysis: AnalysisName) -> Generator[None]:
+        """
+        Wrap a single analysis.
+
+        The CLI reporter of every analysis exits when it's done. Keep the exit code and continue
+        with the next analysis instead.
+        """
+        click.echo()
+        click.echo(click.style(f"--- {ANALYSIS_TITLES[analysis]} ---", bold=True))
+
+        try:
+            yield
+        except SystemExit as e:
+            self.exit_codes[analysis] = e.code if isinstance(e.code, int) else 1
+        else:
+            self.exit_codes[analysis] = 0
+
+    def on_command_end(self):
+        if 255 in self.exit_codes.values():  # noqa: PLR2004
+            sys.exit(255)
+
+        exit_code = sum(self.exit_codes.values())
+        sys.exit(min(exit_code, 200))
@@ -17,6 +17,7 @@ from .partial.keyword_definitions import (
     PartialCliReporterDownloadedKeywordDefinitions,
 )
 from .partial.parse_files import PartialCliReporterParseFiles
+from .partial.profiling import PartialCliReporterProfile
 
 
 class ArgumentCliReporter(
@@ -26,6 +27,7 @@ class ArgumentCliReporter(
     PartialCliReporterCountKeywords,
     PartialCliReporterCustomKeywordDefinitions,
     PartialCliReporterDownloadedKeywordDefinitions,
+    PartialCliReporterProfile,
 ):
     """
     CLI reporter for keyword command.
@@ -29,6 +29,8 @@ from .common import (
     pretty_file_path,
 )
 from .partial.discover_files import PartialCliReporterDiscoverFiles
+from .partial.profiling import PartialCliReporterProfile
+from .partial.watch import PartialCliReporterWatch
 
 
 @dataclass
@@ -40,7 +42,12 @@ class FileImportTreePrintLine:
     color: str | None
 
 
-class FileCliReporter(FileReporter, PartialCliReporterDiscoverFiles):
+class FileCliReporter(
+    FileReporter,
+    PartialCliReporterDiscoverFiles,
+    PartialCliReporterWatch,
+    PartialCliReporterProfile,
+):
     """
     CLI reporter for files command.
     """
@@ -132,10 +139,31 @@ class FileCliReporter(FileReporter, PartialCliReporterDiscoverFiles):
             self._cli_print_grouped_file_trees(files)
         self._cli_log_results(files)
 
+        if self.options.watch:
+            return
+
         unused_files = [f for f in files if "SUITE" not in f.type and len(f.used_by) == 0]
         exit_code = len(unused_files)
         sys.exit(min(exit_code, 200))
 
+    def on_watch_update(
+        self,
+        previous_files: list[FileUseData],
+        files: list[FileUseData],
+    ):
+        self._echo_watch_diff(
+            self._get_unused_files_by_id(previous_files),
+            self._get_unused_files_by_id(files),
+            "files",
+        )
+
+    def _get_unused_files_by_id(self, files: list[FileUseData]) -> dict[str, str]:
+        return {
+            file.id: pretty_file_path(to_relative_path(self.cwd, file.resolved_to.path), file.type)
+            for file in files
+            if "SUITE" not in file.type and len(file.used_by) == 0
+        }
+
     def _cli_log_file_import_warnings_lines_gen(
         self,
         file: FileUseData,
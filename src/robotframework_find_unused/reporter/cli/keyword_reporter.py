@@ -13,7 +13,10 @@ from .partial.keyword_definitions import (
     PartialCliReporterCustomKeywordDefinitions,
     PartialCliReporterDownloadedKeywordDefinitions,
 )
+from .partial.keyword_index import PartialCliReporterKeywordIndex
 from .partial.parse_files import PartialCliReporterParseFiles
+from .partial.profiling import PartialCliReporterProfile
+from .partial.watch import PartialCliReporterWatch
 
 
 class KeywordCliReporter(
@@ -23,6 +26,9 @@ class KeywordCliReporter(
     PartialCliReporterCountKeywords,
     PartialCliReporterCustomKeywordDefinitions,
     PartialCliReporterDownloadedKeywordDefinitions,
+    PartialCliReporterKeywordIndex,
+    PartialCliReporterWatch,
+    PartialCliReporterProfile,
 ):
     """
     CLI reporter for keyword command.
@@ -46,6 +52,27 @@ class KeywordCliReporter(
             for kw in unused_keywords:
                 click.echo("  " + pretty_kw_name(kw))
 
+        if self.options.watch:
+            return
+
         unused_keywords = [kw for kw in counted_keywords if kw.use_count == 0]
         exit_code = len(unused_keywords)
         sys.exit(min(exit_code, 200))
+
+    def on_watch_update(
+        self,
+        previous_keywords: list[KeywordData],
+        counted_keywords: list[KeywordData],
+    ):
+        self._echo_watch_diff(
+            self._get_unused_keywords_by_id(previous_keywords),
+            self._get_unused_keywords_by_id(counted_keywords),
+            "keywords",
+        )
+
+    def _get_unused_keywords_by_id(self, keywords: list[KeywordData]) -> dict[str, str]:
+        return {
+            f"{kw.normalized_name}|{kw.library}": pretty_kw_name(kw)
+            for kw in keywords
+            if kw.use_count == 0
+        }
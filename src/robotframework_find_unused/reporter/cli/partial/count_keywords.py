@@ -3,6 +3,7 @@ from pathlib import Path
 import click
 
 from robotframework_find_unused.common.const import (
+    VERBOSE_DOUBLE,
     VERBOSE_NO,
     KeywordData,
 )
@@ -73,6 +74,15 @@ class PartialCliReporterCountKeywords(PartialReporter_CountKeywords):
             for kw in unknown_keywords:
                 click.echo(f"{INDENT}{kw.name}")
 
+    def on_keyword_resolution_cache_stats(self, cache_hits: int, cache_misses: int):
+        if self.options.verbose < VERBOSE_DOUBLE:
+            return
+
+        click.echo(
+            f"{NOTE} Resolved keyword calls with {cache_hits} cache hits "
+            f"and {cache_misses} cache misses",
+        )
+
     def on_filter_keywords(
         self,
         keywords: list[KeywordData],
@@ -91,10 +91,10 @@ class PartialCliReporterDownloadedKeywordDefinitions(PartialReporter_DownloadedK
         for lib in libraries:
             if lib.import_error:
                 click.echo(f"{INDENT}{lib.name}: {ERROR}")
-            elif len(lib.keywords) == 0:
-                click.echo(f"{INDENT}{lib.name}: {len(lib.keywords)} keywords {WARN}")
+            elif len(lib.keyword_docs) == 0:
+                click.echo(f"{INDENT}{lib.name}: {len(lib.keyword_docs)} keywords {WARN}")
             else:
-                click.echo(f"{INDENT}{lib.name}: {len(lib.keywords)} keywords")
+                click.echo(f"{INDENT}{lib.name}: {len(lib.keyword_docs)} keywords")
 
     def on_library_parse_error(
         self,
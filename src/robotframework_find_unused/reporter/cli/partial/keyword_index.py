@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import click
+
+from robotframework_find_unused.common.const import VERBOSE_NO
+from robotframework_find_unused.reporter.base.partial.keyword_index import (
+    PartialReporter_KeywordIndex,
+)
+from robotframework_find_unused.reporter.cli.common import (
+    DONE,
+    INDENT,
+    NOTE,
+    WARN,
+)
+
+
+class PartialCliReporterKeywordIndex(PartialReporter_KeywordIndex):
+    """
+    Partial CLI reporter for the incremental keyword index.
+    """
+
+    def on_keyword_index_load_start(self):
+        click.echo("Loading keyword index...")
+
+    def on_keyword_index_load_end(
+        self,
+        *,
+        index_found: bool,
+        changed_files: list[Path],
+        deleted_files: list[str],
+    ):
+        if not index_found:
+            click.echo(f"{NOTE} No keyword index found. Indexing all files")
+            return
+
+        click.echo(
+            f"{DONE} Found {len(changed_files)} changed files "
+            f"and {len(deleted_files)} deleted files",
+        )
+
+        if self.options.verbose == VERBOSE_NO:
+            return
+
+        for path in changed_files:
+            click.echo(f"{INDENT}Changed: {click.style(str(path), fg='bright_black')}")
+        for path in deleted_files:
+            click.echo(f"{INDENT}Deleted: {click.style(path, fg='bright_black')}")
+
+    def on_keyword_index_changed_files_error(self, error: str):
+        click.echo(f"{WARN} Failed to get changed files from Git: {error}")
+        click.echo(f"{NOTE} Comparing file contents instead")
+
+    def on_keyword_index_definitions_changed(self):
+        click.echo(f"{NOTE} Keyword definitions changed. Counting keyword usage in all files")
@@ -23,7 +23,7 @@ class PartialCliReporterParseFiles(PartialReporter_ParseFiles):
     """
 
     def on_parse_files_start(self, file_paths: list[Path]):
-        click.echo("Parsing files with LibDoc...")
+        click.echo("Parsing files...")
 
     def on_parse_files_end(
         self,
@@ -31,7 +31,7 @@ class PartialCliReporterParseFiles(PartialReporter_ParseFiles):
         files: list[LibraryDoc],
         parse_errors: list[str],
     ):
-        """After all files have been parsed by Libdoc"""
+        """After all files have been parsed"""
         if len(parse_errors) > 0:
             click.echo(
                 f"{WARN} Failed to parse {len(parse_errors)} files. Files will be ignored",
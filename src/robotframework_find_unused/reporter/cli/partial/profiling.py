@@ -0,0 +1,44 @@
+import click
+
+from robotframework_find_unused.common.profiling import StepProfile
+from robotframework_find_unused.reporter.base.partial.profiling import PartialReporter_Profile
+from robotframework_find_unused.reporter.cli.common import INDENT, NOTE
+
+
+class PartialCliReporterProfile(PartialReporter_Profile):
+    """
+    Partial CLI reporter for profiling.
+    """
+
+    def on_profile_end(self, steps: list[StepProfile], output_path: str | None):
+        click.echo()
+        click.echo(click.style("Profile", bold=True))
+
+        name_width = max([len("Step"), *[len(step.name) for step in steps]])
+        click.echo(
+            click.style(
+                f"{INDENT}{'Step':<{name_width}}  {'Wall':>9}  {'CPU':>9}  "
+                f"{'Peak mem':>10}  {'Peak RSS':>10}  Items",
+                fg="bright_black",
+            ),
+        )
+        for step in steps:
+            peak_rss = "-" if step.peak_rss_mb is None else f"{step.peak_rss_mb:.1f} MB"
+            items = ", ".join(f"{count} {name}" for name, count in step.items.items())
+            click.echo(
+                f"{INDENT}{step.name:<{name_width}}  "
+                f"{step.wall_seconds:>8.3f}s  {step.cpu_seconds:>8.3f}s  "
+                f"{step.peak_memory_mb:>7.1f} MB  {peak_rss:>10}  {items}",
+            )
+
+        total_wall = sum(step.wall_seconds for step in steps)
+        total_cpu = sum(step.cpu_seconds for step in steps)
+        click.echo(
+            click.style(
+                f"{INDENT}{'Total':<{name_width}}  {total_wall:>8.3f}s  {total_cpu:>8.3f}s",
+                bold=True,
+            ),
+        )
+
+        if output_path is not None:
+            click.echo(f"{NOTE} Profile written to {output_path}")
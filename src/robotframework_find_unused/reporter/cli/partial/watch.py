@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import click
+
+from robotframework_find_unused.reporter.base.partial.watch import PartialReporter_Watch
+from robotframework_find_unused.reporter.cli.common import INDENT
+
+
+class PartialCliReporterWatch(PartialReporter_Watch):
+    """
+    Partial CLI reporter for watch mode.
+    """
+
+    def on_watch_start(self, file_paths: list[Path]):
+        click.echo()
+        click.echo(f"Watching {len(file_paths)} files for changes. Press Ctrl+C to stop...")
+
+    def on_watch_change(self, changed_files: list[Path]):
+        click.echo()
+        click.echo(f"Detected changes in {len(changed_files)} files:")
+        for path in changed_files:
+            click.echo(INDENT + click.style(str(path), fg="bright_black"))
+
+    def on_watch_end(self):
+        click.echo()
+        click.echo("Stopped watching")
+
+    def _echo_watch_diff(
+        self,
+        previous_unused: dict[str, str],
+        current_unused: dict[str, str],
+        descriptor: str,
+    ) -> None:
+        """
+        Output the difference between the previous and current unused items.
+
+        Items are keyed by a unique id. Values are formatted for output.
+        """
+        newly_unused = [
+            current_unused[key] for key in sorted(current_unused) if key not in previous_unused
+        ]
+        newly_used = [
+            previous_unused[key] for key in sorted(previous_unused) if key not in current_unused
+        ]
+
+        click.echo(
+            f"Found {len(current_unused)} unused {descriptor} "
+            + click.style(f"(+{len(newly_unused)} -{len(newly_used)})", fg="bright_black"),
+        )
+        for item in newly_unused:
+            click.echo(INDENT + click.style("+ ", fg="red") + item)
+        for item in newly_used:
+            click.echo(INDENT + click.style("- ", fg="green") + item)
@@ -14,6 +14,7 @@ from .partial.keyword_definitions import (
     PartialCliReporterDownloadedKeywordDefinitions,
 )
 from .partial.parse_files import PartialCliReporterParseFiles
+from .partial.profiling import PartialCliReporterProfile
 
 
 class ReturnCliReporter(
@@ -23,6 +24,7 @@ class ReturnCliReporter(
     PartialCliReporterCountKeywords,
     PartialCliReporterCustomKeywordDefinitions,
     PartialCliReporterDownloadedKeywordDefinitions,
+    PartialCliReporterProfile,
 ):
     """
     CLI reporter for return command.
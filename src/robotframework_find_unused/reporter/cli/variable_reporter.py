@@ -20,9 +20,16 @@ from .common import (
     pretty_variable,
 )
 from .partial.discover_files import PartialCliReporterDiscoverFiles
+from .partial.profiling import PartialCliReporterProfile
+from .partial.watch import PartialCliReporterWatch
 
 
-class VariableCliReporter(VariableReporter, PartialCliReporterDiscoverFiles):
+class VariableCliReporter(
+    VariableReporter,
+    PartialCliReporterDiscoverFiles,
+    PartialCliReporterWatch,
+    PartialCliReporterProfile,
+):
     """
     CLI reporter for variable command.
     """
@@ -149,14 +156,7 @@ class VariableCliReporter(VariableReporter, PartialCliReporterDiscoverFiles):
 
         if self.options.filter_glob:
             click.echo(f"Only showing variables matching pattern '{self.options.filter_glob}'")
-
-            pattern = self.options.filter_glob.lower()
-            filtered_variables = []
-            for var in counted_variables:
-                if fnmatch.fnmatchcase(var.normalized_name, pattern):
-                    filtered_variables.append(var)
-
-            counted_variables = filtered_variables
+            counted_variables = self._filter_variables(counted_variables)
 
         if self.options.show_all_count:
             sorted_variables = sorted(counted_variables, key=lambda var: var.normalized_name)
@@ -173,10 +173,43 @@ class VariableCliReporter(VariableReporter, PartialCliReporterDiscoverFiles):
             for var in unused_variables:
                 click.echo(INDENT + pretty_variable(var))
 
+        if self.options.watch:
+            return
+
         unused_variables = [var for var in counted_variables if var.use_count == 0]
         exit_code = len(unused_variables)
         sys.exit(min(exit_code, 200))
 
+    def on_watch_update(
+        self,
+        previous_variables: list[VariableData],
+        counted_variables: list[VariableData],
+    ):
+        self._echo_watch_diff(
+            self._get_unused_variables_by_id(previous_variables),
+            self._get_unused_variables_by_id(counted_variables),
+            "variables",
+        )
+
+    def _get_unused_variables_by_id(self, variables: list[VariableData]) -> dict[str, str]:
+        return {
+            var.normalized_name: pretty_variable(var)
+            for var in self._filter_variables(variables)
+            if var.use_count == 0
+        }
+
+    def _filter_variables(self, variables: list[VariableData]) -> list[VariableData]:
+        """Only keep variables matching the user provided pattern"""
+        if not self.options.filter_glob:
+            return variables
+
+        pattern = self.options.filter_glob.lower()
+        filtered_variables = []
+        for var in variables:
+            if fnmatch.fnmatchcase(var.normalized_name, pattern):
+                filtered_variables.append(var)
+        return filtered_variables
+
     def on_file_import_error(self, error: Exception, import_str: str, import_from_path: str):
         if isinstance(error, ImportError):
             click.echo(
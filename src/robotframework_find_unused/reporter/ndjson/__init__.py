@@ -0,0 +1,3 @@
+"""
+NDJSON reporters. Stream results to other programs as one JSON object per line.
+"""
@@ -0,0 +1,68 @@
+import sys
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from robotframework_find_unused.reporter.base.all_reporter import AllReporter, AnalysisName
+
+from .argument_reporter import ArgumentNdjsonReporter
+from .common import emit
+from .file_reporter import FileNdjsonReporter
+from .keyword_reporter import KeywordNdjsonReporter
+from .partial.discover_files import PartialNdjsonReporterDiscoverFiles
+from .partial.profiling import PartialNdjsonReporterProfile
+from .return_reporter import ReturnNdjsonReporter
+from .variable_reporter import VariableNdjsonReporter
+
+if TYPE_CHECKING:
+    from robotframework_find_unused.commands.all.options import AllOptions
+
+
+class AllNdjsonReporter(
+    AllReporter,
+    PartialNdjsonReporterDiscoverFiles,
+    PartialNdjsonReporterProfile,
+):
+    """
+    NDJSON reporter for all command.
+    """
+
+    def __init__(self, options: "AllOptions") -> None:
+        self.options = options
+        self.keywords = KeywordNdjsonReporter(options.keywords)
+        self.arguments = ArgumentNdjsonReporter(options.arguments)
+        self.returns = ReturnNdjsonReporter(options.returns)
+        self.variables = VariableNdjsonReporter(options.variables)
+        self.files = FileNdjsonReporter(options.files)
+        self.exit_codes: dict[AnalysisName, int] = {}
+
+    def on_command_start(self):
+        emit("command_start", command="all")
+
+    @contextmanager
+    def on_analysis(self, analysis: AnalysisName) -> Generator[None]:
+        """
+        Wrap a single analysis.
+
+        The NDJSON reporter of every analysis exits when it's done. Keep the exit code and continue
+        with the next analysis instead.
+        """
+        emit("analysis_start", analysis=analysis)
+
+        try:
+            yield
+        except SystemExit as e:
+            self.exit_codes[analysis] = e.code if isinstance(e.code, int) else 1
+        else:
+            self.exit_codes[analysis] = 0
+
+        emit("analysis_end", analysis=analysis, exit_code=self.exit_codes[analysis])
+
+    def on_command_end(self):
+        if 255 in self.exit_codes.values():  # noqa: PLR2004
+            emit("command_end", command="all", exit_code=255)
+            sys.exit(255)
+
+        exit_code = min(sum(self.exit_codes.values()), 200)
+        emit("command_end", command="all", exit_code=exit_code)
+        sys.exit(exit_code)
@@ -0,0 +1,61 @@
+import sys
+
+from robotframework_find_unused.common.const import KeywordData
+from robotframework_find_unused.common.sort import sort_keywords_by_name
+from robotframework_find_unused.reporter.base.argument_reporter import ArgumentReporter
+
+from .common import emit, keyword_fields
+from .partial.count_keywords import PartialNdjsonReporterCountKeywords
+from .partial.discover_files import PartialNdjsonReporterDiscoverFiles
+from .partial.keyword_definitions import (
+    PartialNdjsonReporterCustomKeywordDefinitions,
+    PartialNdjsonReporterDownloadedKeywordDefinitions,
+)
+from .partial.parse_files import PartialNdjsonReporterParseFiles
+from .partial.profiling import PartialNdjsonReporterProfile
+
+
+class ArgumentNdjsonReporter(
+    ArgumentReporter,
+    PartialNdjsonReporterDiscoverFiles,
+    PartialNdjsonReporterParseFiles,
+    PartialNdjsonReporterCountKeywords,
+    PartialNdjsonReporterCustomKeywordDefinitions,
+    PartialNdjsonReporterDownloadedKeywordDefinitions,
+    PartialNdjsonReporterProfile,
+):
+    """
+    NDJSON reporter for arguments command.
+    """
+
+    def on_command_start(self):
+        emit("command_start", command="arguments")
+
+    def on_command_end(self, counted_keywords: list[KeywordData]):
+        unused_count = 0
+        for kw in sort_keywords_by_name(counted_keywords):
+            if not kw.argument_use_count:
+                continue
+
+            defaults = kw.arguments.defaults if kw.arguments else {}
+            for arg, use_count in kw.argument_use_count.items():
+                if use_count == 0:
+                    unused_count += 1
+
+                if self.options.show_all_count:
+                    event = "argument_use_count"
+                elif use_count == 0:
+                    event = "unused_argument"
+                else:
+                    continue
+
+                emit(
+                    event,
+                    **keyword_fields(kw),
+                    argument=arg,
+                    default=str(defaults[arg]) if arg in defaults else None,
+                    use_count=use_count,
+                )
+
+        emit("command_end", command="arguments", unused_count=unused_count)
+        sys.exit(min(unused_count, 200))
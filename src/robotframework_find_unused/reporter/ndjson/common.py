@@ -0,0 +1,52 @@
+import json
+from typing import TYPE_CHECKING, Any
+
+import click
+
+if TYPE_CHECKING:
+    from robotframework_find_unused.common.const import FileUseType, KeywordData, VariableData
+
+
+def emit(event: str, **data: Any) -> None:  # noqa: ANN401
+    """
+    Output a single event as one line of JSON.
+
+    Every line is flushed right away, so consumers can process it while the analysis is running.
+    """
+    click.echo(json.dumps({"event": event, **data}, default=str))
+
+
+def keyword_fields(keyword: "KeywordData") -> dict[str, Any]:
+    """
+    Describe a keyword for machine consumption
+    """
+    return {
+        "keyword": keyword.name,
+        "library": keyword.library or None,
+        "type": keyword.type,
+        "deprecated": keyword.deprecated is True,
+        "private": keyword.private,
+    }
+
+
+def variable_fields(var: "VariableData") -> dict[str, Any]:
+    """
+    Describe a variable for machine consumption
+    """
+    return {
+        "variable": var.name,
+        "resolved_name": var.resolved_name,
+        "type": var.type,
+        "defined_in": var.defined_in,
+        "defined_in_type": var.defined_in_type,
+    }
+
+
+def file_fields(path: str, file_types: "set[FileUseType]") -> dict[str, Any]:
+    """
+    Describe a file for machine consumption
+    """
+    return {
+        "file": path,
+        "file_types": sorted(file_types),
+    }
@@ -0,0 +1,139 @@
+import sys
+from pathlib import Path
+from typing import Any
+
+from robotframework_find_unused.commands.files.options import FileOptions
+from robotframework_find_unused.common.const import FileUseData
+from robotframework_find_unused.convert.convert_path import to_relative_path
+from robotframework_find_unused.reporter.base.file_reporter import FileReporter
+
+from .common import emit, file_fields
+from .partial.discover_files import PartialNdjsonReporterDiscoverFiles
+from .partial.profiling import PartialNdjsonReporterProfile
+from .partial.watch import PartialNdjsonReporterWatch
+
+
+class FileNdjsonReporter(
+    FileReporter,
+    PartialNdjsonReporterDiscoverFiles,
+    PartialNdjsonReporterWatch,
+    PartialNdjsonReporterProfile,
+):
+    """
+    NDJSON reporter for files command.
+
+    File import trees are not supported.
+    """
+
+    def __init__(self, options: FileOptions) -> None:
+        super().__init__(options)
+
+        self.cwd = Path.cwd().joinpath(self.options.source_path)
+
+    def on_command_start(self):
+        emit("command_start", command="files")
+
+    def on_count_file_uses_start(self, file_paths: list[Path], source_path: Path):
+        emit("count_file_uses_start", file_count=len(file_paths))
+
+    def on_count_file_uses_end(
+        self,
+        file_paths: list[Path],
+        source_path: Path,
+        files: list[FileUseData],
+    ):
+        emit("count_file_uses_end", parsed_file_count=len(files))
+
+    def on_file_import_error(
+        self,
+        error: ImportError,
+        import_type: str,
+        import_str: str,
+        import_from_path: str,
+    ):
+        emit(
+            "import_error",
+            import_type=import_type,
+            import_string=import_str,
+            imported_from=import_from_path,
+            message=str(error),
+        )
+
+    def on_file_imports_with_different_args(
+        self,
+        file: FileUseData,
+        as_alias: str | None,
+        distinct_args: set[tuple[str, ...]],
+    ):
+        if file.resolved_to.type in ("BUILTIN", "DOWNLOADED_LIBRARY"):
+            path = file.resolved_to.import_string
+        else:
+            path = to_relative_path(self.cwd, file.resolved_to.path)
+
+        used_by = [
+            f for f in file.used_by if str(f.as_alias).casefold() == str(as_alias).casefold()
+        ]
+        emit(
+            "file_imported_with_different_arguments",
+            **file_fields(path, file.type),
+            alias=as_alias,
+            arguments=[list(args) for args in sorted(distinct_args)],
+            import_count=len(used_by),
+        )
+
+    def on_filter_files(
+        self,
+        files: list[FileUseData],
+        filtered_files: list[FileUseData],
+        descriptor: str,
+    ):
+        emit(
+            "filter",
+            description=descriptor,
+            count_before=len(files),
+            count_after=len(filtered_files),
+        )
+
+    def on_command_end(self, files: list[FileUseData]):
+        unused_count = 0
+        for file in sorted(files, key=lambda f: f.id):
+            # Suite files contain tests and are, therefore, always used.
+            if "SUITE" in file.type:
+                continue
+
+            import_count = len(file.used_by)
+            if import_count == 0:
+                unused_count += 1
+
+            if self.options.show_all_count:
+                emit("file_import_count", **self._file_fields(file), import_count=import_count)
+            elif import_count == 0:
+                emit("unused_file", **self._file_fields(file))
+
+        emit("command_end", command="files", unused_count=unused_count)
+
+        if self.options.watch:
+            return
+
+        sys.exit(min(unused_count, 200))
+
+    def on_watch_update(
+        self,
+        previous_files: list[FileUseData],
+        files: list[FileUseData],
+    ):
+        self._emit_watch_diff(
+            self._get_unused_files_by_id(previous_files),
+            self._get_unused_files_by_id(files),
+            "file",
+        )
+
+    def _get_unused_files_by_id(self, files: list[FileUseData]) -> dict[str, dict[str, Any]]:
+        return {
+            file.id: self._file_fields(file)
+            for file in files
+            if "SUITE" not in file.type and len(file.used_by) == 0
+        }
+
+    def _file_fields(self, file: FileUseData) -> dict[str, Any]:
+        return file_fields(to_relative_path(self.cwd, file.resolved_to.path), file.type)
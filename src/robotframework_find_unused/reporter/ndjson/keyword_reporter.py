@@ -0,0 +1,76 @@
+import sys
+from typing import Any
+
+from robotframework_find_unused.common.const import KeywordData
+from robotframework_find_unused.common.sort import sort_keywords_by_name
+from robotframework_find_unused.reporter.base.keyword_reporter import KeywordReporter
+
+from .common import emit, keyword_fields
+from .partial.count_keywords import PartialNdjsonReporterCountKeywords
+from .partial.discover_files import PartialNdjsonReporterDiscoverFiles
+from .partial.keyword_definitions import (
+    PartialNdjsonReporterCustomKeywordDefinitions,
+    PartialNdjsonReporterDownloadedKeywordDefinitions,
+)
+from .partial.keyword_index import PartialNdjsonReporterKeywordIndex
+from .partial.parse_files import PartialNdjsonReporterParseFiles
+from .partial.profiling import PartialNdjsonReporterProfile
+from .partial.watch import PartialNdjsonReporterWatch
+
+
+class KeywordNdjsonReporter(
+    KeywordReporter,
+    PartialNdjsonReporterDiscoverFiles,
+    PartialNdjsonReporterParseFiles,
+    PartialNdjsonReporterCountKeywords,
+    PartialNdjsonReporterCustomKeywordDefinitions,
+    PartialNdjsonReporterDownloadedKeywordDefinitions,
+    PartialNdjsonReporterKeywordIndex,
+    PartialNdjsonReporterWatch,
+    PartialNdjsonReporterProfile,
+):
+    """
+    NDJSON reporter for keyword command.
+    """
+
+    def on_command_start(self):
+        emit("command_start", command="keywords")
+
+    def on_command_end(self, counted_keywords: list[KeywordData]):
+        unused_count = 0
+        for kw in sort_keywords_by_name(counted_keywords):
+            if kw.use_count == 0:
+                unused_count += 1
+
+            if self.options.show_all_count:
+                emit("keyword_use_count", **keyword_fields(kw), use_count=kw.use_count)
+            elif kw.use_count == 0:
+                emit("unused_keyword", **keyword_fields(kw))
+
+        emit("command_end", command="keywords", unused_count=unused_count)
+
+        if self.options.watch:
+            return
+
+        sys.exit(min(unused_count, 200))
+
+    def on_watch_update(
+        self,
+        previous_keywords: list[KeywordData],
+        counted_keywords: list[KeywordData],
+    ):
+        self._emit_watch_diff(
+            self._get_unused_keywords_by_id(previous_keywords),
+            self._get_unused_keywords_by_id(counted_keywords),
+            "keyword",
+        )
+
+    def _get_unused_keywords_by_id(
+        self,
+        keywords: list[KeywordData],
+    ) -> dict[str, dict[str, Any]]:
+        return {
+            f"{kw.normalized_name}|{kw.library}": keyword_fields(kw)
+            for kw in keywords
+            if kw.use_count == 0
+        }
@@ -0,0 +1,3 @@
+"""
+Partial NDJSON reporters.
+"""
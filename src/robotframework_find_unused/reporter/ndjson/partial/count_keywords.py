@@ -0,0 +1,57 @@
+from pathlib import Path
+
+from robotframework_find_unused.common.const import KeywordData, LibraryData
+from robotframework_find_unused.reporter.base.partial.count_keywords import (
+    PartialReporter_CountKeywords,
+)
+from robotframework_find_unused.reporter.ndjson.common import emit
+
+
+class PartialNdjsonReporterCountKeywords(PartialReporter_CountKeywords):
+    """
+    Partial NDJSON reporter for counting keywords.
+    """
+
+    def on_count_keyword_uses_start(
+        self,
+        file_paths: list[Path],
+        keywords: list[KeywordData],
+        downloaded_libraries: list[LibraryData],
+    ):
+        emit("count_keyword_uses_start", file_count=len(file_paths))
+
+    def on_count_keyword_uses_end(
+        self,
+        file_paths: list[Path],
+        keywords: list[KeywordData],
+        downloaded_libraries: list[LibraryData],
+        counted_keywords: list[KeywordData],
+    ):
+        unknown_keyword_count = 0
+        for kw in counted_keywords:
+            if kw.type == "UNKNOWN":
+                unknown_keyword_count += 1
+                emit("unknown_keyword", keyword=kw.name)
+
+        emit(
+            "count_keyword_uses_end",
+            keyword_call_count=sum(kw.use_count for kw in counted_keywords),
+            keyword_count=len(counted_keywords),
+            unknown_keyword_count=unknown_keyword_count,
+        )
+
+    def on_keyword_resolution_cache_stats(self, cache_hits: int, cache_misses: int):
+        emit("keyword_resolution_cache", hits=cache_hits, misses=cache_misses)
+
+    def on_filter_keywords(
+        self,
+        keywords: list[KeywordData],
+        filtered_keywords: list[KeywordData],
+        descriptor: str,
+    ):
+        emit(
+            "filter",
+            description=descriptor,
+            count_before=len(keywords),
+            count_after=len(filtered_keywords),
+        )
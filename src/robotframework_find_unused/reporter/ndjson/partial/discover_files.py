@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+from robotframework_find_unused.reporter.base.partial.discover_files import (
+    PartialReporter_DiscoverFiles,
+)
+from robotframework_find_unused.reporter.ndjson.common import emit
+
+
+class PartialNdjsonReporterDiscoverFiles(PartialReporter_DiscoverFiles):
+    """
+    Partial NDJSON reporter for discovering files.
+    """
+
+    def on_discover_files_start(self, root_folder: str):
+        emit("discover_files_start", root_folder=root_folder)
+
+    def on_discover_files_fail(self, root_folder: str, errors: list[str]):
+        for err in errors:
+            emit("error", message=err)
+        sys.exit(255)
+
+    def on_discover_files_success(self, root_folder: str, discovered_files: list[Path]):
+        emit("discover_files_end", root_folder=root_folder, file_count=len(discovered_files))
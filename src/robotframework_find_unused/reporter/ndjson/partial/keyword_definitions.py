@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+from robot.errors import DataError
+from robot.libdocpkg.model import LibraryDoc
+
+from robotframework_find_unused.common.const import KeywordData, LibraryData
+from robotframework_find_unused.reporter.base.partial.keyword_definitions import (
+    PartialReporter_CustomKeywordDefinitions,
+    PartialReporter_DownloadedKeywordDefinitions,
+)
+from robotframework_find_unused.reporter.ndjson.common import emit
+
+
+class PartialNdjsonReporterCustomKeywordDefinitions(PartialReporter_CustomKeywordDefinitions):
+    """
+    Partial NDJSON reporter for discovering custom keyword definitions.
+    """
+
+    def on_get_custom_keyword_definitions_start(self, files: list[LibraryDoc]):
+        emit("custom_keyword_definitions_start", file_count=len(files))
+
+    def on_get_custom_keyword_definitions_end(
+        self,
+        files: list[LibraryDoc],
+        keywords: list[KeywordData],
+    ):
+        if len(keywords) == 0:
+            emit("error", message="Found 0 custom keyword definitions")
+            sys.exit(255)
+            return
+
+        emit("custom_keyword_definitions_end", keyword_count=len(keywords))
+
+
+class PartialNdjsonReporterDownloadedKeywordDefinitions(
+    PartialReporter_DownloadedKeywordDefinitions,
+):
+    """
+    Partial NDJSON reporter for discovering downloaded keyword definitions.
+    """
+
+    def on_get_downloaded_keyword_definitions_start(self, file_paths: list[Path]):
+        emit("downloaded_keyword_definitions_start")
+
+    def on_get_downloaded_keyword_definitions_end(
+        self,
+        file_paths: list[Path],
+        libraries: list[LibraryData],
+    ):
+        for lib in libraries:
+            emit(
+                "downloaded_library",
+                library=lib.name,
+                keyword_count=len(lib.keyword_docs),
+                import_error=lib.import_error is not False,
+            )
+
+        emit("downloaded_keyword_definitions_end", library_count=len(libraries))
+
+    def on_library_parse_error(self, error: DataError, lib_name: str):
+        emit("library_error", library=lib_name, message=str(error))
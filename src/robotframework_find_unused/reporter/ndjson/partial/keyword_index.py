@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from robotframework_find_unused.reporter.base.partial.keyword_index import (
+    PartialReporter_KeywordIndex,
+)
+from robotframework_find_unused.reporter.ndjson.common import emit
+
+
+class PartialNdjsonReporterKeywordIndex(PartialReporter_KeywordIndex):
+    """
+    Partial NDJSON reporter for the incremental keyword index.
+    """
+
+    def on_keyword_index_load_start(self):
+        emit("keyword_index_load_start")
+
+    def on_keyword_index_load_end(
+        self,
+        *,
+        index_found: bool,
+        changed_files: list[Path],
+        deleted_files: list[str],
+    ):
+        emit(
+            "keyword_index_load_end",
+            index_found=index_found,
+            changed_files=[path.as_posix() for path in changed_files],
+            deleted_files=deleted_files,
+        )
+
+    def on_keyword_index_changed_files_error(self, error: str):
+        emit("warning", message=f"Failed to get changed files from Git: {error}")
+
+    def on_keyword_index_definitions_changed(self):
+        emit("keyword_index_definitions_changed")
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from robot.libdocpkg.model import LibraryDoc
+
+from robotframework_find_unused.reporter.base.partial.parse_files import (
+    PartialReporter_ParseFiles,
+)
+from robotframework_find_unused.reporter.ndjson.common import emit
+
+
+class PartialNdjsonReporterParseFiles(PartialReporter_ParseFiles):
+    """
+    Partial NDJSON reporter for parsing files.
+    """
+
+    def on_parse_files_start(self, file_paths: list[Path]):
+        emit("parse_files_start", file_count=len(file_paths))
+
+    def on_parse_files_end(
+        self,
+        file_paths: list[Path],
+        files: list[LibraryDoc],
+        parse_errors: list[str],
+    ):
+        for error in parse_errors:
+            emit("parse_error", message=error)
+
+        emit("parse_files_end", parsed_file_count=len(files), error_count=len(parse_errors))
@@ -0,0 +1,17 @@
+from dataclasses import asdict
+
+from robotframework_find_unused.common.profiling import StepProfile
+from robotframework_find_unused.reporter.base.partial.profiling import PartialReporter_Profile
+from robotframework_find_unused.reporter.ndjson.common import emit
+
+
+class PartialNdjsonReporterProfile(PartialReporter_Profile):
+    """
+    Partial NDJSON reporter for profiling.
+    """
+
+    def on_profile_end(self, steps: list[StepProfile], output_path: str | None):
+        for step in steps:
+            emit("profile_step", **asdict(step))
+
+        emit("profile_end", output_path=output_path)
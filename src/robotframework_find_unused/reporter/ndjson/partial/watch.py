@@ -0,0 +1,47 @@
+from pathlib import Path
+from typing import Any
+
+from robotframework_find_unused.reporter.base.partial.watch import PartialReporter_Watch
+from robotframework_find_unused.reporter.ndjson.common import emit
+
+
+class PartialNdjsonReporterWatch(PartialReporter_Watch):
+    """
+    Partial NDJSON reporter for watch mode.
+    """
+
+    def on_watch_start(self, file_paths: list[Path]):
+        emit("watch_start", file_count=len(file_paths))
+
+    def on_watch_change(self, changed_files: list[Path]):
+        emit("watch_change", changed_files=[path.as_posix() for path in changed_files])
+
+    def on_watch_end(self):
+        emit("watch_end")
+
+    def _emit_watch_diff(
+        self,
+        previous_unused: dict[str, dict[str, Any]],
+        current_unused: dict[str, dict[str, Any]],
+        item_type: str,
+    ) -> None:
+        """
+        Output the difference between the previous and current unused items.
+
+        Items are keyed by a unique id. Values are the fields of the item.
+        """
+        newly_unused = [key for key in sorted(current_unused) if key not in previous_unused]
+        newly_used = [key for key in sorted(previous_unused) if key not in current_unused]
+
+        for key in newly_unused:
+            emit(f"newly_unused_{item_type}", **current_unused[key])
+        for key in newly_used:
+            emit(f"newly_used_{item_type}", **previous_unused[key])
+
+        emit(
+            "watch_update",
+            item_type=item_type,
+            unused_count=len(current_unused),
+            newly_unused_count=len(newly_unused),
+            newly_used_count=len(newly_used),
+        )
@@ -0,0 +1,46 @@
+import sys
+
+from robotframework_find_unused.common.const import KeywordData
+from robotframework_find_unused.common.sort import sort_keywords_by_name
+from robotframework_find_unused.reporter.base.return_reporter import ReturnReporter
+
+from .common import emit, keyword_fields
+from .partial.count_keywords import PartialNdjsonReporterCountKeywords
+from .partial.discover_files import PartialNdjsonReporterDiscoverFiles
+from .partial.keyword_definitions import (
+    PartialNdjsonReporterCustomKeywordDefinitions,
+    PartialNdjsonReporterDownloadedKeywordDefinitions,
+)
+from .partial.parse_files import PartialNdjsonReporterParseFiles
+from .partial.profiling import PartialNdjsonReporterProfile
+
+
+class ReturnNdjsonReporter(
+    ReturnReporter,
+    PartialNdjsonReporterDiscoverFiles,
+    PartialNdjsonReporterParseFiles,
+    PartialNdjsonReporterCountKeywords,
+    PartialNdjsonReporterCustomKeywordDefinitions,
+    PartialNdjsonReporterDownloadedKeywordDefinitions,
+    PartialNdjsonReporterProfile,
+):
+    """
+    NDJSON reporter for return command.
+    """
+
+    def on_command_start(self):
+        emit("command_start", command="returns")
+
+    def on_command_end(self, counted_keywords: list[KeywordData]):
+        unused_count = 0
+        for kw in sort_keywords_by_name(counted_keywords):
+            if kw.return_use_count == 0:
+                unused_count += 1
+
+            if self.options.show_all_count:
+                emit("return_use_count", **keyword_fields(kw), use_count=kw.return_use_count)
+            elif kw.return_use_count == 0:
+                emit("unused_return", **keyword_fields(kw))
+
+        emit("command_end", command="returns", unused_count=unused_count)
+        sys.exit(min(unused_count, 200))
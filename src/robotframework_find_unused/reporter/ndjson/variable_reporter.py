@@ -0,0 +1,137 @@
+import fnmatch
+import sys
+from pathlib import Path
+from typing import Any
+
+import robot.errors
+
+from robotframework_find_unused.common.const import VariableData
+from robotframework_find_unused.reporter.base.variable_reporter import VariableReporter
+
+from .common import emit, variable_fields
+from .partial.discover_files import PartialNdjsonReporterDiscoverFiles
+from .partial.profiling import PartialNdjsonReporterProfile
+from .partial.watch import PartialNdjsonReporterWatch
+
+
+class VariableNdjsonReporter(
+    VariableReporter,
+    PartialNdjsonReporterDiscoverFiles,
+    PartialNdjsonReporterWatch,
+    PartialNdjsonReporterProfile,
+):
+    """
+    NDJSON reporter for variable command.
+    """
+
+    def on_command_start(self):
+        emit("command_start", command="variables")
+
+    def on_get_variable_definitions_start(self, file_paths: list[Path], source_path: Path):
+        emit("variable_definitions_start", file_count=len(file_paths))
+
+    def on_get_variable_definitions_end(
+        self,
+        file_paths: list[Path],
+        source_path: Path,
+        variables: dict[str, VariableData],
+    ):
+        if len(variables) == 0:
+            emit("error", message="Found 0 unique non-local variables definitions")
+            sys.exit(255)
+            return
+
+        emit("variable_definitions_end", variable_count=len(variables))
+
+    def on_count_variable_uses_start(
+        self,
+        file_paths: list[Path],
+        variables: dict[str, VariableData],
+    ):
+        emit("count_variable_uses_start", file_count=len(file_paths))
+
+    def on_count_variable_uses_end(
+        self,
+        file_paths: list[Path],
+        variables: dict[str, VariableData],
+        counted_variables: list[VariableData],
+    ):
+        total_uses = sum(var.use_count for var in counted_variables)
+        if total_uses == 0:
+            emit("error", message="Found 0 variable uses of gathered variables")
+            sys.exit(255)
+            return
+
+        emit(
+            "count_variable_uses_end",
+            variable_use_count=total_uses,
+            variable_count=len(counted_variables),
+        )
+
+    def on_command_end(self, counted_variables: list[VariableData]):
+        if self.options.filter_glob:
+            emit(
+                "filter",
+                description=f"Only showing variables matching pattern '{self.options.filter_glob}'",
+            )
+            counted_variables = self._filter_variables(counted_variables)
+
+        unused_count = 0
+        for var in sorted(counted_variables, key=lambda var: var.normalized_name):
+            if var.use_count == 0:
+                unused_count += 1
+
+            if self.options.show_all_count:
+                emit("variable_use_count", **variable_fields(var), use_count=var.use_count)
+            elif var.use_count == 0:
+                emit("unused_variable", **variable_fields(var))
+
+        emit("command_end", command="variables", unused_count=unused_count)
+
+        if self.options.watch:
+            return
+
+        sys.exit(min(unused_count, 200))
+
+    def on_watch_update(
+        self,
+        previous_variables: list[VariableData],
+        counted_variables: list[VariableData],
+    ):
+        self._emit_watch_diff(
+            self._get_unused_variables_by_id(previous_variables),
+            self._get_unused_variables_by_id(counted_variables),
+            "variable",
+        )
+
+    def _get_unused_variables_by_id(
+        self,
+        variables: list[VariableData],
+    ) -> dict[str, dict[str, Any]]:
+        return {
+            var.normalized_name: variable_fields(var)
+            for var in self._filter_variables(variables)
+            if var.use_count == 0
+        }
+
+    def _filter_variables(self, variables: list[VariableData]) -> list[VariableData]:
+        """Only keep variables matching the user provided pattern"""
+        if not self.options.filter_glob:
+            return variables
+
+        pattern = self.options.filter_glob.lower()
+        return [var for var in variables if fnmatch.fnmatchcase(var.normalized_name, pattern)]
+
+    def on_file_import_error(self, error: Exception, import_str: str, import_from_path: str):
+        if isinstance(error, robot.errors.DataError):
+            message = error.message.splitlines()[0]
+        else:
+            message = str(error)
+
+        emit(
+            "import_error",
+            import_type="Variables",
+            import_string=import_str,
+            imported_from=import_from_path,
+            message=message,
+        )
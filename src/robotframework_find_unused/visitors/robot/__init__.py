@@ -2,16 +2,23 @@
 Robot Framework AST visitors
 """
 
+from collections.abc import Generator, Iterable
 from pathlib import Path
 from typing import Literal
 
 import robot.api.parsing
 
-from robotframework_find_unused.parse.parse_robot_file import RobotFileSectionName, parse_robot_file
+from robotframework_find_unused.parse.parse_robot_file import (
+    RobotFileSectionName,
+    get_parse_jobs,
+    parse_robot_files,
+)
+from robotframework_find_unused.visitors.robot.file_facts import FileFactsVisitor, get_low_memory
+from robotframework_find_unused.visitors.robot.file_facts_visitor import get_file_facts
 
 
 def visit_robot_files(
-    file_paths: list[Path],
+    file_paths: Iterable[Path],
     visitor: robot.api.parsing.ModelVisitor,
     parse_sections: tuple[RobotFileSectionName, ...] | Literal["all"] = "all",
 ):
@@ -19,7 +26,34 @@ def visit_robot_files(
     Use Robotframework to traverse files with a visitor.
 
     See Robotframework docs on Visitors for details.
+
+    Files are parsed while visiting. Apart from the model that is visited, only the models kept in
+    memory with `apply_max_parsed_files` stay alive.
+
+    In low memory mode, and when parsing in parallel, visitors that support file facts visit the
+    facts of every file instead. Those are gathered when a file is visited for the first time. In
+    parallel, worker processes gather them, so only the small facts are sent back and visited in
+    the order of `file_paths`. In low memory mode, models are not kept in memory.
     """
-    for file_path in file_paths:
-        model = parse_robot_file(file_path, parse_sections)
+    for _ in iter_robot_file_visits(file_paths, visitor, parse_sections):
+        pass
+
+
+def iter_robot_file_visits(
+    file_paths: Iterable[Path],
+    visitor: robot.api.parsing.ModelVisitor,
+    parse_sections: tuple[RobotFileSectionName, ...] | Literal["all"] = "all",
+) -> Generator[None]:
+    """
+    Visit files like `visit_robot_files`, one file every time the generator advances.
+    """
+    if isinstance(visitor, FileFactsVisitor) and (get_low_memory() or get_parse_jobs() > 1):
+        for facts in get_file_facts(file_paths):
+            visitor.visit_file_facts(facts)
+            yield
+        return
+
+    keep_models = not get_low_memory()
+    for model in parse_robot_files(file_paths, parse_sections, keep_models=keep_models):
         visitor.visit(model)
+        yield
@@ -0,0 +1,112 @@
+"""
+Compact facts about Robot files.
+
+Used instead of parsed models in low memory mode, and to send the results of parallel parsing back
+to the main process.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+from robot.api.parsing import ModelVisitor
+
+from robotframework_find_unused.common.const import VariableDefinedInType
+
+_low_memory = False
+
+
+def apply_low_memory(*, enabled: bool) -> None:
+    """
+    Enable or disable low memory mode.
+
+    In low memory mode, parsed models are not kept in memory. Visitors that support file facts
+    visit the facts of a file instead of its model.
+    """
+    global _low_memory  # noqa: PLW0603
+    _low_memory = enabled
+
+
+def get_low_memory() -> bool:
+    """Is low memory mode enabled?"""
+    return _low_memory
+
+
+@dataclass(slots=True)
+class KeywordDefinitionFact:
+    """Keyword defined in a file"""
+
+    name: str
+    returns: bool
+
+
+@dataclass(slots=True)
+class KeywordDocFact:
+    """Documentation of a keyword defined in a file. Only holds what the visitors use."""
+
+    name: str
+    arguments: tuple[str, ...]
+    """Arguments as written in the `[Arguments]` setting"""
+    tags: tuple[str, ...]
+    deprecated: bool
+    lineno: int
+
+
+@dataclass(slots=True)
+class KeywordCallFact:
+    """Keyword called in a file"""
+
+    name: str
+    args: tuple[str, ...]
+    return_value_assigned: bool
+    count_keyword: bool
+    count_arguments: bool
+
+
+@dataclass(slots=True)
+class VariableDefinitionFact:
+    """Variable defined in a file, or variable file imported in a file"""
+
+    name: str
+    type: VariableDefinedInType | Literal["variables_import"]
+    value: Iterable[str]
+    """Value of the variable, or arguments of the variable file import"""
+
+
+@dataclass(slots=True)
+class FileFacts:
+    """
+    Data structure for everything the visitors need to know about a single .robot or .resource file.
+
+    Only holds strings and small records of strings, so it's a lot smaller than the parsed model.
+    """
+
+    source: Path
+    file_name: str
+    """Name used by Robot to refer to the file"""
+    file_type: Literal["SUITE", "RESOURCE"]
+    keyword_definitions: list[KeywordDocFact]
+    keyword_definitions_error: str | None
+    """Error message when LibDoc can't document the file"""
+    keyword_uses: list[KeywordDefinitionFact | KeywordCallFact]
+    """Keyword definitions and calls in the order they are found in the file"""
+    library_imports: list[str]
+    """Names of the imported downloaded libraries"""
+    variable_definitions: list[VariableDefinitionFact]
+    variable_args: list[str]
+    """Arguments and values that can use variables"""
+    variable_evals: list[str]
+    """Python expressions that can use variables"""
+
+
+class FileFactsVisitor(ModelVisitor):
+    """
+    Visitor that can visit the facts of a file instead of its model.
+
+    Visiting the facts of a file must have the same result as visiting its model.
+    """
+
+    def visit_file_facts(self, facts: FileFacts) -> None:
+        """Visit the facts of a single file"""
+        raise NotImplementedError
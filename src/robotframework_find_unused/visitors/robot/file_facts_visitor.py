@@ -0,0 +1,217 @@
+from collections.abc import Generator, Iterable
+from contextlib import closing
+from pathlib import Path
+from typing import Literal
+
+from robot.api.parsing import File, ModelVisitor
+
+from robotframework_find_unused.common.const import VariableDefinedInType
+from robotframework_find_unused.parse.parse_robot_file import summarize_robot_files
+from robotframework_find_unused.visitors.robot.file_facts import (
+    FileFacts,
+    KeywordCallFact,
+    KeywordDefinitionFact,
+    KeywordDocFact,
+    VariableDefinitionFact,
+)
+from robotframework_find_unused.visitors.robot.keyword_definition import (
+    RobotVisitorKeywordDefinitions,
+)
+from robotframework_find_unused.visitors.robot.keyword_visitor import RobotVisitorKeywords
+from robotframework_find_unused.visitors.robot.library_import import RobotVisitorLibraryImports
+from robotframework_find_unused.visitors.robot.variable_count import RobotVisitorVariableUses
+from robotframework_find_unused.visitors.robot.variable_definition import (
+    RobotVisitorVariableDefinitions,
+)
+
+_file_facts: dict[Path, FileFacts] = {}
+
+
+def get_file_facts(file_paths: Iterable[Path]) -> Generator[FileFacts]:
+    """
+    Get the facts of multiple files. Yields facts in the order of `file_paths`.
+
+    Files without facts are parsed. Their models are not kept in memory. Facts are kept in memory.
+
+    When parsing in parallel, facts are gathered in the worker processes. Only the facts are sent
+    back to the main process, not the models.
+    """
+    file_paths = list(file_paths)
+    unparsed_paths = list(dict.fromkeys(p for p in file_paths if p not in _file_facts))
+
+    with closing(summarize_robot_files(unparsed_paths, _get_model_facts)) as facts:
+        for file_path in file_paths:
+            if file_path not in _file_facts:
+                _file_facts[file_path] = next(facts)
+            yield _file_facts[file_path]
+
+
+def _get_model_facts(model: File) -> FileFacts:
+    visitor = RobotVisitorFileFacts()
+    visitor.visit(model)
+    return visitor.facts[0]
+
+
+def forget_file_facts(file_path: Path) -> None:
+    """
+    Drop the in-memory facts of a file. The next request parses the file again.
+    """
+    _file_facts.pop(file_path, None)
+
+
+class RobotVisitorFileFacts(ModelVisitor):
+    """
+    Gather the facts of files that visitors need. See `FileFacts`.
+
+    Runs the fact-supporting visitors on every file, but records what they would count instead of
+    counting it.
+    """
+
+    facts: list[FileFacts]
+
+    def __init__(self) -> None:
+        self.facts = []
+        super().__init__()
+
+    def visit_File(self, node: File):  # noqa: N802
+        """Gather the facts of a single file"""
+        if node.source is None:
+            return
+
+        keyword_definitions = _KeywordDefinitionRecorder()
+        keyword_uses = _KeywordUseRecorder()
+        library_imports = _LibraryImportRecorder()
+        variable_definitions = _VariableDefinitionRecorder()
+        variable_uses = _VariableUseRecorder()
+        for visitor in (
+            keyword_definitions,
+            keyword_uses,
+            library_imports,
+            variable_definitions,
+            variable_uses,
+        ):
+            visitor.visit(node)
+
+        source = Path(node.source)
+        self.facts.append(
+            FileFacts(
+                source=source,
+                file_name=keyword_definitions.file_name,
+                file_type=keyword_definitions.file_type,
+                keyword_definitions=keyword_definitions.keyword_definitions,
+                keyword_definitions_error=keyword_definitions.keyword_definitions_error,
+                keyword_uses=keyword_uses.keyword_uses,
+                library_imports=library_imports.library_imports.get(source, []),
+                variable_definitions=variable_definitions.variable_definitions,
+                variable_args=variable_uses.variable_args,
+                variable_evals=variable_uses.variable_evals,
+            ),
+        )
+
+
+class _KeywordDefinitionRecorder(RobotVisitorKeywordDefinitions):
+    """Records keyword definitions instead of building their LibDoc documentation"""
+
+    file_name: str = ""
+    file_type: Literal["SUITE", "RESOURCE"] = "RESOURCE"
+    keyword_definitions: list[KeywordDocFact]
+    keyword_definitions_error: str | None = None
+
+    def __init__(self) -> None:
+        self.keyword_definitions = []
+        super().__init__()
+
+    def _add_file(
+        self,
+        source: Path,  # noqa: ARG002
+        name: str,
+        file_type: Literal["SUITE", "RESOURCE"],
+        keywords: list[KeywordDocFact],
+    ) -> None:
+        self.file_name = name
+        self.file_type = file_type
+        self.keyword_definitions = keywords
+
+    def _add_invalid_file(self, source: Path, error: str) -> None:  # noqa: ARG002
+        self.keyword_definitions_error = error
+
+
+class _KeywordUseRecorder(RobotVisitorKeywords):
+    """Records keyword definitions and calls instead of counting them"""
+
+    def __init__(self) -> None:
+        # Not calling super().__init__: Keyword calls are not resolved
+        self.keyword_uses: list[KeywordDefinitionFact | KeywordCallFact] = []
+
+    def _define_keyword(self, name: str, *, returns: bool) -> None:
+        self.keyword_uses.append(KeywordDefinitionFact(name=name, returns=returns))
+
+    def _count_keyword_call(
+        self,
+        name: str,
+        args: Iterable[str],
+        *,
+        return_value_assigned: bool = False,
+        count_keyword: bool = True,
+        count_arguments: bool = True,
+    ) -> None:
+        self.keyword_uses.append(
+            KeywordCallFact(
+                name=name,
+                args=tuple(args),
+                return_value_assigned=return_value_assigned,
+                count_keyword=count_keyword,
+                count_arguments=count_arguments,
+            ),
+        )
+
+
+class _LibraryImportRecorder(RobotVisitorLibraryImports):
+    """Records library imports without queueing the libraries"""
+
+    def __init__(self) -> None:
+        # Not calling super().__init__: Libraries are not documented
+        self.library_imports = {}
+        self.current_working_file = None
+
+    def register_downloaded_library(self, lib_name: str) -> None:
+        """Libraries are registered when the facts are visited"""
+
+
+class _VariableDefinitionRecorder(RobotVisitorVariableDefinitions):
+    """Records variable definitions and variable file imports instead of registering them"""
+
+    def __init__(self) -> None:
+        # Not calling super().__init__: Variable files are not imported
+        self.variable_definitions: list[VariableDefinitionFact] = []
+
+    def _import_variables(self, import_string: str, import_args: tuple[str, ...]) -> None:
+        self.variable_definitions.append(
+            VariableDefinitionFact(name=import_string, type="variables_import", value=import_args),
+        )
+
+    def _register_variable(
+        self,
+        name: str,
+        defined_in_type: VariableDefinedInType,
+        defined_in: Path,  # noqa: ARG002
+        value: Iterable[str],
+    ) -> None:
+        self.variable_definitions.append(
+            VariableDefinitionFact(name=name, type=defined_in_type, value=value),
+        )
+
+
+class _VariableUseRecorder(RobotVisitorVariableUses):
+    """Records strings that can use variables instead of counting the variables"""
+
+    def __init__(self) -> None:
+        self.variable_args: list[str] = []
+        self.variable_evals: list[str] = []
+        super().__init__({})
+
+    def _count_used_vars_in_args(self, args: Iterable[str]) -> None:
+        self.variable_args.extend(args)
+
+    def _count_used_vars_in_eval(self, eval_str: str) -> None:
+        self.variable_evals.append(eval_str)
@@ -0,0 +1,210 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import robot.errors
+from robot.api.parsing import Arguments, Documentation
+from robot.api.parsing import Tags as TagsSetting
+from robot.libdocpkg.model import KeywordDoc, LibraryDoc
+from robot.model import Tags
+from robot.running.arguments import ArgumentSpec, UserKeywordArgumentParser
+
+from robotframework_find_unused.visitors.robot.file_facts import (
+    FileFacts,
+    FileFactsVisitor,
+    KeywordDocFact,
+)
+
+if TYPE_CHECKING:
+    from robot.api.parsing import (
+        File,
+        Keyword,
+        KeywordTags,
+        TestCaseSection,
+    )
+    from robot.parsing.model.statements import SectionHeader, SuiteName
+
+
+class RobotVisitorKeywordDefinitions(FileFactsVisitor):
+    """
+    Gather keyword definitions from .robot and .resource files without LibDoc.
+
+    Produces the same documentation structure as LibDoc, but reuses the already parsed model
+    instead of parsing the file again. Keyword documentation texts are left out. They are not used.
+    Files that LibDoc can't document are not in `files`, but in `errors`.
+    """
+
+    files: list[LibraryDoc]
+    errors: dict[Path, str]
+    """Error messages of invalid files, by absolute file path. Same messages as LibDoc."""
+
+    def __init__(self) -> None:
+        self.files = []
+        self.errors = {}
+        super().__init__()
+
+    def visit_File(self, node: "File"):  # noqa: N802
+        """Build the documentation of a single file"""
+        if node.source is None:
+            return
+
+        source = Path(node.source).absolute()
+        self._source = source
+        self._suite_name: str | None = None
+        self._has_tests = False
+        self._test_section_header: SectionHeader | None = None
+        self._keyword_tags: list[str] = []
+        self._keywords: list[KeywordDocFact] = []
+
+        self.generic_visit(node)
+
+        is_suite = source.stem.lower() == "__init__" or (
+            source.suffix.lower() == ".robot" and self._has_tests
+        )
+        if not is_suite and self._test_section_header is not None:
+            # Resource files can't have tests. Neither can .robot files that have no tests.
+            header = self._test_section_header
+            self._add_invalid_file(
+                source,
+                f"Error in file '{source}' on line {header.lineno}: "
+                f"Resource file with '{header.name.title()}' section is invalid.",
+            )
+            return
+
+        self._add_file(
+            source,
+            self._get_file_name(source, is_suite=is_suite),
+            "SUITE" if is_suite else "RESOURCE",
+            self._keywords,
+        )
+
+    def visit_file_facts(self, facts: FileFacts) -> None:
+        """Keyword definitions of a single file"""
+        if facts.keyword_definitions_error is not None:
+            self._add_invalid_file(facts.source.absolute(), facts.keyword_definitions_error)
+            return
+
+        self._add_file(
+            facts.source.absolute(),
+            facts.file_name,
+            facts.file_type,
+            facts.keyword_definitions,
+        )
+
+    def _add_file(
+        self,
+        source: Path,
+        name: str,
+        file_type: Literal["SUITE", "RESOURCE"],
+        keywords: list[KeywordDocFact],
+    ) -> None:
+        """Build the LibDoc documentation of a file"""
+        libdoc = LibraryDoc(
+            name=name,
+            type=file_type,
+            scope="GLOBAL",
+            source=source,
+            lineno=1,
+        )
+        keyword_docs: list[KeywordDoc] = []
+        for keyword in keywords:
+            tags = Tags(keyword.tags)
+            keyword_docs.append(
+                KeywordDoc(
+                    name=keyword.name,
+                    args=self._get_argument_spec(keyword.name, list(keyword.arguments)),
+                    tags=tags,
+                    private=("robot:private" in tags),
+                    deprecated=keyword.deprecated,
+                    source=source,
+                    lineno=keyword.lineno,
+                ),
+            )
+        libdoc.keywords = keyword_docs
+        self.files.append(libdoc)
+
+    def _add_invalid_file(self, source: Path, error: str) -> None:
+        """Keep the error of a file that LibDoc can't document"""
+        self.errors[source] = error
+
+    def visit_SuiteName(self, node: "SuiteName"):  # noqa: N802
+        """Suite name set with the `Name` setting. Not available before Robot 7."""
+        self._suite_name = node.value
+
+    def visit_KeywordTags(self, node: "KeywordTags"):  # noqa: N802
+        """Tags applied to every keyword in the file"""
+        self._keyword_tags.extend(node.values)
+
+    def visit_TestCaseSection(self, node: "TestCaseSection"):  # noqa: N802
+        """Files with tests or tasks are suites. Others are treated as resource files by LibDoc."""
+        if self._test_section_header is None:
+            self._test_section_header = node.header
+        if len(node.body) > 0:
+            self._has_tests = True
+
+    def visit_Keyword(self, node: "Keyword"):  # noqa: N802
+        """Gather the documentation of a keyword definition"""
+        doc = ""
+        arguments: list[str] = []
+        tags = list(self._keyword_tags)
+        for statement in node.body:
+            if isinstance(statement, Documentation):
+                doc = statement.value
+            elif isinstance(statement, Arguments):
+                arguments = list(statement.values)
+            elif isinstance(statement, TagsSetting):
+                tags = self._apply_tags(tags, statement)
+
+        (doc, doc_tags) = self._split_tags_from_doc(doc)
+
+        self._keywords.append(
+            KeywordDocFact(
+                name=node.name,
+                arguments=tuple(arguments),
+                tags=(*tags, *doc_tags),
+                deprecated=doc.startswith("*DEPRECATED") and "*" in doc[1:],
+                lineno=node.lineno,
+            ),
+        )
+
+    def _apply_tags(self, tags: list[str], node: TagsSetting) -> list[str]:
+        """Add keyword tags. Tags starting with `-` remove keyword tags set for the whole file."""
+        for tag in node.values:
+            if tag.startswith("-"):
+                removed = Tags([tag[1:]])
+                tags = [t for t in tags if t not in removed]
+            else:
+                tags.append(tag)
+        return tags
+
+    def _get_argument_spec(self, keyword_name: str, arguments: list[str]) -> ArgumentSpec:
+        try:
+            return UserKeywordArgumentParser().parse(arguments, keyword_name)
+        except robot.errors.DataError:
+            # Robot can't create this keyword. Treat it as a keyword without arguments.
+            return ArgumentSpec(keyword_name)
+
+    def _split_tags_from_doc(self, doc: str) -> tuple[str, list[str]]:
+        """Tags can be set on the last line of the documentation. E.g. `Tags: robot:private`"""
+        doc = doc.rstrip()
+        if not doc:
+            return (doc, [])
+
+        lines = doc.splitlines()
+        if not lines[-1].upper().strip().startswith("TAGS:"):
+            return (doc, [])
+
+        tags = [tag.strip() for tag in lines[-1].split(":", 1)[1].split(",")]
+        return ("\n".join(lines[:-1]).rstrip(), tags)
+
+    def _get_file_name(self, source: Path, *, is_suite: bool) -> str:
+        """Get the name used by Robot to refer to the file"""
+        if not is_suite:
+            return source.stem
+        if self._suite_name:
+            return self._suite_name
+
+        name = source.parent.name if source.stem.lower() == "__init__" else source.stem
+        if "__" in name:
+            name = name.split("__", 1)[1] or name
+        name = name.replace("_", " ").strip()
+        return name.title() if name.islower() else name
@@ -0,0 +1,128 @@
+import functools
+from collections.abc import Iterable
+
+from robotframework_find_unused.common.const import KeywordData
+
+
+class _TrieNode:
+    """Node in a character trie"""
+
+    __slots__ = ("children", "keyword_ids")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.keyword_ids: list[int] = []
+
+
+class EmbeddedKeywordIndex:
+    """
+    Find keyword definitions with embedded arguments that match a keyword call.
+
+    Keywords are indexed in two tries: One on the literal text before the first embedded argument,
+    and one on the reversed literal text after the last embedded argument. A keyword call can only
+    match keywords found in both tries. Only those keywords are matched with a regex.
+    """
+
+    keywords: list[KeywordData]
+
+    def __init__(self, keywords: list[KeywordData]) -> None:
+        self.keywords = keywords
+
+        self._prefix_trie = _TrieNode()
+        self._suffix_trie = _TrieNode()
+        for keyword_id, kw in enumerate(keywords):
+            prefix = kw.name_parts[0]
+            suffix = "" if kw.name_parts[-1] == "__VARIABLE__" else kw.name_parts[-1]
+
+            _insert(self._prefix_trie, prefix, keyword_id)
+            _insert(self._suffix_trie, reversed(suffix), keyword_id)
+
+        self._is_better_match_cache: dict[tuple[int, int], bool] = {}
+
+    def find_matches(self, normalized_name: str) -> list[KeywordData]:
+        """
+        Find all keyword definitions that match the keyword call. In definition order.
+        """
+        return [self.keywords[keyword_id] for keyword_id in self._find_match_ids(normalized_name)]
+
+    def find_best_match(self, normalized_name: str) -> KeywordData | None:
+        """
+        Find the keyword definition that matches the keyword call best.
+        """
+        match_ids = self._find_match_ids(normalized_name)
+        if len(match_ids) == 0:
+            return None
+        if len(match_ids) == 1:
+            return self.keywords[match_ids[0]]
+
+        def match_sorter(a: int, b: int) -> int:
+            return -1 if self._is_better_match(a, b) else 1
+
+        match_order = sorted(match_ids, key=functools.cmp_to_key(match_sorter))
+        return self.keywords[match_order[0]]
+
+    def _find_match_ids(self, normalized_name: str) -> list[int]:
+        prefix_ids = _collect(self._prefix_trie, normalized_name)
+        if len(prefix_ids) == 0:
+            return []
+
+        candidate_ids = [
+            keyword_id
+            for keyword_id in _collect(self._suffix_trie, reversed(normalized_name))
+            if keyword_id in prefix_ids
+        ]
+        candidate_ids.sort()
+
+        return [
+            keyword_id
+            for keyword_id in candidate_ids
+            if self._matches(normalized_name, self.keywords[keyword_id])
+        ]
+
+    def _is_better_match(self, keyword_id: int, other_id: int) -> bool:
+        """
+        Compare two matching keywords. Results are cached per pair of keywords.
+
+        Using same logic as in `robot/running/namespace.py`: "Embedded match is considered better
+        than another if the other matches it, but it doesn't match the other."
+        """
+        key = (keyword_id, other_id)
+        if key not in self._is_better_match_cache:
+            keyword = self.keywords[keyword_id]
+            other = self.keywords[other_id]
+            self._is_better_match_cache[key] = self._matches(
+                keyword.normalized_name,
+                other,
+            ) and not self._matches(other.normalized_name, keyword)
+        return self._is_better_match_cache[key]
+
+    def _matches(self, call: str, definition: KeywordData) -> bool:
+        if definition.name_match_pattern is None:
+            msg = "Attempted to match keyword call to keyword definition without name match pattern"
+            raise ValueError(msg)
+
+        return definition.name_match_pattern.fullmatch(call) is not None
+
+
+def _insert(root: _TrieNode, key: Iterable[str], keyword_id: int) -> None:
+    node = root
+    for char in key:
+        child = node.children.get(char)
+        if child is None:
+            child = _TrieNode()
+            node.children[char] = child
+        node = child
+    node.keyword_ids.append(keyword_id)
+
+
+def _collect(root: _TrieNode, text: Iterable[str]) -> set[int]:
+    """Get the keywords of all keys that are a prefix of the text"""
+    keyword_ids = set(root.keyword_ids)
+    node = root
+    for char in text:
+        child = node.children.get(char)
+        if child is None:
+            break
+        node = child
+        keyword_ids.update(node.keyword_ids)
+    return keyword_ids
@@ -1,10 +1,15 @@
-import functools
 from collections.abc import Generator
+from typing import cast
 
 from robot.api import Language
 
 from robotframework_find_unused.common.const import KeywordData, LibraryData
 from robotframework_find_unused.common.normalize import normalize_keyword_name
+from robotframework_find_unused.convert.convert_keyword import get_library_keyword
+
+from .embedded_keyword_index import EmbeddedKeywordIndex
+
+RESOLUTION_CACHE_SIZE = 10_000
 
 
 class KeywordDefinitionManager:
@@ -14,10 +19,17 @@ class KeywordDefinitionManager:
 
     keywords: dict[str, KeywordData]
     keywords_with_embedded_args: list[KeywordData]
-    lib_keywords: dict[str, KeywordData]
+    embedded_keyword_index: EmbeddedKeywordIndex
+    lib_keywords: dict[str, LibraryData]
+    """Downloaded library of every library keyword, keyed by normalized keyword name"""
 
     bdd_prefixes: set[str]
 
+    resolution_cache_hits: int
+    """Number of keyword searches answered from the resolution cache"""
+    resolution_cache_misses: int
+    """Number of keyword searches not answered from the resolution cache"""
+
     def __init__(
         self,
         custom_keywords: list[KeywordData],
@@ -27,22 +39,60 @@ class KeywordDefinitionManager:
         self.keywords_with_embedded_args = []
         for kw in custom_keywords:
             self.keywords[kw.normalized_name] = kw
-            if len(kw.name_parts) > 1 and kw.name_match_pattern is not None:
+            if len(kw.name_parts) > 1:
                 self.keywords_with_embedded_args.append(kw)
+        self.embedded_keyword_index = EmbeddedKeywordIndex(self.keywords_with_embedded_args)
 
         self.lib_keywords = {}
         for lib in downloaded_library_keywords:
-            for kw in lib.keywords:
-                self.lib_keywords[kw.normalized_name] = kw
+            for normalized_name in lib.keyword_docs:
+                self.lib_keywords[normalized_name] = lib
 
         # Limitation: No localisation
         language = Language.from_name("English")
         self.bdd_prefixes = {normalize_keyword_name(s) for s in language.bdd_prefixes}
 
+        self._resolution_cache: dict[str, KeywordData | None] = {}
+        # Cached searches without result, by the normalized names they tried to match
+        self._cached_misses: dict[str, set[str]] = {}
+        self.resolution_cache_hits = 0
+        self.resolution_cache_misses = 0
+
     def search_keyword_definition(self, keyword_name: str) -> KeywordData | None:
         """
         Search keyword definition from keyword name or keyword call.
+
+        Results are cached per keyword name. Searches without result are cached until a keyword
+        with a matching name is registered.
         """
+        if keyword_name in self._resolution_cache:
+            self.resolution_cache_hits += 1
+            return self._resolution_cache[keyword_name]
+        self.resolution_cache_misses += 1
+
+        keyword = self._resolve_keyword_definition(keyword_name)
+
+        if len(self._resolution_cache) >= RESOLUTION_CACHE_SIZE:
+            # Drop the oldest result
+            oldest_name = next(iter(self._resolution_cache))
+            if self._resolution_cache.pop(oldest_name) is None:
+                self._forget_cached_miss(oldest_name)
+        self._resolution_cache[keyword_name] = keyword
+        if keyword is None:
+            for normalized_name in self._keyword_name_match_options(keyword_name):
+                self._cached_misses.setdefault(normalized_name, set()).add(keyword_name)
+        return keyword
+
+    def _forget_cached_miss(self, keyword_name: str) -> None:
+        for normalized_name in self._keyword_name_match_options(keyword_name):
+            names = self._cached_misses.get(normalized_name)
+            if names is None:
+                continue
+            names.discard(keyword_name)
+            if not names:
+                del self._cached_misses[normalized_name]
+
+    def _resolve_keyword_definition(self, keyword_name: str) -> KeywordData | None:
         for normalized_name in self._keyword_name_match_options(keyword_name):
             if normalized_name in self.keywords:
                 # Matched to a keyword (without embedded args)
@@ -112,65 +162,16 @@ class KeywordDefinitionManager:
         return normalized_name
 
     def _find_keyword_with_embedded_args(self, normalized_name: str) -> KeywordData | None:
-        matches = self._find_keyword_with_embedded_args_matches(normalized_name)
-
-        if len(matches) == 0:
-            return None
-        if len(matches) == 1:
-            return matches[0]
-
-        def match_sorter(a: KeywordData, b: KeywordData) -> int:
-            # Using same logic as in `robot/running/namespace.py`:
-            # "Embedded match is considered better than another if the other matches
-            # it, but it doesn't match the other."
-            if self._keyword_call_matches_keyword_definition(
-                a.normalized_name,
-                b,
-            ) and not self._keyword_call_matches_keyword_definition(
-                b.normalized_name,
-                a,
-            ):
-                return -1
-            return 1
-
-        match_order = sorted(matches, key=functools.cmp_to_key(match_sorter))
-        return match_order[0]
-
-    def _find_keyword_with_embedded_args_matches(self, normalized_name: str) -> list[KeywordData]:
-        """
-        Find matching keyword definitions for the keyword name.
-        """
-        # Fast, inconclusive pre-selection
-        candidates = list(
-            filter(
-                lambda kw: kw.name_parts[0] == "__VARIABLE__"
-                or normalized_name.startswith(kw.name_parts[0]),
-                self.keywords_with_embedded_args,
-            ),
-        )
-        if len(candidates) == 0:
-            return []
-
-        # Slow, conclusive selection
-        matches: list[KeywordData] = []
-        for kw in candidates:
-            if self._keyword_call_matches_keyword_definition(normalized_name, kw):
-                matches.append(kw)
-        return matches
-
-    def _keyword_call_matches_keyword_definition(self, call: str, definition: KeywordData) -> bool:
-        if definition.name_match_pattern is None:
-            msg = "Attempted to match keyword call to keyword definition without name match pattern"
-            raise ValueError(msg)
-
-        return definition.name_match_pattern.fullmatch(call) is not None
+        return self.embedded_keyword_index.find_best_match(normalized_name)
 
     def _register_downloaded_library_keyword(self, normalized_name: str) -> KeywordData:
         """
         Register as a downloaded library keyword.
         """
-        library_keyword = self.lib_keywords[normalized_name]
+        library = self.lib_keywords[normalized_name]
+        library_keyword = cast(KeywordData, get_library_keyword(library, normalized_name))
 
+        # Cached searches stay valid: The keyword was already found under the same name before
         self.keywords[library_keyword.normalized_name] = library_keyword
         return self.keywords[library_keyword.normalized_name]
 
@@ -178,11 +179,14 @@ class KeywordDefinitionManager:
         """
         Register as an unknown keyword with minimum data that does not look weird.
         """
+        # Cached searches without result may resolve to the new keyword now. Found keywords stay
+        # valid: Unknown keywords are only matched by their exact name.
+        for keyword_name in self._cached_misses.pop(normalized_name, ()):
+            self._resolution_cache.pop(keyword_name, None)
         self.keywords[normalized_name] = KeywordData(
             name=name,
             normalized_name=normalized_name,
-            name_parts=[],
-            name_match_pattern=None,
+            name_parts=(),
             argument_use_count=None,
             deprecated=None,
             private=False,
@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from robot.api.parsing import File
+
+from robotframework_find_unused.common.const import KeywordData, LibraryData
+from robotframework_find_unused.visitors.robot.file_facts import FileFacts
+
+from .keyword_definition_manager import KeywordDefinitionManager
+from .keyword_visitor import RobotVisitorKeywords
+
+
+@dataclass
+class KeywordUseCount:
+    """Data structure for the uses of a single keyword"""
+
+    name: str
+    use_count: int
+    return_use_count: int
+    argument_use_count: dict[str, int] | None
+
+
+@dataclass
+class KeywordFileUses:
+    """Data structure for the keyword uses in a single file"""
+
+    keywords: dict[str, KeywordUseCount]
+    """Uses of keywords in this file, keyed by normalized name"""
+
+    returns: dict[str, bool]
+    """Does the keyword return? For keywords defined in this file, keyed by normalized name."""
+
+
+class RobotVisitorKeywordsPerFile(RobotVisitorKeywords):
+    """
+    A Robot Framework visitor.
+
+    Does the same as `RobotVisitorKeywords`, but keeps the keyword uses of every file separate.
+    After visiting a file, the counts of the keyword definitions are reset. The uses of the file are
+    stored in `file_uses`.
+    """
+
+    kw_matcher: "_RecordingKeywordDefinitionManager"
+    file_uses: dict[Path, KeywordFileUses]
+
+    def __init__(
+        self,
+        custom_keywords: list[KeywordData],
+        downloaded_library_keywords: list[LibraryData],
+    ) -> None:
+        # Not calling super().__init__: That would build a second keyword definition manager
+        self.kw_matcher = _RecordingKeywordDefinitionManager(
+            custom_keywords,
+            downloaded_library_keywords,
+        )
+        self.file_uses = {}
+
+    def visit_File(self, node: File):  # noqa: N802
+        """Visit new file and store its keyword uses"""
+        self._start_file()
+        super().visit_File(node)
+        if node.source is not None:
+            self._end_file(Path(node.source))
+
+    def visit_file_facts(self, facts: FileFacts) -> None:
+        """Visit the facts of a new file and store its keyword uses"""
+        self._start_file()
+        super().visit_file_facts(facts)
+        self._end_file(facts.source)
+
+    def _start_file(self) -> None:
+        self.kw_matcher.recorded = {}
+        self._defined_keywords: list[str] = []
+
+    def _end_file(self, file_path: Path) -> None:
+        keywords: dict[str, KeywordUseCount] = {}
+        for name, keyword in self.kw_matcher.recorded.items():
+            keywords[name] = KeywordUseCount(
+                name=keyword.name,
+                use_count=keyword.use_count,
+                return_use_count=keyword.return_use_count,
+                argument_use_count=keyword.argument_use_count,
+            )
+            _reset_keyword_counts(keyword)
+
+        returns: dict[str, bool] = {}
+        for name in self._defined_keywords:
+            keyword_returns = self.kw_matcher.keywords[name].returns
+            if keyword_returns is not None:
+                returns[name] = keyword_returns
+
+        self.file_uses[file_path] = KeywordFileUses(keywords=keywords, returns=returns)
+
+    def _define_keyword(self, name: str, *, returns: bool) -> None:
+        """Register whether a defined keyword returns a value, and remember its definition"""
+        keyword = self.kw_matcher.get_keyword_definition(name)
+        self._defined_keywords.append(keyword.normalized_name)
+
+        super()._define_keyword(name, returns=returns)
+
+
+class _RecordingKeywordDefinitionManager(KeywordDefinitionManager):
+    """Keyword definition manager that remembers which keywords were requested"""
+
+    recorded: dict[str, KeywordData]
+
+    def __init__(
+        self,
+        custom_keywords: list[KeywordData],
+        downloaded_library_keywords: list[LibraryData],
+    ) -> None:
+        super().__init__(custom_keywords, downloaded_library_keywords)
+        self.recorded = {}
+
+    def get_keyword_definition(self, keyword_name: str) -> KeywordData:
+        """Get keyword definition and remember it"""
+        keyword = super().get_keyword_definition(keyword_name)
+        self.recorded[keyword.normalized_name] = keyword
+        return keyword
+
+
+def _reset_keyword_counts(keyword: KeywordData) -> None:
+    keyword.use_count = 0
+    keyword.return_use_count = 0
+    if keyword.argument_use_count is not None:
+        keyword.argument_use_count = dict.fromkeys(keyword.argument_use_count, 0)
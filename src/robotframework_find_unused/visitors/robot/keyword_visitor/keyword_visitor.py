@@ -6,7 +6,6 @@ from robot.api.parsing import (
     File,
     Keyword,
     KeywordCall,
-    ModelVisitor,
     Setup,
     SuiteSetup,
     SuiteTeardown,
@@ -25,6 +24,11 @@ from robot.running.arguments.argumentmapper import DefaultValue
 
 from robotframework_find_unused.common.const import KeywordData, LibraryData
 from robotframework_find_unused.common.normalize import normalize_keyword_name
+from robotframework_find_unused.visitors.robot.file_facts import (
+    FileFacts,
+    FileFactsVisitor,
+    KeywordDefinitionFact,
+)
 
 from .keyword_definition_manager import KeywordDefinitionManager
 
@@ -39,7 +43,7 @@ class KeywordCallData:
     args: tuple[str, ...]
 
 
-class RobotVisitorKeywords(ModelVisitor):
+class RobotVisitorKeywords(FileFactsVisitor):
     """
     A Robot Framework visitor.
 
@@ -68,10 +72,24 @@ class RobotVisitorKeywords(ModelVisitor):
 
         return self.generic_visit(node)
 
+    def visit_file_facts(self, facts: FileFacts) -> None:
+        """Visit the keyword definitions and calls of a single file"""
+        for use in facts.keyword_uses:
+            if isinstance(use, KeywordDefinitionFact):
+                self._define_keyword(use.name, returns=use.returns)
+                continue
+
+            self._count_keyword_call(
+                use.name,
+                use.args,
+                return_value_assigned=use.return_value_assigned,
+                count_keyword=use.count_keyword,
+                count_arguments=use.count_arguments,
+            )
+
     def visit_Keyword(self, node: Keyword):  # noqa: N802
         """Keyword definition"""
-        keyword = self.kw_matcher.get_keyword_definition(node.name)
-        keyword.returns = self._get_keyword_returns(node)
+        self._define_keyword(node.name, returns=self._get_keyword_returns(node))
 
         return self.generic_visit(node)
 
@@ -172,6 +190,11 @@ class RobotVisitorKeywords(ModelVisitor):
 
         return self.generic_visit(node)
 
+    def _define_keyword(self, name: str, *, returns: bool) -> None:
+        """Register whether a defined keyword returns a value"""
+        keyword = self.kw_matcher.get_keyword_definition(name)
+        keyword.returns = returns
+
     def _count_keyword_call(
         self,
         name: str,
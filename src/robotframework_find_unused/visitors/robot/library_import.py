@@ -1,31 +1,41 @@
+from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 import robot.errors
-from robot.api.parsing import ModelVisitor
-from robot.libdoc import LibraryDocumentation
-from robot.libdocpkg.model import KeywordDoc, LibraryDoc
+from robot.libdocpkg.model import KeywordDoc
 
 from robotframework_find_unused.common.const import LibraryData
-from robotframework_find_unused.common.normalize import normalize_library_name
-from robotframework_find_unused.convert.convert_keyword import libdoc_keyword_to_keyword_data
+from robotframework_find_unused.common.normalize import (
+    normalize_keyword_name,
+    normalize_library_name,
+)
+from robotframework_find_unused.convert.convert_keyword import (
+    libdoc_keyword_to_library_keyword_doc,
+)
+from robotframework_find_unused.parse.libdoc_cache import get_libdoc_cache
+from robotframework_find_unused.parse.libdoc_worker import LibdocResult, document_libraries
 from robotframework_find_unused.resolve.resolve_python_keyword_data import (
     enrich_python_keyword_data,
 )
+from robotframework_find_unused.visitors.robot.file_facts import FileFacts, FileFactsVisitor
 
 if TYPE_CHECKING:
-    from robot.api.parsing import LibraryImport
+    from robot.api.parsing import File, LibraryImport
 
     from robotframework_find_unused.reporter.base.partial.keyword_definitions import (
         PartialReporter_DownloadedKeywordDefinitions,
     )
 
 
-class RobotVisitorLibraryImports(ModelVisitor):
+class RobotVisitorLibraryImports(FileFactsVisitor):
     """
     Gather downloaded library imports
     """
 
     downloaded_libraries: dict[str, LibraryData]
+    """Libraries with gathered keywords. Filled by `load_downloaded_libraries`"""
+    library_imports: dict[Path, list[str]]
+    """Names of the downloaded libraries imported by each file"""
 
     def __init__(
         self,
@@ -36,10 +46,21 @@ class RobotVisitorLibraryImports(ModelVisitor):
         self.reporter = reporter
         self.enrich_py_keywords = enrich_py_keywords
         self.downloaded_libraries = {}
+        self.library_imports = {}
+        self._queued_libraries: dict[str, str] = {}
+        self.current_working_file: Path | None = None
         super().__init__()
 
         # Is always imported automatically by Robot
-        self._register_downloaded_library("BuiltIn")
+        self.register_downloaded_library("BuiltIn")
+
+    def visit_File(self, node: "File"):  # noqa: N802
+        """Keep track of the current working file"""
+        self.current_working_file = Path(node.source) if node.source is not None else None
+        if self.current_working_file is not None:
+            self.library_imports[self.current_working_file] = []
+
+        return self.generic_visit(node)
 
     def visit_LibraryImport(self, node: "LibraryImport"):  # noqa: N802
         """Find out which libraries are actually used"""
@@ -49,55 +70,100 @@ class RobotVisitorLibraryImports(ModelVisitor):
             # Not a downloaded lib. We already discovered this.
             return
 
-        self._register_downloaded_library(lib_name)
+        if self.current_working_file is not None:
+            self.library_imports[self.current_working_file].append(lib_name)
+        self.register_downloaded_library(lib_name)
+
+    def visit_file_facts(self, facts: FileFacts) -> None:
+        """Find out which libraries are imported by a single file"""
+        self.current_working_file = facts.source
+        self.library_imports[facts.source] = list(facts.library_imports)
+        for lib_name in facts.library_imports:
+            self.register_downloaded_library(lib_name)
 
-    def _register_downloaded_library(self, lib_name: str) -> None:
+    def register_downloaded_library(self, lib_name: str) -> None:
+        """
+        Queue a downloaded library. Does nothing for known libraries.
+
+        Keywords of queued libraries are gathered by `load_downloaded_libraries`.
+        """
         normalized_lib_name = normalize_library_name(lib_name)
 
-        if normalized_lib_name in self.downloaded_libraries:
+        if (
+            normalized_lib_name in self.downloaded_libraries
+            or normalized_lib_name in self._queued_libraries
+        ):
             # Already found it
             return
 
-        try:
-            lib: LibraryDoc = LibraryDocumentation(lib_name)
-        except robot.errors.DataError as e:
-            self.reporter.on_library_parse_error(e, lib_name)
+        self._queued_libraries[normalized_lib_name] = lib_name
+
+    def load_downloaded_libraries(self) -> None:
+        """
+        Gather the keywords of all queued libraries.
+
+        Libraries missing from the Libdoc cache are documented together, in worker processes.
+        """
+        queued_libraries = self._queued_libraries
+        self._queued_libraries = {}
+
+        libdoc_cache = get_libdoc_cache()
+        libraries: dict[str, LibraryData | None] = {}
+        for normalized_lib_name, lib_name in queued_libraries.items():
+            libraries[normalized_lib_name] = (
+                libdoc_cache.get_library(lib_name, enrich_py_keywords=self.enrich_py_keywords)
+                if libdoc_cache is not None
+                else None
+            )
+
+        undocumented = [
+            normalized_lib_name
+            for normalized_lib_name, library in libraries.items()
+            if library is None
+        ]
+        libdoc_results = document_libraries([queued_libraries[n] for n in undocumented])
+        for normalized_lib_name, libdoc in zip(undocumented, libdoc_results, strict=True):
+            library = self._to_library_data(queued_libraries[normalized_lib_name], libdoc)
+            if libdoc_cache is not None:
+                libdoc_cache.set_library(
+                    library.name,
+                    library,
+                    enrich_py_keywords=self.enrich_py_keywords,
+                )
+            libraries[normalized_lib_name] = library
+
+        for normalized_lib_name, library in libraries.items():
+            self.downloaded_libraries[normalized_lib_name] = cast(LibraryData, library)
+
+    def _to_library_data(self, lib_name: str, libdoc: LibdocResult) -> LibraryData:
+        """Convert Libdoc output of a downloaded library. Reports import errors."""
+        normalized_lib_name = normalize_library_name(lib_name)
+
+        if isinstance(libdoc, robot.errors.DataError):
+            self.reporter.on_library_parse_error(libdoc, lib_name)
 
-            self.downloaded_libraries[normalized_lib_name] = LibraryData(
+            return LibraryData(
                 name=lib_name,
                 name_normalized=normalized_lib_name,
-                keywords=[],
-                keyword_names_normalized=set(),
-                import_error=e,
+                keyword_docs={},
+                import_error=libdoc,
             )
-            return
 
+        # Keywords are converted to KeywordData only when used
         if self.enrich_py_keywords:
-            enriched_keywords = enrich_python_keyword_data(lib)
-            keywords = [
-                libdoc_keyword_to_keyword_data(
-                    kw.doc,
-                    "LIBRARY",
-                    kw.returns,
-                )
-                for kw in enriched_keywords
+            keyword_docs = [
+                libdoc_keyword_to_library_keyword_doc(kw.doc, kw.returns)
+                for kw in enrich_python_keyword_data(libdoc)
             ]
         else:
-            lib_keywords = cast(list[KeywordDoc], lib.keywords)
-            keywords = [
-                libdoc_keyword_to_keyword_data(
-                    kw,
-                    "LIBRARY",
-                )
-                for kw in lib_keywords
+            keyword_docs = [
+                libdoc_keyword_to_library_keyword_doc(kw)
+                for kw in cast(list[KeywordDoc], libdoc.keywords)
             ]
 
-        keyword_names_normalized = {kw.normalized_name for kw in keywords}
-
-        self.downloaded_libraries[normalized_lib_name] = LibraryData(
+        return LibraryData(
             name=lib_name,
             name_normalized=normalized_lib_name,
-            keywords=keywords,
-            keyword_names_normalized=keyword_names_normalized,
+            keyword_docs={normalize_keyword_name(kw.name): kw for kw in keyword_docs},
             import_error=False,
         )
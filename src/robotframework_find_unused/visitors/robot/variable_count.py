@@ -1,22 +1,19 @@
-import re
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
-from robot.api.parsing import (
-    ModelVisitor,
-    Variable,
-)
+from robot.api.parsing import Variable
 
 from robotframework_find_unused.common.const import VariableData
 from robotframework_find_unused.common.normalize import (
     normalize_keyword_name,
     normalize_variable_name,
 )
-from robotframework_find_unused.parse.parse_variable import get_variables_in_string
+from robotframework_find_unused.parse.parse_variable import get_variable_references
 from robotframework_find_unused.resolve.resolve_variables import (
     SUPPORTED_BUILTIN_VARS,
     resolve_variable_name,
 )
+from robotframework_find_unused.visitors.robot.file_facts import FileFacts, FileFactsVisitor
 
 if TYPE_CHECKING:
     from robot.api.parsing import (
@@ -29,22 +26,28 @@ if TYPE_CHECKING:
     )
 
 
-class RobotVisitorVariableUses(ModelVisitor):
+class RobotVisitorVariableUses(FileFactsVisitor):
     """
     Visit file and count variable usage.
     """
 
     variables: dict[str, VariableData]
 
-    # Details: https://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#special-variable-syntax
-    _pattern_eval_variable = re.compile(r"\$(\w+)")
-    # Details: https://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#inline-python-evaluation
-    _pattern_inline_eval = re.compile(r"\${{(.+?)}}")
-
     def __init__(self, variable_defs: dict[str, VariableData]) -> None:
         self.variables = variable_defs
+        # Names of the known variables used by strings. Valid as long as the variable definitions
+        # don't change, which is the lifetime of the visitor.
+        self._arg_names: dict[str, tuple[str, ...]] = {}
+        self._eval_names: dict[str, tuple[str, ...]] = {}
+        self._reference_names: dict[str, tuple[str, ...]] = {}
         super().__init__()
 
+    def visit_file_facts(self, facts: FileFacts) -> None:
+        """Count variable usage in a single file"""
+        self._count_used_vars_in_args(facts.variable_args)
+        for eval_str in facts.variable_evals:
+            self._count_used_vars_in_eval(eval_str)
+
     def visit_VariableSection(self, node: "VariableSection"):  # noqa: N802
         """
         Look for used variables in variable definitions.
@@ -120,98 +123,77 @@ class RobotVisitorVariableUses(ModelVisitor):
         """
         Count used variables found in a python evaluation context
         """
-        used_vars = self._get_used_vars_in_eval(eval_str)
-        used_vars = self._filter_supported_vars(used_vars)
-        for name in used_vars:
-            self._count_variable_use(name)
-
-    def _get_used_vars_in_eval(self, eval_str: str) -> list[str]:
-        """
-        Return a list of used variables in a given evaluated Python expression
-        """
-        eval_str = eval_str.strip()
-        used_vars = self._get_used_vars_in_args([eval_str])
-
-        match = self._pattern_eval_variable.findall(eval_str)
-        for var in match:
-            used_vars.append("${" + normalize_variable_name(var) + "}")
+        names = self._eval_names.get(eval_str)
+        if names is None:
+            references = get_variable_references(eval_str, python_expression=True)
+            names = self._resolve_references(references)
+            self._eval_names[eval_str] = names
 
-        return used_vars
+        for name in names:
+            self._count_variable_use(name)
 
     def _count_used_vars_in_args(self, args: Iterable[str]) -> None:
         """
         Count used variables found in a list of arguments
         """
-        used_vars = self._get_used_vars_in_args(args)
-        used_vars = self._filter_supported_vars(used_vars)
-        for name in used_vars:
-            self._count_variable_use(name)
-
-    def _get_used_vars_in_args(self, args: Iterable[str]) -> list[str]:
-        """
-        Return a list of used variables in a given list of strings
-        """
-        used_vars = []
         for arg in args:
-            var_match = get_variables_in_string(arg)
-            used_vars += var_match
+            names = self._arg_names.get(arg)
+            if names is None:
+                names = self._resolve_references(get_variable_references(arg))
+                self._arg_names[arg] = names
 
-            eval_match = self._pattern_inline_eval.findall(arg)
-            for inline_eval in eval_match:
-                used_vars += self._get_used_vars_in_eval(inline_eval)
+            for name in names:
+                self._count_variable_use(name)
 
-        return used_vars
-
-    def _filter_supported_vars(self, variables: list[str]) -> list[str]:
+    def _resolve_references(self, references: list[str]) -> tuple[str, ...]:
         """
-        Filter out unsupported variables and some Robot builtin stuff.
+        Return the normalized names of the known variables used by the given variable references.
         """
-        filtered = []
-        for formatted_var in variables:
-            var = normalize_variable_name(formatted_var)
+        names: list[str] = []
+        for reference in references:
+            reference_names = self._reference_names.get(reference)
+            if reference_names is None:
+                reference_names = self._resolve_reference(reference)
+                self._reference_names[reference] = reference_names
+            names += reference_names
+        return tuple(names)
 
-            try:
-                float(var)
-                # Is a number, not a variable name.
-                # Details: https://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#number-variables
-                continue
-            except ValueError:
-                pass
+    def _resolve_reference(self, reference: str) -> tuple[str, ...]:
+        """
+        Return the normalized names of the known variables used by a single variable reference.
 
-            if var in SUPPORTED_BUILTIN_VARS:
-                continue
+        Filters out unsupported variables and some Robot builtin stuff.
+        """
+        var = normalize_variable_name(reference)
+
+        try:
+            float(var)
+        except ValueError:
+            pass
+        else:
+            # Is a number, not a variable name.
+            # Details: https://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#number-variables
+            return ()
 
-            (var, used_vars) = resolve_variable_name(var, self.variables)
-            for v in used_vars:
-                self._count_variable_use(v)
+        if var in SUPPORTED_BUILTIN_VARS:
+            return ()
 
-            if not var.isalnum():
-                # Potential extended variable syntax
-                var = self._normalize_extended_variable_syntax(var)
+        (var, used_vars) = resolve_variable_name(var, self.variables)
 
-            filtered.append(var)
+        if not var.isalnum():
+            # Potential extended variable syntax
+            var = self._normalize_extended_variable_syntax(var)
 
-        return filtered
+        return tuple(name for name in [*used_vars, var] if name in self.variables)
 
     def _normalize_extended_variable_syntax(self, var: str) -> str:
         if var in self.variables:
             return var
 
-        var_name = var
-        while len(var_name) > 0:
-            # Remove all trailing alphanumeric
-            while len(var_name) > 0 and var_name[-1].isalnum():
-                var_name = var_name[0:-1]
-            if len(var_name) == 0:
-                break
-
-            # Remove single trailing special char
-            var_name = var_name[0:-1]
-            if len(var_name) == 0:
-                break
-
-            if var_name in self.variables:
-                return var_name
+        # Try the longest name that ends just before a special char
+        for end in range(len(var) - 1, 0, -1):
+            if not var[end].isalnum() and var[:end] in self.variables:
+                return var[:end]
 
         # Could not find var. Don't modify.
         return var
@@ -1,11 +1,9 @@
+import sys
 from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from robot.api.parsing import (
-    ModelVisitor,
-    Variable,
-)
+from robot.api.parsing import Variable
 
 from robotframework_find_unused.common.const import VariableData, VariableDefinedInType
 from robotframework_find_unused.common.impossible_state_error import ImpossibleStateError
@@ -15,6 +13,7 @@ from robotframework_find_unused.common.normalize import (
 )
 from robotframework_find_unused.convert.convert_path import to_relative_path
 from robotframework_find_unused.resolve.resolve_import_string import resolve_import_string
+from robotframework_find_unused.visitors.robot.file_facts import FileFacts, FileFactsVisitor
 
 if TYPE_CHECKING:
     from robot.api.parsing import (
@@ -28,7 +27,7 @@ if TYPE_CHECKING:
     from robotframework_find_unused.reporter.base.variable_reporter import VariableReporter
 
 
-class RobotVisitorVariableDefinitions(ModelVisitor):
+class RobotVisitorVariableDefinitions(FileFactsVisitor):
     """
     Visit file and discover variable definitions.
     """
@@ -84,22 +83,7 @@ class RobotVisitorVariableDefinitions(ModelVisitor):
         """
         Look for variable declarations in variable files.
         """
-        if self.current_working_directory is None or self.current_working_file is None:
-            msg = "Found variables file import outside a .robot or .resource file"
-            raise ImpossibleStateError(msg)
-
-        try:
-            import_path = resolve_import_string(
-                node.name,
-                self.current_working_directory,
-                self.root_directory,
-                self.discovered_files,
-            )
-            if import_path:
-                self._import_variable_file(Path(import_path.path), node.args)
-        except Exception as e:  # noqa: BLE001
-            from_path = to_relative_path(self.root_directory, self.current_working_file)
-            self.reporter.on_file_import_error(e, node.name, from_path)
+        self._import_variables(node.name, node.args)
 
         return self.generic_visit(node)
 
@@ -141,6 +125,44 @@ class RobotVisitorVariableDefinitions(ModelVisitor):
             node.value,
         )
 
+    def visit_file_facts(self, facts: FileFacts) -> None:
+        """Look for variable declarations in a single file"""
+        self.current_working_file = facts.source
+        self.current_working_directory = facts.source.parent
+
+        for definition in facts.variable_definitions:
+            if definition.type == "variables_import":
+                self._import_variables(definition.name, tuple(definition.value))
+                continue
+
+            self._register_variable(
+                definition.name,
+                definition.type,
+                facts.source,
+                definition.value,
+            )
+
+    def _import_variables(self, import_string: str, import_args: tuple[str, ...]) -> None:
+        """
+        Resolve a variables file import and import the variable file. Reports import errors.
+        """
+        if self.current_working_directory is None or self.current_working_file is None:
+            msg = "Found variables file import outside a .robot or .resource file"
+            raise ImpossibleStateError(msg)
+
+        try:
+            import_path = resolve_import_string(
+                import_string,
+                self.current_working_directory,
+                self.root_directory,
+                self.discovered_files,
+            )
+            if import_path:
+                self._import_variable_file(Path(import_path.path), import_args)
+        except Exception as e:  # noqa: BLE001
+            from_path = to_relative_path(self.root_directory, self.current_working_file)
+            self.reporter.on_file_import_error(e, import_string, from_path)
+
     def _import_variable_file(self, import_path: Path, import_args: tuple[str, ...]) -> None:
         """
         Import a file as a variable file.
@@ -172,7 +194,8 @@ class RobotVisitorVariableDefinitions(ModelVisitor):
     ) -> None:
         (var_name, var_type) = self._parse_var_name(name)
 
-        name_normalized = normalize_variable_name(var_name)
+        # Interned: Many variables share names and files
+        name_normalized = sys.intern(normalize_variable_name(var_name))
         if name_normalized in self.variables:
             var_def = self.variables[name_normalized]
 
@@ -194,7 +217,7 @@ class RobotVisitorVariableDefinitions(ModelVisitor):
             resolved_name=var_name,
             use_count=0,
             defined_in_type=defined_in_type,
-            defined_in=defined_in.as_posix(),
+            defined_in=sys.intern(defined_in.as_posix()),
             value=value,
         )
 
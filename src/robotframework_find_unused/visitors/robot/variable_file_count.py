@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from robot.api.parsing import File
+
+from robotframework_find_unused.common.const import VariableData
+from robotframework_find_unused.visitors.robot.file_facts import FileFacts
+
+from .variable_count import RobotVisitorVariableUses
+
+
+class RobotVisitorVariableUsesPerFile(RobotVisitorVariableUses):
+    """
+    Visit file and count variable usage.
+
+    Does the same as `RobotVisitorVariableUses`, but also keeps the variable uses of every file
+    separate. The uses of every file are stored in `file_uses`.
+    """
+
+    file_uses: dict[Path, dict[str, int]]
+    """Number of uses of each variable, keyed by normalized name. Per file."""
+
+    def __init__(self, variable_defs: dict[str, VariableData]) -> None:
+        self.file_uses = {}
+        self._current_file_uses: dict[str, int] = {}
+        super().__init__(variable_defs)
+
+    def visit_File(self, node: File):  # noqa: N802
+        """Visit new file and store its variable uses"""
+        self._current_file_uses = {}
+
+        self.generic_visit(node)
+
+        if node.source is not None:
+            self.file_uses[Path(node.source)] = self._current_file_uses
+
+    def visit_file_facts(self, facts: FileFacts) -> None:
+        """Visit the facts of a new file and store its variable uses"""
+        self._current_file_uses = {}
+
+        super().visit_file_facts(facts)
+
+        self.file_uses[facts.source] = self._current_file_uses
+
+    def _count_variable_use(self, normalized_name: str) -> None:
+        """
+        Count the variable for the current file.
+        """
+        if normalized_name not in self.variables:
+            # Unknown variable definition. Ignore
+            return
+        super()._count_variable_use(normalized_name)
+
+        uses = self._current_file_uses.get(normalized_name, 0)
+        self._current_file_uses[normalized_name] = uses + 1
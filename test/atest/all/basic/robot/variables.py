@@ -0,0 +1,2 @@
+USED_FROM_FILE = "used"
+UNUSED_FROM_FILE = "unused"
@@ -0,0 +1,43 @@
+from test.atest.utils import AcceptanceTest
+
+
+class TestCommandAcceptance(AcceptanceTest):
+    def test_all_command(self):
+        self.run_test(
+            ["all", "./robot"],
+            "./expected_output.log",
+            __file__,
+            expected_exit_code=7,
+        )
+
+    def test_all_command_with_count(self):
+        self.run_test(
+            ["all", "./robot", "--show-count"],
+            "./expected_output_count.log",
+            __file__,
+            expected_exit_code=7,
+        )
+
+    def test_all_command_with_jobs(self):
+        self.run_test(
+            ["all", "./robot", "--jobs", "2"],
+            "./expected_output.log",
+            __file__,
+            expected_exit_code=7,
+        )
+
+    def test_all_command_with_low_memory(self):
+        self.run_test(
+            ["all", "./robot", "--low-memory"],
+            "./expected_output.log",
+            __file__,
+            expected_exit_code=7,
+        )
+
+    def test_all_command_with_ndjson_format(self):
+        self.run_test(
+            ["all", "./robot", "--format", "ndjson"],
+            "./expected_output_ndjson.log",
+            __file__,
+            expected_exit_code=7,
+        )
@@ -0,0 +1,11 @@
+from test.atest.utils import AcceptanceTest
+
+
+class TestCommandAcceptance(AcceptanceTest):
+    def test_all_command_continues_after_failed_command(self):
+        self.run_test(
+            ["all", "./robot"],
+            "./expected_output.log",
+            __file__,
+            expected_exit_code=255,
+        )
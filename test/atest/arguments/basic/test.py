@@ -25,3 +25,19 @@ class TestCommandAcceptance(AcceptanceTest):
             __file__,
             expected_exit_code=2,
         )
+
+    def test_arguments_command_with_jobs(self):
+        self.run_test(
+            ["arguments", "./robot", "--verbose", "--jobs", "2"],
+            "./expected_output_verbose.log",
+            __file__,
+            expected_exit_code=2,
+        )
+
+    def test_arguments_command_with_ndjson_format(self):
+        self.run_test(
+            ["arguments", "./robot", "--format", "ndjson"],
+            "./expected_output_ndjson.log",
+            __file__,
+            expected_exit_code=2,
+        )
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from test.atest.utils import AcceptanceTest
 
 
@@ -25,3 +27,29 @@ class TestCommandAcceptance(AcceptanceTest):
             __file__,
             expected_exit_code=1,
         )
+
+    def test_files_command_with_parse_cache(self, tmp_path: Path):
+        cache_dir = tmp_path.joinpath(".robotunused_cache").as_posix()
+        for _ in ("cold cache", "warm cache"):
+            self.run_test(
+                ["files", "./robot", "--cache-dir", cache_dir],
+                "./expected_output.log",
+                __file__,
+                expected_exit_code=1,
+            )
+
+    def test_files_command_with_jobs(self):
+        self.run_test(
+            ["files", "./robot", "--show-tree", "--jobs", "2"],
+            "./expected_output_tree.log",
+            __file__,
+            expected_exit_code=1,
+        )
+
+    def test_files_command_with_ndjson_format(self):
+        self.run_test(
+            ["files", "./robot", "--format", "ndjson"],
+            "./expected_output_ndjson.log",
+            __file__,
+            expected_exit_code=1,
+        )
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from test.atest.utils import AcceptanceTest
 
 
@@ -25,3 +27,37 @@ class TestCommandAcceptance(AcceptanceTest):
             __file__,
             expected_exit_code=9,
         )
+
+    def test_variables_command_with_low_memory(self):
+        self.run_test(
+            ["variables", "./robot", "--verbose", "--low-memory"],
+            "./expected_output_verbose.log",
+            __file__,
+            expected_exit_code=9,
+        )
+
+    def test_variables_command_with_parse_cache(self, tmp_path: Path):
+        cache_dir = tmp_path.joinpath(".robotunused_cache").as_posix()
+        for _ in ("cold cache", "warm cache"):
+            self.run_test(
+                ["variables", "./robot", "--cache-dir", cache_dir],
+                "./expected_output.log",
+                __file__,
+                expected_exit_code=9,
+            )
+
+    def test_variables_command_with_jobs(self):
+        self.run_test(
+            ["variables", "./robot", "--verbose", "--jobs", "2"],
+            "./expected_output_verbose.log",
+            __file__,
+            expected_exit_code=9,
+        )
+
+    def test_variables_command_with_ndjson_format(self):
+        self.run_test(
+            ["variables", "./robot", "--format", "ndjson"],
+            "./expected_output_ndjson.log",
+            __file__,
+            expected_exit_code=9,
+        )
@@ -0,0 +1,144 @@
+"""
+Microbenchmark for `append_unused_library_keywords`.
+
+Compares the current implementation with the previous implementation, which checked every library
+keyword against the list of counted keywords. Uses a project that imports ten large libraries and
+calls half of their keywords. Run with:
+
+    python test/benchmark/append_unused_library_keywords.py
+"""
+
+import dataclasses
+import sys
+import timeit
+
+from robot.libdocpkg.model import KeywordDoc, LibraryDoc
+from robot.running.arguments.argumentspec import ArgumentSpec
+
+from robotframework_find_unused.commands.step.keyword_count_uses import (
+    append_unused_library_keywords,
+)
+from robotframework_find_unused.common.const import KeywordData, LibraryData
+from robotframework_find_unused.convert.convert_keyword import (
+    get_library_keyword,
+    get_library_keywords,
+    libdoc_keyword_to_keyword_data,
+)
+from robotframework_find_unused.reporter.base.partial.keyword_definitions import (
+    PartialReporter_DownloadedKeywordDefinitions,
+)
+from robotframework_find_unused.visitors.robot.library_import import RobotVisitorLibraryImports
+
+LIBRARIES = (
+    "BuiltIn",
+    "Collections",
+    "DateTime",
+    "Dialogs",
+    "OperatingSystem",
+    "Process",
+    "Screenshot",
+    "String",
+    "Telnet",
+    "XML",
+)
+# Copies of every standard library, to get as many keywords as large external libraries have
+COPIES_PER_LIBRARY = 8
+CUSTOM_KEYWORDS = 2_000
+REPEAT = 5
+
+
+def load_libraries() -> list[LibraryData]:
+    """Document the libraries, every library a couple of times"""
+    visitor = RobotVisitorLibraryImports(PartialReporter_DownloadedKeywordDefinitions(None))
+    for lib_name in LIBRARIES:
+        visitor.register_downloaded_library(lib_name)
+    visitor.load_downloaded_libraries()
+
+    libraries: list[LibraryData] = []
+    for library in visitor.downloaded_libraries.values():
+        for i in range(COPIES_PER_LIBRARY):
+            libraries.append(
+                LibraryData(
+                    name=f"{library.name}{i}",
+                    name_normalized=f"{library.name_normalized}{i}",
+                    keyword_docs={
+                        name: dataclasses.replace(doc, library=f"{doc.library}{i}")
+                        for name, doc in library.keyword_docs.items()
+                    },
+                    import_error=False,
+                ),
+            )
+    return libraries
+
+
+def count_keywords(libraries: list[LibraryData]) -> list[KeywordData]:
+    """Get custom keywords and every other library keyword, like the output of counting uses"""
+    library_doc = LibraryDoc(name="custom")
+    counted_keywords = [
+        libdoc_keyword_to_keyword_data(
+            KeywordDoc(name=f"Custom Keyword {i}", args=ArgumentSpec(), parent=library_doc),
+            "CUSTOM_RESOURCE",
+        )
+        for i in range(CUSTOM_KEYWORDS)
+    ]
+    for library in libraries:
+        for normalized_name in list(library.keyword_docs)[::2]:
+            keyword = get_library_keyword(library, normalized_name)
+            if keyword is not None:
+                counted_keywords.append(keyword)
+    return counted_keywords
+
+
+def reference_append_unused_library_keywords(
+    counted_keywords: list[KeywordData],
+    downloaded_libraries: list[LibraryData],
+) -> list[KeywordData]:
+    """Previous implementation. Kept as baseline and to check results are identical."""
+    for lib in downloaded_libraries:
+        for kw in get_library_keywords(lib):
+            if kw in counted_keywords:
+                continue
+            counted_keywords.append(kw)
+
+    return counted_keywords
+
+
+def main() -> int:
+    """Run the benchmark"""
+    libraries = load_libraries()
+    counted_keywords = count_keywords(libraries)
+    library_keyword_count = sum(len(lib.keyword_docs) for lib in libraries)
+
+    current_result = append_unused_library_keywords(list(counted_keywords), libraries)
+    reference_result = reference_append_unused_library_keywords(list(counted_keywords), libraries)
+    if [id(kw) for kw in current_result] != [id(kw) for kw in reference_result]:
+        msg = "Results differ"
+        raise AssertionError(msg)
+
+    current = min(
+        timeit.repeat(
+            lambda: append_unused_library_keywords(list(counted_keywords), libraries),
+            number=1,
+            repeat=REPEAT,
+        ),
+    )
+    reference = min(
+        timeit.repeat(
+            lambda: reference_append_unused_library_keywords(list(counted_keywords), libraries),
+            number=1,
+            repeat=REPEAT,
+        ),
+    )
+    print(
+        f"{len(libraries)} libraries, {library_keyword_count} library keywords, "
+        f"{len(counted_keywords)} counted keywords  "
+        f"reference {reference * 1000:>9.2f} ms  "
+        f"current {current * 1000:>8.2f} ms  "
+        f"speedup {reference / current:>6.1f}x",
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
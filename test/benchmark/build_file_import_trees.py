@@ -0,0 +1,224 @@
+"""
+Microbenchmark for `FileImportTreeBuilder.build_grouped_trees`.
+
+Compares the current implementation with the previous implementation, which copied the list of
+visited files for every node and hashed every subtree again for every ancestor. Uses a project
+where suites import layers of resource files that import each other, including circular imports.
+Run with:
+
+    python test/benchmark/build_file_import_trees.py
+"""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+from typing import Literal
+
+from robotframework_find_unused.commands.step.file_import_tree import (
+    FileImportTreeBuilder,
+    FileImportTreeNode,
+)
+from robotframework_find_unused.common.const import (
+    FileUseData,
+    FileUsedByData,
+    ResolvedFileImport,
+)
+
+SUITES = 500
+RESOURCE_LAYERS = 6
+RESOURCES_PER_LAYER = 100
+IMPORTS_PER_FILE = 6
+CIRCULAR_IMPORTS = 50
+MAX_DEPTH = 0
+REPEAT = 3
+
+
+def generate_files() -> tuple[list[FileUseData], list[FileUseData]]:
+    """Generate suites and resources. Returns root files and all files."""
+    rng = random.Random(0)
+
+    def file(name: str) -> FileUseData:
+        path = Path(f"/project/{name}")
+        return FileUseData(
+            id=str(path),
+            resolved_to=ResolvedFileImport(type="FILE_PATH", import_string=name, path=path),
+            type={"SUITE"} if name.startswith("suite") else {"RESOURCE"},
+            used_by=[],
+        )
+
+    def add_import(importing: FileUseData, imported: FileUseData) -> None:
+        imported.used_by.append(
+            FileUsedByData(file=importing, as_alias=None, normalized_as_alias=None, args=()),
+        )
+
+    suites = [file(f"suite_{i}.robot") for i in range(SUITES)]
+    layers = [
+        [file(f"layer_{layer}/resource_{i}.resource") for i in range(RESOURCES_PER_LAYER)]
+        for layer in range(RESOURCE_LAYERS)
+    ]
+
+    importing_layers = [suites, *layers]
+    for importing_layer, imported_layer in zip(importing_layers, layers, strict=False):
+        for importing in importing_layer:
+            for imported in rng.sample(imported_layer, IMPORTS_PER_FILE):
+                add_import(importing, imported)
+
+    for _ in range(CIRCULAR_IMPORTS):
+        importing_layer = rng.randrange(1, RESOURCE_LAYERS)
+        add_import(
+            rng.choice(layers[importing_layer]),
+            rng.choice(layers[rng.randrange(importing_layer)]),
+        )
+
+    files = [*suites, *[resource for layer in layers for resource in layer]]
+    return (suites, files)
+
+
+class ReferenceFileImportTreeBuilder(FileImportTreeBuilder):
+    """Previous implementation. Kept as baseline and to check results are identical."""
+
+    def build_grouped_trees(
+        self,
+        root_files: list[FileUseData],
+        files: list[FileUseData],
+    ) -> list[list[FileImportTreeNode]]:
+        """Build file import trees for each root file. Group root files with identical imports."""
+        file_imports_map: dict[str, list[FileUseData]] = {file.id: [] for file in files}
+        for file in files:
+            for using_file in file.used_by:
+                file_imports_map[using_file.file.id].append(file)
+
+        grouped_trees: dict[int, list[FileImportTreeNode]] = {}
+        for root_file in root_files:
+            tree = self.reference_build_single_file_tree(root_file, file_imports_map)
+
+            tree_hash = reference_content_hash(tree)
+            if tree_hash not in grouped_trees:
+                grouped_trees[tree_hash] = []
+            grouped_trees[tree_hash].append(tree)
+
+        return list(grouped_trees.values())
+
+    def reference_build_single_file_tree(
+        self,
+        cur_file: FileUseData,
+        file_imports: dict[str, list[FileUseData]],
+        *,
+        depth: int = 0,
+        visited_files_in_branch: list[str] | None = None,
+        runtime_file_scope: set[str] | None = None,
+    ) -> FileImportTreeNode:
+        """Build file import tree for a single file."""
+        if visited_files_in_branch is None:
+            visited_files_in_branch = []
+        if runtime_file_scope is None:
+            runtime_file_scope = set()
+
+        node = FileImportTreeNode(data=cur_file, depth=depth, branches=[], parent=None)
+
+        prune_reason = self.reference_get_node_prune_reason(
+            node,
+            depth,
+            visited_files_in_branch,
+            runtime_file_scope,
+        )
+        if prune_reason is not None:
+            node.branches = prune_reason
+            return node
+
+        visited_files_in_branch = visited_files_in_branch.copy()
+        visited_files_in_branch.append(node.data.id)
+
+        runtime_file_scope.add(node.data.id)
+
+        cur_file_imports = file_imports.get(node.data.id, [])
+
+        cur_file_import_hash = hash("|".join([str(hash(i)) for i in cur_file_imports]))
+        if depth == 0 and cur_file_import_hash in self._tree_cache:
+            node.branches = self._tree_cache[cur_file_import_hash].branches  # type: ignore[index]
+            return node
+
+        node.branches = []
+        for file_import in cur_file_imports:
+            branch_node = self.reference_build_single_file_tree(
+                file_import,
+                file_imports,
+                depth=depth + 1,
+                visited_files_in_branch=visited_files_in_branch,
+                runtime_file_scope=runtime_file_scope,
+            )
+            branch_node.parent = node
+            node.branches.append(branch_node)
+
+        if depth == 0:
+            self._tree_cache[cur_file_import_hash] = node  # type: ignore[index]
+        return node
+
+    def reference_get_node_prune_reason(
+        self,
+        node: FileImportTreeNode,
+        depth: int,
+        visited_files_in_branch: list[str],
+        runtime_file_scope: set[str],
+    ) -> Literal["CIRCULAR", "MAX_DEPTH", "DEDUPED"] | None:
+        """Why should the node be pruned or None."""
+        if self.max_depth > 0 and depth > self.max_depth:
+            return "MAX_DEPTH"
+        if node.data.id in visited_files_in_branch:
+            return "CIRCULAR"
+        if node.data.id in runtime_file_scope:
+            return "DEDUPED"
+        return None
+
+
+def reference_content_hash(node: FileImportTreeNode) -> int:
+    """Previous, not memoized, content hash"""
+    if isinstance(node.branches, str):
+        return hash(node.data)
+    return hash("|".join([str(reference_content_hash(branch)) for branch in node.branches]))
+
+
+def serialize(grouped_trees: list[list[FileImportTreeNode]]) -> list[list[tuple]]:
+    """Get comparable representation of the trees"""
+
+    def serialize_node(node: FileImportTreeNode) -> tuple:
+        if isinstance(node.branches, str):
+            return (node.data.id, node.depth, node.branches)
+        return (node.data.id, node.depth, [serialize_node(branch) for branch in node.branches])
+
+    return [[serialize_node(tree) for tree in group] for group in grouped_trees]
+
+
+def main() -> int:
+    """Run the benchmark"""
+    (root_files, files) = generate_files()
+
+    def current_build() -> list[list[FileImportTreeNode]]:
+        return FileImportTreeBuilder(max_depth=MAX_DEPTH).build_grouped_trees(root_files, files)
+
+    def reference_build() -> list[list[FileImportTreeNode]]:
+        return ReferenceFileImportTreeBuilder(max_depth=MAX_DEPTH).build_grouped_trees(
+            root_files,
+            files,
+        )
+
+    current_result = current_build()
+    if serialize(current_result) != serialize(reference_build()):
+        msg = "Results differ"
+        raise AssertionError(msg)
+
+    current = min(timeit.repeat(current_build, number=1, repeat=REPEAT))
+    reference = min(timeit.repeat(reference_build, number=1, repeat=REPEAT))
+    print(
+        f"{len(root_files)} suites, {len(files)} files, {len(current_result)} tree groups  "
+        f"reference {reference * 1000:>9.2f} ms  "
+        f"current {current * 1000:>8.2f} ms  "
+        f"speedup {reference / current:>6.1f}x",
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Benchmark for file discovery.
+
+Compares discovering files with Robocop with discovering files natively on a generated tree of
+50,000 files. Run with:
+
+    python test/benchmark/discover_files.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from robotframework_find_unused.commands.step.discover_files import step_discover_file_paths
+from robotframework_find_unused.common.const import DiscoveryOption
+from robotframework_find_unused.common.file_discovery import apply_file_discovery
+from robotframework_find_unused.reporter.base.partial.discover_files import (
+    PartialReporter_DiscoverFiles,
+)
+
+FILE_COUNT = 50_000
+FILES_PER_DIRECTORY = 50
+DIRECTORIES_PER_DIRECTORY = 10
+SUFFIXES = (".robot", ".resource", ".py", ".txt", ".json")
+REPEAT = 3
+
+
+def generate_tree(root: Path) -> None:
+    """Create nested directories with files of various types"""
+    root.joinpath(".git").mkdir()
+    root.joinpath(".gitignore").write_text("output/\n*.generated.robot\n")
+
+    for i in range(FILE_COUNT):
+        directory_index = i // FILES_PER_DIRECTORY
+        parts = []
+        while directory_index > 0:
+            parts.append(f"dir_{directory_index % DIRECTORIES_PER_DIRECTORY}")
+            directory_index //= DIRECTORIES_PER_DIRECTORY
+        directory = root.joinpath(*reversed(parts))
+        if i % 1000 == 0:
+            directory = directory.joinpath("output")
+        directory.mkdir(parents=True, exist_ok=True)
+
+        suffix = SUFFIXES[i % len(SUFFIXES)]
+        name = "__init__" if i % FILES_PER_DIRECTORY == 0 else f"file_{i}"
+        if i % 100 == 1:
+            name += ".generated"
+        directory.joinpath(f"{name}{suffix}").write_text("")
+
+
+def measure(root: Path, discovery: DiscoveryOption) -> tuple[float, list[Path]]:
+    """Discover files a couple of times. Returns the fastest time."""
+    apply_file_discovery(discovery)
+    reporter = PartialReporter_DiscoverFiles(None)
+
+    fastest = float("inf")
+    file_paths: list[Path] = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        file_paths = step_discover_file_paths(str(root), reporter=reporter) or []
+        fastest = min(fastest, time.perf_counter() - start)
+    return (fastest, file_paths)
+
+
+def main() -> int:
+    """Run the benchmark"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        generate_tree(root)
+
+        (robocop, robocop_paths) = measure(root, "robocop")
+        (native, native_paths) = measure(root, "native")
+
+    if native_paths != robocop_paths:
+        msg = "Results differ"
+        raise AssertionError(msg)
+
+    print(
+        f"{FILE_COUNT} files, {len(native_paths)} discovered  "
+        f"robocop {robocop * 1000:>9.2f} ms  "
+        f"native {native * 1000:>8.2f} ms  "
+        f"speedup {robocop / native:>6.1f}x",
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""
+Generate synthetic Robot Framework projects for benchmarking.
+"""
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+INDENT = "    "
+SEPARATOR = "    "
+
+
+@dataclass
+class ProjectScale:
+    """Size and shape of a synthetic project"""
+
+    name: str
+    suites: int
+    """Number of .robot suite files"""
+    tests_per_suite: int
+    resources: int
+    """Number of .resource files"""
+    keywords_per_resource: int
+    embedded_ratio: float
+    """Ratio of keywords with embedded arguments"""
+    import_depth: int
+    """Number of resource layers. Resources import resources of the next layer."""
+    variables_per_file: int
+    calls_per_keyword: int
+    """Number of keyword calls in every keyword and test"""
+    seed: int = 0
+
+
+SCALES = {
+    "tiny": ProjectScale(
+        name="tiny",
+        suites=5,
+        tests_per_suite=3,
+        resources=5,
+        keywords_per_resource=5,
+        embedded_ratio=0.2,
+        import_depth=2,
+        variables_per_file=3,
+        calls_per_keyword=3,
+    ),
+    "small": ProjectScale(
+        name="small",
+        suites=50,
+        tests_per_suite=10,
+        resources=20,
+        keywords_per_resource=20,
+        embedded_ratio=0.2,
+        import_depth=3,
+        variables_per_file=10,
+        calls_per_keyword=5,
+    ),
+    "medium": ProjectScale(
+        name="medium",
+        suites=200,
+        tests_per_suite=15,
+        resources=100,
+        keywords_per_resource=30,
+        embedded_ratio=0.3,
+        import_depth=4,
+        variables_per_file=20,
+        calls_per_keyword=6,
+    ),
+    "large": ProjectScale(
+        name="large",
+        suites=1000,
+        tests_per_suite=20,
+        resources=400,
+        keywords_per_resource=40,
+        embedded_ratio=0.3,
+        import_depth=6,
+        variables_per_file=30,
+        calls_per_keyword=8,
+    ),
+}
+
+
+@dataclass
+class _Keyword:
+    name: str
+    call: str
+    """Keyword call without arguments"""
+    arguments: int
+
+
+def generate_project(root: Path, scale: ProjectScale) -> list[Path]:
+    """
+    Write a synthetic project to the root folder.
+
+    Returns the paths of all written files.
+    """
+    rand = random.Random(scale.seed)
+
+    layers = max(1, scale.import_depth)
+    resource_layer = [i % layers for i in range(scale.resources)]
+    resource_paths = [
+        Path("resources", f"layer_{resource_layer[i]}", f"resource_{i}.resource")
+        for i in range(scale.resources)
+    ]
+    resource_keywords = [
+        [
+            _create_keyword(rand, i, j, scale.embedded_ratio)
+            for j in range(scale.keywords_per_resource)
+        ]
+        for i in range(scale.resources)
+    ]
+
+    written: list[Path] = []
+    for i, relative_path in enumerate(resource_paths):
+        layer = resource_layer[i]
+        next_layer = [k for k in range(scale.resources) if resource_layer[k] == layer + 1]
+        imports = [
+            resource_paths[next_layer[(i // layers + offset) % len(next_layer)]]
+            for offset in range(min(2, len(next_layer)))
+        ]
+        callable_keywords = [
+            kw
+            for k in range(scale.resources)
+            if resource_layer[k] > layer
+            for kw in resource_keywords[k]
+        ]
+
+        content = _build_resource(
+            rand,
+            scale,
+            f"RES_{i}",
+            [_relative_import(relative_path, p) for p in imports],
+            resource_keywords[i],
+            callable_keywords,
+        )
+        written.append(_write(root, relative_path, content))
+
+    top_layer_keywords = [
+        kw for k in range(scale.resources) if resource_layer[k] == 0 for kw in resource_keywords[k]
+    ]
+    top_layer_paths = [p for k, p in enumerate(resource_paths) if resource_layer[k] == 0]
+    for n in range(scale.suites):
+        relative_path = Path("suites", f"suite_{n}.robot")
+        imports = rand.sample(top_layer_paths, min(2, len(top_layer_paths)))
+
+        content = _build_suite(
+            rand,
+            scale,
+            f"SUITE_{n}",
+            [_relative_import(relative_path, p) for p in imports],
+            top_layer_keywords,
+        )
+        written.append(_write(root, relative_path, content))
+
+    return written
+
+
+def _create_keyword(
+    rand: random.Random,
+    resource_index: int,
+    keyword_index: int,
+    embedded_ratio: float,
+) -> _Keyword:
+    name = f"Resource {resource_index} Keyword {keyword_index}"
+    if rand.random() < embedded_ratio:
+        return _Keyword(
+            name=f"{name} Uses ${{value}} Value",
+            call=f"{name} Uses {rand.choice(['some', 'other', 'third'])} Value",
+            arguments=0,
+        )
+    return _Keyword(name=name, call=name, arguments=rand.randint(0, 2))
+
+
+def _build_resource(  # noqa: PLR0913
+    rand: random.Random,
+    scale: ProjectScale,
+    variable_prefix: str,
+    imports: list[str],
+    keywords: list[_Keyword],
+    callable_keywords: list[_Keyword],
+) -> str:
+    lines = ["*** Settings ***"]
+    lines += [f"Resource{SEPARATOR}{path}" for path in imports]
+    lines += [f"Library{SEPARATOR}Collections", ""]
+
+    variables = [f"{variable_prefix}_VAR_{k}" for k in range(scale.variables_per_file)]
+    lines += _build_variables_section(variables)
+
+    lines.append("*** Keywords ***")
+    for kw in keywords:
+        lines.append(kw.name)
+        arguments = [f"${{arg_{a}}}" for a in range(kw.arguments)]
+        if arguments:
+            lines.append(f"{INDENT}[Arguments]{SEPARATOR}{SEPARATOR.join(arguments)}")
+        lines += _build_body(rand, scale, variables, arguments, callable_keywords)
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def _build_suite(
+    rand: random.Random,
+    scale: ProjectScale,
+    variable_prefix: str,
+    imports: list[str],
+    callable_keywords: list[_Keyword],
+) -> str:
+    lines = ["*** Settings ***"]
+    lines += [f"Resource{SEPARATOR}{path}" for path in imports]
+    lines += [f"Library{SEPARATOR}Collections", ""]
+
+    variables = [f"{variable_prefix}_VAR_{k}" for k in range(scale.variables_per_file)]
+    lines += _build_variables_section(variables)
+
+    lines.append("*** Test Cases ***")
+    for t in range(scale.tests_per_suite):
+        lines.append(f"Test {t}")
+        lines += _build_body(rand, scale, variables, [], callable_keywords)
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def _build_variables_section(variables: list[str]) -> list[str]:
+    if not variables:
+        return []
+
+    lines = ["*** Variables ***"]
+    lines += [f"${{{var}}}{SEPARATOR}value {k}" for k, var in enumerate(variables)]
+    lines.append("")
+    return lines
+
+
+def _build_body(
+    rand: random.Random,
+    scale: ProjectScale,
+    variables: list[str],
+    arguments: list[str],
+    callable_keywords: list[_Keyword],
+) -> list[str]:
+    lines: list[str] = []
+
+    used_variables = rand.sample(variables, min(2, len(variables)))
+    log_message = " ".join([*arguments, *[f"${{{var}}}" for var in used_variables]])
+    lines.append(f"{INDENT}Log{SEPARATOR}{log_message or 'Hello'}")
+    lines.append(f"{INDENT}${{list}}={SEPARATOR}Create List{SEPARATOR}a{SEPARATOR}b")
+
+    if not callable_keywords:
+        return lines
+
+    for _ in range(scale.calls_per_keyword):
+        kw = rand.choice(callable_keywords)
+        call_arguments = [f"argument {a}" for a in range(kw.arguments)]
+        lines.append(INDENT + SEPARATOR.join([kw.call, *call_arguments]))
+
+    return lines
+
+
+def _relative_import(from_path: Path, to_path: Path) -> str:
+    """Relative import path from a file to a file, both relative to the project root"""
+    ups = [".."] * (len(from_path.parts) - 1)
+    return Path(*ups, to_path).as_posix()
+
+
+def _write(root: Path, relative_path: Path, content: str) -> Path:
+    file_path = root.joinpath(relative_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text(content, encoding="utf8")
+    return file_path
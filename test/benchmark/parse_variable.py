@@ -0,0 +1,122 @@
+"""
+Microbenchmark for `get_variables_in_string`.
+
+Compares the current implementation with the previous implementation, which was quadratic in the
+length of the string. Run with:
+
+    python test/benchmark/parse_variable.py
+"""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+import robot.api
+from robot.api import Token
+
+from robotframework_find_unused.parse.parse_variable import get_variables_in_string
+
+ROBOT_FILES_FOLDER = Path(__file__).parent.parent.joinpath("atest")
+PAYLOAD_SIZES = (1_000, 4_000, 16_000)
+REPEAT = 5
+
+
+def collect_robot_strings(folder: Path) -> list[str]:
+    """Collect keyword names and keyword arguments from all robot files in the folder"""
+    strings: list[str] = []
+    file_paths = [*folder.glob("**/*.robot"), *folder.glob("**/*.resource")]
+    for file_path in sorted(file_paths):
+        for token in robot.api.get_tokens(file_path, data_only=True):
+            if token.type in (Token.ARGUMENT, Token.KEYWORD, Token.KEYWORD_NAME):
+                strings.append(token.value)
+    return strings
+
+
+def build_json_payload(size: int) -> str:
+    """Build a JSON payload argument with some embedded variables"""
+    items = []
+    while len(json.dumps(items)) < size:
+        index = len(items)
+        items.append(
+            {
+                "id": f"${{id_{index}}}",
+                "name": f"Item {index}",
+                "tags": ["a", "b", "c"],
+                "nested": {"price": index * 10, "currency": "EUR"},
+            },
+        )
+    return json.dumps(items)
+
+
+def reference_get_variables_in_string(input_string: str) -> list[str]:
+    """Previous implementation. Kept as baseline and to check results are identical."""
+    variables: list[str] = []
+
+    string = input_string
+    while len(string) > 0:
+        while len(string) >= 4 and string[0:2] not in ["${", "&{", "@{", "%{"]:  # noqa: PLR2004
+            string = string[1:]
+        if len(string) < 4:  # noqa: PLR2004
+            string = ""
+
+        variable = ""
+        depth = 0
+        while len(string) > 0:
+            char = string[0]
+            if char == "{":
+                depth += 1
+            if char == "}":
+                depth -= 1
+
+            variable += char
+            string = string[1:]
+
+            if char == "}" and depth == 0:
+                break
+
+        if variable:
+            variables.append(variable)
+
+    return variables
+
+
+def run_benchmark(name: str, strings: list[str]) -> None:
+    """Time both implementations on the strings and print the results"""
+    for string in strings:
+        if get_variables_in_string(string) != reference_get_variables_in_string(string):
+            msg = f"Results differ for: {string[:100]}"
+            raise AssertionError(msg)
+
+    def run_current() -> None:
+        for string in strings:
+            get_variables_in_string(string)
+
+    def run_reference() -> None:
+        for string in strings:
+            reference_get_variables_in_string(string)
+
+    current = min(timeit.repeat(run_current, number=1, repeat=REPEAT))
+    reference = min(timeit.repeat(run_reference, number=1, repeat=REPEAT))
+    print(
+        f"{name:<28} {len(strings):>6} strings  "
+        f"reference {reference * 1000:>9.2f} ms  "
+        f"current {current * 1000:>8.2f} ms  "
+        f"speedup {reference / current:>6.1f}x",
+    )
+
+
+def main() -> int:
+    """Run all benchmarks"""
+    robot_strings = collect_robot_strings(ROBOT_FILES_FOLDER)
+    run_benchmark("Robot files in test/atest", robot_strings)
+
+    for size in PAYLOAD_SIZES:
+        payload = build_json_payload(size)
+        run_benchmark(f"JSON payload of {len(payload)} chars", [payload] * 10)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Microbenchmark for reading specific sections of Robot files.
+
+Compares `read_sections` with the previous implementation, which read the file line by line and
+concatenated the lines of the requested sections. Uses a file with a large variables section that
+is skipped, like the 'files' command does. Run with:
+
+    python test/benchmark/read_sections.py
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from robotframework_find_unused.parse.section_index import RobotFileSectionName, read_sections
+
+SECTIONS: tuple[RobotFileSectionName, ...] = ("settings", "keywords", "test cases", "tasks")
+VARIABLES = 50_000
+KEYWORDS = 2_000
+REPEAT = 5
+
+
+def generate_file(file_path: Path) -> None:
+    """Write a Robot file with many variables and keywords"""
+    lines = ["*** Settings ***", "Resource    common.resource", "", "*** Variables ***"]
+    lines.extend(f"${{VARIABLE_{i}}}    value {i}" for i in range(VARIABLES))
+    lines.extend(["", "*** Keywords ***"])
+    for i in range(KEYWORDS):
+        lines.extend([f"Keyword {i}", f"    Log    ${{VARIABLE_{i}}}", ""])
+    file_path.write_text("\n".join(lines), encoding="utf8")
+
+
+def reference_read_sections(file_path: Path, parse_sections: tuple[str, ...]) -> str:
+    """Previous implementation. Kept as baseline. Doesn't keep line numbers."""
+    with file_path.open(encoding="utf8") as f:
+        raw_file_content = f.readlines()
+
+    file_content = ""
+    cur_section = None
+    for line in raw_file_content:
+        if line.startswith("***"):
+            cur_section = line.strip("* \n").lower()
+            if not cur_section.endswith("s"):
+                cur_section += "s"
+            file_content += line
+            continue
+
+        if cur_section and cur_section not in parse_sections:
+            continue
+
+        file_content += line
+
+    return file_content
+
+
+def main() -> int:
+    """Run the benchmark"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir).joinpath("large.robot")
+        generate_file(file_path)
+
+        current_content = read_sections(file_path, SECTIONS)
+        reference_content = reference_read_sections(file_path, SECTIONS)
+        if [line for line in current_content.splitlines() if line] != [
+            line for line in reference_content.splitlines() if line
+        ]:
+            msg = "Results differ"
+            raise AssertionError(msg)
+
+        current = min(
+            timeit.repeat(lambda: read_sections(file_path, SECTIONS), number=1, repeat=REPEAT),
+        )
+        reference = min(
+            timeit.repeat(
+                lambda: reference_read_sections(file_path, SECTIONS),
+                number=1,
+                repeat=REPEAT,
+            ),
+        )
+        file_size = file_path.stat().st_size
+
+    print(
+        f"{file_size / 1024 / 1024:.1f} MB file  "
+        f"reference {reference * 1000:>9.2f} ms  "
+        f"current {current * 1000:>8.2f} ms  "
+        f"speedup {reference / current:>6.1f}x",
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
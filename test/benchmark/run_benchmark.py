@@ -0,0 +1,337 @@
+"""
+Benchmark the analysis pipeline on synthetic Robot Framework projects.
+
+Every pipeline step is timed separately. Every scale is measured in a fresh Python process, so
+in-memory caches and peak memory use of one scale don't affect another. Run with:
+
+    python test/benchmark/run_benchmark.py --scale small --scale medium --output results.json
+
+Compare with results of an earlier run with `--baseline`.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, TypeVar
+
+sys.path.append(str(Path(__file__).parent))
+
+from generate_project import SCALES, generate_project
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+T = TypeVar("T")
+
+
+def main() -> int:
+    """Parse arguments and run the benchmarks"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scale",
+        action="append",
+        choices=list(SCALES.keys()),
+        help="Project scale to benchmark. Can be used multiple times. Defaults to 'small'.",
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare with JSON results of an earlier run")
+    parser.add_argument(
+        "--project-dir",
+        type=Path,
+        help="Generate projects in this folder and keep them. Defaults to a temporary folder.",
+    )
+    parser.add_argument("--measure", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure is not None:
+        # Running in a child process
+        print(json.dumps(measure_pipeline(args.measure)))
+        return 0
+
+    results = []
+    for scale_name in args.scale or ["small"]:
+        scale = SCALES[scale_name]
+        if args.project_dir is not None:
+            result = run_scale(scale_name, args.project_dir.joinpath(scale_name))
+        else:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                result = run_scale(scale_name, Path(tmp_dir))
+        result["scale"] = vars(scale)
+        results.append(result)
+        print_result(result)
+
+    output = {
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "commit": _get_git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(output, indent=2) + "\n", encoding="utf8")
+        print(f"Results written to {args.output}")
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf8"))
+        print_comparison(baseline, output)
+
+    return 0
+
+
+def run_scale(scale_name: str, project_dir: Path) -> dict[str, Any]:
+    """Generate a project and measure the pipeline in a fresh Python process"""
+    print(f"Generating '{scale_name}' project in {project_dir}...")
+    generate_project(project_dir, SCALES[scale_name])
+
+    print(f"Measuring '{scale_name}' project...")
+    process = subprocess.run(
+        [sys.executable, __file__, "--measure", str(project_dir)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+def measure_pipeline(project_dir: Path) -> dict[str, Any]:
+    """
+    Run all analysis steps on a project and measure every step.
+
+    Steps are the same as in the 'all' command.
+    """
+    from robotframework_find_unused.commands.files.options import FileOptions
+    from robotframework_find_unused.commands.keywords.options import KeywordOptions
+    from robotframework_find_unused.commands.step.discover_files import (
+        step_discover_file_paths,
+    )
+    from robotframework_find_unused.commands.step.keyword_count_uses import (
+        step_count_keyword_uses,
+    )
+    from robotframework_find_unused.commands.step.keyword_definitions import (
+        step_get_custom_keyword_definitions,
+    )
+    from robotframework_find_unused.commands.step.lib_keyword_definitions import (
+        step_get_downloaded_lib_keywords,
+    )
+    from robotframework_find_unused.commands.step.parse_file_use import step_parse_file_use
+    from robotframework_find_unused.commands.step.parse_files import step_parse_files
+    from robotframework_find_unused.commands.step.variables_count_uses import (
+        step_count_variable_uses,
+    )
+    from robotframework_find_unused.commands.step.variables_definitions import (
+        step_get_variable_definitions,
+    )
+    from robotframework_find_unused.commands.variables.options import VariableOptions
+    from robotframework_find_unused.reporter.base.file_reporter import FileReporter
+    from robotframework_find_unused.reporter.base.keyword_reporter import KeywordReporter
+    from robotframework_find_unused.reporter.base.variable_reporter import VariableReporter
+
+    source_path = str(project_dir)
+    keyword_reporter = KeywordReporter(
+        KeywordOptions(
+            show_all_count=False,
+            deprecated_keywords="include",
+            private_keywords="include",
+            library_keywords="include",
+            unused_library_keywords="include",
+            keyword_filter_glob=None,
+            verbose=0,
+            source_path=source_path,
+            jobs=1,
+            cache_dir=None,
+        ),
+    )
+    variable_reporter = VariableReporter(
+        VariableOptions(
+            show_all_count=False,
+            filter_glob=None,
+            verbose=0,
+            pythonpath=[],
+            source_path=source_path,
+            jobs=1,
+            cache_dir=None,
+        ),
+    )
+    file_reporter = FileReporter(
+        FileOptions(
+            show_all_count=False,
+            library_files="include",
+            variable_files="include",
+            resource_files="include",
+            unused_files="include",
+            path_filter_glob=None,
+            show_tree=False,
+            tree_max_depth=0,
+            tree_max_height=0,
+            verbose=0,
+            source_path=source_path,
+            pythonpath=[],
+            jobs=1,
+            cache_dir=None,
+        ),
+    )
+
+    steps: list[dict[str, Any]] = []
+
+    def step(name: str, func: Callable[[], T]) -> T:
+        start = time.perf_counter()
+        result = func()
+        steps.append(
+            {
+                "name": name,
+                "seconds": time.perf_counter() - start,
+                "peak_rss_mb": _get_peak_rss_mb(),
+            },
+        )
+        return result
+
+    start = time.perf_counter()
+    file_paths = step(
+        "discover_files",
+        lambda: step_discover_file_paths(source_path, reporter=keyword_reporter),
+    )
+    if file_paths is None:
+        msg = f"No files found in {source_path}"
+        raise ValueError(msg)
+
+    files = step("parse_files", lambda: step_parse_files(file_paths, reporter=keyword_reporter))
+    keywords = step(
+        "get_custom_keyword_definitions",
+        lambda: step_get_custom_keyword_definitions(files, reporter=keyword_reporter),
+    )
+    downloaded_library_keywords = step(
+        "get_downloaded_lib_keywords",
+        lambda: step_get_downloaded_lib_keywords(file_paths, reporter=keyword_reporter),
+    )
+    counted_keywords = step(
+        "count_keyword_uses",
+        lambda: step_count_keyword_uses(
+            file_paths,
+            keywords,
+            downloaded_library_keywords,
+            reporter=keyword_reporter,
+        ),
+    )
+    variables = step(
+        "get_variable_definitions",
+        lambda: step_get_variable_definitions(
+            file_paths,
+            Path(source_path),
+            reporter=variable_reporter,
+        ),
+    )
+    step(
+        "count_variable_uses",
+        lambda: step_count_variable_uses(file_paths, variables, reporter=variable_reporter),
+    )
+    file_uses = step(
+        "parse_file_use",
+        lambda: step_parse_file_use(file_paths, Path(source_path), reporter=file_reporter),
+    )
+
+    return {
+        "total_seconds": time.perf_counter() - start,
+        "peak_rss_mb": _get_peak_rss_mb(),
+        "items": {
+            "files": len(file_paths),
+            "keywords": len(counted_keywords),
+            "keyword_calls": sum(kw.use_count for kw in counted_keywords),
+            "variables": len(variables),
+            "file_uses": len(file_uses),
+        },
+        "steps": steps,
+    }
+
+
+def print_result(result: dict[str, Any]) -> None:
+    """Print the measurements of one scale"""
+    items = ", ".join(f"{count} {name}" for name, count in result["items"].items())
+    print(f"Scale '{result['scale']['name']}': {items}")
+    for step in result["steps"]:
+        print(
+            f"  {step['name']:<32} {step['seconds']:>8.3f} s"
+            + _format_optional_mb(step["peak_rss_mb"], "  peak RSS"),
+        )
+    print(
+        f"  {'total':<32} {result['total_seconds']:>8.3f} s"
+        + _format_optional_mb(result["peak_rss_mb"], "  peak RSS"),
+    )
+
+
+def print_comparison(baseline: dict[str, Any], current: dict[str, Any]) -> None:
+    """Print the time of every step relative to the baseline"""
+    print(f"Compared with baseline of commit {baseline.get('commit')}:")
+    baseline_results = {r["scale"]["name"]: r for r in baseline["results"]}
+    for result in current["results"]:
+        scale_name = result["scale"]["name"]
+        if scale_name not in baseline_results:
+            print(f"  Scale '{scale_name}' is not in the baseline")
+            continue
+
+        baseline_steps = {s["name"]: s for s in baseline_results[scale_name]["steps"]}
+        print(f"Scale '{scale_name}':")
+        for step in result["steps"]:
+            if step["name"] not in baseline_steps:
+                continue
+            before = baseline_steps[step["name"]]["seconds"]
+            print(
+                f"  {step['name']:<32} {before:>8.3f} s -> {step['seconds']:>8.3f} s"
+                f"  ({_format_ratio(before, step['seconds'])})",
+            )
+        before = baseline_results[scale_name]["total_seconds"]
+        print(
+            f"  {'total':<32} {before:>8.3f} s -> {result['total_seconds']:>8.3f} s"
+            f"  ({_format_ratio(before, result['total_seconds'])})",
+        )
+
+
+def _format_ratio(before: float, after: float) -> str:
+    if after == 0:
+        return "n/a"
+    return f"{before / after:.2f}x faster" if after <= before else f"{after / before:.2f}x slower"
+
+
+def _format_optional_mb(value: float | None, label: str) -> str:
+    if value is None:
+        return ""
+    return f"{label} {value:>8.1f} MB"
+
+
+def _get_peak_rss_mb() -> float | None:
+    """Peak resident set size of this process"""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # Bytes on macOS, kilobytes elsewhere
+        return peak / 1024 / 1024
+    return peak / 1024
+
+
+def _get_git_commit() -> str | None:
+    try:
+        process = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return process.stdout.strip()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
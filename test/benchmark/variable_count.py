@@ -0,0 +1,203 @@
+"""
+Microbenchmark for counting variable uses with `RobotVisitorVariableUses`.
+
+Compares the current implementation with the previous implementation, which scanned every argument
+several times and resolved every variable reference again. Uses an argument-heavy suite. Visits
+both the model and the file facts of the suite. The file facts only hold the strings, like in low
+memory mode. Run with:
+
+    python test/benchmark/variable_count.py
+"""
+
+import re
+import sys
+import tempfile
+import timeit
+from collections.abc import Iterable
+from pathlib import Path
+
+import robot.api.parsing
+
+from robotframework_find_unused.common.const import VariableData
+from robotframework_find_unused.common.normalize import normalize_variable_name
+from robotframework_find_unused.parse.parse_variable import get_variables_in_string
+from robotframework_find_unused.resolve.resolve_variables import (
+    SUPPORTED_BUILTIN_VARS,
+    resolve_variable_name,
+)
+from robotframework_find_unused.visitors.robot.file_facts import FileFacts
+from robotframework_find_unused.visitors.robot.file_facts_visitor import RobotVisitorFileFacts
+from robotframework_find_unused.visitors.robot.variable_count import RobotVisitorVariableUses
+
+VARIABLES = 500
+TESTS = 2_000
+REPEAT = 5
+
+
+class ReferenceRobotVisitorVariableUses(RobotVisitorVariableUses):
+    """Previous implementation. Kept as baseline and to check results are identical."""
+
+    _pattern_eval_variable = re.compile(r"\$(\w+)")
+    _pattern_inline_eval = re.compile(r"\${{(.+?)}}")
+
+    def _count_used_vars_in_eval(self, eval_str: str) -> None:
+        for name in self._filter_supported_vars(self._get_used_vars_in_eval(eval_str)):
+            self._count_variable_use(name)
+
+    def _get_used_vars_in_eval(self, eval_str: str) -> list[str]:
+        eval_str = eval_str.strip()
+        used_vars = self._get_used_vars_in_args([eval_str])
+        for var in self._pattern_eval_variable.findall(eval_str):
+            used_vars.append("${" + normalize_variable_name(var) + "}")
+        return used_vars
+
+    def _count_used_vars_in_args(self, args: Iterable[str]) -> None:
+        for name in self._filter_supported_vars(self._get_used_vars_in_args(args)):
+            self._count_variable_use(name)
+
+    def _get_used_vars_in_args(self, args: Iterable[str]) -> list[str]:
+        used_vars = []
+        for arg in args:
+            used_vars += get_variables_in_string(arg)
+            for inline_eval in self._pattern_inline_eval.findall(arg):
+                used_vars += self._get_used_vars_in_eval(inline_eval)
+        return used_vars
+
+    def _filter_supported_vars(self, variables: list[str]) -> list[str]:
+        filtered = []
+        for formatted_var in variables:
+            var = normalize_variable_name(formatted_var)
+            try:
+                float(var)
+                continue
+            except ValueError:
+                pass
+            if var in SUPPORTED_BUILTIN_VARS:
+                continue
+            (var, used_vars) = resolve_variable_name(var, self.variables)
+            for v in used_vars:
+                self._count_variable_use(v)
+            if not var.isalnum():
+                var = self._normalize_extended_variable_syntax_reference(var)
+            filtered.append(var)
+        return filtered
+
+    def _normalize_extended_variable_syntax_reference(self, var: str) -> str:
+        if var in self.variables:
+            return var
+        var_name = var
+        while len(var_name) > 0:
+            while len(var_name) > 0 and var_name[-1].isalnum():
+                var_name = var_name[0:-1]
+            if len(var_name) == 0:
+                break
+            var_name = var_name[0:-1]
+            if len(var_name) == 0:
+                break
+            if var_name in self.variables:
+                return var_name
+        return var
+
+
+def generate_file(file_path: Path) -> None:
+    """Write a suite with many variables and keyword calls with many arguments"""
+    lines = ["*** Variables ***"]
+    lines.extend(f"${{VARIABLE_{i}}}    value {i}" for i in range(VARIABLES))
+    lines.extend(["${NAME}    VARIABLE_1", "", "*** Test Cases ***"])
+    for i in range(TESTS):
+        var = f"${{VARIABLE_{i % VARIABLES}}}"
+        lines.extend(
+            [
+                f"Test {i}",
+                f"    Log Many    {var}    ${{{{ $VARIABLE_{i % 7} + 1 }}}}    ${{EMPTY}}",
+                f"    Set Suite Variable    ${{SUITE}}    {var}.attribute    @{{list}}[0]",
+                f"    Log    ${{${{NAME}}}}    {var}[key]    &{{dict}}    %{{HOME}}",
+                f"    IF    $VARIABLE_{i % 11} == {var}",
+                "        Log    Done",
+                "    END",
+                f"    Evaluate    $VARIABLE_{i % 13} + {i}",
+                "",
+            ],
+        )
+    file_path.write_text("\n".join(lines), encoding="utf8")
+
+
+def get_variable_defs() -> dict[str, VariableData]:
+    """Definitions of the variables in the suite"""
+    variable_defs: dict[str, VariableData] = {}
+    for name, value in [
+        *[(f"VARIABLE_{i}", f"value {i}") for i in range(VARIABLES)],
+        ("NAME", "VARIABLE_1"),
+    ]:
+        normalized_name = normalize_variable_name(name)
+        variable_defs[normalized_name] = VariableData(
+            normalized_name=normalized_name,
+            value=[value],
+            name="${" + name + "}",
+            type=None,
+            resolved_name=name,
+            use_count=0,
+            defined_in_type="variables_section",
+            defined_in="suite.robot",
+        )
+    return variable_defs
+
+
+def count_uses(
+    visitor_class: type[RobotVisitorVariableUses],
+    model: robot.api.parsing.File | FileFacts,
+) -> dict[str, int]:
+    """Count the variable uses in the model or file facts"""
+    visitor = visitor_class(get_variable_defs())
+    if isinstance(model, FileFacts):
+        visitor.visit_file_facts(model)
+    else:
+        visitor.visit(model)
+    return {name: var.use_count for name, var in visitor.variables.items()}
+
+
+def run_benchmark(name: str, model: robot.api.parsing.File | FileFacts) -> None:
+    """Time both implementations on the model or file facts and print the results"""
+    if count_uses(RobotVisitorVariableUses, model) != count_uses(
+        ReferenceRobotVisitorVariableUses,
+        model,
+    ):
+        msg = "Variable use counts differ"
+        raise AssertionError(msg)
+
+    current = min(
+        timeit.repeat(lambda: count_uses(RobotVisitorVariableUses, model), number=1, repeat=REPEAT),
+    )
+    reference = min(
+        timeit.repeat(
+            lambda: count_uses(ReferenceRobotVisitorVariableUses, model),
+            number=1,
+            repeat=REPEAT,
+        ),
+    )
+    print(
+        f"{name:<12} {TESTS} tests  "
+        f"reference {reference * 1000:>9.2f} ms  "
+        f"current {current * 1000:>8.2f} ms  "
+        f"speedup {reference / current:>6.1f}x",
+    )
+
+
+def main() -> int:
+    """Run all benchmarks"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir).joinpath("suite.robot")
+        generate_file(file_path)
+        model = robot.api.parsing.get_model(file_path, data_only=True)
+
+    facts_visitor = RobotVisitorFileFacts()
+    facts_visitor.visit(model)
+
+    run_benchmark("Model", model)
+    run_benchmark("File facts", facts_visitor.facts[0])
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+from pathlib import Path
+
+from robotframework_find_unused.commands.step.file_import_tree import (
+    FileImportTreeBuilder,
+    FileImportTreeNode,
+)
+from robotframework_find_unused.common.const import (
+    FileUseData,
+    FileUsedByData,
+    ResolvedFileImport,
+)
+
+
+def _files(imports: dict[str, list[str]]) -> dict[str, FileUseData]:
+    files = {
+        name: FileUseData(
+            id=name,
+            resolved_to=ResolvedFileImport(type="FILE_PATH", import_string=name, path=Path(name)),
+            type={"SUITE"} if name.startswith("suite") else {"RESOURCE"},
+            used_by=[],
+        )
+        for name in imports
+    }
+    for name, imported_names in imports.items():
+        for imported_name in imported_names:
+            files[imported_name].used_by.append(
+                FileUsedByData(file=files[name], as_alias=None, normalized_as_alias=None, args=()),
+            )
+    return files
+
+
+def _serialize(node: FileImportTreeNode) -> tuple:
+    if isinstance(node.branches, str):
+        return (node.data.id, node.branches)
+    return (node.data.id, [_serialize(branch) for branch in node.branches])
+
+
+class TestFileImportTreeBuilder:
+    def test_prune_reasons(self):
+        files = _files(
+            {
+                "suite": ["a", "c"],
+                "a": ["b"],
+                "b": ["a", "c"],
+                "c": ["d"],
+                "d": [],
+            },
+        )
+
+        [[tree]] = FileImportTreeBuilder(max_depth=3).build_grouped_trees(
+            [files["suite"]],
+            list(files.values()),
+        )
+
+        assert _serialize(tree) == (
+            "suite",
+            [
+                ("a", [("b", [("a", "CIRCULAR"), ("c", [("d", "MAX_DEPTH")])])]),
+                ("c", "DEDUPED"),
+            ],
+        )
+        assert tree.branches[0].parent is tree
+
+    def test_identical_trees_are_grouped(self):
+        files = _files(
+            {
+                "suite_1": ["a"],
+                "suite_2": ["a"],
+                "suite_3": ["b"],
+                "a": ["b"],
+                "b": [],
+            },
+        )
+        root_files = [files["suite_1"], files["suite_2"], files["suite_3"]]
+
+        grouped_trees = FileImportTreeBuilder().build_grouped_trees(
+            root_files,
+            list(files.values()),
+        )
+
+        assert [[tree.data.id for tree in group] for group in grouped_trees] == [
+            ["suite_1", "suite_2"],
+            ["suite_3"],
+        ]
+        assert grouped_trees[0][0].branches is grouped_trees[0][1].branches
+
+    def test_long_circular_import_chain(self):
+        chain_length = 500
+        files = _files(
+            {f"resource_{i}": [f"resource_{(i + 1) % chain_length}"] for i in range(chain_length)},
+        )
+
+        [[tree]] = FileImportTreeBuilder(max_depth=0).build_grouped_trees(
+            [files["resource_0"]],
+            list(files.values()),
+        )
+
+        node = tree
+        while isinstance(node.branches, list):
+            [node] = node.branches
+        assert node.depth == chain_length
+        assert (node.data.id, node.branches) == ("resource_0", "CIRCULAR")
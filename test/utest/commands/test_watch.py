@@ -0,0 +1,38 @@
+from pathlib import Path
+
+import pytest
+
+from robotframework_find_unused.commands.step import watch
+from robotframework_find_unused.common.file_watcher import FileWatcher
+
+
+class _FakeWatcher(FileWatcher):
+    def __init__(self, polls: list[tuple[list[Path], bool]]) -> None:
+        self.polls = polls
+
+    def poll(self) -> tuple[list[Path], bool]:
+        return self.polls.pop(0)
+
+
+class TestWaitForChanges:
+    def test_changes_settle_quickly(self, monkeypatch: pytest.MonkeyPatch):
+        sleeps: list[float] = []
+        monkeypatch.setattr(watch.time, "sleep", sleeps.append)
+        watcher = _FakeWatcher(
+            [
+                ([], False),
+                ([Path("a.robot")], False),
+                ([Path("b.robot")], True),
+                ([], False),
+            ],
+        )
+
+        changes = watch._wait_for_changes(watcher)  # noqa: SLF001
+
+        assert changes == ({Path("a.robot"), Path("b.robot")}, True)
+        assert sleeps == [
+            watch.POLL_INTERVAL_SECONDS,
+            watch.POLL_INTERVAL_SECONDS,
+            watch.SETTLE_INTERVAL_SECONDS,
+            watch.SETTLE_INTERVAL_SECONDS,
+        ]
@@ -0,0 +1,65 @@
+import os
+from pathlib import Path
+
+from robotframework_find_unused.common.disk_cache import DiskCache
+
+
+class TestDiskCache:
+    def test_get_unknown_key(self, tmp_path: Path):
+        cache = DiskCache(tmp_path, "test")
+
+        assert cache.get("unknown") is None
+
+    def test_set_and_get(self, tmp_path: Path):
+        cache = DiskCache(tmp_path, "test")
+        cache.set("key", {"hello": ["world"]})
+
+        assert DiskCache(tmp_path, "test").get("key") == {"hello": ["world"]}
+        assert tmp_path.joinpath(".gitignore").exists()
+
+    def test_namespaces_are_isolated(self, tmp_path: Path):
+        DiskCache(tmp_path, "first").set("key", "first value")
+
+        assert DiskCache(tmp_path, "second").get("key") is None
+
+    def test_corrupt_entry_is_removed(self, tmp_path: Path):
+        cache = DiskCache(tmp_path, "test")
+        cache.set("key", "value")
+        for entry in tmp_path.joinpath("test").iterdir():
+            entry.write_bytes(b"not a pickle")
+
+        assert cache.get("key") is None
+        assert list(tmp_path.joinpath("test").iterdir()) == []
+
+    def test_evicts_least_recently_used(self, tmp_path: Path):
+        cache = DiskCache(tmp_path, "test")
+        for i, key in enumerate(("oldest", "middle", "newest")):
+            cache.set(key, "x" * 100)
+            entry_path = cache._get_entry_path(key)  # noqa: SLF001
+            os.utime(entry_path, ns=(i * 10**9, i * 10**9))
+
+        # Reading an entry makes it the most recently used entry
+        assert cache.get("oldest") is not None
+
+        entry_size = cache.get_size() // 3
+        cache.evict(target_size=entry_size * 2)
+
+        assert cache.get("middle") is None
+        assert cache.get("oldest") is not None
+        assert cache.get("newest") is not None
+
+    def test_evicts_when_over_max_size(self, tmp_path: Path):
+        cache = DiskCache(tmp_path, "test", max_size=1000)
+        for i in range(20):
+            cache.set(f"key {i}", "x" * 100)
+
+        assert cache.get_size() <= 1000
+        assert cache.get("key 19") is not None
+
+    def test_clear(self, tmp_path: Path):
+        cache = DiskCache(tmp_path, "test")
+        cache.set("key", "value")
+        cache.clear()
+
+        assert cache.get("key") is None
+        assert cache.get_size() == 0
@@ -0,0 +1,108 @@
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from robotframework_find_unused.commands.step.discover_files import step_discover_file_paths
+from robotframework_find_unused.common.file_discovery import (
+    RobocopConfigFoundError,
+    apply_file_discovery,
+    discover_file_paths_native,
+)
+from robotframework_find_unused.reporter.base.partial.discover_files import (
+    PartialReporter_DiscoverFiles,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_file_discovery() -> Generator[None]:
+    yield
+    apply_file_discovery("auto")
+
+
+def _create_files(root: Path, relative_paths: list[str]) -> None:
+    for relative_path in relative_paths:
+        path = root.joinpath(relative_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+
+
+def _discover(root: Path, discovery: str) -> list[Path] | None:
+    apply_file_discovery(discovery)  # type: ignore[arg-type]
+    return step_discover_file_paths(str(root), reporter=PartialReporter_DiscoverFiles(None))
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Git repository with ignored files and default excludes"""
+    tmp_path.joinpath(".git").mkdir()
+    tmp_path.joinpath(".gitignore").write_text("build/\n*.log.robot\n!keep.log.robot\n")
+    _create_files(
+        tmp_path,
+        [
+            "__init__.robot",
+            "suite.robot",
+            "keep.log.robot",
+            "ignored.log.robot",
+            "readme.md",
+            "build/generated.robot",
+            "venv/lib.py",
+            "dist/package.robot",
+            "resources/__init__.robot",
+            "resources/.gitignore",
+            "resources/common.resource",
+            "resources/secret.resource",
+            "resources/nested/library.py",
+        ],
+    )
+    tmp_path.joinpath("resources/.gitignore").write_text("secret*\n")
+    return tmp_path
+
+
+class TestFileDiscovery:
+    def test_native_is_same_as_robocop(self, project: Path):
+        native = _discover(project, "native")
+        robocop = _discover(project, "robocop")
+
+        assert native == robocop
+        assert native == [
+            project.joinpath("__init__.robot"),
+            project.joinpath("keep.log.robot"),
+            project.joinpath("suite.robot"),
+            project.joinpath("resources/__init__.robot"),
+            project.joinpath("resources/common.resource"),
+            project.joinpath("resources/nested/library.py"),
+        ]
+
+    def test_robocop_config_is_found(self, project: Path):
+        project.joinpath("resources/robocop.toml").write_text('exclude = ["nested"]\n')
+
+        with pytest.raises(RobocopConfigFoundError):
+            discover_file_paths_native(str(project), allow_robocop_config=False)
+        with pytest.raises(RobocopConfigFoundError):
+            discover_file_paths_native(str(project / "resources"), allow_robocop_config=False)
+
+    def test_pyproject_without_robocop_section_is_ignored(self, project: Path):
+        project.joinpath("pyproject.toml").write_text("[tool.ruff]\nline-length = 100\n")
+        project.joinpath("resources/pyproject.toml").write_text("[tool.robocop]\n")
+
+        discover_file_paths_native(str(project / "build"), allow_robocop_config=False)
+        with pytest.raises(RobocopConfigFoundError):
+            discover_file_paths_native(str(project / "resources"), allow_robocop_config=False)
+
+    def test_auto_uses_robocop_config(self, project: Path):
+        project.joinpath("robocop.toml").write_text('exclude = ["nested"]\n')
+
+        auto = _discover(project, "auto")
+
+        assert auto == _discover(project, "robocop")
+        assert project.joinpath("resources/nested/library.py") not in (auto or [])
+        assert project.joinpath("resources/nested/library.py") in (
+            _discover(project, "native") or []
+        )
+
+    def test_file_path(self, project: Path):
+        file_path = project.joinpath("readme.md")
+
+        assert discover_file_paths_native(str(file_path), allow_robocop_config=True) == [file_path]
+        assert discover_file_paths_native(str(project / "nope"), allow_robocop_config=True) == []
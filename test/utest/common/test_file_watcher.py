@@ -0,0 +1,59 @@
+import os
+from pathlib import Path
+
+from robotframework_find_unused.common.file_watcher import FileWatcher
+
+
+def _touch(path: Path, content: str, mtime_s: int) -> None:
+    path.write_text(content)
+    os.utime(path, ns=(mtime_s * 10**9, mtime_s * 10**9))
+
+
+class TestFileWatcher:
+    def test_no_changes(self, tmp_path: Path):
+        file_path = tmp_path.joinpath("test.robot")
+        _touch(file_path, "hello", 1)
+
+        watcher = FileWatcher(tmp_path)
+        watcher.watch([file_path])
+
+        assert watcher.poll() == ([], False)
+
+    def test_changed_file(self, tmp_path: Path):
+        file_path = tmp_path.joinpath("test.robot")
+        other_path = tmp_path.joinpath("other.robot")
+        _touch(file_path, "hello", 1)
+        _touch(other_path, "hello", 1)
+
+        watcher = FileWatcher(tmp_path)
+        watcher.watch([file_path, other_path])
+        _touch(file_path, "hello world", 2)
+
+        assert watcher.poll() == ([file_path], False)
+        assert watcher.poll() == ([], False)
+
+    def test_added_file(self, tmp_path: Path):
+        nested_path = tmp_path.joinpath("nested")
+        nested_path.mkdir()
+        file_path = nested_path.joinpath("test.robot")
+        _touch(file_path, "hello", 1)
+
+        watcher = FileWatcher(tmp_path)
+        watcher.watch([file_path])
+        os.utime(nested_path, ns=(1, 1))
+        watcher.watch([file_path])
+        _touch(nested_path.joinpath("new.resource"), "hello", 2)
+
+        assert watcher.poll() == ([], True)
+
+    def test_removed_file(self, tmp_path: Path):
+        file_path = tmp_path.joinpath("test.robot")
+        _touch(file_path, "hello", 1)
+
+        watcher = FileWatcher(tmp_path)
+        watcher.watch([file_path])
+        os.utime(tmp_path, ns=(1, 1))
+        watcher.watch([file_path])
+        file_path.unlink()
+
+        assert watcher.poll() == ([file_path], True)
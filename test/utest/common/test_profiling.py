@@ -0,0 +1,42 @@
+import json
+from pathlib import Path
+
+from robotframework_find_unused.common.profiling import apply_profile, get_profiler, profile_step
+
+
+class TestProfiling:
+    def test_steps_are_not_measured_without_profiling(self):
+        apply_profile(enabled=False)
+
+        with profile_step("amazing_step") as items:
+            items["files"] = 3
+
+        assert get_profiler() is None
+
+    def test_steps_are_measured(self, tmp_path: Path):
+        apply_profile(enabled=True)
+        try:
+            with profile_step("amazing_step") as items:
+                items["files"] = 3
+                data = [str(i) for i in range(10_000)]
+            del data
+            with profile_step("other_step"):
+                pass
+
+            profiler = get_profiler()
+            assert profiler is not None
+            assert [step.name for step in profiler.steps] == ["amazing_step", "other_step"]
+
+            step = profiler.steps[0]
+            assert step.items == {"files": 3}
+            assert step.wall_seconds >= 0
+            assert step.cpu_seconds >= 0
+            assert step.peak_memory_mb > 0
+
+            output_path = tmp_path.joinpath("profile.json")
+            profiler.write_json(output_path)
+            content = json.loads(output_path.read_text())
+            assert content["steps"][0]["name"] == "amazing_step"
+            assert content["steps"][0]["items"] == {"files": 3}
+        finally:
+            apply_profile(enabled=False)
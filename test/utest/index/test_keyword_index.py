@@ -0,0 +1,127 @@
+from pathlib import Path
+
+from robotframework_find_unused.commands import KeywordOptions, command_keywords
+from robotframework_find_unused.common.const import KeywordData
+from robotframework_find_unused.reporter.base.keyword_reporter import KeywordReporter
+
+KEYWORDS_FILE_CONTENT = """
+*** Keywords ***
+Amazing Keyword
+    [Arguments]    ${name}    ${greeting}=Hello
+    Log    ${greeting} ${name}
+
+Keyword With ${embedded} Argument
+    Log    ${embedded}
+"""
+
+TEST_FILE_CONTENT = """
+*** Settings ***
+Resource    ./keywords.resource
+
+*** Test Cases ***
+Amazing Test
+    Amazing Keyword    world
+    Keyword With Some Argument
+    Undefined Keyword
+"""
+
+
+class _CollectingReporter(KeywordReporter):
+    counted_keywords: list[KeywordData]
+
+    def on_command_end(self, counted_keywords: list[KeywordData]) -> None:
+        self.counted_keywords = counted_keywords
+
+
+class TestKeywordIndex:
+    def _count(
+        self,
+        source_path: Path,
+        cache_dir: Path | None,
+        changed_files: tuple[str, ...] = (),
+    ) -> dict:
+        keyword_options = KeywordOptions(
+            show_all_count=True,
+            deprecated_keywords="include",
+            private_keywords="include",
+            library_keywords="exclude",
+            unused_library_keywords="exclude",
+            keyword_filter_glob=None,
+            verbose=0,
+            source_path=source_path.as_posix(),
+            jobs=1,
+            cache_dir=cache_dir.as_posix() if cache_dir else None,
+            incremental=cache_dir is not None,
+            changed_files=changed_files,
+        )
+        reporter = _CollectingReporter(keyword_options)
+        command_keywords(keyword_options, reporter)
+        return {
+            kw.normalized_name: (kw.use_count, kw.argument_use_count)
+            for kw in reporter.counted_keywords
+        }
+
+    def _assert_same_as_full_run(
+        self,
+        source_path: Path,
+        cache_dir: Path,
+        changed_files: tuple[str, ...] = (),
+    ) -> None:
+        full = self._count(source_path, None)
+        incremental = self._count(source_path, cache_dir, changed_files)
+
+        assert incremental == full
+
+    def test_unchanged_files(self, tmp_path: Path):
+        source_path = tmp_path.joinpath("robot")
+        source_path.mkdir()
+        source_path.joinpath("keywords.resource").write_text(KEYWORDS_FILE_CONTENT)
+        source_path.joinpath("test.robot").write_text(TEST_FILE_CONTENT)
+
+        self._assert_same_as_full_run(source_path, tmp_path.joinpath("cache"))
+        self._assert_same_as_full_run(source_path, tmp_path.joinpath("cache"))
+
+    def test_changed_keyword_calls(self, tmp_path: Path):
+        source_path = tmp_path.joinpath("robot")
+        source_path.mkdir()
+        source_path.joinpath("keywords.resource").write_text(KEYWORDS_FILE_CONTENT)
+        test_path = source_path.joinpath("test.robot")
+        test_path.write_text(TEST_FILE_CONTENT)
+        self._count(source_path, tmp_path.joinpath("cache"))
+
+        test_path.write_text(
+            TEST_FILE_CONTENT + "    Amazing Keyword    robot    greeting=Hi\n",
+        )
+        self._assert_same_as_full_run(source_path, tmp_path.joinpath("cache"))
+
+        test_path.write_text(TEST_FILE_CONTENT.replace("    Undefined Keyword\n", ""))
+        self._assert_same_as_full_run(
+            source_path,
+            tmp_path.joinpath("cache"),
+            changed_files=(test_path.as_posix(),),
+        )
+
+    def test_changed_keyword_definitions(self, tmp_path: Path):
+        source_path = tmp_path.joinpath("robot")
+        source_path.mkdir()
+        keywords_path = source_path.joinpath("keywords.resource")
+        keywords_path.write_text(KEYWORDS_FILE_CONTENT)
+        source_path.joinpath("test.robot").write_text(TEST_FILE_CONTENT)
+        self._count(source_path, tmp_path.joinpath("cache"))
+
+        keywords_path.write_text(KEYWORDS_FILE_CONTENT + "\nUndefined Keyword\n    No Operation\n")
+        self._assert_same_as_full_run(source_path, tmp_path.joinpath("cache"))
+
+    def test_added_and_deleted_files(self, tmp_path: Path):
+        source_path = tmp_path.joinpath("robot")
+        source_path.mkdir()
+        source_path.joinpath("keywords.resource").write_text(KEYWORDS_FILE_CONTENT)
+        source_path.joinpath("test.robot").write_text(TEST_FILE_CONTENT)
+        self._count(source_path, tmp_path.joinpath("cache"))
+
+        other_test_path = source_path.joinpath("other_test.robot")
+        other_test_path.write_text(TEST_FILE_CONTENT)
+        self._assert_same_as_full_run(source_path, tmp_path.joinpath("cache"))
+
+        other_test_path.unlink()
+        self._assert_same_as_full_run(source_path, tmp_path.joinpath("cache"))
@@ -0,0 +1,120 @@
+from pathlib import Path
+
+from robotframework_find_unused.commands import VariableOptions
+from robotframework_find_unused.commands.step.variables_count_uses import (
+    step_count_variable_uses,
+    step_update_variable_index,
+)
+from robotframework_find_unused.commands.step.variables_definitions import (
+    step_get_variable_definitions,
+)
+from robotframework_find_unused.index.variable_index import VariableIndex
+from robotframework_find_unused.parse.parse_robot_file import forget_robot_file
+from robotframework_find_unused.reporter.base.variable_reporter import VariableReporter
+
+VARIABLES_FILE_CONTENT = """
+*** Variables ***
+${GREETING}    Hello
+${NAME}        World
+${UNUSED}      Nope
+"""
+
+TEST_FILE_CONTENT = """
+*** Settings ***
+Resource    ./variables.resource
+
+*** Test Cases ***
+Amazing Test
+    Log    ${GREETING} ${NAME}
+"""
+
+
+class TestVariableIndex:
+    def _get_reporter(self, source_path: Path) -> VariableReporter:
+        return VariableReporter(
+            VariableOptions(
+                show_all_count=True,
+                filter_glob=None,
+                verbose=0,
+                pythonpath=[],
+                source_path=source_path.as_posix(),
+                jobs=1,
+                cache_dir=None,
+            ),
+        )
+
+    def _count_full(self, source_path: Path, file_paths: list[Path]) -> dict[str, int]:
+        reporter = self._get_reporter(source_path)
+        variable_defs = step_get_variable_definitions(file_paths, source_path, reporter=reporter)
+        variables = step_count_variable_uses(file_paths, variable_defs, reporter=reporter)
+        return {var.normalized_name: var.use_count for var in variables}
+
+    def _count_indexed(
+        self,
+        source_path: Path,
+        file_paths: list[Path],
+        changed_files: list[Path],
+        index: VariableIndex,
+    ) -> dict[str, int]:
+        reporter = self._get_reporter(source_path)
+        variable_defs = step_get_variable_definitions(file_paths, source_path, reporter=reporter)
+        variables = step_update_variable_index(
+            file_paths,
+            changed_files,
+            variable_defs,
+            index,
+            reporter=reporter,
+        )
+        return {var.normalized_name: var.use_count for var in variables}
+
+    def _setup(self, tmp_path: Path) -> tuple[Path, list[Path]]:
+        source_path = tmp_path.joinpath("robot")
+        source_path.mkdir()
+        variables_path = source_path.joinpath("variables.resource")
+        variables_path.write_text(VARIABLES_FILE_CONTENT)
+        test_path = source_path.joinpath("test.robot")
+        test_path.write_text(TEST_FILE_CONTENT)
+        return (source_path, [variables_path, test_path])
+
+    def test_changed_uses(self, tmp_path: Path):
+        (source_path, file_paths) = self._setup(tmp_path)
+        index = VariableIndex(definitions_fingerprint=None, file_uses={})
+        self._count_indexed(source_path, file_paths, [], index)
+
+        test_path = file_paths[1]
+        test_path.write_text(TEST_FILE_CONTENT + "    Log    ${UNUSED} ${NAME}\n")
+        forget_robot_file(test_path)
+
+        indexed = self._count_indexed(source_path, file_paths, [test_path], index)
+
+        assert indexed == self._count_full(source_path, file_paths)
+        assert indexed["unused"] == 1
+        assert indexed["name"] == 2
+
+    def test_changed_definitions(self, tmp_path: Path):
+        (source_path, file_paths) = self._setup(tmp_path)
+        index = VariableIndex(definitions_fingerprint=None, file_uses={})
+        self._count_indexed(source_path, file_paths, [], index)
+
+        variables_path = file_paths[0]
+        variables_path.write_text(VARIABLES_FILE_CONTENT.replace("${NAME}", "${OTHER}"))
+        forget_robot_file(variables_path)
+
+        indexed = self._count_indexed(source_path, file_paths, [variables_path], index)
+
+        assert indexed == self._count_full(source_path, file_paths)
+        assert "name" not in indexed
+        assert indexed["other"] == 0
+
+    def test_removed_file(self, tmp_path: Path):
+        (source_path, file_paths) = self._setup(tmp_path)
+        index = VariableIndex(definitions_fingerprint=None, file_uses={})
+        self._count_indexed(source_path, file_paths, [], index)
+
+        file_paths[1].unlink()
+        file_paths = file_paths[:1]
+
+        indexed = self._count_indexed(source_path, file_paths, [], index)
+
+        assert indexed == self._count_full(source_path, file_paths)
+        assert indexed["greeting"] == 0
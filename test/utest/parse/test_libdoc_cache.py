@@ -0,0 +1,100 @@
+import sys
+from pathlib import Path
+
+import robot.errors
+
+from robotframework_find_unused.common.const import LibraryData
+from robotframework_find_unused.convert.convert_keyword import get_library_keywords
+from robotframework_find_unused.parse.libdoc_cache import (
+    LibDocCache,
+    apply_libdoc_cache,
+    get_library_version,
+)
+from robotframework_find_unused.reporter.base.partial.keyword_definitions import (
+    PartialReporter_DownloadedKeywordDefinitions,
+)
+from robotframework_find_unused.visitors.robot.library_import import RobotVisitorLibraryImports
+
+PYTHON_LIBRARY_CONTENT = """
+def amazing_keyword(arg):
+    pass
+"""
+
+
+def _get_libraries(cache_dir: Path | None) -> dict[str, LibraryData]:
+    apply_libdoc_cache(str(cache_dir) if cache_dir else None)
+    try:
+        visitor = RobotVisitorLibraryImports(PartialReporter_DownloadedKeywordDefinitions(None))
+        visitor.register_downloaded_library("Collections")
+        visitor.load_downloaded_libraries()
+        return visitor.downloaded_libraries
+    finally:
+        apply_libdoc_cache(None)
+
+
+class TestLibDocCache:
+    def test_standard_library_is_loaded_from_cache(self, tmp_path: Path):
+        uncached = _get_libraries(None)
+        _get_libraries(tmp_path)
+        cached = _get_libraries(tmp_path)
+
+        cached_keywords = get_library_keywords(cached["collections"])
+        uncached_keywords = get_library_keywords(uncached["collections"])
+        assert [kw.name for kw in cached_keywords] == [kw.name for kw in uncached_keywords]
+        assert list(cached["collections"].keyword_docs) == list(
+            uncached["collections"].keyword_docs,
+        )
+
+        cached_kw = next(kw for kw in cached_keywords if kw.name == "Get From Dictionary")
+        uncached_kw = next(kw for kw in uncached_keywords if kw.name == "Get From Dictionary")
+        assert cached_kw.arguments is not None
+        assert uncached_kw.arguments is not None
+        assert cached_kw.arguments.name == uncached_kw.arguments.name
+        assert cached_kw.arguments.argument_names == uncached_kw.arguments.argument_names
+        assert {arg: str(value) for arg, value in cached_kw.arguments.defaults.items()} == {
+            arg: str(value) for arg, value in uncached_kw.arguments.defaults.items()
+        }
+        assert cached_kw.arguments.map(["${dict}", "key"], {}) == uncached_kw.arguments.map(
+            ["${dict}", "key"],
+            {},
+        )
+
+    def test_cache_hits_and_misses(self, tmp_path: Path):
+        library = _get_libraries(None)["collections"]
+
+        first_cache = LibDocCache(tmp_path)
+        first_cache.get_library("Collections", enrich_py_keywords=False)
+        first_cache.set_library("Collections", library, enrich_py_keywords=False)
+        second_cache = LibDocCache(tmp_path)
+        second_cache.get_library("Collections", enrich_py_keywords=False)
+        second_cache.get_library("Collections", enrich_py_keywords=True)
+
+        assert (first_cache.hits, first_cache.misses) == (0, 1)
+        assert (second_cache.hits, second_cache.misses) == (1, 1)
+
+    def test_import_errors_are_not_cached(self, tmp_path: Path):
+        library = LibraryData(
+            name="Collections",
+            name_normalized="collections",
+            keyword_docs={},
+            import_error=robot.errors.DataError("Oops"),
+        )
+
+        LibDocCache(tmp_path).set_library("Collections", library, enrich_py_keywords=False)
+
+        assert LibDocCache(tmp_path).get_library("Collections", enrich_py_keywords=False) is None
+
+    def test_library_versions(self, tmp_path: Path):
+        tmp_path.joinpath("not_installed_library.py").write_text(PYTHON_LIBRARY_CONTENT)
+        sys.path.append(str(tmp_path))
+        try:
+            assert get_library_version("not_installed_library") is None
+        finally:
+            sys.path.remove(str(tmp_path))
+
+        assert get_library_version("Collections") is not None
+        assert get_library_version("Remote") is None
+        assert get_library_version("path/to/Library") is None
+        assert get_library_version("click") is not None
+        # Installed in editable mode
+        assert get_library_version("robotframework_find_unused") is None
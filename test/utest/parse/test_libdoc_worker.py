@@ -0,0 +1,120 @@
+import sys
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+import robot.errors
+from robot.libdocpkg.model import LibraryDoc
+
+from robotframework_find_unused.parse.libdoc_worker import apply_libdoc_workers, document_libraries
+
+AMAZING_LIBRARY_CONTENT = """
+def amazing_keyword(first, second="default", *rest, named, **kwargs):
+    pass
+"""
+
+SLOW_LIBRARY_CONTENT = """
+import time
+
+time.sleep(60)
+
+def slow_keyword():
+    pass
+"""
+
+CRASHING_LIBRARY_CONTENT = """
+import os
+
+os._exit(3)
+"""
+
+BROKEN_LIBRARY_CONTENT = """
+import module_that_does_not_exist
+"""
+
+GREEDY_LIBRARY_CONTENT = """
+data = bytearray(512 * 1024 * 1024)
+"""
+
+
+@pytest.fixture(autouse=True)
+def _reset_libdoc_workers() -> Generator[None]:
+    yield
+    apply_libdoc_workers(1)
+
+
+class TestLibdocWorker:
+    def _write_library(self, tmp_path: Path, name: str, content: str) -> Path:
+        file_path = tmp_path.joinpath(f"{name}.py")
+        file_path.write_text(content)
+        return file_path
+
+    def test_python_library_is_documented(self, tmp_path: Path):
+        file_path = self._write_library(tmp_path, "amazing", AMAZING_LIBRARY_CONTENT)
+
+        [libdoc] = document_libraries([file_path])
+
+        assert isinstance(libdoc, LibraryDoc)
+        [keyword] = libdoc.keywords
+        assert keyword.name == "Amazing Keyword"
+        assert keyword.parent is libdoc
+        assert keyword.args.argument_names == ("first", "second", "rest", "named", "kwargs")
+        assert keyword.args.defaults == {"second": "default"}
+
+    def test_results_are_in_order(self, tmp_path: Path):
+        apply_libdoc_workers(2)
+        amazing_path = self._write_library(tmp_path, "amazing", AMAZING_LIBRARY_CONTENT)
+        broken_path = self._write_library(tmp_path, "broken", BROKEN_LIBRARY_CONTENT)
+
+        results = document_libraries([broken_path, "Collections", amazing_path, broken_path])
+
+        assert isinstance(results[0], robot.errors.DataError)
+        assert isinstance(results[1], LibraryDoc)
+        assert results[1].name == "Collections"
+        assert isinstance(results[2], LibraryDoc)
+        assert results[2].name == "amazing"
+        assert isinstance(results[3], robot.errors.DataError)
+
+    def test_slow_library_times_out(self, tmp_path: Path):
+        apply_libdoc_workers(1, timeout=1)
+        slow_path = self._write_library(tmp_path, "slow", SLOW_LIBRARY_CONTENT)
+        amazing_path = self._write_library(tmp_path, "amazing", AMAZING_LIBRARY_CONTENT)
+
+        [slow, amazing] = document_libraries([slow_path, amazing_path])
+
+        assert isinstance(slow, robot.errors.DataError)
+        assert "timed out after 1 seconds" in slow.message
+        assert isinstance(amazing, LibraryDoc)
+
+    def test_crashing_library_is_reported(self, tmp_path: Path):
+        crashing_path = self._write_library(tmp_path, "crashing", CRASHING_LIBRARY_CONTENT)
+        amazing_path = self._write_library(tmp_path, "amazing", AMAZING_LIBRARY_CONTENT)
+
+        [crashing, amazing] = document_libraries([crashing_path, amazing_path])
+
+        assert isinstance(crashing, robot.errors.DataError)
+        assert "exited unexpectedly with exit code 3" in crashing.message
+        assert isinstance(amazing, LibraryDoc)
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="Memory limit is only reliable on Linux")
+    def test_greedy_library_exceeds_memory_limit(self, tmp_path: Path):
+        apply_libdoc_workers(1, memory_limit_mb=256)
+        greedy_path = self._write_library(tmp_path, "greedy", GREEDY_LIBRARY_CONTENT)
+        amazing_path = self._write_library(tmp_path, "amazing", AMAZING_LIBRARY_CONTENT)
+
+        [greedy, amazing] = document_libraries([greedy_path, amazing_path])
+
+        assert isinstance(greedy, robot.errors.DataError)
+        assert "MemoryError" in greedy.message
+        assert isinstance(amazing, LibraryDoc)
+
+    def test_library_is_not_imported_in_this_process(self, tmp_path: Path):
+        self._write_library(tmp_path, "isolated_library", AMAZING_LIBRARY_CONTENT)
+        sys.path.append(str(tmp_path))
+        try:
+            [libdoc] = document_libraries(["isolated_library"])
+        finally:
+            sys.path.remove(str(tmp_path))
+
+        assert isinstance(libdoc, LibraryDoc)
+        assert "isolated_library" not in sys.modules
@@ -0,0 +1,76 @@
+import os
+from pathlib import Path
+
+import robot.api.parsing
+
+from robotframework_find_unused.parse.parse_cache import ParseCache
+
+ROBOT_FILE_CONTENT = """
+*** Keywords ***
+Amazing Keyword
+    Log    Hello world
+"""
+
+
+class TestParseCache:
+    def _parse(self, file_path: Path) -> robot.api.parsing.File:
+        return robot.api.parsing.get_model(file_path, data_only=True)
+
+    def test_unchanged_file_is_not_parsed_again(self, tmp_path: Path):
+        file_path = tmp_path.joinpath("file.resource")
+        file_path.write_text(ROBOT_FILE_CONTENT)
+
+        ParseCache(tmp_path.joinpath("cache")).get_model(
+            file_path,
+            "all",
+            lambda: self._parse(file_path),
+        )
+
+        cache = ParseCache(tmp_path.joinpath("cache"))
+        model = cache.get_model(file_path, "all", lambda: self._parse(file_path))
+
+        assert (cache.hits, cache.misses) == (1, 0)
+        assert model.sections[0].body[0].name == "Amazing Keyword"
+
+    def test_touched_file_is_not_parsed_again(self, tmp_path: Path):
+        file_path = tmp_path.joinpath("file.resource")
+        file_path.write_text(ROBOT_FILE_CONTENT)
+
+        ParseCache(tmp_path.joinpath("cache")).get_model(
+            file_path,
+            "all",
+            lambda: self._parse(file_path),
+        )
+        os.utime(file_path, ns=(0, 0))
+
+        cache = ParseCache(tmp_path.joinpath("cache"))
+        cache.get_model(file_path, "all", lambda: self._parse(file_path))
+
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_changed_file_is_parsed_again(self, tmp_path: Path):
+        file_path = tmp_path.joinpath("file.resource")
+        file_path.write_text(ROBOT_FILE_CONTENT)
+
+        ParseCache(tmp_path.joinpath("cache")).get_model(
+            file_path,
+            "all",
+            lambda: self._parse(file_path),
+        )
+        file_path.write_text(ROBOT_FILE_CONTENT.replace("Amazing", "Beautiful"))
+
+        cache = ParseCache(tmp_path.joinpath("cache"))
+        model = cache.get_model(file_path, "all", lambda: self._parse(file_path))
+
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert model.sections[0].body[0].name == "Beautiful Keyword"
+
+    def test_parse_sections_are_cached_separately(self, tmp_path: Path):
+        file_path = tmp_path.joinpath("file.resource")
+        file_path.write_text(ROBOT_FILE_CONTENT)
+
+        cache = ParseCache(tmp_path.joinpath("cache"))
+        cache.get_model(file_path, "all", lambda: self._parse(file_path))
+        cache.get_model(file_path, ("settings",), lambda: self._parse(file_path))
+
+        assert (cache.hits, cache.misses) == (0, 2)
@@ -0,0 +1,149 @@
+import operator
+from collections.abc import Callable, Generator
+from concurrent.futures import Future
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from robotframework_find_unused.parse import parse_robot_file as parse_module
+from robotframework_find_unused.parse.parse_cache import apply_parse_cache
+from robotframework_find_unused.parse.parse_robot_file import (
+    apply_max_parsed_files,
+    apply_parse_jobs,
+    apply_skip_sections,
+    forget_robot_file,
+    parse_robot_file,
+    parse_robot_files,
+    summarize_robot_files,
+)
+
+ROBOT_FILE_CONTENT = """
+*** Settings ***
+Resource    common.resource
+
+*** Variables ***
+${NAME}    World
+
+*** Test Cases ***
+Amazing Test
+    Log    Hello ${NAME}
+"""
+
+
+@pytest.fixture
+def robot_files(tmp_path: Path) -> Generator[list[Path]]:
+    """Robot files that are forgotten after the test. Parsed without the persistent parse cache."""
+    apply_parse_cache(None)
+    file_paths = [tmp_path.joinpath(f"suite_{i}.robot") for i in range(3)]
+    for file_path in file_paths:
+        file_path.write_text(ROBOT_FILE_CONTENT)
+
+    yield file_paths
+
+    apply_max_parsed_files(0)
+    apply_skip_sections(enabled=False)
+    for file_path in file_paths:
+        forget_robot_file(file_path)
+
+
+def _count_parses() -> mock.MagicMock:
+    return mock.patch.object(
+        parse_module,
+        "_parse_robot_file",
+        side_effect=parse_module._parse_robot_file,  # noqa: SLF001
+    )
+
+
+class TestParseRobotFile:
+    def test_file_is_parsed_once_for_all_sections(self, robot_files: list[Path]):
+        with _count_parses() as parse:
+            full = parse_robot_file(robot_files[0])
+            partial = parse_robot_file(robot_files[0], ("settings", "test cases"))
+
+        assert parse.call_count == 1
+        assert [len(section.body) for section in full.sections] == [1, 1, 1]
+        assert [section.header.type for section in partial.sections] == [
+            section.header.type for section in full.sections
+        ]
+        assert [len(section.body) for section in partial.sections] == [1, 0, 1]
+        assert partial.sections[0] is full.sections[0]
+        assert partial.source == robot_files[0]
+
+    def test_file_is_parsed_once_for_sections_then_all(self, robot_files: list[Path]):
+        with _count_parses() as parse:
+            partial = parse_robot_file(robot_files[0], ("settings", "test cases"))
+            full = parse_robot_file(robot_files[0])
+
+        assert [call.args[1] for call in parse.call_args_list] == ["all"]
+        assert [len(section.body) for section in partial.sections] == [1, 0, 1]
+        assert [len(section.body) for section in full.sections] == [1, 1, 1]
+
+    def test_file_is_parsed_again_for_more_sections(self, robot_files: list[Path]):
+        apply_skip_sections(enabled=True)
+
+        with _count_parses() as parse:
+            parse_robot_file(robot_files[0], ("settings",))
+            parse_robot_file(robot_files[0], ("settings",))
+            parse_robot_file(robot_files[0], ("settings", "variables"))
+            full = parse_robot_file(robot_files[0], ("settings", "test cases"))
+
+        assert [call.args[1] for call in parse.call_args_list] == [("settings",), "all"]
+        assert [len(section.body) for section in full.sections] == [1, 0, 1]
+
+    def test_least_recently_used_files_are_dropped(self, robot_files: list[Path]):
+        apply_max_parsed_files(2)
+
+        with _count_parses() as parse:
+            list(parse_robot_files(robot_files))
+            parse_robot_file(robot_files[2])
+            parse_robot_file(robot_files[1])
+            parse_robot_file(robot_files[0])
+
+        assert parse.call_count == 4
+
+    def test_parallel_parse_keeps_order(self, robot_files: list[Path]):
+        apply_parse_jobs(2)
+        try:
+            models = list(parse_robot_files([*robot_files, robot_files[0]]))
+        finally:
+            apply_parse_jobs(1)
+
+        assert [model.source for model in models] == [*robot_files, robot_files[0]]
+
+    def test_parallel_parse_queues_few_files(self, tmp_path: Path):
+        parse_args = [(tmp_path.joinpath(f"suite_{i}.robot"), "all") for i in range(1000)]
+        submitted: list[list] = []
+
+        class Executor:
+            def submit(self, _fn: Callable, chunk: list, _summarize: Callable | None) -> Future:
+                submitted.append(chunk)
+                future = Future()
+                future.set_result([(b"", None)] * len(chunk))
+                return future
+
+        parsed = parse_module._parse_in_workers(Executor(), parse_args, 2)  # noqa: SLF001
+        next(parsed)
+
+        assert len(submitted) == 2 * parse_module.PARSE_CHUNKS_PER_JOB + 1
+        assert all(len(chunk) == parse_module.MAX_PARSE_CHUNK_SIZE for chunk in submitted)
+        assert len(list(parsed)) == len(parse_args) - 1
+
+    def test_parallel_summaries_keep_order(self, robot_files: list[Path]):
+        parse_robot_file(robot_files[1])
+        apply_parse_jobs(2)
+        try:
+            with _count_parses() as parse:
+                sources = list(
+                    summarize_robot_files(
+                        [*robot_files, robot_files[0]],
+                        operator.attrgetter("source"),
+                    ),
+                )
+        finally:
+            apply_parse_jobs(1)
+
+        assert sources == [*robot_files, robot_files[0]]
+        # Parsed in the workers, or kept in memory before
+        assert parse.call_count == 0
+        assert robot_files[0] not in parse_module._parsed_models  # noqa: SLF001
@@ -0,0 +1,63 @@
+import pytest
+
+from robotframework_find_unused.parse.parse_variable import (
+    get_variable_references,
+    get_variables_in_string,
+)
+
+
+class TestGetVariablesInString:
+    @pytest.mark.parametrize(
+        ("string", "expected"),
+        [
+            ("", []),
+            ("No variables here", []),
+            ("${x}", ["${x}"]),
+            ("${x", []),
+            ("${xy", ["${xy"]),
+            ("a${}", []),
+            ("Hello ${name}, you are ${age} years old", ["${name}", "${age}"]),
+            ("@{list} &{dict} %{ENV_VAR}", ["@{list}", "&{dict}", "%{ENV_VAR}"]),
+            ("${outer_${inner}}", ["${outer_${inner}}"]),
+            ("${list}[${index}]", ["${list}", "${index}"]),
+            ("${var}}${other}", ["${var}", "${other}"]),
+            ("${unclosed ${closed}", ["${unclosed ${closed}"]),
+            ("{not a var} $ {x} ${y}", ["${y}"]),
+        ],
+    )
+    def test_get_variables_in_string(self, string: str, expected: list[str]):
+        assert get_variables_in_string(string) == expected
+
+    def test_long_string(self):
+        payload = '{"key": "value", "nested": {"id": ${id}}}' * 1000
+
+        assert get_variables_in_string(payload) == ["${id}"] * 1000
+
+
+class TestGetVariableReferences:
+    @pytest.mark.parametrize(
+        ("string", "expected"),
+        [
+            ("", []),
+            ("$name is not a variable here", []),
+            ("@{list} &{dict} %{ENV_VAR}", ["@{list}", "&{dict}", "%{ENV_VAR}"]),
+            ("${list}[${index}]", ["${list}", "${index}"]),
+            ("${{ $x + ${y} }}", ["${{ $x + ${y} }}", "${x}", "${y}"]),
+            ("${{ {'key': $value} }}", ["${{ {'key': $value} }}", "${value}"]),
+            ("a${}", []),
+        ],
+    )
+    def test_arguments(self, string: str, expected: list[str]):
+        assert get_variable_references(string) == expected
+
+    @pytest.mark.parametrize(
+        ("string", "expected"),
+        [
+            ("$x == 1", ["${x}"]),
+            ("$x + ${y} + $z_2", ["${x}", "${y}", "${z_2}"]),
+            ("${list}[$i]", ["${list}", "${i}"]),
+            ("'$' + @{list}", ["@{list}"]),
+        ],
+    )
+    def test_python_expression(self, string: str, expected: list[str]):
+        assert get_variable_references(string, python_expression=True) == expected
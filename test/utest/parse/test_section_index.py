@@ -0,0 +1,91 @@
+from pathlib import Path
+
+import pytest
+import robot.api.parsing
+
+from robotframework_find_unused.parse import section_index
+from robotframework_find_unused.parse.section_index import get_section_index, read_sections
+
+ROBOT_FILE_CONTENT = """\
+language: de
+
+*** Einstellungen ***
+Resource    common.resource
+
+*** Variablen ***
+${NAME}    World
+
+*** Testfälle ***
+Amazing Test
+    Log    Hello ${NAME}
+
+*** Keyword ***
+Amazing Keyword
+    No Operation
+
+*** Unknown ***
+Something
+"""
+
+
+class TestSectionIndex:
+    def test_localized_and_singular_headers(self):
+        index = get_section_index(ROBOT_FILE_CONTENT.encode())
+
+        assert [section.name for section in index] == [
+            None,
+            "settings",
+            "variables",
+            "test cases",
+            "keywords",
+            None,
+        ]
+
+    def test_headers_without_language_config(self):
+        content = ROBOT_FILE_CONTENT.replace("language: de", "").encode()
+
+        index = get_section_index(content)
+
+        assert [section.name for section in index] == [None, None, None, None, "keywords", None]
+
+    @pytest.mark.parametrize("mmap_min_file_size", [0, section_index.MMAP_MIN_FILE_SIZE])
+    def test_skipped_sections_keep_line_numbers(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        mmap_min_file_size: int,
+    ):
+        monkeypatch.setattr(section_index, "MMAP_MIN_FILE_SIZE", mmap_min_file_size)
+        file_path = tmp_path.joinpath("suite.robot")
+        file_path.write_text(ROBOT_FILE_CONTENT, encoding="utf8")
+
+        content = read_sections(file_path, ["keywords"])
+
+        assert content.splitlines() == [
+            "language: de",
+            "",
+            "*** Einstellungen ***",
+            "",
+            "",
+            "*** Variablen ***",
+            "",
+            "",
+            "*** Testfälle ***",
+            "",
+            "",
+            "",
+            "*** Keyword ***",
+            "Amazing Keyword",
+            "    No Operation",
+            "",
+            "*** Unknown ***",
+            "Something",
+        ]
+        model = robot.api.parsing.get_model(content, data_only=True)
+        assert (
+            model.sections[-2].body[0].lineno
+            == ROBOT_FILE_CONTENT.splitlines().index(
+                "Amazing Keyword",
+            )
+            + 1
+        )
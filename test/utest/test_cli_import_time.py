@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = {"robot", "robocop", "pathspec"}
+
+
+def _get_import_times(module: str) -> dict[str, int]:
+    """Import the module in a new process. Returns the cumulative import time in us per module."""
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    import_times: dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        (_, cumulative, name) = line.removeprefix("import time:").split("|")
+        import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+class TestCliImportTime:
+    def test_cli_does_not_import_heavy_modules(self):
+        import_times = _get_import_times("robotframework_find_unused.cli")
+
+        imported = {name.split(".")[0] for name in import_times}
+        assert imported.isdisjoint(HEAVY_MODULES)
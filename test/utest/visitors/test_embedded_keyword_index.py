@@ -0,0 +1,98 @@
+import pickle
+
+from robot.libdocpkg.model import KeywordDoc, LibraryDoc
+from robot.running.arguments.argumentspec import ArgumentSpec
+
+from robotframework_find_unused.common.const import KeywordData
+from robotframework_find_unused.common.normalize import normalize_keyword_name
+from robotframework_find_unused.convert.convert_keyword import libdoc_keyword_to_keyword_data
+from robotframework_find_unused.visitors.robot.keyword_visitor.embedded_keyword_index import (
+    EmbeddedKeywordIndex,
+)
+
+
+def _keyword(name: str) -> KeywordData:
+    libdoc = KeywordDoc(name=name, args=ArgumentSpec(name), parent=LibraryDoc(name="lib"))
+    return libdoc_keyword_to_keyword_data(libdoc, "CUSTOM_RESOURCE")
+
+
+def _names(keywords: list[KeywordData]) -> list[str]:
+    return [kw.name for kw in keywords]
+
+
+class TestEmbeddedKeywordIndex:
+    def test_find_matches(self):
+        index = EmbeddedKeywordIndex(
+            [
+                _keyword("User ${name} logs in"),
+                _keyword("User ${name} logs out"),
+                _keyword("Admin ${name} logs in"),
+            ],
+        )
+
+        matches = index.find_matches(normalize_keyword_name("User Alice logs in"))
+        assert _names(matches) == ["User ${name} logs in"]
+
+        matches = index.find_matches(normalize_keyword_name("Admin Bob logs out"))
+        assert matches == []
+
+    def test_find_matches_variable_at_start_or_end(self):
+        index = EmbeddedKeywordIndex(
+            [
+                _keyword("${count} items are selected"),
+                _keyword("Select ${item}"),
+                _keyword("${anything}"),
+            ],
+        )
+
+        matches = index.find_matches(normalize_keyword_name("3 items are selected"))
+        assert _names(matches) == ["${count} items are selected", "${anything}"]
+
+        matches = index.find_matches(normalize_keyword_name("Select the first item"))
+        assert _names(matches) == ["Select ${item}", "${anything}"]
+
+    def test_find_matches_in_definition_order(self):
+        index = EmbeddedKeywordIndex(
+            [
+                _keyword("${a} is ${b}"),
+                _keyword("User ${a} is ${b}"),
+                _keyword("${a} is logged in"),
+            ],
+        )
+
+        matches = index.find_matches(normalize_keyword_name("User Alice is logged in"))
+        assert _names(matches) == ["${a} is ${b}", "User ${a} is ${b}", "${a} is logged in"]
+
+    def test_find_best_match(self):
+        index = EmbeddedKeywordIndex(
+            [
+                _keyword("${a} is ${b}"),
+                _keyword("User ${a} is ${b}"),
+            ],
+        )
+
+        best = index.find_best_match(normalize_keyword_name("User Alice is logged in"))
+        assert best is not None
+        assert best.name == "User ${a} is ${b}"
+
+        best = index.find_best_match(normalize_keyword_name("Alice is logged in"))
+        assert best is not None
+        assert best.name == "${a} is ${b}"
+
+        assert index.find_best_match(normalize_keyword_name("Alice logs in")) is None
+
+    def test_name_match_pattern_is_compiled_on_first_use(self):
+        plain = _keyword("Amazing Keyword")
+        embedded = _keyword("User ${name} logs in")
+
+        assert plain.name_match_pattern is None
+        assert embedded._name_match_pattern is None  # noqa: SLF001
+
+        pattern = embedded.name_match_pattern
+        assert pattern is not None
+        assert pattern.fullmatch(normalize_keyword_name("User Alice logs in")) is not None
+        assert embedded.name_match_pattern is pattern
+
+        restored = pickle.loads(pickle.dumps(embedded))  # noqa: S301
+        assert restored.name_parts == embedded.name_parts
+        assert restored.name_match_pattern is not None
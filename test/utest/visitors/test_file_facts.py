@@ -0,0 +1,184 @@
+from pathlib import Path
+
+import robot.api.parsing
+
+from robotframework_find_unused.commands import VariableOptions
+from robotframework_find_unused.common.const import KeywordData
+from robotframework_find_unused.convert.convert_keyword import libdoc_keyword_to_keyword_data
+from robotframework_find_unused.parse.parse_cache import apply_parse_cache
+from robotframework_find_unused.parse.parse_robot_file import apply_parse_jobs
+from robotframework_find_unused.reporter.base.variable_reporter import VariableReporter
+from robotframework_find_unused.visitors.robot.file_facts import FileFacts
+from robotframework_find_unused.visitors.robot.file_facts_visitor import (
+    RobotVisitorFileFacts,
+    forget_file_facts,
+    get_file_facts,
+)
+from robotframework_find_unused.visitors.robot.keyword_definition import (
+    RobotVisitorKeywordDefinitions,
+)
+from robotframework_find_unused.visitors.robot.keyword_visitor import RobotVisitorKeywords
+from robotframework_find_unused.visitors.robot.variable_count import RobotVisitorVariableUses
+from robotframework_find_unused.visitors.robot.variable_definition import (
+    RobotVisitorVariableDefinitions,
+)
+
+ROBOT_FILE_CONTENT = """
+*** Settings ***
+Library         Collections
+Test Template   Templated Keyword
+
+*** Variables ***
+${GREETING}    Hello
+${NAME}        ${GREETING} World
+${UNUSED}      Nope
+
+*** Test Cases ***
+Templated Test
+    first    ${NAME}
+    second   ${{ $GREETING.upper() }}
+
+Amazing Test
+    [Template]    NONE
+    ${value} =    Returning Keyword    ${NAME}
+    Run Keyword    Templated Keyword    ${value}
+    Set Suite Variable    ${SUITE_VAR}    ${GREETING}
+    IF    $value == "foo"
+        Log    ${SUITE_VAR}
+    END
+    Evaluate    $NAME + "!"
+
+*** Keywords ***
+Templated Keyword
+    [Arguments]    ${arg}
+    VAR    ${TEST_VAR}    ${arg}    scope=TEST
+    Log    ${arg}
+
+Returning Keyword
+    [Arguments]    ${arg}    ${unused}=default
+    RETURN    ${arg}
+"""
+
+
+class TestFileFacts:
+    def _get_model(self, tmp_path: Path) -> robot.api.parsing.File:
+        file_path = tmp_path.joinpath("suite.robot")
+        file_path.write_text(ROBOT_FILE_CONTENT)
+        return robot.api.parsing.get_model(file_path, data_only=True)
+
+    def _get_facts(self, model: robot.api.parsing.File) -> FileFacts:
+        visitor = RobotVisitorFileFacts()
+        visitor.visit(model)
+        return visitor.facts[0]
+
+    def _get_keywords(self, model: robot.api.parsing.File) -> list[KeywordData]:
+        visitor = RobotVisitorKeywordDefinitions()
+        visitor.visit(model)
+        return [
+            libdoc_keyword_to_keyword_data(kw, "CUSTOM_SUITE", keyword_returns=None)
+            for kw in visitor.files[0].keywords
+        ]
+
+    def _get_reporter(self, tmp_path: Path) -> VariableReporter:
+        return VariableReporter(
+            VariableOptions(
+                show_all_count=True,
+                filter_glob=None,
+                verbose=0,
+                pythonpath=[],
+                source_path=tmp_path.as_posix(),
+                jobs=1,
+                cache_dir=None,
+            ),
+        )
+
+    def test_parallel_facts_match_model(self, tmp_path: Path):
+        file_paths = [tmp_path.joinpath(f"suite_{i}.robot") for i in range(3)]
+        for file_path in file_paths:
+            file_path.write_text(ROBOT_FILE_CONTENT)
+
+        apply_parse_cache(None)
+        apply_parse_jobs(2)
+        try:
+            facts = list(get_file_facts(file_paths))
+        finally:
+            apply_parse_jobs(1)
+            for file_path in file_paths:
+                forget_file_facts(file_path)
+
+        assert facts == [
+            self._get_facts(robot.api.parsing.get_model(file_path, data_only=True))
+            for file_path in file_paths
+        ]
+
+    def test_keyword_uses_match_model(self, tmp_path: Path):
+        model = self._get_model(tmp_path)
+        facts = self._get_facts(model)
+
+        from_model = RobotVisitorKeywords(self._get_keywords(model), [])
+        from_model.visit(model)
+        from_facts = RobotVisitorKeywords(self._get_keywords(model), [])
+        from_facts.visit_file_facts(facts)
+
+        def counts(visitor: RobotVisitorKeywords) -> list[tuple]:
+            return [
+                (kw.name, kw.use_count, kw.return_use_count, kw.argument_use_count, kw.returns)
+                for kw in visitor.keywords.values()
+            ]
+
+        assert counts(from_facts) == counts(from_model)
+        assert facts.library_imports == ["Collections"]
+        assert [kw.name for kw in facts.keyword_definitions] == [
+            "Templated Keyword",
+            "Returning Keyword",
+        ]
+
+    def test_keyword_definitions_match_model(self, tmp_path: Path):
+        model = self._get_model(tmp_path)
+        facts = self._get_facts(model)
+
+        from_model = RobotVisitorKeywordDefinitions()
+        from_model.visit(model)
+        from_facts = RobotVisitorKeywordDefinitions()
+        from_facts.visit_file_facts(facts)
+
+        def keywords(visitor: RobotVisitorKeywordDefinitions) -> list[tuple]:
+            return [
+                (
+                    kw.name,
+                    kw.library,
+                    kw.type,
+                    kw.private,
+                    kw.deprecated,
+                    kw.arguments.argument_names,
+                )
+                for kw in (
+                    libdoc_keyword_to_keyword_data(kw, "CUSTOM_SUITE")
+                    for file in visitor.files
+                    for kw in file.keywords
+                )
+            ]
+
+        assert keywords(from_facts) == keywords(from_model)
+        assert from_facts.files[0].source == from_model.files[0].source
+
+    def test_variables_match_model(self, tmp_path: Path):
+        model = self._get_model(tmp_path)
+        facts = self._get_facts(model)
+        reporter = self._get_reporter(tmp_path)
+
+        definitions_from_model = RobotVisitorVariableDefinitions(tmp_path, None, reporter)
+        definitions_from_model.visit(model)
+        definitions_from_facts = RobotVisitorVariableDefinitions(tmp_path, None, reporter)
+        definitions_from_facts.visit_file_facts(facts)
+
+        assert definitions_from_facts.variables == definitions_from_model.variables
+
+        uses_from_model = RobotVisitorVariableUses(definitions_from_model.variables)
+        uses_from_model.visit(model)
+        uses_from_facts = RobotVisitorVariableUses(definitions_from_facts.variables)
+        uses_from_facts.visit_file_facts(facts)
+
+        assert {name: var.use_count for name, var in uses_from_facts.variables.items()} == {
+            name: var.use_count for name, var in uses_from_model.variables.items()
+        }
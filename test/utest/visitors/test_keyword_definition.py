@@ -0,0 +1,135 @@
+from pathlib import Path
+
+import pytest
+import robot.api.parsing
+import robot.errors
+from robot.libdoc import LibraryDocumentation
+from robot.libdocpkg.model import LibraryDoc
+
+from robotframework_find_unused.commands.step.parse_files import step_parse_files
+from robotframework_find_unused.parse.parse_robot_file import forget_robot_file
+from robotframework_find_unused.reporter.base.partial.parse_files import (
+    PartialReporter_ParseFiles,
+)
+from robotframework_find_unused.visitors.robot.file_facts_visitor import RobotVisitorFileFacts
+from robotframework_find_unused.visitors.robot.keyword_definition import (
+    RobotVisitorKeywordDefinitions,
+)
+
+ROBOT_FILE_CONTENT = """
+*** Settings ***
+Keyword Tags    amazing
+
+*** Test Cases ***
+Amazing Test
+    Public Keyword    foo
+
+*** Keywords ***
+Public Keyword
+    [Arguments]    ${first}    ${second}=default    @{rest}    ${named}=${None}
+    Log    ${first}
+
+Private Keyword
+    [Tags]    robot:private
+    Log    Hello world
+
+Old Keyword
+    [Documentation]    *DEPRECATED* Use something else
+    ...
+    ...    Tags: deprecated
+    No Operation
+
+Keyword With ${embedded} Argument
+    [Arguments]    ${normal}
+    Log    ${embedded} ${normal}
+"""
+
+
+class TestRobotVisitorKeywordDefinitions:
+    def _get_docs(self, file_path: Path) -> tuple[LibraryDoc, LibraryDoc]:
+        visitor = RobotVisitorKeywordDefinitions()
+        visitor.visit(robot.api.parsing.get_model(file_path, data_only=True))
+        return (visitor.files[0], LibraryDocumentation(str(file_path)))
+
+    def test_suite_file_matches_libdoc(self, tmp_path: Path):
+        file_path = tmp_path.joinpath("01__amazing_suite.robot")
+        file_path.write_text(ROBOT_FILE_CONTENT)
+
+        (native, libdoc) = self._get_docs(file_path)
+
+        assert (native.name, native.type) == (libdoc.name, libdoc.type)
+        assert [kw.name for kw in native.keywords] == [kw.name for kw in libdoc.keywords]
+        for native_kw, libdoc_kw in zip(native.keywords, libdoc.keywords, strict=True):
+            assert str(native_kw.args) == str(libdoc_kw.args)
+            assert native_kw.args.argument_names == libdoc_kw.args.argument_names
+            assert native_kw.private == libdoc_kw.private
+            assert native_kw.deprecated == libdoc_kw.deprecated
+            assert list(native_kw.tags) == list(libdoc_kw.tags)
+
+    def test_robot_file_without_tests_is_a_resource(self, tmp_path: Path):
+        file_path = tmp_path.joinpath("keywords.robot")
+        file_path.write_text(ROBOT_FILE_CONTENT.replace("*** Test Cases ***", "*** Comments ***"))
+
+        (native, libdoc) = self._get_docs(file_path)
+
+        assert (native.name, native.type) == (libdoc.name, libdoc.type) == ("keywords", "RESOURCE")
+
+    @pytest.mark.parametrize(
+        ("file_name", "header"),
+        [
+            ("empty_tests.robot", "*** Test Cases ***"),
+            ("empty_tasks.robot", "*** Tasks ***"),
+            ("tests.resource", "*** Test Cases ***"),
+        ],
+    )
+    def test_resource_with_tests_is_invalid(self, tmp_path: Path, file_name: str, header: str):
+        file_path = tmp_path.joinpath(file_name)
+        content = f"*** Settings ***\nDocumentation    Invalid\n\n{header}\n"
+        if file_path.suffix == ".resource":
+            content += "Amazing Test\n    No Operation\n"
+        file_path.write_text(content + "\n*** Keywords ***\nMy Keyword\n    No Operation\n")
+        model = robot.api.parsing.get_model(file_path, data_only=True)
+
+        visitor = RobotVisitorKeywordDefinitions()
+        visitor.visit(model)
+        with pytest.raises(robot.errors.DataError) as libdoc_error:
+            LibraryDocumentation(str(file_path))
+
+        assert visitor.files == []
+        assert visitor.errors == {file_path.absolute(): libdoc_error.value.message}
+
+        facts_visitor = RobotVisitorFileFacts()
+        facts_visitor.visit(model)
+        from_facts = RobotVisitorKeywordDefinitions()
+        from_facts.visit_file_facts(facts_visitor.facts[0])
+
+        assert from_facts.files == []
+        assert from_facts.errors == visitor.errors
+
+    def test_invalid_files_are_not_parsed(self, tmp_path: Path):
+        valid_path = tmp_path.joinpath("valid.robot")
+        valid_path.write_text(ROBOT_FILE_CONTENT)
+        invalid_path = tmp_path.joinpath("invalid.robot")
+        invalid_path.write_text(
+            "*** Test Cases ***\n\n*** Keywords ***\nMy Keyword\n    No Operation\n",
+        )
+
+        class Reporter(PartialReporter_ParseFiles):
+            def on_parse_files_end(
+                self,
+                file_paths: list[Path],  # noqa: ARG002
+                files: list[LibraryDoc],  # noqa: ARG002
+                parse_errors: list[str],
+            ) -> None:
+                self.parse_errors = parse_errors
+
+        reporter = Reporter(None)  # pyright: ignore[reportArgumentType]
+        try:
+            files = step_parse_files([valid_path, invalid_path], reporter=reporter)
+        finally:
+            forget_robot_file(valid_path)
+            forget_robot_file(invalid_path)
+
+        assert [Path(file.source) for file in files] == [valid_path.absolute()]
+        assert len(reporter.parse_errors) == 1
+        assert "Resource file with 'Test Cases' section is invalid." in reporter.parse_errors[0]
@@ -0,0 +1,105 @@
+import pytest
+from robot.libdocpkg.model import KeywordDoc, LibraryDoc
+from robot.running.arguments.argumentspec import ArgumentSpec
+
+from robotframework_find_unused.common.const import KeywordData, LibraryData
+from robotframework_find_unused.common.normalize import normalize_keyword_name
+from robotframework_find_unused.convert.convert_keyword import (
+    libdoc_keyword_to_keyword_data,
+    libdoc_keyword_to_library_keyword_doc,
+)
+from robotframework_find_unused.visitors.robot.keyword_visitor import keyword_definition_manager
+from robotframework_find_unused.visitors.robot.keyword_visitor.keyword_definition_manager import (
+    KeywordDefinitionManager,
+)
+
+
+def _keyword(name: str, library: str = "lib") -> KeywordData:
+    libdoc = KeywordDoc(name=name, args=ArgumentSpec(name), parent=LibraryDoc(name=library))
+    return libdoc_keyword_to_keyword_data(libdoc, "CUSTOM_RESOURCE")
+
+
+def _library(name: str, keyword_names: list[str]) -> LibraryData:
+    library_doc = LibraryDoc(name=name)
+    keyword_docs = [
+        libdoc_keyword_to_library_keyword_doc(
+            KeywordDoc(name=kw_name, args=ArgumentSpec(kw_name), parent=library_doc),
+        )
+        for kw_name in keyword_names
+    ]
+    return LibraryData(
+        name=name,
+        name_normalized=name.lower(),
+        keyword_docs={normalize_keyword_name(kw.name): kw for kw in keyword_docs},
+        import_error=False,
+    )
+
+
+class TestKeywordDefinitionManagerResolutionCache:
+    def test_repeated_search_is_cached(self):
+        manager = KeywordDefinitionManager([_keyword("Open Page")], [])
+
+        first = manager.search_keyword_definition("Open Page")
+        second = manager.search_keyword_definition("Open Page")
+
+        assert first is not None
+        assert first is second
+        assert (manager.resolution_cache_hits, manager.resolution_cache_misses) == (1, 1)
+
+    def test_cached_miss_is_invalidated_by_unknown_keyword(self):
+        manager = KeywordDefinitionManager([_keyword("Open ${page} Page")], [])
+
+        assert manager.search_keyword_definition("Given Close Page") is None
+
+        unknown = manager.get_keyword_definition("Close Page")
+        assert unknown.type == "UNKNOWN"
+
+        assert manager.search_keyword_definition("Given Close Page") is unknown
+
+    def test_cached_hits_are_kept_on_unknown_keyword(self):
+        manager = KeywordDefinitionManager([_keyword("Open Page")], [])
+
+        found = manager.search_keyword_definition("Open Page")
+        assert manager.search_keyword_definition("Other Page") is None
+        manager.get_keyword_definition("Close Page")
+
+        assert manager.search_keyword_definition("Open Page") is found
+        assert manager.search_keyword_definition("Other Page") is None
+        assert (manager.resolution_cache_hits, manager.resolution_cache_misses) == (2, 3)
+
+    def test_downloaded_library_keyword(self):
+        library = _library("Browser", ["Click Element", "Go To"])
+        manager = KeywordDefinitionManager([], [library])
+
+        lib_keyword = manager.search_keyword_definition("Click Element")
+        assert lib_keyword is not None
+        assert lib_keyword.type == "LIBRARY"
+        assert manager.search_keyword_definition("Browser.Click Element") is lib_keyword
+        assert manager.search_keyword_definition("Click Element") is lib_keyword
+        assert manager.resolution_cache_hits == 1
+
+    def test_unused_library_keywords_are_not_converted(self):
+        library = _library("Browser", ["Click Element", "Go To"])
+        manager = KeywordDefinitionManager([], [library])
+
+        manager.search_keyword_definition("Click Element")
+
+        assert list(library.keywords) == ["clickelement"]
+
+    def test_cache_size_is_bounded(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(keyword_definition_manager, "RESOLUTION_CACHE_SIZE", 2)
+        manager = KeywordDefinitionManager([_keyword("Open Page")], [])
+
+        for name in ("Open Page", "open page", "OPEN PAGE", "Open Page"):
+            manager.search_keyword_definition(name)
+
+        assert (manager.resolution_cache_hits, manager.resolution_cache_misses) == (0, 4)
+
+    def test_evicted_misses_are_forgotten(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(keyword_definition_manager, "RESOLUTION_CACHE_SIZE", 2)
+        manager = KeywordDefinitionManager([], [])
+
+        for name in ("First", "Second", "Third"):
+            manager.search_keyword_definition(name)
+
+        assert set(manager._cached_misses) == {"second", "third"}  # noqa: SLF001